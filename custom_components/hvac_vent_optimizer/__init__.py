@@ -8,7 +8,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api import FlairApi
+from .api import FlairApi, FlairApiHub
 from .const import (
     BRAND_FLAIR,
     CONF_ADJUSTMENT_WINDOW_MINUTES,
@@ -54,6 +54,29 @@ _OPTIONS_DEFAULTS: dict[str, int | float] = {
 # Old default that should be upgraded
 _OLD_TEMP_ERROR_OVERRIDE = 0.6
 
+# ``hass.data[DOMAIN]`` key of the per-client-id :class:`FlairApiHub` map.
+_API_HUBS = "_api_hubs"
+
+
+def _acquire_api(hass: HomeAssistant, entry: ConfigEntry) -> FlairApi:
+    """Entry's Flair client from the hub shared by entries on the same account."""
+    hubs: dict[str, FlairApiHub] = hass.data[DOMAIN].setdefault(_API_HUBS, {})
+    client_id = entry.data[CONF_CLIENT_ID]
+    hub = hubs.get(client_id)
+    if hub is None:
+        hub = hubs[client_id] = FlairApiHub(
+            async_get_clientsession(hass), client_id, entry.data[CONF_CLIENT_SECRET]
+        )
+    return hub.acquire(entry.entry_id, entry.data[CONF_CLIENT_SECRET])
+
+
+def _release_api(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    hubs: dict[str, FlairApiHub] = hass.data.get(DOMAIN, {}).get(_API_HUBS, {})
+    client_id = entry.data.get(CONF_CLIENT_ID)
+    hub = hubs.get(client_id) if client_id else None
+    if hub is not None and hub.release(entry.entry_id):
+        del hubs[client_id]
+
 
 async def _async_migrate_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Add missing option keys introduced in the algorithm-improvement update."""
@@ -151,21 +174,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await _async_migrate_options(hass, entry)
 
     brand = entry.options.get(CONF_VENT_BRAND, entry.data.get(CONF_VENT_BRAND, BRAND_FLAIR))
-    api = None
-    if brand == BRAND_FLAIR:
-        session = async_get_clientsession(hass)
-        api = FlairApi(
-            session,
-            entry.data[CONF_CLIENT_ID],
-            entry.data[CONF_CLIENT_SECRET],
-        )
+    api = _acquire_api(hass, entry) if brand == BRAND_FLAIR else None
 
     coordinator = FlairCoordinator(hass, api, entry)
-    await coordinator.async_initialize()
-    await coordinator.async_ensure_structure_mode()
-    await coordinator.async_config_entry_first_refresh()
-    coordinator.async_detect_active_hvac()
-    await coordinator.async_setup_thermostat_listeners()
+    try:
+        await coordinator.async_initialize()
+        # A persisted snapshot brings the entities up at once (marked stale) while
+        # the first live poll runs in the background; otherwise block on it. The
+        # poll itself re-asserts the structure mode, so the restored path skips it.
+        restored = await coordinator.async_restore_snapshot()
+        if not restored:
+            await coordinator.async_ensure_structure_mode()
+            await coordinator.async_config_entry_first_refresh()
+            coordinator.async_detect_active_hvac()
+        await coordinator.async_setup_thermostat_listeners()
+    except BaseException:
+        _release_api(hass, entry)
+        raise
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
     await async_register_services(hass)
@@ -173,6 +198,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    if restored:
+        coordinator.async_start_background_refresh()
     return True
 
 
@@ -183,10 +210,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         coordinator = hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
         if coordinator:
             coordinator.async_shutdown()
+        _release_api(hass, entry)
         await async_unregister_services(hass)
     return unload_ok
 
 
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options updates."""
+    """Handle options updates: tunables apply in place, anything structural reloads."""
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if coordinator is not None and await coordinator.async_apply_options():
+        return
     await hass.config_entries.async_reload(entry.entry_id)
@@ -5,16 +5,34 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import random
+import time
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import aiohttp
 
-from .utils import AsyncRateLimiter
+from .telemetry import ApiTelemetry
+from .utils import AsyncRateLimiter, CircuitBreaker, FairRateLimiter, RateLimiter
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Collections whose next path segment is a resource id (templated as ``{id}``
+# so request counts aggregate per endpoint rather than per device).
+_ID_COLLECTIONS = frozenset({"structures", "vents", "pucks", "rooms", "remote-sensors"})
+
+
+def endpoint_key(method: str, path: str) -> str:
+    """``GET /api/vents/abc/room`` -> ``GET /api/vents/{id}/room``."""
+    parts = path.split("?", 1)[0].split("/")
+    for i in range(1, len(parts)):
+        if parts[i - 1] in _ID_COLLECTIONS and parts[i]:
+            parts[i] = "{id}"
+    return f"{method.upper()} {'/'.join(parts)}"
+
+
 class FlairApiError(Exception):
     """Base Flair API error."""
 
@@ -23,6 +41,59 @@ class FlairApiAuthError(FlairApiError):
     """Authentication failure with Flair API."""
 
 
+class FlairApiTransientError(FlairApiError):
+    """A 429/5xx or auth transport failure still failing after the retries."""
+
+
+class FlairApiUnavailable(FlairApiError):
+    """Request refused locally because the circuit breaker is open."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retries for one request class: up to ``retries`` extra attempts.
+
+    Back-off grows as ``base_s * 2**attempt``, capped at ``max_s``, with full
+    jitter so that many vents retrying together do not stay in lock-step.
+    """
+
+    retries: int
+    base_s: float
+    max_s: float
+
+
+# Per request class (see ``FlairApi._request_class``). Reads fan out per device
+# every poll and are cheap to repeat. Writes set absolute positions/setpoints,
+# so a repeat is harmless, but they are retried less. Search shares the 1 req/s
+# limiter and backs off harder.
+DEFAULT_RETRY_POLICIES: dict[str, RetryPolicy] = {
+    "read": RetryPolicy(retries=2, base_s=0.5, max_s=4.0),
+    "write": RetryPolicy(retries=1, base_s=1.0, max_s=4.0),
+    "search": RetryPolicy(retries=1, base_s=2.0, max_s=8.0),
+}
+# Upper bound honored for a server ``Retry-After``.
+RETRY_AFTER_MAX_S = 30.0
+# Consecutive failed requests (after retries) that trip the breaker, and how
+# long it stays open before a half-open probe.
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN_S = 60.0
+# Flair's documented per-account request rates.
+BASIC_RATE_PER_S = 4.0
+SEARCH_RATE_PER_S = 1.0
+
+
+class FlairToken:
+    """Client-credentials bearer token; shared by every client of one hub."""
+
+    def __init__(self) -> None:
+        self.access_token: str | None = None
+        self.expires_at: datetime | None = None
+        self.lock = asyncio.Lock()
+
+    def valid(self) -> bool:
+        return bool(self.access_token and self.expires_at and datetime.now(UTC) < self.expires_at)
+
+
 class FlairApi:
     """Minimal Flair API client with token management."""
 
@@ -32,23 +103,60 @@ class FlairApi:
     )
     _SCOPES_BASE = "vents.view vents.edit structures.view structures.edit pucks.view pucks.edit"
 
-    def __init__(self, session: aiohttp.ClientSession, client_id: str, client_secret: str) -> None:
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        client_id: str,
+        client_secret: str,
+        *,
+        retry_policies: dict[str, RetryPolicy] | None = None,
+        breaker: CircuitBreaker | None = None,
+        token: FlairToken | None = None,
+        basic_limiter: RateLimiter | None = None,
+        search_limiter: RateLimiter | None = None,
+    ) -> None:
         self._session = session
         self._client_id = client_id
         self._client_secret = client_secret
-        self._access_token: str | None = None
-        self._token_expires_at: datetime | None = None
-        self._auth_lock = asyncio.Lock()
+        # Injected by :class:`FlairApiHub` so that entries on one account share
+        # a token and the account's request budget.
+        self._token = token or FlairToken()
         self._missing_pressure_logged: set[str] = set()
-        self._basic_limiter = AsyncRateLimiter(4.0)
-        self._search_limiter = AsyncRateLimiter(1.0)
+        self._basic_limiter: RateLimiter = basic_limiter or AsyncRateLimiter(BASIC_RATE_PER_S)
+        self._search_limiter: RateLimiter = search_limiter or AsyncRateLimiter(SEARCH_RATE_PER_S)
+        # Per-endpoint-template request/error/429/retry/bytes/latency counters
+        # for every HTTP attempt, token requests included.
+        self.telemetry = ApiTelemetry()
+        self.retry_policies = {**DEFAULT_RETRY_POLICIES, **(retry_policies or {})}
+        self.breaker = breaker or CircuitBreaker(BREAKER_FAILURE_THRESHOLD, BREAKER_COOLDOWN_S)
+        self._sleep = asyncio.sleep
+        self._rng = random.Random()
+
+    @property
+    def request_counts(self) -> dict[str, int]:
+        """HTTP requests issued per endpoint template (retries included)."""
+        return self.telemetry.counts()
+
+    @staticmethod
+    def _response_bytes(resp: Any) -> int:
+        """Response size from ``Content-Length`` (0 when the server omits it)."""
+        try:
+            return int((getattr(resp, "headers", None) or {}).get("Content-Length", 0))
+        except (TypeError, ValueError):
+            return 0
 
     async def async_authenticate(self) -> None:
         """Authenticate with Flair API using client credentials."""
-        async with self._auth_lock:
-            if self._access_token and self._token_expires_at and datetime.now(UTC) < self._token_expires_at:
+        token_state = self._token
+        async with token_state.lock:
+            if token_state.valid():
                 return
 
+            token_key = endpoint_key("POST", "/oauth2/token")
+            # A token request while one was already held is a refresh (expiry or
+            # a 401 mid-request) and is counted as a retry.
+            refresh = token_state.expires_at is not None
+
             async def _request_token(scope: str) -> dict[str, Any]:
                 payload = {
                     "client_id": self._client_id,
@@ -57,8 +165,12 @@ class FlairApi:
                     "grant_type": "client_credentials",
                 }
 
+                started = 0.0
+                status: int | None = None
+                nbytes = 0
                 try:
                     await self._basic_limiter.acquire()
+                    started = time.perf_counter()
                     async with self._session.post(
                         f"{self.BASE_URL}/oauth2/token",
                         data=payload,
@@ -68,9 +180,11 @@ class FlairApi:
                         },
                         timeout=aiohttp.ClientTimeout(total=10),
                     ) as resp:
+                        status = resp.status
                         if resp.status in {401, 403}:
                             raise FlairApiAuthError("Invalid Flair credentials")
                         body = await resp.text()
+                        nbytes = len(body.encode())
                         if resp.status >= 400:
                             raise FlairApiError(f"Authentication failed: HTTP {resp.status}: {body}")
                         if not body:
@@ -80,9 +194,14 @@ class FlairApi:
                         except json.JSONDecodeError:
                             return {}
                 except TimeoutError as err:
-                    raise FlairApiError("Authentication request timed out") from err
+                    raise FlairApiTransientError("Authentication request timed out") from err
                 except aiohttp.ClientError as err:
-                    raise FlairApiError(f"Authentication request failed: {err}") from err
+                    raise FlairApiTransientError(f"Authentication request failed: {err}") from err
+                finally:
+                    if started:
+                        self.telemetry.record(
+                            token_key, status, time.perf_counter() - started, nbytes, refresh
+                        )
 
             try:
                 data = await _request_token(self._SCOPES_FULL)
@@ -97,62 +216,130 @@ class FlairApi:
             if not token:
                 raise FlairApiAuthError("Missing access_token in response")
 
-            self._access_token = token
+            token_state.access_token = token
             expires_in = int(data.get("expires_in", 3600))
-            self._token_expires_at = datetime.now(UTC) + timedelta(seconds=expires_in - 60)
+            token_state.expires_at = datetime.now(UTC) + timedelta(seconds=expires_in - 60)
 
-    def _get_rate_limiter(self, path: str) -> AsyncRateLimiter:
+    def _get_rate_limiter(self, path: str) -> RateLimiter:
         # Flair documents different limits; treat any search endpoint as "search".
         if "search" in path:
             return self._search_limiter
         return self._basic_limiter
 
+    def _request_class(self, method: str, path: str) -> str:
+        if "search" in path:
+            return "search"
+        return "read" if method.upper() == "GET" else "write"
+
+    def _retry_delay(self, policy: RetryPolicy, attempt: int, retry_after: str | None) -> float:
+        """Back-off before retry ``attempt`` (0-based).
+
+        A ``Retry-After`` header is honored (capped) with up to 10 % extra
+        jitter; otherwise "full jitter": uniform in ``[0, min(max, base * 2**n)]``.
+        """
+        if retry_after:
+            try:
+                wait_for = min(float(retry_after), RETRY_AFTER_MAX_S)
+            except ValueError:
+                wait_for = -1.0
+            if wait_for >= 0.0:
+                return wait_for * (1.0 + 0.1 * self._rng.random())
+        return self._rng.uniform(0.0, min(policy.max_s, policy.base_s * (2**attempt)))
+
     async def _async_request(self, method: str, path: str, **kwargs: Any) -> dict[str, Any]:
-        await self._get_rate_limiter(path).acquire()
+        """Issue a request through the circuit breaker with per-class retries.
+
+        Transport failures, timeouts, 429s and 5xx responses are retried with
+        back-off (see :data:`DEFAULT_RETRY_POLICIES`). What is still failing
+        after the retries counts against the breaker. While the breaker is open
+        the request is refused up front with :class:`FlairApiUnavailable`.
+        Other 4xx answers mean the service is up and count as successes.
+        """
+        breaker = self.breaker
+        if not breaker.allow():
+            raise FlairApiUnavailable(f"Flair API circuit open; skipped {method} {path}")
+        try:
+            result = await self._async_request_with_retries(method, path, **kwargs)
+        except (TimeoutError, aiohttp.ClientError, FlairApiTransientError):
+            breaker.record_failure()
+            raise
+        except FlairApiError:
+            breaker.record_success()
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record_success()
+        return result
+
+    async def _async_request_with_retries(self, method: str, path: str, **kwargs: Any) -> dict[str, Any]:
+        limiter = self._get_rate_limiter(path)
         await self.async_authenticate()
         headers = kwargs.pop("headers", {})
         headers.setdefault("Accept", "application/vnd.api+json")
 
-        async def _do_request() -> aiohttp.ClientResponse:
+        key = endpoint_key(method, path)
+        telemetry = self.telemetry
+        policy = self.retry_policies[self._request_class(method, path)]
+
+        async def _do_request(retry: bool) -> aiohttp.ClientResponse:
+            await limiter.acquire()
             request_headers = dict(headers)
-            request_headers["Authorization"] = f"Bearer {self._access_token}"
-            return await self._session.request(
-                method,
-                f"{self.BASE_URL}{path}",
-                headers=request_headers,
-                timeout=aiohttp.ClientTimeout(total=10),
-                **kwargs,
+            request_headers["Authorization"] = f"Bearer {self._token.access_token}"
+            started = time.perf_counter()
+            try:
+                resp = await self._session.request(
+                    method,
+                    f"{self.BASE_URL}{path}",
+                    headers=request_headers,
+                    timeout=aiohttp.ClientTimeout(total=10),
+                    **kwargs,
+                )
+            except (TimeoutError, aiohttp.ClientError):
+                telemetry.record(key, None, time.perf_counter() - started, retry=retry)
+                raise
+            # Latency is time to response headers; the body is read below.
+            telemetry.record(
+                key, resp.status, time.perf_counter() - started, self._response_bytes(resp), retry
             )
+            return resp
 
         auth_retried = False
-        rate_retried = False
+        attempt = 0
         while True:
-            async with await _do_request() as resp:
-                if resp.status in {401, 403}:
-                    # Token may have expired mid-flight; refresh once and retry.
-                    self._access_token = None
-                    if auth_retried:
-                        raise FlairApiAuthError("Flair token expired or unauthorized")
-                    auth_retried = True
-                    await self.async_authenticate()
-                    continue
-                if resp.status == 429 and not rate_retried:
-                    rate_retried = True
-                    retry_after = resp.headers.get("Retry-After")
-                    try:
-                        wait_for = float(retry_after) if retry_after else 1.0
-                    except ValueError:
-                        wait_for = 1.0
-                    await asyncio.sleep(wait_for)
-                    continue
-                if resp.status >= 400:
-                    body = await resp.text()
-                    raise FlairApiError(f"Flair API error: HTTP {resp.status}: {body}")
-                try:
-                    return await resp.json()
-                except (aiohttp.ContentTypeError, json.JSONDecodeError) as err:
-                    body = await resp.text()
-                    raise FlairApiError(f"Flair API non-JSON response: HTTP {resp.status}: {body}") from err
+            retry_after: str | None = None
+            try:
+                async with await _do_request(auth_retried or attempt > 0) as resp:
+                    if resp.status in {401, 403}:
+                        # Token may have expired mid-flight; refresh once and retry.
+                        self._token.access_token = None
+                        if auth_retried:
+                            raise FlairApiAuthError("Flair token expired or unauthorized")
+                        auth_retried = True
+                        await self.async_authenticate()
+                        continue
+                    if resp.status == 429 or resp.status >= 500:
+                        body = await resp.text()
+                        if attempt >= policy.retries:
+                            raise FlairApiTransientError(f"Flair API error: HTTP {resp.status}: {body}")
+                        retry_after = resp.headers.get("Retry-After")
+                    elif resp.status >= 400:
+                        body = await resp.text()
+                        raise FlairApiError(f"Flair API error: HTTP {resp.status}: {body}")
+                    else:
+                        try:
+                            return await resp.json()
+                        except (aiohttp.ContentTypeError, json.JSONDecodeError) as err:
+                            telemetry.record_error(key)
+                            body = await resp.text()
+                            raise FlairApiError(
+                                f"Flair API non-JSON response: HTTP {resp.status}: {body}"
+                            ) from err
+            except (TimeoutError, aiohttp.ClientError):
+                if attempt >= policy.retries:
+                    raise
+            await self._sleep(self._retry_delay(policy, attempt, retry_after))
+            attempt += 1
 
     async def async_get_structures(self) -> list[dict[str, str]]:
         """Return a list of structures with id and name."""
@@ -291,3 +478,55 @@ class FlairApi:
                 }
             )
         return devices
+
+
+class FlairApiHub:
+    """Per-account state shared by every config entry using one client id.
+
+    Flair meters requests per account, so two structures under one account
+    must not each run their own limiters. Entries :meth:`acquire` a
+    :class:`FlairApi` from the hub; all of them share one token and one
+    request budget, which is split round-robin between entries while it is
+    saturated. Each client keeps its own telemetry and circuit breaker so
+    per-entry diagnostics and budgets stay meaningful. The hub is
+    reference-counted: :meth:`release` reports when the last entry is gone.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, client_id: str, client_secret: str) -> None:
+        self._session = session
+        self.client_id = client_id
+        self._client_secret = client_secret
+        self.token = FlairToken()
+        self.basic_limiter = FairRateLimiter(BASIC_RATE_PER_S)
+        self.search_limiter = FairRateLimiter(SEARCH_RATE_PER_S)
+        self._clients: dict[str, FlairApi] = {}
+
+    @property
+    def refcount(self) -> int:
+        return len(self._clients)
+
+    def acquire(self, owner: str, client_secret: str) -> FlairApi:
+        """Client billed to ``owner`` (an entry id); re-acquiring returns the same one."""
+        if client_secret != self._client_secret:
+            # Rotated secret: the newest credentials win and the token is re-fetched.
+            self._client_secret = client_secret
+            self.token.access_token = None
+            for existing in self._clients.values():
+                existing._client_secret = client_secret
+        client = self._clients.get(owner)
+        if client is None:
+            client = FlairApi(
+                self._session,
+                self.client_id,
+                client_secret,
+                token=self.token,
+                basic_limiter=self.basic_limiter.for_client(owner),
+                search_limiter=self.search_limiter.for_client(owner),
+            )
+            self._clients[owner] = client
+        return client
+
+    def release(self, owner: str) -> bool:
+        """Drop ``owner``'s client; True once no entry holds the hub."""
+        self._clients.pop(owner, None)
+        return not self._clients
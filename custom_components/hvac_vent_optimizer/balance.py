@@ -21,7 +21,10 @@ setpoint helper live here.
 
 from __future__ import annotations
 
+import bisect
 import logging
+import math
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -207,6 +210,9 @@ class AllocSettings:
     # to be worth the vent travel (R7.3). Defaults match the design table.
     spread_guardrail_c: float = 1.0
     spread_improvement_deadband_c: float = 0.3
+    # ``mpc`` plan selection (:func:`plan_mpc`): °C of predicted spread that one
+    # room's full 0→100 % travel is worth, so a marginal gain does not move vents.
+    mpc_movement_cost_c: float = 0.2
 
 
 @dataclass(frozen=True)
@@ -225,6 +231,9 @@ class AllocResult:
         floor_binding: ``True`` if the safety floor had to raise apertures.
             The floor itself is applied by the choke point in a later task;
             A1 reports ``False`` here (clean seam — see allocate step 4).
+        pre_floor_targets: the plan before any floor raise, for allocators
+            that fold the floor in (:func:`allocate_exact`); ``None`` when
+            ``targets`` is already pre-floor.
     """
 
     targets: dict[str, float]
@@ -232,6 +241,7 @@ class AllocResult:
     predicted_spread_c: float
     airflow_limited: frozenset[str]
     floor_binding: bool
+    pre_floor_targets: dict[str, float] | None = None
 
 
 # Tiny positive guards so degenerate inputs (e_i≈0, leak≈1) cannot raise
@@ -337,27 +347,29 @@ def predicted_spread(
     not inflate the spread. The spread is ``max - min`` over active rooms
     (``0.0`` when fewer than two are active). Pure and deterministic.
     """
-    predicted: list[float] = []
-    for room in rooms:
-        if not room.active:
-            continue
-        aperture = max(0.0, min(1.0, targets.get(room.room_id, 0.0) / 100.0))
-        rate = _room_rate(room, aperture)
-        satisfied = is_satisfied(mode, setpoint_c, room.temp_c, 0.0)
-        if mode == MODE_COOLING:
-            temp = room.temp_c - rate * horizon_min
-            if satisfied:
-                temp = max(temp, setpoint_c)
-        else:
-            temp = room.temp_c + rate * horizon_min
-            if satisfied:
-                temp = min(temp, setpoint_c)
-        predicted.append(temp)
+    predicted = [
+        _predicted_temp(room, targets.get(room.room_id, 0.0), mode, setpoint_c, horizon_min)
+        for room in rooms
+        if room.active
+    ]
     if len(predicted) < 2:
         return 0.0
     return max(predicted) - min(predicted)
 
 
+def _predicted_temp(
+    room: RoomAllocInput, pct: float, mode: str, setpoint_c: float, horizon_min: float
+) -> float:
+    """One room's projected temperature at ``horizon_min`` (see :func:`predicted_spread`)."""
+    rate = _room_rate(room, max(0.0, min(1.0, pct / 100.0)))
+    satisfied = is_satisfied(mode, setpoint_c, room.temp_c, 0.0)
+    if mode == MODE_COOLING:
+        temp = room.temp_c - rate * horizon_min
+        return max(temp, setpoint_c) if satisfied else temp
+    temp = room.temp_c + rate * horizon_min
+    return min(temp, setpoint_c) if satisfied else temp
+
+
 # ===========================================================================
 # Task 11 — Cross-coupling guard (design A4, R6) + optional duct signals.
 #
@@ -635,6 +647,400 @@ def allocate(
     )
 
 
+# ===========================================================================
+# Exact lattice allocation — synchronized convergence on the granularity grid.
+#
+# ``allocate`` solves the continuous problem and then rounds each aperture on its
+# own. The floor choke point then pads the rounded plan one granularity step at
+# a time and re-checks the combined open % after every step. ``allocate_exact``
+# works on the lattice directly and meets the floor in one pass:
+#
+# 1. For the shared finish ``tau*`` each room's aperture comes from the monotone
+#    curve inverse. Of the two lattice points around it, the room takes the one
+#    whose predicted finish is closer to ``tau*``.
+# 2. If that plan is below the floor, the missing open % is handed out in the
+#    choke point's own order: largest signed error first (R3.4). Each room gets
+#    what it can take up to 100 %, and the last one only the lattice steps the
+#    floor still needs. The choke point pads the same rooms in the same order,
+#    so the spread it would reach is unchanged. It just takes one pass over the
+#    rooms instead of one re-check per step.
+#
+# The cost is ``O(rooms log rooms)`` and does not depend on the granularity.
+# ===========================================================================
+
+
+def _floor_shortfall(plan: dict[str, float], weights: dict[str, float], settings: AllocSettings) -> float:
+    """Vent-weighted open % still missing to reach the floor (``<= 0`` when met).
+
+    The :func:`combined_open_pct` metric over ``plan`` expanded per vent
+    (``weights`` = vents per room), without building the expansion.
+    """
+    conventional = max(0, settings.conventional_vents)
+    inactive_devices = settings.inactive_count if settings.inactive_open_pct_sum > 0.0 else 0
+    devices = sum(weights.get(rid, 1.0) for rid in plan) + conventional + inactive_devices
+    if devices <= 0:
+        return 0.0
+    opened = (
+        sum(weights.get(rid, 1.0) * pct for rid, pct in plan.items())
+        + conventional * settings.conventional_open_pct
+        + settings.inactive_open_pct_sum
+    )
+    return _clamp_safety_floor(settings.safety_floor_pct) * devices - opened
+
+
+@dataclass(frozen=True)
+class _LatticeRoom:
+    """Per-room constants for :func:`allocate_exact` (unsatisfied rooms only)."""
+
+    room: RoomAllocInput
+    err: float
+    leak: float
+    flow_knee: float
+    knee_pct: float
+    cap: float
+
+
+def allocate_exact(
+    rooms: list[RoomAllocInput],
+    setpoint_c: float,
+    mode: str,
+    settings: AllocSettings,
+    duct: DuctSignals | None = None,
+) -> AllocResult:
+    """Synchronized-convergence allocation on the granularity lattice, floor included.
+
+    Same classification, bottleneck horizon, airflow-limited detection and
+    cross-coupling guard as :func:`allocate`, but the targets are already
+    multiples of ``granularity``. They also already meet the safety floor
+    whenever active not-yet-satisfied rooms can carry it. ``floor_binding``
+    reports whether the floor raised anything, and ``pre_floor_targets`` then
+    holds the plan before the raise. :func:`apply_safety_floor` stays the choke
+    point after this and is a no-op when the floor is met. It still owns the
+    inactive last resort. Pure and deterministic.
+    """
+    active = [room for room in rooms if room.active]
+    step = float(settings.granularity) if settings.granularity > 0 else 0.0
+    errors = {room.room_id: _signed_error(mode, setpoint_c, room.temp_c) for room in active}
+
+    lattice: list[_LatticeRoom] = []
+    tau_star = 0.0
+    for room in active:
+        if is_satisfied(mode, setpoint_c, room.temp_c, settings.hysteresis_c):
+            continue
+        knee_frac = _room_knee_frac(room)
+        rate_knee = _room_rate(room, knee_frac)
+        err = errors[room.room_id]
+        tau_star = max(tau_star, err / rate_knee if rate_knee > _EPS else float("inf"))
+        lattice.append(
+            _LatticeRoom(
+                room=room,
+                err=err,
+                leak=_room_leak(room),
+                flow_knee=_room_flow_at_knee(room),
+                knee_pct=knee_frac * 100.0,
+                cap=_round_to_granularity(knee_frac * 100.0, settings.granularity),
+            )
+        )
+
+    def _finish(lr: _LatticeRoom, pct: float) -> float:
+        rate = _room_rate(lr.room, pct / 100.0)
+        return lr.err / rate if rate > _EPS else float("inf")
+
+    def _aperture(lr: _LatticeRoom, tau: float) -> float:
+        """Lattice aperture finishing closest to ``tau`` (capped at the knee)."""
+        if tau <= _EPS or tau == float("inf") or lr.room.efficiency <= _EPS:
+            return lr.cap
+        required_flow = min(max(lr.err / tau / lr.room.efficiency, lr.leak), lr.flow_knee)
+        pct = min(lr.knee_pct, _room_inverse_frac(lr.room, required_flow) * 100.0)
+        if step <= 0.0:
+            return pct
+        low = min(lr.cap, step * int(pct / step + _EPS))
+        high = min(lr.cap, low + step)
+        if high <= low or pct - low <= _EPS:
+            return low
+        return low if abs(_finish(lr, low) - tau) < abs(_finish(lr, high) - tau) else high
+
+    weights = {room.room_id: float(len(room.vent_ids) or 1) for room in active}
+
+    # 1. Synchronized plan at tau*, then the same cross-coupling guard as allocate.
+    targets = {room.room_id: 0.0 for room in active}
+    for lr in lattice:
+        targets[lr.room.room_id] = _aperture(lr, tau_star)
+    margin = settings.airflow_limited_margin_pct
+    airflow_limited = frozenset(
+        lr.room.room_id
+        for lr in lattice
+        if targets[lr.room.room_id] >= lr.knee_pct - margin and lr.err > settings.airflow_limited_error_c
+    )
+    targets = apply_cross_coupling(targets, active, mode, setpoint_c, settings, airflow_limited, duct=duct)
+    unconstrained = dict(targets)
+
+    # 2. Floor in one pass, largest signed error first (apply_safety_floor's order).
+    missing = _floor_shortfall(targets, weights, settings)
+    if missing > 0.0:
+        need_order = sorted(
+            (room for room in active if room.signed_error_c > 0.0),
+            key=lambda room: (room.signed_error_c, room.room_id),
+            reverse=True,
+        )
+        for room in need_order:
+            if missing <= 0.0:
+                break
+            rid = room.room_id
+            raise_by = min(100.0 - targets[rid], missing / weights[rid])
+            if step > 0.0:
+                raise_by = min(100.0 - targets[rid], step * math.ceil(raise_by / step - _EPS))
+            if raise_by <= 0.0:
+                continue
+            targets[rid] += raise_by
+            missing -= raise_by * weights[rid]
+    floor_binding = targets != unconstrained
+
+    # Satisfied and leak-pinned rooms report 0.0, as in :func:`allocate`.
+    finish = {room.room_id: 0.0 for room in active}
+    for lr in lattice:
+        if targets[lr.room.room_id] > 0.0:
+            finish[lr.room.room_id] = _finish(lr, targets[lr.room.room_id])
+
+    return AllocResult(
+        targets=targets,
+        predicted_finish_min=finish,
+        predicted_spread_c=predicted_spread(active, targets, mode, setpoint_c, settings.horizon_min),
+        airflow_limited=airflow_limited,
+        floor_binding=floor_binding,
+        pre_floor_targets=unconstrained if floor_binding else None,
+    )
+
+
+# ===========================================================================
+# ``mpc`` strategy — model-predictive plan selection.
+#
+# ``allocate`` plans one horizon (tau*) from instantaneous rates. ``plan_mpc``
+# scores whole aperture plans instead: every active room is rolled forward by the
+# closed-loop law the simulator steps (``advance_temp``: the signed error falls
+# by ``e_i * flow_i(a_i)`` per minute) and the plan with the lowest predicted
+# spread, averaged over the horizon, plus a movement cost wins. The law is linear
+# in time while the apertures hold, so the rollout is evaluated in closed form at
+# a few checkpoints; a room reaching setpoint stays there (the controller closes
+# it on the next poll). The search is a coordinate descent warm-started from
+# ``allocate``: a coarse pass over half steps, then a fine pass one
+# ``granularity`` either side of each room's pick. Satisfied rooms stay closed, and the
+# result still goes through the cross-coupling guard and the safety floor.
+# ===========================================================================
+
+# Rollout checkpoints, evenly spaced up to ``horizon_min``.
+MPC_CHECKPOINTS: int = 3
+# Coarse-pass aperture step (%), before refining at ``granularity``.
+MPC_COARSE_STEP_PCT: float = 50.0
+# Coordinate-descent sweeps per pass. Each sweep visits every free room once, so
+# the work is bounded at ``O(sweeps * rooms * (candidates + rooms) * checkpoints)``.
+# A second sweep cost about 60 % more rollout scores with learned curves for
+# picks it rarely changed; with one, a 30-room house with learned curves plans
+# in about 1.5 ms, two to three times ``allocate``.
+MPC_MAX_SWEEPS: int = 1
+# Weight on the largest remaining error at the horizon, so that equalizing by
+# starving every room never beats a plan that makes progress.
+MPC_RESIDUAL_WEIGHT: float = 0.25
+
+
+def _extremes_at(rows: list[tuple[float, ...]], k: int) -> list[float]:
+    """``[max, argmax, 2nd max, its index, min, argmin, 2nd min, its index]`` at ``k``."""
+    hi1 = hi2 = float("-inf")
+    lo1 = lo2 = float("inf")
+    hi1_i = hi2_i = lo1_i = lo2_i = -1
+    for i, row in enumerate(rows):
+        value = row[k]
+        if value > hi1:
+            hi1, hi1_i, hi2, hi2_i = value, i, hi1, hi1_i
+        elif value > hi2:
+            hi2, hi2_i = value, i
+        if value < lo1:
+            lo1, lo1_i, lo2, lo2_i = value, i, lo1, lo1_i
+        elif value < lo2:
+            lo2, lo2_i = value, i
+    return [hi1, hi1_i, hi2, hi2_i, lo1, lo1_i, lo2, lo2_i]
+
+
+def _update_extremes(ext: list[list[float]], rows: list[tuple[float, ...]], i: int) -> None:
+    """Refresh ``ext`` after ``rows[i]`` changed (rescan only where ``i`` was a top two)."""
+    row = rows[i]
+    for k, entry in enumerate(ext):
+        if i in (entry[1], entry[3], entry[5], entry[7]):
+            ext[k] = _extremes_at(rows, k)
+            continue
+        value = row[k]
+        if value > entry[0]:
+            entry[2], entry[3], entry[0], entry[1] = entry[0], entry[1], value, i
+        elif value > entry[2]:
+            entry[2], entry[3] = value, i
+        if value < entry[4]:
+            entry[6], entry[7], entry[4], entry[5] = entry[4], entry[5], value, i
+        elif value < entry[6]:
+            entry[6], entry[7] = value, i
+
+
+def _mpc_rollout(error: float, rate: float, times: list[float]) -> tuple[float, ...]:
+    """Signed error at each of ``times`` while the aperture holds.
+
+    ``max(err - rate * t, min(err, 0))``: a room reaching setpoint stays there
+    (the controller closes it on the next poll), and one already past it does
+    not drift further. Overshoot the controller would stop is never scored as
+    spread, so fast rooms are not penalized for finishing early.
+    """
+    floor = error if error < 0.0 else 0.0
+    row = [error - rate * t for t in times]
+    return tuple([value if value > floor else floor for value in row])
+
+
+def _mpc_score(others: list[tuple[float, float]], row: tuple[float, ...], movement: float) -> float:
+    """Objective of one room's candidate ``row`` against the other rooms' extremes.
+
+    ``others[k]`` is ``(max, min)`` of every other room's error at checkpoint
+    ``k``. Only what the candidate adds is scored: how far it leaves the other
+    rooms' envelope (the spread it adds), how far it raises the largest error
+    at the horizon, and its own travel. Scores therefore compare only within
+    one room's candidates.
+    """
+    excess = 0.0
+    for (hi, lo), value in zip(others, row, strict=True):
+        if value > hi:
+            excess += value - hi
+        elif value < lo:
+            excess += lo - value
+    over = row[-1] - max(others[-1][0], 0.0)
+    residual = over if over > 0.0 else 0.0
+    return excess / len(row) + MPC_RESIDUAL_WEIGHT * residual + movement
+
+
+def plan_mpc(
+    rooms: list[RoomAllocInput],
+    setpoint_c: float,
+    mode: str,
+    settings: AllocSettings,
+    duct: DuctSignals | None = None,
+) -> AllocResult:
+    """Model-predictive allocation: best plan by forward rollout (``mpc``).
+
+    The objective for a plan ``a`` is::
+
+        J(a) = mean_k spread(t_k) + MPC_RESIDUAL_WEIGHT * max_i err_i(H)+
+               + mpc_movement_cost_c * sum_i |a_i - current_i| / 100
+
+    with ``err_i(t) = max(err_i - e_i * flow_i(a_i) * t, min(err_i, 0))`` at
+    ``MPC_CHECKPOINTS`` times up to ``horizon_min``. Candidate apertures are
+    multiples of ``granularity`` capped at each room's knee. The search only
+    accepts strict improvements and visits rooms in input order, so it is
+    deterministic. Returns an :class:`AllocResult` shaped like :func:`allocate`'s
+    (pre-floor; ``floor_binding`` is ``False``).
+    """
+    seed = allocate(rooms, setpoint_c, mode, settings, duct)
+    active = [room for room in rooms if room.active]
+    free = [
+        i
+        for i, room in enumerate(active)
+        if not is_satisfied(mode, setpoint_c, room.temp_c, settings.hysteresis_c)
+    ]
+    if not free:
+        return seed
+    free_set = set(free)
+
+    step = float(settings.granularity) if settings.granularity > 0 else 1.0
+    horizon = max(settings.horizon_min, _EPS)
+    times = [horizon * (k + 1) / MPC_CHECKPOINTS for k in range(MPC_CHECKPOINTS)]
+    move_cost = settings.mpc_movement_cost_c / 100.0
+    errors = [_signed_error(mode, setpoint_c, room.temp_c) for room in active]
+    caps = [_round_to_granularity(_room_knee_frac(room) * 100.0, settings.granularity) for room in active]
+    cache: list[dict[float, tuple[float, ...]]] = [{} for _ in active]
+
+    def _rollout(i: int, pct: float) -> tuple[float, ...]:
+        row = cache[i].get(pct)
+        if row is None:
+            rate = _room_rate(active[i], pct / 100.0)
+            row = cache[i][pct] = _mpc_rollout(errors[i], rate, times)
+        return row
+
+    plan = {i: seed.targets.get(active[i].room_id, 0.0) for i in range(len(active))}
+    for i in plan:
+        plan[i] = min(plan[i], caps[i]) if i in free_set else 0.0
+    rows = [_rollout(i, plan[i]) for i in range(len(active))]
+
+    # Coarse candidates: half steps up to the knee, plus the knee itself and
+    # the current aperture (holding is always on the table).
+    coarse: dict[int, list[float]] = {}
+    for i in free:
+        levels = {caps[i], _round_to_granularity(active[i].current_open, settings.granularity)}
+        pct = 0.0
+        while pct < caps[i]:
+            levels.add(_round_to_granularity(pct, settings.granularity))
+            pct += MPC_COARSE_STEP_PCT
+        coarse[i] = sorted(levels)
+
+    ext = [_extremes_at(rows, k) for k in range(MPC_CHECKPOINTS)]
+
+    def _sweep(fine: bool, seen: dict[int, list[tuple[float, float]]]) -> bool:
+        improved = False
+        for i in free:
+            others = [(e[2] if e[1] == i else e[0], e[6] if e[5] == i else e[4]) for e in ext]
+            # A room's best pick depends only on the other rooms' extremes; if
+            # those are unchanged since its last visit, so is its pick.
+            if seen.get(i) == others:
+                continue
+            seen[i] = others
+            current = active[i].current_open
+            best_pct = plan[i]
+            best = _mpc_score(others, rows[i], abs(best_pct - current) * move_cost)
+            levels = (best_pct - step, best_pct + step) if fine else coarse[i]
+            for pct in levels:
+                if pct == best_pct or pct < 0.0 or pct > caps[i]:
+                    continue
+                # The travel alone is a lower bound on the score: skip the rollout.
+                movement = abs(pct - current) * move_cost
+                if movement >= best - _EPS:
+                    continue
+                score = _mpc_score(others, _rollout(i, pct), movement)
+                if score < best - _EPS:
+                    best, best_pct = score, pct
+            if best_pct != plan[i]:
+                plan[i] = best_pct
+                rows[i] = _rollout(i, best_pct)
+                _update_extremes(ext, rows, i)
+                seen.pop(i, None)
+                improved = True
+        return improved
+
+    for fine in (False, True):
+        seen: dict[int, list[tuple[float, float]]] = {}
+        for _ in range(MPC_MAX_SWEEPS):
+            if not _sweep(fine, seen):
+                break
+
+    targets = {room.room_id: plan[i] for i, room in enumerate(active)}
+    finish: dict[str, float] = {}
+    for i, room in enumerate(active):
+        rate = _room_rate(room, plan[i] / 100.0)
+        if i in free_set and plan[i] > 0.0:
+            finish[room.room_id] = errors[i] / rate if rate > _EPS else float("inf")
+        else:
+            finish[room.room_id] = 0.0
+
+    # A3 as in :func:`allocate`: pinned at/near its own knee and still off-target.
+    margin = settings.airflow_limited_margin_pct
+    airflow_limited = frozenset(
+        active[i].room_id
+        for i in free
+        if plan[i] >= caps[i] - margin and errors[i] > settings.airflow_limited_error_c
+    )
+    targets = apply_cross_coupling(targets, active, mode, setpoint_c, settings, airflow_limited, duct=duct)
+
+    return AllocResult(
+        targets=targets,
+        predicted_finish_min=finish,
+        predicted_spread_c=predicted_spread(active, targets, mode, setpoint_c, settings.horizon_min),
+        airflow_limited=airflow_limited,
+        floor_binding=False,
+    )
+
+
 # ===========================================================================
 # Task 10.2 — CRITICAL airflow-safety floor (design A2, R3, decision D1).
 #
@@ -947,3 +1353,233 @@ def should_apply(
     proposed_spread = predicted_spread(rooms, proposed, gate.mode, gate.setpoint_c, horizon)
     improvement = current_spread - proposed_spread
     return improvement >= settings.spread_improvement_deadband_c
+
+
+# ===========================================================================
+# Movement-aware plan selection (R7, vent write traffic).
+#
+# The dispatch loop drops moves after the fact (deadband, minimum percent,
+# cooldown), so what gets executed can differ from the plan whose spread was
+# predicted. :func:`select_fewest_moves` runs before the floor choke point.
+# Among the plans that hold some rooms at their current position and stay
+# within ``spread_improvement_deadband_c`` of the planned spread, it picks the
+# one that commands the fewest vents. That is the same tolerance the hold gate
+# already treats as "not worth the travel".
+#
+# Each room has two candidates, its planned target and its current position.
+# Rooms are tried greedily: ``sticky`` rooms first (the coordinator would hold
+# them anyway), then the rooms whose hold shifts their projection least, with
+# multi-vent rooms first on ties since they save the most PATCHes. A hold is
+# kept if the spread stays within budget, the largest predicted error does not
+# grow, and the plan does not drop below the safety floor. The second rule
+# means the laggard is never slowed down to save a write. The checks reuse the
+# top-two extremes from ``mpc``, so a rejected hold is O(1) and an accepted one
+# at most O(rooms).
+# ===========================================================================
+
+
+def select_fewest_moves(
+    targets: dict[str, float],
+    rooms: list[RoomAllocInput],
+    mode: str,
+    setpoint_c: float,
+    settings: AllocSettings,
+    *,
+    sticky: frozenset[str] = frozenset(),
+) -> tuple[dict[str, float], frozenset[str]]:
+    """Hold rooms at their current position while the predicted spread allows.
+
+    Returns ``(new_targets, held)``. ``held`` is the set of rooms moved back to
+    ``current_open`` (rounded to ``granularity``). Every other room keeps its
+    planned target. The predicted spread of ``new_targets`` stays within
+    ``settings.spread_improvement_deadband_c`` of the spread of ``targets``.
+    The largest predicted error at the horizon does not grow. A hold never takes
+    a floor-feasible plan below the safety floor, and a plan already short of
+    the floor only accepts holds that open. A satisfied room is never held
+    more open than planned, since the projection cannot see overshoot.
+
+    ``sticky`` names rooms the caller will not command this poll anyway (group
+    cooldown, deadband, minimum percent), so they are tried first and the plan
+    predicts what will actually be executed. Rooms outside ``targets`` and
+    inactive rooms are ignored. Pure and deterministic.
+    """
+    plan = dict(targets)
+    active = [room for room in rooms if room.active and room.room_id in plan]
+    if not active:
+        return plan, frozenset()
+    horizon = settings.horizon_min
+    weights = {room.room_id: float(len(room.vent_ids) or 1) for room in active}
+    sign = 1.0 if mode == MODE_COOLING else -1.0
+
+    def _residual(room: RoomAllocInput, pct: float) -> float:
+        return sign * (_predicted_temp(room, pct, mode, setpoint_c, horizon) - setpoint_c)
+
+    # Signed error at the horizon: its max - min is the predicted spread.
+    rows: list[tuple[float, ...]] = [(_residual(room, plan[room.room_id]),) for room in active]
+    ext = [_extremes_at(rows, 0)]
+    worst = ext[0][0]
+    budget = worst - ext[0][4] + settings.spread_improvement_deadband_c
+    missing = _floor_shortfall(plan, weights, settings)
+
+    candidates: list[tuple[int, float, float, str, int, float, float]] = []
+    for i, room in enumerate(active):
+        current = _round_to_granularity(room.current_open, settings.granularity)
+        if current == plan[room.room_id]:
+            continue
+        # The projection clamps satisfied rooms at the setpoint, so it cannot
+        # see overshoot: never keep one more open than planned (R8).
+        if current > plan[room.room_id] and is_satisfied(
+            mode, setpoint_c, room.temp_c, settings.hysteresis_c
+        ):
+            continue
+        held_err = _residual(room, current)
+        tier = 0 if room.room_id in sticky else 1
+        shift = abs(held_err - rows[i][0])
+        candidates.append((tier, shift, -weights[room.room_id], room.room_id, i, current, held_err))
+    candidates.sort()
+
+    held: set[str] = set()
+    for *_, rid, i, current, held_err in candidates:
+        lowered = (plan[rid] - current) * weights[rid]
+        if lowered > 0.0 and missing + lowered > 0.0:
+            continue
+        hi, hi_i, hi2, _, lo, lo_i, lo2, _ = ext[0]
+        others_hi = hi2 if hi_i == i else hi
+        others_lo = lo2 if lo_i == i else lo
+        new_hi = max(others_hi, held_err)
+        if new_hi > worst + _EPS or new_hi - min(others_lo, held_err) > budget + _EPS:
+            continue
+        plan[rid] = current
+        rows[i] = (held_err,)
+        _update_extremes(ext, rows, i)
+        missing += lowered
+        held.add(rid)
+    return plan, frozenset(held)
+
+
+# ---------------------------------------------------------------------------
+# Incremental active-room observability (R13.1/R13.3/R14.1/R5.4)
+# ---------------------------------------------------------------------------
+# The spread, max error, signed errors and airflow-limited set used to be
+# rebuilt from every room each poll. With room temperatures arriving one
+# sensor at a time they are kept incrementally instead: one cell per active
+# room plus the active temperatures in sorted order, so a single room's change
+# costs a bisect (the list is a few dozen rooms) and the spread and max error
+# read off the two ends. Both are O(1): the largest |signed error| is at the
+# hottest or the coldest room whatever the mode.
+
+
+class ActiveRoomStats:
+    """Per-room observability cells with O(1) spread / max-error reads.
+
+    :meth:`configure` sets the conditioning mode, the shared setpoint and the
+    airflow-limited thresholds (a change re-derives every cell);
+    :meth:`update_room` / :meth:`discard` apply one room's change and report
+    whether anything moved. ``signed_errors`` (rounded to 0.01 °C),
+    ``airflow_rooms`` and ``airflow_vents`` are kept in place so a caller may
+    hold on to them. Pure and HA-free like the rest of this module.
+    """
+
+    def __init__(self) -> None:
+        self.mode = MODE_COOLING
+        self.setpoint_c = 0.0
+        self.margin_pct = 0.0
+        self.error_c = 0.0
+        # room id -> (temp °C, representative vent open %, vent ids)
+        self._cells: dict[str, tuple[float, float, tuple[str, ...]]] = {}
+        self._vent_rooms: dict[str, str] = {}
+        self._temps: list[float] = []
+        self.signed_errors: dict[str, float] = {}
+        self.airflow_rooms: set[str] = set()
+        self.airflow_vents: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def __contains__(self, room_id: object) -> bool:
+        return room_id in self._cells
+
+    @property
+    def spread(self) -> float:
+        """Max minus min active-room temperature; ``0.0`` for fewer than two rooms."""
+        return self._temps[-1] - self._temps[0] if len(self._temps) >= 2 else 0.0
+
+    @property
+    def max_error(self) -> float:
+        """Largest absolute active-room error vs the setpoint (``0.0`` when empty)."""
+        if not self._temps:
+            return 0.0
+        return max(abs(self._temps[-1] - self.setpoint_c), abs(self._temps[0] - self.setpoint_c))
+
+    def room_for_vent(self, vent_id: str) -> str | None:
+        """The tracked room ``vent_id`` belongs to, if any."""
+        return self._vent_rooms.get(vent_id)
+
+    def vents(self, room_id: str) -> tuple[str, ...]:
+        """The room's vent ids, representative first (empty when untracked)."""
+        cell = self._cells.get(room_id)
+        return cell[2] if cell is not None else ()
+
+    def configure(self, mode: str, setpoint_c: float, margin_pct: float, error_c: float) -> bool:
+        """Set mode, setpoint and thresholds; re-derive every cell if one changed."""
+        settings = (mode, float(setpoint_c), float(margin_pct), float(error_c))
+        if settings == (self.mode, self.setpoint_c, self.margin_pct, self.error_c):
+            return False
+        self.mode, self.setpoint_c, self.margin_pct, self.error_c = settings
+        self.airflow_rooms.clear()
+        self.airflow_vents.clear()
+        for room_id in self._cells:
+            self._derive(room_id)
+        return True
+
+    def update_room(self, room_id: str, temp_c: float, open_pct: float, vent_ids: Iterable[str] = ()) -> bool:
+        """Record one active room's temperature and aperture; ``False`` if unchanged."""
+        cell = (float(temp_c), float(open_pct), tuple(vent_ids))
+        old = self._cells.get(room_id)
+        if old == cell:
+            return False
+        if old is not None:
+            self._drop(room_id, old)
+        self._cells[room_id] = cell
+        for vent_id in cell[2]:
+            self._vent_rooms[vent_id] = room_id
+        bisect.insort(self._temps, cell[0])
+        self._derive(room_id)
+        return True
+
+    def discard(self, room_id: str) -> bool:
+        """Forget a room that went inactive or lost its temperature."""
+        old = self._cells.pop(room_id, None)
+        if old is None:
+            return False
+        self._drop(room_id, old)
+        self.signed_errors.pop(room_id, None)
+        return True
+
+    def retain(self, room_ids: Iterable[str]) -> set[str]:
+        """Discard every tracked room not in ``room_ids``; returns the ones dropped."""
+        stale = set(self._cells).difference(room_ids)
+        for room_id in stale:
+            self.discard(room_id)
+        return stale
+
+    def _drop(self, room_id: str, cell: tuple[float, float, tuple[str, ...]]) -> None:
+        index = bisect.bisect_left(self._temps, cell[0])
+        del self._temps[index]
+        for vent_id in cell[2]:
+            if self._vent_rooms.get(vent_id) == room_id:
+                del self._vent_rooms[vent_id]
+        if room_id in self.airflow_rooms:
+            self.airflow_rooms.discard(room_id)
+            self.airflow_vents.difference_update(cell[2])
+
+    def _derive(self, room_id: str) -> None:
+        temp_c, open_pct, vent_ids = self._cells[room_id]
+        signed = _signed_error(self.mode, self.setpoint_c, temp_c)
+        self.signed_errors[room_id] = round(signed, 2)
+        if open_pct >= 100.0 - self.margin_pct and signed > self.error_c:
+            self.airflow_rooms.add(room_id)
+            self.airflow_vents.update(vent_ids)
+        elif room_id in self.airflow_rooms:
+            self.airflow_rooms.discard(room_id)
+            self.airflow_vents.difference_update(vent_ids)
@@ -49,6 +49,10 @@ class FlairPuckOccupancyBinarySensor(CoordinatorEntity, BinarySensorEntity):
     def device_info(self):
         return self.coordinator.get_room_device_info_for_puck(self._puck_id)
 
+    @property
+    def extra_state_attributes(self):
+        return self.coordinator.get_stale_attributes() or None
+
     @property
     def available(self) -> bool:
         if not self.coordinator.last_update_success:
@@ -95,6 +99,11 @@ class FlairRoomAirflowLimitedBinarySensor(CoordinatorEntity, BinarySensorEntity)
         self._attr_device_class = BinarySensorDeviceClass.PROBLEM
         self._attr_icon = "mdi:fan-alert"
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # A room sensor can flip the flag between polls.
+        self.async_on_remove(self.coordinator.async_add_observability_listener(self.async_write_ha_state))
+
     @property
     def name(self):
         room = self.coordinator.get_room_by_id(self._room_id)
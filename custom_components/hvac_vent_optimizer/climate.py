@@ -72,6 +72,10 @@ class FlairRoomClimate(CoordinatorEntity, ClimateEntity):
     def current_temperature(self):
         return self.coordinator.get_room_temperature(self._room_id)
 
+    @property
+    def extra_state_attributes(self):
+        return self.coordinator.get_stale_attributes() or None
+
     @property
     def target_temperature(self):
         room = self.coordinator.get_room_by_id(self._room_id)
@@ -83,6 +83,51 @@ CONF_HOLD_UNTIL = "hold_until"
 CONF_STRUCTURE_MODE = "structure_mode"
 CONF_EFFICIENCY_PATH = "efficiency_path"
 CONF_EFFICIENCY_PAYLOAD = "efficiency_payload"
+CONF_TRACE_PATH = "trace_path"
+CONF_DECISION_PATH = "decision_path"
+CONF_PROFILE_PATH = "profile_path"
+CONF_PROFILE_POLLS = "polls"
+CONF_PROFILE_TOP = "top"
+CONF_PROFILE_SORT = "sort"
+CONF_DRY_RUN = "dry_run"
+CONF_DAYS = "days"
+
+# Options the live coordinator applies in place (algorithm, gating and
+# poll-interval knobs, all read per poll or rebuilt by ``async_apply_options``).
+# A change to any other option (brand, manual vents, assignments) or to the
+# entry data (credentials, structure) reloads the entry.
+HOT_RELOAD_OPTIONS = frozenset(
+    {
+        CONF_DAB_ENABLED,
+        CONF_DAB_FORCE_MANUAL,
+        CONF_OPEN_INACTIVE_ROOMS,
+        CONF_VENT_GRANULARITY,
+        CONF_POLL_INTERVAL_ACTIVE,
+        CONF_POLL_INTERVAL_IDLE,
+        CONF_INITIAL_EFFICIENCY_PERCENT,
+        CONF_NOTIFY_EFFICIENCY_CHANGES,
+        CONF_LOG_EFFICIENCY_CHANGES,
+        CONF_CONTROL_STRATEGY,
+        CONF_MIN_ADJUSTMENT_PERCENT,
+        CONF_MIN_ADJUSTMENT_INTERVAL,
+        CONF_TEMP_ERROR_OVERRIDE,
+        CONF_DEADBAND_PERCENT,
+        CONF_DEVIATION_THRESHOLD,
+        CONF_MAX_RECALC_PER_CYCLE,
+        CONF_MAX_ADJUSTMENT_BATCHES_PER_CYCLE,
+        CONF_MAX_ADJUSTMENT_BATCHES_PER_WINDOW,
+        CONF_ADJUSTMENT_WINDOW_MINUTES,
+        CONF_SHORT_CYCLE_GAP_MIN,
+        CONF_SAFETY_FLOOR_PCT,
+        CONF_SPREAD_GUARDRAIL_C,
+        CONF_SPREAD_IMPROVEMENT_DEADBAND_C,
+        CONF_CROSSCOUPLING_ENABLED,
+        CONF_AIRFLOW_LIMITED_MARGIN_PCT,
+        CONF_AIRFLOW_LIMITED_ERROR_C,
+        CONF_OUTDOOR_TEMP_ENTITY,
+        CONF_CONVENTIONAL_VENTS_BY_THERMOSTAT,
+    }
+)
 
 SERVICE_SET_ROOM_ACTIVE = "set_room_active"
 SERVICE_SET_ROOM_SETPOINT = "set_room_setpoint"
@@ -91,6 +136,11 @@ SERVICE_SET_STRUCTURE_MODE = "set_structure_mode"
 SERVICE_REFRESH_DEVICES = "refresh_devices"
 SERVICE_EXPORT_EFFICIENCY = "export_efficiency"
 SERVICE_IMPORT_EFFICIENCY = "import_efficiency"
+SERVICE_EXPORT_REPLAY_TRACE = "export_replay_trace"
+SERVICE_EXPORT_DECISION_LOG = "export_decision_log"
+SERVICE_PROFILE = "profile"
+SERVICE_REFIT_MODELS = "refit_models"
+SERVICE_BOOTSTRAP_HISTORY = "bootstrap_history"
 
 DEFAULT_DAB_ENABLED = False
 # Inactive vents stay OPEN by default (R: see CONF_OPEN_INACTIVE_ROOMS). The
@@ -111,6 +161,11 @@ DEFAULT_LOG_EFFICIENCY_CHANGES = True
 # The ``balance`` (DAB v2) synchronized-convergence strategy. Registered here as
 # a selectable value so the coordinator can branch on it (Task 15).
 CONTROL_STRATEGY_BALANCE = "balance"
+# Model-predictive variant of ``balance``: same inputs, hold gate and safety
+# floor, but the plan is chosen by forward rollout (``balance.plan_mpc``).
+CONTROL_STRATEGY_MPC = "mpc"
+# Strategies that run on the learned per-room model and the spread hold gate.
+BALANCE_STRATEGIES = frozenset({CONTROL_STRATEGY_BALANCE, CONTROL_STRATEGY_MPC})
 # ``balance`` is the default for NEW installs (Task 27, R16.1/R17.1). The R15.6
 # spread evidence gate was not met, but the homeowner explicitly accepted the
 # change on the decisive vent-movement win (balance uses 16-93 % of dab's moves)
@@ -124,9 +179,9 @@ DEFAULT_CONTROL_STRATEGY = CONTROL_STRATEGY_BALANCE
 # explicitly selected a strategy (R17.3).
 LEGACY_DEFAULT_CONTROL_STRATEGY = "hybrid"
 # Allowed control strategies (the options-flow dropdown + translations are wired
-# in Task 23). Ordered so the legacy strategies stay first and ``balance`` is the
-# newest selectable option.
-CONTROL_STRATEGIES = ["dab", "cost", "stats", "hybrid", CONTROL_STRATEGY_BALANCE]
+# in Task 23). Ordered so the legacy strategies stay first and the newest
+# selectable options come last.
+CONTROL_STRATEGIES = ["dab", "cost", "stats", "hybrid", CONTROL_STRATEGY_BALANCE, CONTROL_STRATEGY_MPC]
 DEFAULT_DEADBAND_PERCENT = 15
 DEFAULT_DEVIATION_THRESHOLD = 1.0
 DEFAULT_MAX_RECALC_PER_CYCLE = 3
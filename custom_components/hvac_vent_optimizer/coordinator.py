@@ -5,8 +5,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import math
-from collections.abc import Callable
-from dataclasses import dataclass
+import time
+from collections.abc import Awaitable, Callable, Iterable, Mapping, MutableMapping, Sequence
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -16,6 +17,7 @@ from homeassistant.components.climate.const import HVACAction
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
@@ -25,13 +27,17 @@ from .api import FlairApi, FlairApiError
 from .balance import (
     MODE_COOLING,
     MODE_HEATING,
+    ActiveRoomStats,
     AllocSettings,
     RoomAllocInput,
-    allocate,
+    allocate_exact,
     apply_safety_floor,
+    plan_mpc,
     predicted_spread,
+    select_fewest_moves,
 )
 from .const import (
+    BALANCE_STRATEGIES,
     BRAND_FLAIR,
     BRAND_MANUAL,
     CONF_ADJUSTMENT_WINDOW_MINUTES,
@@ -70,7 +76,7 @@ from .const import (
     CONF_VENT_ASSIGNMENTS,
     CONF_VENT_BRAND,
     CONF_VENT_GRANULARITY,
-    CONTROL_STRATEGY_BALANCE,
+    CONTROL_STRATEGY_MPC,
     DEFAULT_ADJUSTMENT_WINDOW_MINUTES,
     DEFAULT_AIRFLOW_LIMITED_ERROR_C,
     DEFAULT_AIRFLOW_LIMITED_MARGIN_PCT,
@@ -95,7 +101,9 @@ from .const import (
     DEFAULT_SPREAD_GUARDRAIL_C,
     DEFAULT_SPREAD_IMPROVEMENT_DEADBAND_C,
     DEFAULT_TEMP_ERROR_OVERRIDE,
+    DEFAULT_VENT_GRANULARITY,
     DOMAIN,
+    HOT_RELOAD_OPTIONS,
 )
 from .context import (
     Context,
@@ -118,28 +126,54 @@ from .dab import (
 from .learning import (
     DOOR_MIN_N,
     LEAK_DEFAULT,
-    DoorFactorModel,
-    RoomEfficiencyModel,
+    DoorModelLike,
+    RoomModelLike,
+    RoomModelStore,
     VentCurve,
     derive_effectiveness,
-    door_factor_from_dict,
-    door_factor_to_dict,
-    effective_rate as learning_effective_rate,
-    new_door_factor_model,
-    new_room_model,
+    new_vent_rls,
     resolve_door_factor,
-    room_model_from_dict,
-    room_model_to_dict,
+    room_model_changes,
+    seed_linear_curve,
     seed_room_model_from_v1,
     seed_vent_effectiveness,
-    update_door_factor,
-    update_room_efficiency,
+    update_vent_rls,
+    vent_rls_from_sums,
+    vent_rls_params,
+    vent_rls_uncertainty,
 )
+from .replay import (
+    HISTORY_ACTION,
+    HISTORY_APERTURE,
+    HISTORY_DOOR,
+    HISTORY_DUCT,
+    HISTORY_OUTDOOR,
+    HISTORY_SUN,
+    HISTORY_TEMP,
+    CycleArchive,
+    CycleReconstructor,
+    CycleRecord,
+    DecisionLog,
+    DecisionRecord,
+    RoomDecision,
+    RoomSample,
+    Trace,
+    VentCycleSamples,
+)
+from .telemetry import PhaseTimer, PollProfiler, ProfileCapture
 from .utils import get_remote_sensor_id, is_fahrenheit_unit
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _note_room(room: RoomDecision | None, outcome: str, applied: int | None = None) -> None:
+    """Record a room group's dispatch outcome on its decision record, if any."""
+    if room is not None:
+        room.outcome = outcome
+        if applied is not None:
+            room.applied_pct = applied
+
+
 def _slugify(text: str) -> str:
     """Lowercase ``text`` and collapse non-alphanumeric runs into underscores.
 
@@ -183,6 +217,67 @@ EFF_REGIME_COUNT = 4
 # data on a parse failure.
 STORE_SCHEMA_VERSION = 2
 
+# One-time store migrations, in run order, with their current revision. The
+# store's ``migrations`` ledger records the revision each one last completed at;
+# :meth:`async_initialize` skips any that are up to date, so a clean restart
+# does no per-vent migration work. Bump a revision to make it run once more.
+# ``regime_offsets`` is keyed to the regime count it expands stored models to.
+# ``vent_model_rls`` turns the v1 regression sums into RLS fits and runs first so
+# the v2 seeding reads the fitted coefficients. The v2 seeding itself is not a
+# ledger step: vents and rooms learned after a migration still need their
+# ``vent_effectiveness`` / ``room_efficiency`` entries, so every load fills in
+# whichever are missing (a dict lookup per entry once seeded).
+STORE_MIGRATIONS: tuple[tuple[str, int], ...] = (
+    ("vent_model_rls", 1),
+    ("regime_offsets", EFF_REGIME_COUNT),
+    ("metric_fields", 1),
+)
+# Ledger entry for the load-time sanitation of ``vent_effectiveness``. Every
+# save writes sanitized in-memory state, so a store last written at this
+# revision is loaded as-is; bump it when the sanitation rules change.
+SANITIZE_REVISION = 1
+
+# Last good Flair ``data`` snapshot (Store file ``{DOMAIN}_<entry>_snapshot.json``):
+# topology, names and last readings, used to seed entities at startup while the
+# first live poll runs in the background. Kept apart from the DAB state so the
+# snapshot writes never rewrite the learned models. Written on the first good
+# poll, then at most once per interval: ``Store.async_delay_save`` re-arms its
+# delay on every call, so a per-poll debounce shorter than the poll cadence
+# would never fire while polling.
+SNAPSHOT_STORE_VERSION = 1
+SNAPSHOT_SAVE_INTERVAL = timedelta(minutes=5)
+# An older snapshot is ignored (blocking first refresh): devices may have been
+# added or removed and the readings are too old to show.
+SNAPSHOT_MAX_AGE = timedelta(days=7)
+
+# Raw per-cycle samples (Store file ``{DOMAIN}_<entry>_samples.json``) kept for
+# the ``refit_models`` service. Written debounced after each finalize, apart from
+# the DAB state for the same reason as the snapshot.
+CYCLE_ARCHIVE_STORE_VERSION = 1
+CYCLE_ARCHIVE_SAVE_DELAY_S = 120
+
+# Recorder history bootstrap (``bootstrap_history``): how far back it may read,
+# and the time span fetched per executor job. Each chunk stops loading once it
+# would hold more than BOOTSTRAP_MAX_CHUNK_STATES recorded states and is retried
+# over half the span; the span doubles again after a sparse chunk.
+BOOTSTRAP_DEFAULT_DAYS = 14
+BOOTSTRAP_MAX_DAYS = 90
+BOOTSTRAP_CHUNK = timedelta(hours=6)
+BOOTSTRAP_CHUNK_MIN = timedelta(minutes=1)
+BOOTSTRAP_CHUNK_MAX = timedelta(days=1)
+BOOTSTRAP_MAX_CHUNK_STATES = 20_000
+
+# Rows kept per thermostat in the in-memory replay trace (replay.py): one week
+# of 1-minute active polls. Older rows are dropped in batches as new ones land.
+REPLAY_TRACE_MAX_ROWS = 7 * 24 * 60
+
+# Phases timed inside the ``_dab_lock`` apply path; ``decide`` is what remains.
+_APPLY_SUB_PHASES = ("dispatch", "observability", "save")
+
+# Slack added to ``polls x update_interval`` before a ``profile`` capture gives
+# up waiting and returns what it has.
+PROFILE_TIMEOUT_MARGIN_S = 60.0
+
 # New per-strategy spread metric fields backfilled with defaults on migration
 # (R13.4/R13.5). Existing metric values are preserved untouched.
 _NEW_METRIC_DEFAULTS: dict[str, float] = {
@@ -218,6 +313,162 @@ class EfficiencyContext:
         return 0
 
 
+def _outdoor_temp_c(entity_id: str, state: str, attributes: Mapping[str, Any]) -> float | None:
+    """Outdoor temperature in °C from a ``sensor.*`` state or a ``weather.*`` attribute."""
+    unit = attributes.get("unit_of_measurement")
+    raw: Any = None
+    if str(entity_id).startswith("weather."):
+        raw = attributes.get("temperature")
+        unit = attributes.get("temperature_unit", unit)
+    if raw is None:
+        if state in {STATE_UNKNOWN, STATE_UNAVAILABLE}:
+            return None
+        raw = state
+    try:
+        temp = float(raw)
+    except (TypeError, ValueError):
+        return None
+    if is_fahrenheit_unit(unit):
+        return (temp - 32) * 5 / 9
+    return temp
+
+
+def _opt_float(options: Mapping[str, Any], key: str, default: float) -> float:
+    """Read a numeric option as a float, falling back to ``default``.
+
+    The options flow already clamps to the documented range on save; this
+    guards against a hand-edited or legacy option that is missing or
+    non-numeric so the apply path never raises.
+    """
+    try:
+        value = float(options.get(key, default))
+    except (TypeError, ValueError):
+        return float(default)
+    if value != value:  # NaN
+        return float(default)
+    return value
+
+
+def _opt_int(options: Mapping[str, Any], key: str, default: int) -> int:
+    """Integer counterpart of :func:`_opt_float` (truncates like ``int()``)."""
+    return int(_opt_float(options, key, default))
+
+
+def _resolve_close_inactive(options: Mapping[str, Any]) -> bool:
+    """Resolve the effective "close inactive rooms" behaviour (bool).
+
+    The user-facing option was reframed positively as
+    :data:`CONF_OPEN_INACTIVE_ROOMS` ("open vents in rooms marked inactive",
+    default ON) — the inverse of the legacy ``close_inactive_rooms`` key.
+    Resolution order, newest first, so back-compat installs keep working:
+
+    * new key present  -> ``close_inactive = not open_inactive`` ;
+    * legacy key present -> use it verbatim (pre-v3 entries that the
+      migration somehow missed) ;
+    * neither -> the new default (open inactive vents), i.e. ``close = False``.
+    """
+    if CONF_OPEN_INACTIVE_ROOMS in options:
+        return not bool(options[CONF_OPEN_INACTIVE_ROOMS])
+    if CONF_CLOSE_INACTIVE_ROOMS in options:
+        return bool(options[CONF_CLOSE_INACTIVE_ROOMS])
+    return not DEFAULT_OPEN_INACTIVE_ROOMS
+
+
+@dataclass
+class _ModelRefit:
+    """Models rebuilt by :meth:`FlairCoordinator._replay_cycle_archive`.
+
+    ``curves`` maps ``vent_id -> mode -> VentCurve``; the counters report how
+    many archived cycles were replayed and how many per-room samples were
+    accepted or rejected by the efficiency-sample filters.
+    """
+
+    room_models: RoomModelStore
+    curves: dict[str, dict[str, VentCurve]]
+    cycles: int = 0
+    samples: int = 0
+    rejected: int = 0
+
+
+@dataclass(frozen=True)
+class CoordinatorSettings:
+    """The apply path's options, parsed and validated once per options version.
+
+    Built by :meth:`from_options` whenever ``entry.options`` is replaced (see
+    :attr:`FlairCoordinator.settings`) and passed down the DAB apply path, so a
+    poll reads plain attributes instead of re-coercing ``entry.options`` keys.
+    ``alloc`` is the prebuilt :class:`AllocSettings` for the hold gate. The
+    allocation itself only adds the per-poll conventional/inactive fields to it.
+    """
+
+    control_strategy: str
+    granularity: int
+    close_inactive: bool
+    min_adjust_percent: int
+    min_adjust_interval: int
+    temp_error_override: float
+    deviation_threshold: float
+    max_recalc: int
+    deadband: int
+    max_batches_per_cycle: int
+    max_batches_per_window: int
+    adjustment_window_minutes: int
+    poll_interval_active_min: float
+    conventional_vents: Mapping[str, int]
+    alloc: AllocSettings
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> CoordinatorSettings:
+        granularity = _opt_int(options, CONF_VENT_GRANULARITY, DEFAULT_VENT_GRANULARITY)
+        conventional: dict[str, int] = {}
+        raw_conventional = options.get(CONF_CONVENTIONAL_VENTS_BY_THERMOSTAT)
+        if isinstance(raw_conventional, Mapping):
+            conventional = {
+                str(thermostat): _opt_int(raw_conventional, thermostat, 0) for thermostat in raw_conventional
+            }
+        return cls(
+            control_strategy=str(options.get(CONF_CONTROL_STRATEGY, DEFAULT_CONTROL_STRATEGY)),
+            granularity=granularity,
+            close_inactive=_resolve_close_inactive(options),
+            min_adjust_percent=_opt_int(options, CONF_MIN_ADJUSTMENT_PERCENT, DEFAULT_MIN_ADJUSTMENT_PERCENT),
+            min_adjust_interval=_opt_int(
+                options, CONF_MIN_ADJUSTMENT_INTERVAL, DEFAULT_MIN_ADJUSTMENT_INTERVAL
+            ),
+            temp_error_override=_opt_float(options, CONF_TEMP_ERROR_OVERRIDE, DEFAULT_TEMP_ERROR_OVERRIDE),
+            deviation_threshold=_opt_float(options, CONF_DEVIATION_THRESHOLD, DEFAULT_DEVIATION_THRESHOLD),
+            max_recalc=_opt_int(options, CONF_MAX_RECALC_PER_CYCLE, DEFAULT_MAX_RECALC_PER_CYCLE),
+            deadband=_opt_int(options, CONF_DEADBAND_PERCENT, DEFAULT_DEADBAND_PERCENT),
+            max_batches_per_cycle=_opt_int(
+                options, CONF_MAX_ADJUSTMENT_BATCHES_PER_CYCLE, DEFAULT_MAX_ADJUSTMENT_BATCHES_PER_CYCLE
+            ),
+            max_batches_per_window=_opt_int(
+                options, CONF_MAX_ADJUSTMENT_BATCHES_PER_WINDOW, DEFAULT_MAX_ADJUSTMENT_BATCHES_PER_WINDOW
+            ),
+            adjustment_window_minutes=_opt_int(
+                options, CONF_ADJUSTMENT_WINDOW_MINUTES, DEFAULT_ADJUSTMENT_WINDOW_MINUTES
+            ),
+            poll_interval_active_min=_opt_float(
+                options, CONF_POLL_INTERVAL_ACTIVE, DEFAULT_POLL_INTERVAL_ACTIVE
+            ),
+            conventional_vents=conventional,
+            alloc=AllocSettings(
+                granularity=granularity,
+                safety_floor_pct=_opt_float(options, CONF_SAFETY_FLOOR_PCT, DEFAULT_SAFETY_FLOOR_PCT),
+                crosscoupling=bool(options.get(CONF_CROSSCOUPLING_ENABLED, DEFAULT_CROSSCOUPLING_ENABLED)),
+                spread_guardrail_c=_opt_float(options, CONF_SPREAD_GUARDRAIL_C, DEFAULT_SPREAD_GUARDRAIL_C),
+                spread_improvement_deadband_c=_opt_float(
+                    options, CONF_SPREAD_IMPROVEMENT_DEADBAND_C, DEFAULT_SPREAD_IMPROVEMENT_DEADBAND_C
+                ),
+                airflow_limited_margin_pct=_opt_float(
+                    options, CONF_AIRFLOW_LIMITED_MARGIN_PCT, DEFAULT_AIRFLOW_LIMITED_MARGIN_PCT
+                ),
+                airflow_limited_error_c=_opt_float(
+                    options, CONF_AIRFLOW_LIMITED_ERROR_C, DEFAULT_AIRFLOW_LIMITED_ERROR_C
+                ),
+            ),
+        )
+
+
 class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinates API access and polling for vent devices."""
 
@@ -225,6 +476,9 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.api = api
         self.entry = entry
         self._unsub_thermostat_listeners: list[Callable[[], None]] = []
+        self._unsub_room_temp_listeners: list[Callable[[], None]] = []
+        # Assigned room temperature sensor -> the vents it reports for.
+        self._room_temp_sensor_vents: dict[str, list[str]] = {}
         self._dab_state: dict[str, dict[str, Any]] = {}
         self._last_hvac_action: dict[str, str | None] = {}
         self._vent_rates: dict[str, dict[str, float]] = {}
@@ -232,17 +486,15 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._vent_last_commanded: dict[str, datetime] = {}
         self._vent_last_target: dict[str, int] = {}
         self._manual_apertures: dict[str, int] = {}
-        self._vent_models: dict[str, dict[str, dict[str, float]]] = {}
+        # Per-vent, per-mode aperture->rate RLS fits (``learning.update_vent_rls``).
+        self._vent_models: dict[str, dict[str, dict[str, Any]]] = {}
         self._efficiency_models: dict[str, dict[str, dict[str, Any]]] = {}
-        # Per-room regime-aware learning models (R11/R25.1), keyed by room name.
-        # Kept in-memory for now; Task 22 wires the schema-v2 persistence store
-        # around this dict (clean seam — load seeds it, save reads from it).
-        self._room_efficiency_models: dict[str, RoomEfficiencyModel] = {}
-        # Per-room door-leakage residual models (R26.4), keyed identically to the
-        # room-efficiency store: by room name, falling back to the vent id when a
-        # room is unnamed. In-memory only for now; Tasks 7/8 wire the learning
-        # writes and read-time resolution, Task 9 the schema-v2 persistence.
-        self._door_factor_models: dict[str, DoorFactorModel] = {}
+        # Per-room regime-aware learning models (R11/R25.1) and door-leakage
+        # residual models (R26.4), keyed by room name (falling back to the vent
+        # id when a room is unnamed). Both live column-wise in one store; the
+        # ``_room_efficiency_models`` / ``_door_factor_models`` properties are
+        # its mapping views.
+        self._room_models = RoomModelStore()
         # Per-vent aperture->airflow effectiveness, schema-v2 ``vent_effectiveness``
         # section (R25.2/25.3): ``{vent: {mode: {leak, n, curve{breakpoints,flow,
         # counts}, knee_pct, sum_*}}}``. Seeded from the regression at migration
@@ -274,11 +526,19 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._hold_status: str = "idle"
         self._total_active_polls: int = 0
         # --- Task 24 observability state (R13/R14/R5.4) ----------------------
-        # Recomputed every active poll by :meth:`_update_active_observability`.
+        # Kept incrementally in ``_active_rooms`` (each active poll diffs the
+        # rooms in, a room temperature sensor change updates its one room) and
+        # published to these attributes by :meth:`_publish_active_stats`.
+        self._active_rooms = ActiveRoomStats()
         self._last_max_active_error: float = 0.0
-        self._room_signed_errors: dict[str, float] = {}
-        self._airflow_limited_rooms: set[str] = set()
-        self._airflow_limited_vents: set[str] = set()
+        # Aliases: ``_active_rooms`` updates these in place.
+        self._room_signed_errors: dict[str, float] = self._active_rooms.signed_errors
+        self._airflow_limited_rooms: set[str] = self._active_rooms.airflow_rooms
+        self._airflow_limited_vents: set[str] = self._active_rooms.airflow_vents
+        # Whether the last poll conditioned (room sensor changes only count then),
+        # and the entities that show the stats, refreshed on such a change.
+        self._observability_active = False
+        self._observability_listeners: list[Callable[[], None]] = []
         # Rolling 24 h event timestamps for the recalculations/holds sensors
         # (kept in memory only; they reset on restart, which is acceptable for
         # a 24 h rolling window and avoids persistence churn).
@@ -287,36 +547,153 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Per-strategy spread-sample counts (in-memory; the derived averages are
         # persisted inside ``_strategy_metrics``).
         self._spread_sample_counts: dict[str, int] = {}
+        # Per-thermostat columnar replay traces of the active polls (in memory;
+        # exported on demand by the ``export_replay_trace`` service).
+        self._replay_traces: dict[str, Trace] = {}
+        # Struct-packed ring of per-apply decision records (``export_decision_log``).
+        self._decision_log = DecisionLog()
+        # Rolling per-phase poll timings + ``_dab_lock`` wait/hold (telemetry.py),
+        # exposed by the poll-timing sensor and the diagnostics download.
+        self._poll_timings = PhaseTimer()
+        # On-demand cProfile capture of the next N polls (``profile`` service).
+        self._profiler = PollProfiler()
+        # Flair requests issued by the last completed poll (API budget projection).
+        self._last_poll_requests: int | None = None
+        # Last successfully fetched snapshot, served (marked ``stale``) while the
+        # Flair client's circuit breaker is open instead of failing every poll.
+        self._last_good_data: dict[str, Any] | None = None
+        self._stale_since: datetime | None = None
         self._store = Store(hass, 1, f"{DOMAIN}_{entry.entry_id}_dab.json")
+        # Store migrations completed (name -> revision), persisted as ``migrations``.
+        self._migration_ledger: dict[str, int] = {}
+        self._snapshot_store = Store(hass, SNAPSHOT_STORE_VERSION, f"{DOMAIN}_{entry.entry_id}_snapshot.json")
+        # When ``_last_good_data`` was fetched (or, after a restore, saved).
+        self._snapshot_at: datetime | None = None
+        # When the snapshot was last handed to the store (throttles the writes).
+        self._snapshot_saved_at: datetime | None = None
+        self._snapshot_restored = False
+        # Finalized cycles' raw readings, replayed by ``async_refit_models``.
+        self._cycle_archive = CycleArchive()
+        # Start (epoch s) of the span the learners have already seen: the
+        # history bootstrap reads only what is older. Persisted as
+        # ``learned_since``; moves back with each finalized or bootstrapped cycle.
+        self._learned_since = datetime.now(UTC).timestamp()
+        # Serializes the re-fit swap and the history bootstrap's live updates.
+        self._model_lock = asyncio.Lock()
+        self._bootstrap_status: dict[str, Any] = {"state": "idle"}
+        self._archive_store = Store(
+            hass, CYCLE_ARCHIVE_STORE_VERSION, f"{DOMAIN}_{entry.entry_id}_samples.json"
+        )
         self._save_lock = asyncio.Lock()
         self._dab_lock = asyncio.Lock()
+        # Poll-scoped context cache (:meth:`_build_context`): the house-wide
+        # part and one finished context per room and door sensor. ``None``
+        # outside a poll, where every build reads the current states.
+        self._house_context: Context | None = None
+        self._room_contexts: dict[tuple[int, str, str | None], Context] | None = None
         self._pending_finalize: dict[str, asyncio.Task] = {}
         self._background_tasks: set[asyncio.Task] = set()
         self._error_counts: dict[str, int] = {}
 
-        poll_active = entry.options.get(CONF_POLL_INTERVAL_ACTIVE, DEFAULT_POLL_INTERVAL_ACTIVE)
-        poll_idle = entry.options.get(CONF_POLL_INTERVAL_IDLE, DEFAULT_POLL_INTERVAL_IDLE)
+        # The entry data/options this coordinator was built from or last
+        # hot-applied (see :meth:`async_apply_options`).
+        self._applied_data = dict(entry.data)
+        self._applied_options = dict(entry.options)
+        # ``CoordinatorSettings`` for the options mapping it was built from.
+        self._settings_options: Mapping[str, Any] | None = entry.options
+        self._settings = CoordinatorSettings.from_options(entry.options)
+        self._load_cached_options()
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}-{entry.title}",
+            update_interval=self._poll_interval_idle,
+        )
+
+    @property
+    def settings(self) -> CoordinatorSettings:
+        """Parsed options for the apply path, rebuilt when ``entry.options`` is replaced.
+
+        Home Assistant swaps in a new options mapping on every update, so the
+        identity check is the options version.
+        """
+        options = self.entry.options
+        if options is not self._settings_options:
+            self._settings = CoordinatorSettings.from_options(options)
+            self._settings_options = options
+        return self._settings
+
+    @property
+    def _room_efficiency_models(self) -> MutableMapping[str, RoomModelLike]:
+        """Per-room efficiency models, a live view over :attr:`_room_models`."""
+        return self._room_models.efficiency
+
+    @_room_efficiency_models.setter
+    def _room_efficiency_models(self, models: Mapping[str, RoomModelLike]) -> None:
+        self._room_models.efficiency.replace(models)
+
+    @property
+    def _door_factor_models(self) -> MutableMapping[str, DoorModelLike]:
+        """Per-room door-factor models, a live view over :attr:`_room_models`."""
+        return self._room_models.door
+
+    @_door_factor_models.setter
+    def _door_factor_models(self, models: Mapping[str, DoorModelLike]) -> None:
+        self._room_models.door.replace(models)
+
+    def _load_cached_options(self) -> None:
+        """(Re)read the options cached on the coordinator rather than read per use."""
+        options = self.entry.options
+        poll_active = options.get(CONF_POLL_INTERVAL_ACTIVE, DEFAULT_POLL_INTERVAL_ACTIVE)
+        poll_idle = options.get(CONF_POLL_INTERVAL_IDLE, DEFAULT_POLL_INTERVAL_IDLE)
         self._poll_interval_active = timedelta(minutes=poll_active)
         self._poll_interval_idle = timedelta(minutes=poll_idle)
         self._initial_efficiency_percent = float(
-            entry.options.get(CONF_INITIAL_EFFICIENCY_PERCENT, DEFAULT_INITIAL_EFFICIENCY_PERCENT)
+            options.get(CONF_INITIAL_EFFICIENCY_PERCENT, DEFAULT_INITIAL_EFFICIENCY_PERCENT)
         )
         self._notify_efficiency_changes = bool(
-            entry.options.get(CONF_NOTIFY_EFFICIENCY_CHANGES, DEFAULT_NOTIFY_EFFICIENCY_CHANGES)
+            options.get(CONF_NOTIFY_EFFICIENCY_CHANGES, DEFAULT_NOTIFY_EFFICIENCY_CHANGES)
         )
         self._log_efficiency_changes = bool(
-            entry.options.get(CONF_LOG_EFFICIENCY_CHANGES, DEFAULT_LOG_EFFICIENCY_CHANGES)
+            options.get(CONF_LOG_EFFICIENCY_CHANGES, DEFAULT_LOG_EFFICIENCY_CHANGES)
         )
 
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=f"{DOMAIN}-{entry.title}",
-            update_interval=self._poll_interval_idle,
-        )
+    async def async_apply_options(self) -> bool:
+        """Apply an entry update in place when it only touches hot options.
+
+        Returns ``False`` when the update needs a full reload: the entry data
+        changed or any changed option is outside :data:`HOT_RELOAD_OPTIONS`.
+        Otherwise the cached options are re-read and the poll interval
+        recomputed. Cycle state, learned models and entities are kept.
+        Everything else is read from ``entry.options`` per poll.
+        """
+        if dict(self.entry.data) != self._applied_data:
+            return False
+        new = dict(self.entry.options)
+        old = self._applied_options
+        changed = {key for key in old.keys() | new.keys() if old.get(key) != new.get(key)}
+        if not changed <= HOT_RELOAD_OPTIONS:
+            return False
+        self._applied_options = new
+        if not changed:
+            return True
+
+        self._load_cached_options()
+        await self._recompute_polling_interval()
+        if changed & {CONF_DAB_ENABLED, CONF_DAB_FORCE_MANUAL}:
+            # Same steps setup runs once DAB is on: manual structure mode and
+            # picking up an already-running cycle.
+            await self.async_ensure_structure_mode()
+            self.async_detect_active_hvac()
+        _LOGGER.info("Applied option change(s) without reload: %s", ", ".join(sorted(changed)))
+        self.async_update_listeners()
+        return True
 
     async def async_initialize(self) -> None:
         """Load persisted DAB state."""
+        await self._async_load_cycle_archive()
+        self._learned_since = self._default_learned_since()
         stored = await self._store.async_load()
         if not stored:
             return
@@ -338,20 +715,31 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._strategy_metrics = _safe_dict(stored.get("strategy_metrics"))
         self._last_hvac_action = _safe_dict(stored.get("last_hvac_action"))
         self._pre_adjust_flags = _safe_dict(stored.get("pre_adjust_flags"))
+        learned_since = stored.get("learned_since")
+        if isinstance(learned_since, (int, float)) and math.isfinite(learned_since):
+            self._learned_since = min(float(learned_since), self._learned_since)
+
+        ledger = _safe_dict(stored.get("migrations"))
+        self._migration_ledger = {
+            name: revision
+            for name, revision in ledger.items()
+            if isinstance(name, str) and isinstance(revision, int)
+        }
 
         # Schema-v2 sections (R18.3/R25.7). ``_safe_dict`` degrades a malformed
         # section to an empty dict so a bad payload never crashes init or wipes
         # the other (valid) sections; the migrator below re-seeds what it can.
-        self._vent_effectiveness = self._sanitize_vent_effectiveness(
-            _safe_dict(stored.get("vent_effectiveness"))
-        )
-        self._room_efficiency_models = self._load_room_efficiency(_safe_dict(stored.get("room_efficiency")))
-
-        # Additive ``door_factor`` section (R29.3/R29.4). A missing/malformed
-        # section degrades to an empty map (every room resolves to the 0.9
-        # default) without touching the room_efficiency/vent_effectiveness
-        # sections; no STORE_SCHEMA_VERSION bump is required.
-        self._door_factor_models = self._load_door_factor(_safe_dict(stored.get("door_factor")))
+        vent_effectiveness = _safe_dict(stored.get("vent_effectiveness"))
+        if self._migration_ledger.get("sanitize") != SANITIZE_REVISION:
+            vent_effectiveness = self._sanitize_vent_effectiveness(vent_effectiveness)
+        self._vent_effectiveness = vent_effectiveness
+        # ``room_efficiency`` and the additive ``door_factor`` section (R29.3/
+        # R29.4) decode straight into the column store. Malformed entries decay
+        # to fresh models and a missing section leaves every room on the 0.9
+        # door default; no STORE_SCHEMA_VERSION bump is required.
+        self._room_models = RoomModelStore()
+        self._room_models.load_efficiency(_safe_dict(stored.get("room_efficiency")))
+        self._room_models.load_door_factor(_safe_dict(stored.get("door_factor")))
 
         # Restore hold/deviation counters
         self._hold_count = int(stored.get("hold_count", 0) or 0)
@@ -391,8 +779,29 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 len(self._cycle_targets),
             )
 
-        self._migrate_symmetric_offsets()
-        self._migrate_state_to_v2()
+        self._run_pending_migrations()
+
+    def _run_pending_migrations(self) -> None:
+        """Run the :data:`STORE_MIGRATIONS` the ledger hasn't recorded yet.
+
+        Then seed the v2 entries still missing, whatever the ledger says.
+        """
+        steps = {
+            "vent_model_rls": self._migrate_vent_models_to_rls,
+            "regime_offsets": self._migrate_symmetric_offsets,
+            "metric_fields": self._backfill_metric_fields,
+        }
+        skipped = 0
+        for name, revision in STORE_MIGRATIONS:
+            if self._migration_ledger.get(name, 0) >= revision:
+                skipped += 1
+                continue
+            steps[name]()
+            self._migration_ledger[name] = revision
+        if skipped:
+            _LOGGER.debug("Skipped %d store migration(s) already recorded in the ledger", skipped)
+        self._seed_vent_effectiveness_from_v1()
+        self._seed_room_efficiency_from_v1()
 
     def _migrate_symmetric_offsets(self) -> None:
         """Fix existing efficiency models with identical (symmetric) offsets.
@@ -436,6 +845,19 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 EFF_REGIME_COUNT,
             )
 
+    def _migrate_vent_models_to_rls(self) -> None:
+        """Seed each vent's aperture->rate RLS fit from its stored regression sums."""
+        migrated = 0
+        for modes in self._vent_models.values():
+            if not isinstance(modes, dict):
+                continue
+            for mode, stats in list(modes.items()):
+                if isinstance(stats, dict) and "slope" not in stats:
+                    modes[mode] = vent_rls_from_sums(stats)
+                    migrated += 1
+        if migrated:
+            _LOGGER.info("Seeded %d aperture->rate RLS fit(s) from regression sums", migrated)
+
     # ------------------------------------------------------------------
     # Schema-v2 migration + (de)serialization (R18.3 / R25.7 / R13.5)
     # ------------------------------------------------------------------
@@ -472,45 +894,6 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 valid[vent_id] = clean
         return valid
 
-    @staticmethod
-    def _load_room_efficiency(data: Any) -> dict[str, RoomEfficiencyModel]:
-        """Deserialize the ``room_efficiency`` section to RoomEfficiencyModels.
-
-        Each entry is decoded via the pure :func:`learning.room_model_from_dict`,
-        which tolerates malformed/partial entries (they become fresh/padded
-        models) so a corrupt entry never raises or drops the others.
-        """
-        models: dict[str, RoomEfficiencyModel] = {}
-        if not isinstance(data, dict):
-            return models
-        for room, raw in data.items():
-            try:
-                models[str(room)] = room_model_from_dict(raw)
-            except Exception:  # noqa: BLE001 - never lose the rest of the store
-                _LOGGER.warning("Skipping malformed room_efficiency entry for %r", room)
-        return models
-
-    @staticmethod
-    def _load_door_factor(data: Any) -> dict[str, DoorFactorModel]:
-        """Deserialize the ``door_factor`` section to DoorFactorModels (R29.3/R29.4).
-
-        Mirrors :meth:`_load_room_efficiency`: a non-dict/missing section yields an
-        empty map (every room then resolves to the ``0.9`` default), and each
-        per-room entry is decoded via the pure :func:`learning.door_factor_from_dict`,
-        which tolerates malformed/partial input (it becomes a fresh model) so a
-        garbled entry never raises or drops the others — and never affects the
-        ``room_efficiency``/``vent_effectiveness`` sections.
-        """
-        models: dict[str, DoorFactorModel] = {}
-        if not isinstance(data, dict):
-            return models
-        for room, raw in data.items():
-            try:
-                models[str(room)] = door_factor_from_dict(raw)
-            except Exception:  # noqa: BLE001 - never lose the rest of the store
-                _LOGGER.warning("Skipping malformed door_factor entry for %r", room)
-        return models
-
     def _migrate_state_to_v2(self) -> None:
         """Idempotently bring loaded state up to schema v2 (R18.3/R25.7/R13.5).
 
@@ -723,30 +1106,64 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.warning("Failed to set structure mode to manual: %s", err or repr(err))
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from Flair API."""
+        """Fetch data from Flair API (one timed poll, see :meth:`get_poll_timings`)."""
+        self._poll_timings.begin_poll()
+        issued = self.api.telemetry.total if self.api else 0
+        self._house_context = None
+        self._room_contexts = {}
+        try:
+            with self._profiler.span(poll=True):
+                return await self._async_poll()
+        finally:
+            self._house_context = None
+            self._room_contexts = None
+            self._poll_timings.end_poll()
+            if self.api:
+                self._last_poll_requests = self.api.telemetry.total - issued
+
+    async def _async_poll(self) -> dict[str, Any]:
         if self._is_manual():
             return await self._async_update_manual_data()
 
+        timings = self._poll_timings
         structure_id = self.entry.data[CONF_STRUCTURE_ID]
         if self.entry.options.get(CONF_DAB_ENABLED, False):
-            await self.async_ensure_structure_mode()
+            with timings.measure("structure_mode"):
+                await self.async_ensure_structure_mode()
         try:
             if not self.api:
                 raise UpdateFailed("Flair API client not initialized")
-            vents = await self.api.async_get_vents(structure_id)
-            pucks = await self.api.async_get_pucks(structure_id)
+            with timings.measure("fetch"):
+                vents = await self.api.async_get_vents(structure_id)
+                pucks = await self.api.async_get_pucks(structure_id)
         except Exception as err:
+            stale = self._stale_snapshot()
+            if stale is not None:
+                return stale
             self._async_notify_error("Flair update failed", str(err))
             raise UpdateFailed(f"Error fetching Flair data: {err}") from err
 
         remote_cache: dict[str, asyncio.Task | Any] = {}
-        vents = await self._async_enrich_vents(vents, remote_cache)
-        pucks = await self._async_enrich_pucks(pucks, remote_cache)
+        with timings.measure("enrich_vents"):
+            vents = await self._async_enrich_vents(vents, remote_cache)
+        with timings.measure("enrich_pucks"):
+            pucks = await self._async_enrich_pucks(pucks, remote_cache)
+
+        # The breaker tripped mid-poll: the readings are partial, so don't
+        # balance on them.
+        stale = self._stale_snapshot()
+        if stale is not None:
+            return stale
 
         data = {
             "vents": {vent["id"]: vent for vent in vents},
             "pucks": {puck["id"]: puck for puck in pucks},
+            "stale": False,
         }
+        self._last_good_data = data
+        self._stale_since = None
+        self._snapshot_at = datetime.now(UTC)
+        self._maybe_save_snapshot()
 
         if self.entry.options.get(CONF_DAB_ENABLED, False):
             try:
@@ -758,6 +1175,154 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._prune_stale_efficiency_models(data)
         return data
 
+    def _stale_snapshot(self) -> dict[str, Any] | None:
+        """The last good data marked ``stale``, while the API circuit is open.
+
+        ``None`` when the breaker is closed (a plain failure still raises
+        ``UpdateFailed``) or nothing has been fetched yet. DAB is not run on a
+        stale snapshot; vent commands would be refused by the breaker anyway.
+        """
+        breaker = getattr(self.api, "breaker", None)
+        if breaker is None or not breaker.is_open or self._last_good_data is None:
+            return None
+        if self._stale_since is None:
+            self._stale_since = datetime.now(UTC)
+            _LOGGER.warning("Flair API circuit open; serving the last good data until it recovers")
+            self._async_notify_error(
+                "Flair API unavailable",
+                "Flair requests keep failing; showing the last known state and pausing vent "
+                "balancing until the API recovers.",
+            )
+        return {**self._last_good_data, "stale": True, "stale_since": self._stale_since.isoformat()}
+
+    def _maybe_save_snapshot(self) -> None:
+        """Persist the last good snapshot unless one was written < ``SNAPSHOT_SAVE_INTERVAL`` ago."""
+        now = self._snapshot_at or datetime.now(UTC)
+        if self._snapshot_saved_at is not None and now - self._snapshot_saved_at < SNAPSHOT_SAVE_INTERVAL:
+            return
+        self._snapshot_saved_at = now
+        self._snapshot_store.async_delay_save(self._snapshot_payload, 0)
+
+    def _snapshot_payload(self) -> dict[str, Any]:
+        data = self._last_good_data or {}
+        saved_at = self._snapshot_at or datetime.now(UTC)
+        return {
+            "saved_at": saved_at.isoformat(),
+            "vents": data.get("vents", {}),
+            "pucks": data.get("pucks", {}),
+        }
+
+    def _default_learned_since(self) -> float:
+        """``learned_since`` for a store that predates it: when live learning began.
+
+        The entry's creation time bounds it (installs before the archive existed
+        learned live from then on), as does the oldest archived cycle; with
+        neither known it is now, so nothing already learned is read again.
+        """
+        since = datetime.now(UTC).timestamp()
+        created_at = getattr(self.entry, "created_at", None)
+        if isinstance(created_at, datetime):
+            since = min(since, created_at.timestamp())
+        oldest = next(self._cycle_archive.records(), None)
+        if oldest is not None:
+            since = min(since, oldest.started_s)
+        return since
+
+    async def _async_load_cycle_archive(self) -> None:
+        """Load the cycle sample archive; an unreadable one starts empty."""
+        try:
+            stored = await self._archive_store.async_load()
+        except Exception as err:  # noqa: BLE001 - a bad archive only costs re-fit history
+            _LOGGER.warning("Ignoring unreadable cycle sample archive: %s", err)
+            return
+        if stored:
+            self._cycle_archive = CycleArchive.from_json(stored)
+
+    async def async_restore_snapshot(self) -> bool:
+        """Seed ``self.data`` from the persisted last good snapshot, marked ``stale``.
+
+        Lets setup create the entities without waiting for the Flair fan-out;
+        the caller then runs the first live refresh in the background
+        (:meth:`async_start_background_refresh`). The snapshot also backs the
+        open-circuit fallback until that refresh succeeds. Returns ``False``
+        (blocking first refresh as before) for manual vents, or when no usable
+        snapshot exists: missing, malformed or older than ``SNAPSHOT_MAX_AGE``.
+        DAB never runs on restored data.
+        """
+        if self._is_manual():
+            return False
+        try:
+            stored = await self._snapshot_store.async_load()
+        except Exception as err:  # noqa: BLE001 - a bad snapshot only costs the fast start
+            _LOGGER.warning("Ignoring unreadable Flair snapshot: %s", err)
+            return False
+        if not isinstance(stored, dict):
+            return False
+        vents = stored.get("vents")
+        pucks = stored.get("pucks")
+        if not isinstance(vents, dict) or not vents or not isinstance(pucks, dict):
+            return False
+        try:
+            saved_at = datetime.fromisoformat(stored["saved_at"])
+        except (KeyError, TypeError, ValueError):
+            return False
+        age = datetime.now(UTC) - saved_at
+        if age > SNAPSHOT_MAX_AGE:
+            _LOGGER.debug("Flair snapshot is %s old; waiting for a live refresh", age)
+            return False
+
+        self._last_good_data = {"vents": vents, "pucks": pucks, "stale": False}
+        self._snapshot_at = saved_at
+        self._snapshot_restored = True
+        self.data = {**self._last_good_data, "stale": True, "stale_since": saved_at.isoformat()}
+        _LOGGER.info(
+            "Restored %d vent(s) and %d puck(s) from the snapshot saved %s",
+            len(vents),
+            len(pucks),
+            saved_at.isoformat(),
+        )
+        return True
+
+    def async_start_background_refresh(self) -> None:
+        """Run the first live refresh off the setup path (after a snapshot restore)."""
+
+        async def _first_refresh() -> None:
+            await self.async_refresh()
+            self.async_detect_active_hvac()
+
+        task = self.hass.async_create_task(_first_refresh())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def get_stale_attributes(self) -> dict[str, Any]:
+        """``stale``/``stale_since`` state attributes while ``data`` is not live.
+
+        Set on the Flair-backed entities while they show the restored startup
+        snapshot or the open-circuit fallback; empty once a live poll lands.
+        """
+        data = self.data or {}
+        if not data.get("stale"):
+            return {}
+        return {"stale": True, "stale_since": data.get("stale_since")}
+
+    def get_snapshot_status(self) -> dict[str, Any]:
+        """Age of the persisted snapshot and whether startup was seeded from it."""
+        return {
+            "saved_at": self._snapshot_at.isoformat() if self._snapshot_at else None,
+            "restored_at_startup": self._snapshot_restored,
+            "stale": bool((self.data or {}).get("stale")),
+        }
+
+    def get_api_circuit(self) -> dict[str, Any]:
+        """Circuit-breaker state of the Flair client plus whether data is stale."""
+        breaker = getattr(self.api, "breaker", None)
+        if breaker is None:
+            return {}
+        return {
+            **breaker.snapshot(),
+            "stale_since": self._stale_since.isoformat() if self._stale_since else None,
+        }
+
     async def _async_update_manual_data(self) -> dict[str, Any]:
         manual_vents = self._get_manual_vents()
         vents: list[dict[str, Any]] = []
@@ -834,9 +1399,11 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def async_shutdown(self) -> None:
         """Clean up listeners and cancel all pending tasks when unloading."""
-        for unsub in self._unsub_thermostat_listeners:
+        self._profiler.cancel()
+        for unsub in self._unsub_thermostat_listeners + self._unsub_room_temp_listeners:
             unsub()
         self._unsub_thermostat_listeners.clear()
+        self._unsub_room_temp_listeners.clear()
         for task in list(self._pending_finalize.values()):
             task.cancel()
         self._pending_finalize.clear()
@@ -845,9 +1412,22 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._background_tasks.clear()
 
     async def async_setup_thermostat_listeners(self) -> None:
-        """Track thermostat HVAC action changes to adjust polling interval."""
+        """Track thermostat HVAC action changes to adjust polling interval.
+
+        Also tracks the assigned room temperature sensors so the active-room
+        spread/error sensors follow a room's reading between polls.
+        """
         self.async_shutdown()
 
+        self._room_temp_sensor_vents = {}
+        for vent_id, assignment in self._get_vent_assignments().items():
+            temp_sensor = (assignment or {}).get(CONF_TEMP_SENSOR_ENTITY)
+            if temp_sensor:
+                self._room_temp_sensor_vents.setdefault(temp_sensor, []).append(vent_id)
+        for entity_id in self._room_temp_sensor_vents:
+            unsub = async_track_state_change_event(self.hass, entity_id, self._handle_room_temp_event)
+            self._unsub_room_temp_listeners.append(unsub)
+
         thermostat_entities = self._get_thermostat_entities()
         if not thermostat_entities:
             _LOGGER.debug("No thermostat entities configured for polling control")
@@ -869,12 +1449,14 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return vents
         semaphore = asyncio.Semaphore(6)
 
-        async def enrich(vent: dict[str, Any]) -> dict[str, Any]:
+        async def enrich(vent: dict[str, Any]) -> tuple[dict[str, Any], bool]:
             async with semaphore:
                 vent_id = vent["id"]
+                answered = False
                 try:
                     reading = await api.async_get_vent_reading(vent_id)
                     self._vent_last_reading[vent_id] = datetime.now(UTC)
+                    answered = True
                 except Exception as err:  # noqa: BLE001
                     _LOGGER.warning("Failed to fetch vent reading for %s: %s", vent_id, err)
                     reading = {}
@@ -889,9 +1471,9 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 attributes.update(reading)
                 vent["attributes"] = attributes
                 vent["room"] = room
-                return vent
+                return vent, answered
 
-        return await asyncio.gather(*(enrich(vent) for vent in vents))
+        return await self._async_gather_after_probe(vents, enrich)
 
     async def _async_enrich_pucks(
         self,
@@ -903,11 +1485,13 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return pucks
         semaphore = asyncio.Semaphore(6)
 
-        async def enrich(puck: dict[str, Any]) -> dict[str, Any]:
+        async def enrich(puck: dict[str, Any]) -> tuple[dict[str, Any], bool]:
             async with semaphore:
                 puck_id = puck["id"]
+                answered = False
                 try:
                     reading = await api.async_get_puck_reading(puck_id)
+                    answered = True
                 except Exception as err:  # noqa: BLE001
                     _LOGGER.warning("Failed to fetch puck reading for %s: %s", puck_id, err)
                     reading = {}
@@ -922,9 +1506,34 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 attributes.update(reading)
                 puck["attributes"] = attributes
                 puck["room"] = room
-                return puck
+                return puck, answered
 
-        return await asyncio.gather(*(enrich(puck) for puck in pucks))
+        return await self._async_gather_after_probe(pucks, enrich)
+
+    @staticmethod
+    async def _async_gather_after_probe(
+        devices: list[dict[str, Any]],
+        enrich: Callable[[dict[str, Any]], Awaitable[tuple[dict[str, Any], bool]]],
+    ) -> list[dict[str, Any]]:
+        """Enrich ``devices`` concurrently once the Flair API has answered one.
+
+        Devices are enriched one at a time until a reading comes back, then the
+        rest fan out. In an outage the sequential failures trip the API circuit
+        breaker after ``BREAKER_FAILURE_THRESHOLD`` requests and every remaining
+        request is refused locally, instead of the whole fan-out running its
+        retries against a dead endpoint. ``enrich`` returns the device and
+        whether the API answered its reading.
+        """
+        enriched: list[dict[str, Any]] = []
+        index = 0
+        while index < len(devices):
+            device, answered = await enrich(devices[index])
+            enriched.append(device)
+            index += 1
+            if answered:
+                break
+        rest = await asyncio.gather(*(enrich(device) for device in devices[index:]))
+        return enriched + [device for device, _answered in rest]
 
     async def _async_enrich_room(
         self, room: dict[str, Any], remote_cache: dict[str, asyncio.Task | Any]
@@ -1063,22 +1672,8 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         return (1.0 * temp_cost) + (0.15 * open_cost) + (0.6 * move_cost) + cumulative_penalty
 
     def _get_model_params(self, vent_id: str, mode: str) -> tuple[float, float] | None:
-        stats = (self._vent_models.get(vent_id) or {}).get(mode)
-        if not stats:
-            return None
-        n = stats.get("n", 0)
-        if n < 2:
-            return None
-        sum_x = stats.get("sum_x", 0.0)
-        sum_y = stats.get("sum_y", 0.0)
-        sum_xx = stats.get("sum_xx", 0.0)
-        sum_xy = stats.get("sum_xy", 0.0)
-        denom = (n * sum_xx) - (sum_x * sum_x)
-        if denom == 0:
-            return None
-        slope = ((n * sum_xy) - (sum_x * sum_y)) / denom
-        intercept = (sum_y - (slope * sum_x)) / n
-        return slope, intercept
+        """Cached ``(slope, intercept)`` of the vent's aperture->rate RLS fit."""
+        return vent_rls_params((self._vent_models.get(vent_id) or {}).get(mode))
 
     def _update_strategy_metrics(
         self,
@@ -1125,24 +1720,8 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             metrics["last_active_rooms"] = active_rooms
 
     def _resolve_close_inactive(self) -> bool:
-        """Resolve the effective "close inactive rooms" behaviour (bool).
-
-        The user-facing option was reframed positively as
-        :data:`CONF_OPEN_INACTIVE_ROOMS` ("open vents in rooms marked inactive",
-        default ON) — the inverse of the legacy ``close_inactive_rooms`` key.
-        Resolution order, newest first, so back-compat installs keep working:
-
-        * new key present  -> ``close_inactive = not open_inactive`` ;
-        * legacy key present -> use it verbatim (pre-v3 entries that the
-          migration somehow missed) ;
-        * neither -> the new default (open inactive vents), i.e. ``close = False``.
-        """
-        opts = self.entry.options
-        if CONF_OPEN_INACTIVE_ROOMS in opts:
-            return not bool(opts[CONF_OPEN_INACTIVE_ROOMS])
-        if CONF_CLOSE_INACTIVE_ROOMS in opts:
-            return bool(opts[CONF_CLOSE_INACTIVE_ROOMS])
-        return not DEFAULT_OPEN_INACTIVE_ROOMS
+        """Effective "close inactive rooms" behaviour (see :func:`_resolve_close_inactive`)."""
+        return self.settings.close_inactive
 
     def get_strategy_metrics(self) -> dict[str, Any]:
         close_inactive = self._resolve_close_inactive()
@@ -1162,6 +1741,38 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "min_combined_airflow_percent": DEFAULT_SETTINGS.min_combined_vent_flow,
         }
 
+    @callback
+    def async_add_observability_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Call ``update_callback`` when a room sensor moves the active-room stats.
+
+        Between polls only the entities that show the stats need refreshing;
+        returns the callable that removes the listener.
+        """
+        self._observability_listeners.append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            self._observability_listeners.remove(update_callback)
+
+        return _remove
+
+    @callback
+    def _handle_room_temp_event(self, event) -> None:
+        """Fold one room temperature sensor change into the active-room stats.
+
+        Ignored unless the last poll was an active one: idle, the stats are the
+        last cycle's and stay as they were.
+        """
+        data = self.data
+        if not data or not self._observability_active:
+            return
+        changed = False
+        for vent_id in self._room_temp_sensor_vents.get(event.data.get("entity_id"), ()):
+            changed |= self._refresh_active_room(vent_id, data)
+        if changed:
+            for update_callback in list(self._observability_listeners):
+                update_callback()
+
     @callback
     def _handle_thermostat_event(self, event) -> None:
         """Handle thermostat state changes and adjust polling."""
@@ -1318,6 +1929,8 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
 
     async def _async_process_dab(self, data: dict[str, Any]) -> None:
+        # Set again by an active thermostat group's observability pass.
+        self._observability_active = False
         assignments = self._get_vent_assignments()
         if not assignments:
             return
@@ -1567,7 +2180,15 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         rate_prop = "cooling" if hvac_action == HVACAction.COOLING else "heating"
         setpoint_target = self._get_thermostat_target_raw(thermostat_entity, hvac_action)
         room_rates: dict[str, float] = {}
+        room_samples: list[tuple[str, float]] = []
         samples_by_vent: dict[str, list[dict[str, Any]]] = state.get("samples", {})
+        # One context per sampled vent, shared by room learning and the archive.
+        data = self.data or {}
+        contexts = {
+            vent_id: self._build_context(vent_id, data)
+            for vent_id in vent_ids
+            if samples_by_vent.get(vent_id)
+        }
 
         for vent_id in vent_ids:
             room_name = self._get_room_name(vent_id, self.data)
@@ -1587,10 +2208,10 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             baseline_rate, effective_rate, _confidence = self._update_efficiency_model(
                 vent_id, rate_prop, efficiency_sample, context=vent_context
             )
-            # Fold the same observed full-open rate sample into the regime-aware
+            # Queue the same observed full-open rate sample for the regime-aware
             # per-room learning model (R25.4/R25.5). Keyed by room (vents in a
             # room share temp/targets, R23) so a multi-vent room is updated once.
-            self._update_room_efficiency_model(vent_id, rate_prop, efficiency_sample)
+            room_samples.append((vent_id, efficiency_sample))
             cleaned = round_big_decimal(baseline_rate, 6)
             self._set_vent_rate(vent_id, rate_prop, cleaned)
             self._maybe_log_efficiency_change(vent_id, rate_prop, current_rate, cleaned)
@@ -1603,15 +2224,10 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
             if observed_rate is not None and observed_rate > 0 and mean_aperture is not None:
                 model = self._vent_models.setdefault(vent_id, {})
-                stats = model.setdefault(
-                    rate_prop,
-                    {"n": 0, "sum_x": 0.0, "sum_y": 0.0, "sum_xx": 0.0, "sum_xy": 0.0},
-                )
-                stats["n"] += 1
-                stats["sum_x"] += mean_aperture
-                stats["sum_y"] += observed_rate
-                stats["sum_xx"] += mean_aperture * mean_aperture
-                stats["sum_xy"] += mean_aperture * observed_rate
+                update_vent_rls(model.setdefault(rate_prop, new_vent_rls()), mean_aperture, observed_rate)
+
+        self._update_room_efficiency_models(rate_prop, room_samples, contexts)
+        self._archive_cycle(hvac_action, started_running, setpoint_target, samples_by_vent, contexts)
 
         setpoint = setpoint_target or self._get_thermostat_setpoint(thermostat_entity, hvac_action)
         if setpoint is not None:
@@ -1663,10 +2279,37 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         ``pre_adjust`` marks the bounded pre-adjust path (R7.7), the only command
         path R7.6 permits while the thermostat is idle/fan.
         """
+        timings = self._poll_timings
+        waiting = time.perf_counter()
         async with self._dab_lock:
-            await self._apply_dab_adjustments_impl(
-                thermostat_entity, hvac_action, vent_ids, data, count_as_poll, pre_adjust
+            acquired = time.perf_counter()
+            timings.add("lock_wait", acquired - waiting)
+            # ``decide`` is the apply time not spent in the separately timed
+            # dispatch / observability / save phases.
+            nested = timings.spent(_APPLY_SUB_PHASES)
+            decision = DecisionRecord(
+                t_s=datetime.now(UTC).timestamp(),
+                thermostat=thermostat_entity,
+                action=hvac_action,
+                kind="pre_adjust" if pre_adjust else "poll" if count_as_poll else "manual",
             )
+            try:
+                with self._profiler.span():
+                    await self._apply_dab_adjustments_impl(
+                        thermostat_entity,
+                        hvac_action,
+                        vent_ids,
+                        data,
+                        count_as_poll,
+                        pre_adjust,
+                        decision=decision,
+                        settings=self.settings,
+                    )
+            finally:
+                self._decision_log.append(decision)
+                held = time.perf_counter() - acquired
+                timings.add("lock_hold", held)
+                timings.add("decide", held - (timings.spent(_APPLY_SUB_PHASES) - nested))
 
     async def _apply_dab_adjustments_impl(
         self,
@@ -1676,7 +2319,13 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         data: dict[str, Any],
         count_as_poll: bool = False,
         pre_adjust: bool = False,
+        decision: DecisionRecord | None = None,
+        settings: CoordinatorSettings | None = None,
     ) -> None:
+        if settings is None:
+            settings = self.settings
+        if decision is None:
+            decision = DecisionRecord(datetime.now(UTC).timestamp(), thermostat_entity, hvac_action)
         setpoint = self._get_thermostat_setpoint(thermostat_entity, hvac_action)
         if setpoint is None:
             _LOGGER.debug(
@@ -1684,42 +2333,53 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 thermostat_entity,
                 hvac_action,
             )
+            decision.outcome = "no_setpoint"
             return
 
-        close_inactive = self._resolve_close_inactive()
-        granularity = int(self.entry.options.get(CONF_VENT_GRANULARITY, 5))
-        control_strategy = self.entry.options.get(CONF_CONTROL_STRATEGY, DEFAULT_CONTROL_STRATEGY)
-        min_adjust_percent = int(
-            self.entry.options.get(CONF_MIN_ADJUSTMENT_PERCENT, DEFAULT_MIN_ADJUSTMENT_PERCENT)
-        )
-        min_adjust_interval = int(
-            self.entry.options.get(CONF_MIN_ADJUSTMENT_INTERVAL, DEFAULT_MIN_ADJUSTMENT_INTERVAL)
-        )
-        temp_error_override = float(
-            self.entry.options.get(CONF_TEMP_ERROR_OVERRIDE, DEFAULT_TEMP_ERROR_OVERRIDE)
-        )
+        close_inactive = settings.close_inactive
+        granularity = settings.granularity
+        control_strategy = settings.control_strategy
+        min_adjust_percent = settings.min_adjust_percent
+        min_adjust_interval = settings.min_adjust_interval
+        temp_error_override = settings.temp_error_override
         max_running_time = self._max_running_minutes.get(
             thermostat_entity, DEFAULT_SETTINGS.max_minutes_to_setpoint
         )
 
         self._total_active_polls += 1 if count_as_poll else 0
+        decision.setpoint_c = setpoint
+        decision.strategy = control_strategy
 
         # --- Task 24: active-room observability (R13.1/R13.3/R14.1/R5.4) -----
         # Compute the actual active-room spread, max error, per-room signed
         # errors and airflow-limited set every poll while conditioning, and
         # accumulate per-strategy spread metrics. Defensive: a gather failure
         # for one room never breaks the apply path (R22.3).
+        vent_rooms: dict[str, str] = {}
         if hvac_action in (HVACAction.COOLING, HVACAction.HEATING):
-            self._update_active_observability(
-                hvac_action, setpoint, vent_ids, data, control_strategy, granularity
-            )
+            with self._poll_timings.measure("observability"):
+                self._update_active_observability(hvac_action, setpoint, vent_ids, data, settings)
+                samples, vent_rooms = self._gather_room_samples(hvac_action, vent_ids, data)
+                decision.rooms = {
+                    room_id: RoomDecision(
+                        sample.temp_c,
+                        sample.open_pct,
+                        sample.active,
+                        sample.rate,
+                        sample.leak,
+                        sample.vents,
+                    )
+                    for room_id, sample in samples.items()
+                }
+                if count_as_poll:
+                    self._record_replay_row(thermostat_entity, hvac_action, setpoint, samples)
 
         # --- Deviation check: hold positions if tracking within threshold ---
-        deviation_threshold = float(
-            self.entry.options.get(CONF_DEVIATION_THRESHOLD, DEFAULT_DEVIATION_THRESHOLD)
-        )
-        max_recalc = int(self.entry.options.get(CONF_MAX_RECALC_PER_CYCLE, DEFAULT_MAX_RECALC_PER_CYCLE))
+        deviation_threshold = settings.deviation_threshold
+        max_recalc = settings.max_recalc
         cycle_data = self._cycle_targets.get(thermostat_entity)
+        if cycle_data:
+            decision.recalc_count = int(cycle_data.get("recalc_count", 0) or 0)
         _LOGGER.debug(
             "DAB poll #%d for %s: cycle_data=%s, targets=%d, hold_count=%d",
             self._total_active_polls,
@@ -1745,21 +2405,23 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     self._note_hold()
                     for vent_id in vent_ids:
                         self._record_cycle_sample(thermostat_entity, vent_id, data)
+                    decision.outcome = "hold_recalc_cap"
                     return
 
                 needs_recalc = False
                 recalc_reason = ""
 
-                if control_strategy == CONTROL_STRATEGY_BALANCE:
+                if control_strategy in BALANCE_STRATEGIES:
                     # --- A5 hold integration (R5.2/R7.1/R7.2) ---------------
                     # The active-room spread guardrail is the PRIMARY recompute
                     # trigger. Airflow-limited rooms are excluded from the
                     # per-vent "all rooms tracking" determination so a pinned-
                     # but-hot room neither forces churn nor a false hold.
-                    gate_settings = self._balance_gate_settings(granularity)
+                    gate_settings = settings.alloc
                     spread, airflow_limited_vents = self._balance_hold_metrics(
                         hvac_action, setpoint, vent_ids, data, gate_settings
                     )
+                    decision.spread_c = spread
                     if spread > gate_settings.spread_guardrail_c:
                         # R7.2: predicted active-room spread exceeds the
                         # guardrail -> a new allocation is permitted even when
@@ -1769,6 +2431,7 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                             f"active-room spread {spread:.2f}°C exceeds guardrail "
                             f"{gate_settings.spread_guardrail_c:.2f}°C"
                         )
+                        decision.reason = "spread_guardrail"
                     else:
                         # R7.1: at/below the guardrail -> prefer holding. Still
                         # honor the deviation safety check, but EXCLUDE airflow-
@@ -1788,6 +2451,8 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                             exclude_vents=airflow_limited_vents,
                         )
                         self._last_max_deviation = max_deviation
+                        decision.max_deviation_c = max_deviation
+                        decision.reason = "deviation" if needs_recalc else ""
                 else:
                     # Legacy strategies keep their original deviation-only hold
                     # behavior (no spread guardrail, no airflow-limited
@@ -1804,6 +2469,8 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         deviation_threshold,
                     )
                     self._last_max_deviation = max_deviation
+                    decision.max_deviation_c = max_deviation
+                    decision.reason = "deviation" if needs_recalc else ""
 
                 if not needs_recalc:
                     _LOGGER.debug(
@@ -1815,6 +2482,7 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     self._note_hold()
                     for vent_id in vent_ids:
                         self._record_cycle_sample(thermostat_entity, vent_id, data)
+                    decision.outcome = "hold_tracking"
                     return
 
                 _LOGGER.debug(
@@ -1828,16 +2496,19 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self._note_recalc()
                 cycle_data["recalc_count"] += 1
                 cycle_data["last_recalc"] = now_check
+                decision.outcome = "recalc"
+                decision.recalc_count = cycle_data["recalc_count"]
 
         rate_and_temp: dict[str, dict[str, Any]] = {}
         missing_temp_vents: set[str] = set()
-        is_balance = control_strategy == CONTROL_STRATEGY_BALANCE
+        is_balance = control_strategy in BALANCE_STRATEGIES
+        learned_rates = self._learned_room_rates(hvac_action) if is_balance and vent_ids else {}
         for vent_id in vent_ids:
             if is_balance:
                 # balance sources its rate from the learned per-room model +
                 # context regime (R11/R12/R25); legacy strategies keep the
                 # legacy regime/offset effective-rate source unchanged.
-                rate = self._get_room_effective_rate(vent_id, hvac_action, data)
+                rate = self._get_room_effective_rate(vent_id, hvac_action, data, learned_rates)
             else:
                 vent_context = self._get_vent_context(vent_id, data)
                 rate = self._get_effective_efficiency_rate(vent_id, hvac_action, context=vent_context)
@@ -1855,6 +2526,7 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             }
 
         if not rate_and_temp:
+            decision.outcome = "no_data"
             return
 
         # --- Target computation (R20.5 refactor) -------------------------------
@@ -1867,15 +2539,14 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # carries the pre-safety-floor per-vent snapshot so the floor's *opening*
         # moves can be detected (and exempted from cooldown) below.
         balance_pre_floor: dict[str, float] | None = None
-        if control_strategy == CONTROL_STRATEGY_BALANCE:
+        if control_strategy in BALANCE_STRATEGIES:
             targets, balance_pre_floor = self._compute_balance_targets(
                 rate_and_temp,
                 hvac_action,
                 setpoint,
-                granularity,
+                settings,
                 thermostat_entity,
                 data,
-                close_inactive,
                 missing_temp_vents,
             )
         else:
@@ -1909,9 +2580,7 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             # the cooldown/deadband below (R9/R7.5).
             pre_safety_targets = balance_pre_floor
         else:
-            conventional = self.entry.options.get(CONF_CONVENTIONAL_VENTS_BY_THERMOSTAT, {}).get(
-                thermostat_entity, 0
-            )
+            conventional = settings.conventional_vents.get(thermostat_entity, 0)
             pre_safety_targets = dict(targets)
             targets = adjust_for_minimum_airflow(
                 rate_and_temp,
@@ -1923,6 +2592,13 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 allow_inactive_if_needed=True,
             )
 
+        for vent_id, target in targets.items():
+            room_decision = decision.rooms.get(vent_rooms.get(vent_id, ""))
+            if room_decision is not None and room_decision.target_pct is None:
+                pre = pre_safety_targets.get(vent_id)
+                room_decision.pre_floor_pct = float(pre) if pre is not None else None
+                room_decision.target_pct = float(target)
+
         # --- Reach-the-floor vs padding/balancing distinction (R9.1/R9.2/R7.5) -
         # A vent is a "reach-the-floor" open — immediate, bypassing cooldown /
         # deadband / min-percent — ONLY when BOTH hold:
@@ -1973,6 +2649,7 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         "HVAC action changed to %s before vent commands; skipping",
                         current_action,
                     )
+                    decision.outcome = "skipped_idle"
                     return
 
         now = datetime.now(UTC)
@@ -1996,24 +2673,9 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 group_last_commanded[vid] = group_max
 
         cycle_data = self._cycle_targets.get(thermostat_entity)
-        max_batches_per_cycle = int(
-            self.entry.options.get(
-                CONF_MAX_ADJUSTMENT_BATCHES_PER_CYCLE,
-                DEFAULT_MAX_ADJUSTMENT_BATCHES_PER_CYCLE,
-            )
-        )
-        max_batches_per_window = int(
-            self.entry.options.get(
-                CONF_MAX_ADJUSTMENT_BATCHES_PER_WINDOW,
-                DEFAULT_MAX_ADJUSTMENT_BATCHES_PER_WINDOW,
-            )
-        )
-        adjustment_window_minutes = int(
-            self.entry.options.get(
-                CONF_ADJUSTMENT_WINDOW_MINUTES,
-                DEFAULT_ADJUSTMENT_WINDOW_MINUTES,
-            )
-        )
+        max_batches_per_cycle = settings.max_batches_per_cycle
+        max_batches_per_window = settings.max_batches_per_window
+        adjustment_window_minutes = settings.adjustment_window_minutes
         if max_batches_per_cycle > 0 and cycle_data is not None:
             batch_count = int(cycle_data.get("adjustment_batches", 0) or 0)
             if batch_count >= max_batches_per_cycle:
@@ -2024,6 +2686,7 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 )
                 for vent_id in vent_ids:
                     self._record_cycle_sample(thermostat_entity, vent_id, data)
+                decision.outcome = "hold_batch_cycle"
                 return
         if max_batches_per_window > 0 and adjustment_window_minutes > 0:
             cutoff = now - timedelta(minutes=adjustment_window_minutes)
@@ -2038,9 +2701,10 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 )
                 for vent_id in vent_ids:
                     self._record_cycle_sample(thermostat_entity, vent_id, data)
+                decision.outcome = "hold_batch_window"
                 return
 
-        deadband = int(self.entry.options.get(CONF_DEADBAND_PERCENT, DEFAULT_DEADBAND_PERCENT))
+        deadband = settings.deadband
 
         def _bump_movement(vent_id: str, movement_value: float) -> None:
             vent_movement = self._cycle_stats.get(thermostat_entity, {}).setdefault("vent_movement", {})
@@ -2058,6 +2722,7 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 continue
             rep = gids[0]
             active = rate_and_temp.get(rep, {}).get("active", True)
+            room_decision = decision.rooms.get(vent_rooms.get(rep, ""))
 
             # Inactive rooms with close_inactive off are held at their current
             # position and are NEVER repositioned by balancing; the only move
@@ -2076,14 +2741,16 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     target_rounded = round_to_nearest_multiple(tgt, granularity)
                     target_rounded_values[vent_id] = target_rounded
                     current_int = int(current)
-                    if current_int == target_rounded:
+                    if current_int == target_rounded or vent_id not in safety_opened:
+                        # held — balancing never repositions inactive
+                        _note_room(room_decision, "inactive_held", current_int)
                         continue
-                    if vent_id not in safety_opened:
-                        continue  # held — balancing never repositions inactive
                     # Safety reach-the-floor open: immediate (bypasses cooldown).
                     movement_value = abs(target_rounded - current_int)
                     if not await self._command_vent(vent_id, target_rounded):
+                        _note_room(room_decision, "command_failed")
                         continue
+                    _note_room(room_decision, "safety_open", target_rounded)
                     self._vent_last_commanded[vent_id] = now
                     changed += 1
                     movement_total += movement_value
@@ -2102,6 +2769,7 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 if cur is not None:
                     currents[vent_id] = int(cur)
             if not currents:
+                _note_room(room_decision, "no_reading")
                 continue
 
             # Group-level gating uses the LARGEST member deviation so the whole
@@ -2109,6 +2777,7 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             # independent per-vent deadband/min-percent decision (R23.3).
             max_dev = max(abs(shared_target_rounded - c) for c in currents.values())
             if max_dev == 0:
+                _note_room(room_decision, "at_target", shared_target_rounded)
                 continue  # whole group already at the shared target
 
             temp = float(rate_and_temp.get(rep, {}).get("temp", 0) or 0)
@@ -2119,8 +2788,10 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if not override and not safety_override:
                 # Deadband + minimum-adjustment-percent evaluated ONCE per group.
                 if deadband > 0 and max_dev <= deadband:
+                    _note_room(room_decision, "deadband", currents.get(rep))
                     continue
                 if min_adjust_percent > 0 and max_dev < min_adjust_percent:
+                    _note_room(room_decision, "min_percent", currents.get(rep))
                     continue
             # Time-based cooldown always applies (even for temp-error override);
             # only safety_override (reach-the-floor opening) skips it. The group's
@@ -2129,6 +2800,7 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if not safety_override:
                 last_change = group_last_commanded.get(rep, self._vent_last_commanded.get(rep))
                 if last_change and (now - last_change) < timedelta(minutes=min_adjust_interval):
+                    _note_room(room_decision, "cooldown", currents.get(rep))
                     continue
 
             # Commit the group move: command every member that is not already at
@@ -2152,8 +2824,13 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             # whole room observes one cooldown window and the vents never drift
             # apart in move count (R23.2, the 53-vs-51 fix).
             if group_commanded:
+                _note_room(
+                    room_decision, "safety_open" if safety_override else "moved", shared_target_rounded
+                )
                 for vent_id in gids:
                     self._vent_last_commanded[vent_id] = now
+            else:
+                _note_room(room_decision, "command_failed")
 
         for vent_id in vent_ids:
             self._record_cycle_sample(thermostat_entity, vent_id, data)
@@ -2238,7 +2915,8 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return True
         if self.api:
             try:
-                await self.api.async_set_vent_position(vent_id, target_rounded)
+                with self._poll_timings.measure("dispatch"):
+                    await self.api.async_set_vent_position(vent_id, target_rounded)
             except (TimeoutError, aiohttp.ClientError, FlairApiError) as err:
                 _LOGGER.warning(
                     "Failed to set vent %s to %s%%: %s",
@@ -2440,48 +3118,6 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         n = int(stats.get("n", 0) or 0)
         return VentCurve.seed_from_regression(slope, intercept, n)
 
-    def _balance_gate_settings(self, granularity: int) -> AllocSettings:
-        """Build :class:`AllocSettings` for the A5 hold/gating decision.
-
-        Sources the spread guardrail, cross-coupling toggle, safety floor and
-        airflow-limited detection thresholds from ``entry.options`` (the
-        dedicated ``CONF_*`` keys wired in Task 23) with the design defaults as
-        the fallback. Values are read defensively so a malformed option degrades
-        to its default rather than raising in the apply path.
-        """
-        opts = self.entry.options
-        return AllocSettings(
-            granularity=int(granularity),
-            safety_floor_pct=self._opt_float(CONF_SAFETY_FLOOR_PCT, DEFAULT_SAFETY_FLOOR_PCT),
-            crosscoupling=bool(opts.get(CONF_CROSSCOUPLING_ENABLED, DEFAULT_CROSSCOUPLING_ENABLED)),
-            spread_guardrail_c=self._opt_float(CONF_SPREAD_GUARDRAIL_C, DEFAULT_SPREAD_GUARDRAIL_C),
-            spread_improvement_deadband_c=self._opt_float(
-                CONF_SPREAD_IMPROVEMENT_DEADBAND_C,
-                DEFAULT_SPREAD_IMPROVEMENT_DEADBAND_C,
-            ),
-            airflow_limited_margin_pct=self._opt_float(
-                CONF_AIRFLOW_LIMITED_MARGIN_PCT, DEFAULT_AIRFLOW_LIMITED_MARGIN_PCT
-            ),
-            airflow_limited_error_c=self._opt_float(
-                CONF_AIRFLOW_LIMITED_ERROR_C, DEFAULT_AIRFLOW_LIMITED_ERROR_C
-            ),
-        )
-
-    def _opt_float(self, key: str, default: float) -> float:
-        """Read a numeric option as a float, falling back to ``default``.
-
-        The options flow already clamps to the documented range on save; this
-        guards against a hand-edited or legacy option that is missing or
-        non-numeric so the apply path never raises.
-        """
-        try:
-            value = float(self.entry.options.get(key, default))
-        except (TypeError, ValueError):
-            return float(default)
-        if value != value:  # NaN
-            return float(default)
-        return value
-
     def _balance_hold_metrics(
         self,
         hvac_action: str,
@@ -2509,6 +3145,7 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         mode = MODE_COOLING if hvac_action == HVACAction.COOLING else MODE_HEATING
         groups = self._build_room_vent_groups(vent_ids, data)
+        learned_rates = self._learned_room_rates(hvac_action) if vent_ids else {}
         rooms: list[RoomAllocInput] = []
         targets: dict[str, float] = {}
         airflow_limited_vents: set[str] = set()
@@ -2521,7 +3158,7 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             temp = self._get_room_temp(rep, data)
             if temp is None:
                 continue
-            rate = self._get_room_effective_rate(rep, hvac_action, data)
+            rate = self._get_room_effective_rate(rep, hvac_action, data, learned_rates)
             if rate <= 0:
                 continue
             cur = self._get_vent_attribute(rep, data, "percent-open")
@@ -2557,10 +3194,9 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         setpoint: float,
         vent_ids: list[str],
         data: dict[str, Any],
-        control_strategy: str,
-        granularity: int,
+        settings: CoordinatorSettings,
     ) -> None:
-        """Recompute active-room observability every poll while conditioning.
+        """Refresh active-room observability every poll while conditioning.
 
         Stores, for the observability sensors/attributes:
 
@@ -2574,57 +3210,137 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         * ``_airflow_limited_rooms`` / ``_airflow_limited_vents`` -- rooms whose
           representative vent is at/near full open yet still off-target (R5.4).
 
-        Also accumulates per-strategy spread metrics (R13.4). Inactive rooms are
-        excluded from every active-room aggregate (R2.5). A gather error for one
-        room is swallowed so the apply path never crashes (R22.3); strategy is
-        independent (spread/error are temperature-only).
+        The state lives in ``_active_rooms`` (``balance.ActiveRoomStats``): each
+        poll re-reads every room but only a room whose temperature, aperture or
+        vents changed touches it, and rooms that left the active set are
+        dropped. Also accumulates per-strategy spread metrics (R13.4). Inactive
+        rooms are excluded from every active-room aggregate (R2.5). A gather
+        error for one room drops that room so the apply path never crashes
+        (R22.3); strategy is independent (spread/error are temperature-only).
         """
-        try:
-            settings = self._balance_gate_settings(granularity)
-        except Exception:  # noqa: BLE001 - defensive at the apply boundary
-            settings = AllocSettings()
-        margin = settings.airflow_limited_margin_pct
-        error_c = settings.airflow_limited_error_c
-        cooling = hvac_action == HVACAction.COOLING
+        stats = self._active_rooms
+        stats.configure(
+            MODE_COOLING if hvac_action == HVACAction.COOLING else MODE_HEATING,
+            setpoint,
+            settings.alloc.airflow_limited_margin_pct,
+            settings.alloc.airflow_limited_error_c,
+        )
+        seen: set[str] = set()
+        for room_name, group_vent_ids in self._build_room_vent_groups(vent_ids, data).items():
+            try:
+                room = self._get_room_data(group_vent_ids[0], data)
+                room_id = room.get("id") or room_name
+                if self._update_active_room(room_id, group_vent_ids, data):
+                    seen.add(room_id)
+            except Exception:  # noqa: BLE001 - skip the room, never crash (R22.3)
+                continue
+        stats.retain(seen)
+        self._publish_active_stats()
+        self._observability_active = True
+        self._record_spread_metrics(settings.control_strategy, self._last_active_spread, settings)
+
+    def _update_active_room(self, room_id: str, group_vent_ids: list[str], data: dict[str, Any]) -> bool:
+        """Re-read one room into ``_active_rooms``; ``False`` if it is not active-with-a-temp."""
+        rep = group_vent_ids[0]
+        temp = self._get_room_temp(rep, data) if self._get_room_active(rep, data) else None
+        if temp is None:
+            self._active_rooms.discard(room_id)
+            return False
+        cur = self._get_vent_attribute(rep, data, "percent-open")
+        current_open = float(cur) if cur is not None else 0.0
+        self._active_rooms.update_room(room_id, float(temp), current_open, group_vent_ids)
+        return True
 
-        groups = self._build_room_vent_groups(vent_ids, data)
-        temps: list[float] = []
-        signed_errors: dict[str, float] = {}
-        airflow_rooms: set[str] = set()
-        airflow_vents: set[str] = set()
-        max_err = 0.0
-        for room_name, group_vent_ids in groups.items():
+    def _refresh_active_room(self, vent_id: str, data: dict[str, Any]) -> bool:
+        """Re-read the tracked active room whose representative vent is ``vent_id``.
+
+        Between polls only rooms already in the active set are touched (the
+        set, mode and setpoint are the last active poll's). Returns whether the
+        published stats changed.
+        """
+        stats = self._active_rooms
+        room_id = stats.room_for_vent(vent_id)
+        if room_id is None:
+            return False
+        group_vent_ids = list(stats.vents(room_id))
+        if group_vent_ids[0] != vent_id:
+            return False  # a room reads its representative vent's sensor
+        before = (stats.spread, stats.max_error, stats.signed_errors.get(room_id), room_id in stats)
+        try:
+            self._update_active_room(room_id, group_vent_ids, data)
+        except Exception:  # noqa: BLE001 - keep the last value, never crash (R22.3)
+            return False
+        self._publish_active_stats()
+        return before != (stats.spread, stats.max_error, stats.signed_errors.get(room_id), room_id in stats)
+
+    def _publish_active_stats(self) -> None:
+        """Expose ``_active_rooms`` through the attributes the getters read (O(1))."""
+        stats = self._active_rooms
+        self._last_active_spread = round(stats.spread, 3)
+        self._last_max_active_error = stats.max_error
+
+    def _gather_room_samples(
+        self, hvac_action: str, vent_ids: list[str], data: dict[str, Any]
+    ) -> tuple[dict[str, RoomSample], dict[str, str]]:
+        """This poll's per-room state for the replay trace and decision record.
+
+        One :class:`replay.RoomSample` per room-group (R23), keyed by room id,
+        carrying the ``balance`` effective rate and leak the allocator would use
+        so the offline replay sees the same inputs, plus the vent -> room id map.
+        Defensive like the observability pass: a failing room is recorded as
+        missing (R22.3).
+        """
+        rooms: dict[str, RoomSample] = {}
+        vent_rooms: dict[str, str] = {}
+        learned_rates = self._learned_room_rates(hvac_action) if vent_ids else {}
+        for room_name, group_vent_ids in self._build_room_vent_groups(vent_ids, data).items():
             rep = group_vent_ids[0]
             try:
-                if not self._get_room_active(rep, data):
-                    continue
-                temp = self._get_room_temp(rep, data)
-                if temp is None:
-                    continue
-                signed = (float(temp) - setpoint) if cooling else (setpoint - float(temp))
                 room = self._get_room_data(rep, data)
                 room_id = room.get("id") or room_name
-                signed_errors[room_id] = round(signed, 2)
-                temps.append(float(temp))
-                max_err = max(max_err, abs(signed))
+                temp = self._get_room_temp(rep, data)
                 cur = self._get_vent_attribute(rep, data, "percent-open")
-                current_open = float(cur) if cur is not None else 0.0
-                if current_open >= 100.0 - margin and signed > error_c:
-                    airflow_rooms.add(room_id)
-                    airflow_vents.update(group_vent_ids)
+                active = self._get_room_active(rep, data)
+                rooms[room_id] = RoomSample(
+                    temp_c=float(temp) if temp is not None else None,
+                    open_pct=float(cur) if cur is not None else None,
+                    active=active,
+                    rate=(
+                        self._get_room_effective_rate(rep, hvac_action, data, learned_rates)
+                        if active
+                        else None
+                    ),
+                    leak=self._get_vent_leak(rep, hvac_action),
+                    vents=len(group_vent_ids),
+                )
             except Exception:  # noqa: BLE001 - skip the room, never crash (R22.3)
                 continue
+            for vent_id in group_vent_ids:
+                vent_rooms[vent_id] = room_id
+        return rooms, vent_rooms
+
+    def _record_replay_row(
+        self,
+        thermostat_entity: str,
+        hvac_action: str,
+        setpoint: float,
+        rooms: dict[str, RoomSample],
+    ) -> None:
+        """Append this poll's per-room state to the thermostat's replay trace."""
+        trace = self._replay_traces.get(thermostat_entity)
+        if trace is None:
+            trace = self._replay_traces[thermostat_entity] = Trace(max_rows=REPLAY_TRACE_MAX_ROWS)
+        trace.append(datetime.now(UTC).timestamp(), hvac_action, setpoint, rooms)
 
-        spread = (max(temps) - min(temps)) if len(temps) >= 2 else 0.0
-        spread = round(spread, 3)
-        self._last_active_spread = spread
-        self._last_max_active_error = max_err
-        self._room_signed_errors = signed_errors
-        self._airflow_limited_rooms = airflow_rooms
-        self._airflow_limited_vents = airflow_vents
-        self._record_spread_metrics(control_strategy, spread, settings.spread_guardrail_c)
+    def get_replay_traces(self) -> dict[str, Trace]:
+        """Snapshot of the recorded replay traces, keyed by thermostat entity."""
+        return {thermostat: trace.copy() for thermostat, trace in self._replay_traces.items()}
 
-    def _record_spread_metrics(self, strategy: str, spread: float, guardrail_c: float) -> None:
+    def get_decision_log(self) -> DecisionLog:
+        """Snapshot of the decision-record ring (see ``replay.DecisionLog``)."""
+        return self._decision_log.copy()
+
+    def _record_spread_metrics(self, strategy: str, spread: float, settings: CoordinatorSettings) -> None:
         """Accumulate per-strategy spread metrics each active poll (R13.4)."""
         metrics = self._strategy_metrics.setdefault(strategy, {})
         for field, default in _NEW_METRIC_DEFAULTS.items():
@@ -2633,12 +3349,9 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._spread_sample_counts[strategy] = n
         metrics["avg_spread"] = (float(metrics.get("avg_spread", 0.0)) * (n - 1) + spread) / n
         metrics["max_spread"] = max(float(metrics.get("max_spread", 0.0)), spread)
-        if spread > guardrail_c:
-            interval_min = float(
-                self.entry.options.get(CONF_POLL_INTERVAL_ACTIVE, DEFAULT_POLL_INTERVAL_ACTIVE)
-            )
+        if spread > settings.alloc.spread_guardrail_c:
             metrics["time_above_guardrail_min"] = (
-                float(metrics.get("time_above_guardrail_min", 0.0)) + interval_min
+                float(metrics.get("time_above_guardrail_min", 0.0)) + settings.poll_interval_active_min
             )
 
     def _note_hold(self) -> None:
@@ -2715,14 +3428,21 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         rate_and_temp: dict[str, dict[str, Any]],
         hvac_action: str,
         setpoint: float,
-        granularity: int,
+        coordinator_settings: CoordinatorSettings,
         thermostat_entity: str,
         data: dict[str, Any],
-        close_inactive: bool,
         missing_temp_vents: set[str],
     ) -> tuple[dict[str, float], dict[str, float]]:
         """Gather rooms, run the pure ``balance`` allocation + safety floor (R1/R20.5).
 
+        ``balance`` plans with ``balance.allocate_exact`` (already on the
+        granularity lattice and floor-feasible, so the floor below is only the
+        re-check); the ``mpc`` strategy plans with ``balance.plan_mpc``.
+        Everything else here is shared. Before the floor,
+        ``balance.select_fewest_moves`` holds every room it can at its current
+        position within the spread improvement deadband, trying first the rooms
+        the dispatch loop below would not command this poll anyway.
+
         Returns ``(targets, pre_floor)`` — per-vent commanded apertures after the
         single ``balance.apply_safety_floor`` choke point, and the per-vent
         pre-floor snapshot (so the dispatch loop can tell which opens were forced
@@ -2782,39 +3502,35 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Held-open inactive airflow counts toward the floor only while the vents
         # are actually open (R3.7) — i.e. when close_inactive is off.
         inactive_open_sum = 0.0
-        if not close_inactive:
+        if not coordinator_settings.close_inactive:
             for vid in inactive_vents:
                 cur = self._get_vent_attribute(vid, data, "percent-open")
                 inactive_open_sum += float(cur) if cur is not None else 0.0
 
-        conventional = int(
-            self.entry.options.get(CONF_CONVENTIONAL_VENTS_BY_THERMOSTAT, {}).get(thermostat_entity, 0) or 0
-        )
-        settings = AllocSettings(
-            safety_floor_pct=self._opt_float(CONF_SAFETY_FLOOR_PCT, DEFAULT_SAFETY_FLOOR_PCT),
-            conventional_vents=conventional,
+        # The prebuilt options part plus this poll's floor inputs.
+        settings = replace(
+            coordinator_settings.alloc,
+            conventional_vents=coordinator_settings.conventional_vents.get(thermostat_entity, 0),
             inactive_open_pct_sum=inactive_open_sum,
             inactive_count=len(inactive_vents),
-            granularity=int(granularity),
-            crosscoupling=bool(
-                self.entry.options.get(CONF_CROSSCOUPLING_ENABLED, DEFAULT_CROSSCOUPLING_ENABLED)
-            ),
-            airflow_limited_margin_pct=self._opt_float(
-                CONF_AIRFLOW_LIMITED_MARGIN_PCT, DEFAULT_AIRFLOW_LIMITED_MARGIN_PCT
-            ),
-            airflow_limited_error_c=self._opt_float(
-                CONF_AIRFLOW_LIMITED_ERROR_C, DEFAULT_AIRFLOW_LIMITED_ERROR_C
-            ),
         )
 
-        result = allocate(rooms, setpoint, mode, settings)
+        mpc = coordinator_settings.control_strategy == CONTROL_STRATEGY_MPC
+        planner = plan_mpc if mpc else allocate_exact
+        result = planner(rooms, setpoint, mode, settings)
+        sticky = self._balance_sticky_rooms(rooms, result.targets, coordinator_settings)
+        selected, held = select_fewest_moves(result.targets, rooms, mode, setpoint, settings, sticky=sticky)
         # Single safety choke point — every balance dispatch routes through here.
-        floored, _floor_binding = apply_safety_floor(result.targets, rooms, settings)
+        floored, _floor_binding = apply_safety_floor(selected, rooms, settings)
 
         targets: dict[str, float] = {}
         pre_floor: dict[str, float] = {}
+        # ``allocate_exact`` folds the floor into its plan; the opens it forced
+        # are still told apart through its pre-floor plan.
+        unfloored = dict(result.pre_floor_targets if result.pre_floor_targets is not None else result.targets)
+        unfloored.update((room_name, selected[room_name]) for room_name in held)
         for room_name, group_vent_ids in room_to_vents.items():
-            pre_pct = result.targets.get(room_name, 0.0)
+            pre_pct = unfloored.get(room_name, 0.0)
             post_pct = floored.get(room_name, pre_pct)
             for vid in group_vent_ids:
                 pre_floor[vid] = pre_pct
@@ -2828,6 +3544,40 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return targets, pre_floor
 
+    def _balance_sticky_rooms(
+        self,
+        rooms: list[RoomAllocInput],
+        plan: dict[str, float],
+        coordinator_settings: CoordinatorSettings,
+    ) -> frozenset[str]:
+        """Rooms the dispatch loop will not command this poll whatever the plan says.
+
+        Mirrors its group gates: a shared cooldown still running, or a rounded
+        move inside the deadband / below the minimum percent without the
+        temperature-error override. ``select_fewest_moves`` tries these holds
+        first, so the predicted spread matches what is actually executed.
+        """
+        now = datetime.now(UTC)
+        cooldown = timedelta(minutes=coordinator_settings.min_adjust_interval)
+        deadband = coordinator_settings.deadband
+        min_percent = coordinator_settings.min_adjust_percent
+        sticky: set[str] = set()
+        for room in rooms:
+            last = max(
+                (self._vent_last_commanded[vid] for vid in room.vent_ids if vid in self._vent_last_commanded),
+                default=None,
+            )
+            if last is not None and now - last < cooldown:
+                sticky.add(room.room_id)
+                continue
+            if room.signed_error_c >= coordinator_settings.temp_error_override:
+                continue
+            target = round_to_nearest_multiple(plan.get(room.room_id, 0.0), coordinator_settings.granularity)
+            deviation = abs(target - int(room.current_open))
+            if deviation and ((deadband > 0 and deviation <= deadband) or deviation < min_percent):
+                sticky.add(room.room_id)
+        return frozenset(sticky)
+
     def _get_vent_attribute(self, vent_id: str, data: dict[str, Any], attr: str) -> Any:
         vent = (data.get("vents") or {}).get(vent_id, {})
         return (vent.get("attributes") or {}).get(attr)
@@ -2943,22 +3693,7 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         state = self.hass.states.get(entity)
         if state is None:
             return None
-        unit = state.attributes.get("unit_of_measurement")
-        raw: Any = None
-        if str(entity).startswith("weather."):
-            raw = state.attributes.get("temperature")
-            unit = state.attributes.get("temperature_unit", unit)
-        if raw is None:
-            if state.state in {STATE_UNKNOWN, STATE_UNAVAILABLE}:
-                return None
-            raw = state.state
-        try:
-            temp = float(raw)
-        except (TypeError, ValueError):
-            return None
-        if is_fahrenheit_unit(unit):
-            return (temp - 32) * 5 / 9
-        return temp
+        return _outdoor_temp_c(entity, state.state, state.attributes)
 
     def _resolve_sun_state(self) -> str | None:
         """Return the ``sun.sun`` state (``above_horizon``/``below_horizon``).
@@ -2971,17 +3706,45 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return None
         return state.state
 
+    def _get_house_context(self) -> Context:
+        """House-wide part of the context: local hour, outdoor band and sun.
+
+        Resolved once per poll (the outdoor entity and ``sun.sun`` reads, the
+        unit conversion) and reused by every room; outside a poll it is read
+        fresh. ``occupied`` and ``doors_open`` are left unset.
+        """
+        house = self._house_context
+        if house is None:
+            house = build_context(
+                hour=dt_util.now().hour,
+                outdoor_temp_c=self._resolve_outdoor_temp_c(),
+                sun_state=self._resolve_sun_state(),
+            )
+            if self._room_contexts is not None:
+                self._house_context = house
+        return house
+
     def _build_context(self, vent_id: str, data: dict[str, Any]) -> Context:
         """Build a pure :class:`context.Context` from current HA states (R12).
 
         Resolves the primitives ``context.build`` expects — local hour, outdoor
         temperature (°C), tri-state occupancy, tri-state door-open and the sun
-        state — then delegates to the pure builder. Every source degrades
-        gracefully: a missing outdoor reading yields the mild band and an unset
-        occupancy/door sensor stays ``None`` (multiplier 1.0). Never raises.
+        state. The house-wide part comes from :meth:`_get_house_context`; the
+        room part is occupancy and the vent's assigned door sensor. During a
+        poll the finished context is cached per room and door sensor, so every
+        vent of a room and every consumer in the poll share one build. Every
+        source degrades gracefully: a missing outdoor reading yields the mild
+        band and an unset occupancy/door sensor stays ``None`` (multiplier
+        1.0). Never raises.
         """
-        hour = dt_util.now().hour
-        outdoor_temp_c = self._resolve_outdoor_temp_c()
+        assignment = self._get_vent_assignments().get(vent_id, {})
+        door_sensor = assignment.get(CONF_DOOR_SENSOR_ENTITY)
+        rooms = self._room_contexts
+        key = (id(data), self._get_room_name(vent_id, data) or vent_id, door_sensor)
+        if rooms is not None:
+            cached = rooms.get(key)
+            if cached is not None:
+                return cached
 
         # Occupancy is tri-state: only a present attribute yields True/False.
         room = self._get_room_data(vent_id, data)
@@ -2996,33 +3759,48 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Door state from the per-vent assignment (R12.2/12.3); tri-state None
         # when unset or unavailable.
-        assignment = self._get_vent_assignments().get(vent_id, {})
-        door_sensor = assignment.get(CONF_DOOR_SENSOR_ENTITY)
         doors_open: bool | None = None
         if door_sensor:
             door_state = self.hass.states.get(door_sensor)
             if door_state and door_state.state not in {STATE_UNKNOWN, STATE_UNAVAILABLE}:
                 doors_open = door_state.state == "on"
 
-        return build_context(
-            hour=hour,
-            outdoor_temp_c=outdoor_temp_c,
-            occupied=occupied,
-            doors_open=doors_open,
-            sun_state=self._resolve_sun_state(),
-        )
+        ctx = replace(self._get_house_context(), occupied=occupied, doors_open=doors_open)
+        if rooms is not None:
+            rooms[key] = ctx
+        return ctx
+
+    def _learned_room_rates(self, hvac_action: str) -> dict[str, float]:
+        """Every room's learned rate for the current regime, in one bulk lookup.
+
+        The regime (day/night x mild/hot) is house-wide — it depends only on the
+        hour, the outdoor band and the sun — so the house context resolves it.
+        Pass the result to :meth:`_get_room_effective_rate` for each room of a
+        pass instead of looking the models up one at a time.
+        """
+        mode = "cooling" if hvac_action == HVACAction.COOLING else "heating"
+        regime = context_regime_index(self._get_house_context())
+        return self._room_models.effective_rates(regime, mode)
 
-    def _get_room_effective_rate(self, vent_id: str, hvac_action: str, data: dict[str, Any]) -> float:
+    def _get_room_effective_rate(
+        self,
+        vent_id: str,
+        hvac_action: str,
+        data: dict[str, Any],
+        learned_rates: Mapping[str, float] | None = None,
+    ) -> float:
         """Context-adjusted effective rate for ``balance`` from the learned model.
 
         The synchronized-convergence allocator consumes a context-adjusted
         full-open room efficiency ``e_i`` (R25.4). This sources it from the
-        per-room :class:`learning.RoomEfficiencyModel`:
+        per-room learned model:
 
         * build the :class:`context.Context` and its ``regime_index``;
-        * if a model exists and :func:`learning.effective_rate` returns a
-          positive (trusted regime or baseline) rate, apply the bounded
-          occupancy/door context multipliers (R12) and return it;
+        * if the room has a model and its effective rate (from
+          ``learned_rates``, a :meth:`_learned_room_rates` bulk lookup, or else
+          :meth:`learning.RoomModelStore.effective_rates`) is positive (trusted
+          regime or baseline), apply the bounded occupancy/door context
+          multipliers (R12) and return it;
         * otherwise fall back to the legacy effective-rate source
           (:meth:`_get_effective_efficiency_rate`) so the room is never left
           without a rate while the new model is still cold (R22.3).
@@ -3031,9 +3809,10 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         ctx = self._build_context(vent_id, data)
         room_name = self._get_room_name(vent_id, data)
         room_key = room_name or vent_id
-        model = self._room_efficiency_models.get(room_key) if room_name else None
-        if model is not None:
-            learned = learning_effective_rate(model, context_regime_index(ctx), mode)
+        if room_name:
+            if learned_rates is None:
+                learned_rates = self._room_models.effective_rates(context_regime_index(ctx), mode)
+            learned = learned_rates.get(room_key, 0.0)
             if learned > 0:
                 # A7 "Apply": resolve the learned per-room door factor (door-open
                 # only; neutral 0.9 when the model is None/cold) and thread it
@@ -3047,7 +3826,20 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def _update_room_efficiency_model(self, vent_id: str, mode: str, sample: float) -> None:
         """Route one observed full-open rate ``sample`` per door state (R25/A7).
 
-        Builds the current :class:`context.Context` and derives its
+        A single-row :meth:`_update_room_efficiency_models`.
+        """
+        self._update_room_efficiency_models(mode, [(vent_id, sample)])
+
+    def _update_room_efficiency_models(
+        self,
+        mode: str,
+        samples: Sequence[tuple[str, float]],
+        contexts: Mapping[str, Context] | None = None,
+    ) -> None:
+        """Route a finalize's ``(vent_id, sample)`` full-open rates per door state (R25/A7).
+
+        For each row takes the vent's :class:`context.Context` (from ``contexts``
+        when the caller already built it, else the current one) and derives its
         ``regime_index``. The learning write is then split on ``ctx.doors_open``
         (D11):
 
@@ -3055,45 +3847,95 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
           door-closed reference ``ref = effective_rate(room_model, regime, mode)``
           is read *before* the sample is incorporated. WHEN ``ref > 0`` the
           residual ratio ``sample / ref`` is folded into the room's
-          :class:`learning.DoorFactorModel` for ``mode`` via
-          :func:`learning.update_door_factor` (created on first use), and the
+          door-factor cell for ``mode`` (the batch form of
+          :func:`learning.update_door_factor`, created on first use), and the
           :class:`learning.RoomEfficiencyModel` is left untouched so the
           reference stays door-closed-clean (R29.1, removing the latent
           double-count). WHEN ``ref <= 0`` no ratio can be formed, so neither
           learner is updated (R28.4).
         * **Door closed / unknown** (``False``/``None``) — the sample is folded
-          into the room model via :func:`learning.update_room_efficiency`
-          exactly as before; the door learner is untouched (R29.2).
+          into the room model (the batch form of
+          :func:`learning.update_room_efficiency`); the door learner is
+          untouched (R29.2).
 
         Keyed by room name so a multi-vent room learns at the group level; falls
-        back to the vent id when the room is unnamed.
+        back to the vent id when the room is unnamed. Every door-open reference
+        is read before any row is written, then both learners take their rows
+        as one batch EMA update on the column store (a finalize touches each
+        room once, so this matches applying the rows one at a time).
         """
         data = self.data or {}
-        room_key = self._get_room_name(vent_id, data) or vent_id
-        ctx = self._build_context(vent_id, data)
-        regime = context_regime_index(ctx)
-
-        if ctx.doors_open is True:
-            # D11/R29.1: door-open samples train the door-factor learner against
-            # the door-closed reference and never mutate the room model.
-            room_model = self._room_efficiency_models.get(room_key)
-            ref = learning_effective_rate(room_model, regime, mode) if room_model is not None else 0.0
-            if ref <= 0:
-                # R28.4: no positive reference -> no ratio -> skip both learners.
-                return
-            door_model = self._door_factor_models.get(room_key)
-            if door_model is None:
-                door_model = new_door_factor_model()
-                self._door_factor_models[room_key] = door_model
-            update_door_factor(door_model, sample / ref, mode)
-            return
+        room_rows: list[tuple[str, float, int]] = []
+        door_rows: list[tuple[str, float]] = []
+        refs_by_regime: dict[int, dict[str, float]] = {}
+        for vent_id, sample in samples:
+            room_key = self._get_room_name(vent_id, data) or vent_id
+            ctx = contexts.get(vent_id) if contexts else None
+            if ctx is None:
+                ctx = self._build_context(vent_id, data)
+            regime = context_regime_index(ctx)
+            if ctx.doors_open is True:
+                # D11/R29.1: door-open samples train the door-factor learner
+                # against the door-closed reference and never touch the room model.
+                refs = refs_by_regime.get(regime)
+                if refs is None:
+                    refs = refs_by_regime[regime] = self._room_models.effective_rates(regime, mode)
+                ref = refs.get(room_key, 0.0)
+                if ref <= 0:
+                    # R28.4: no positive reference -> no ratio -> skip both learners.
+                    continue
+                door_rows.append((room_key, sample / ref))
+            else:
+                # R29.2: door-closed/door-unknown -> fold into the room model.
+                room_rows.append((room_key, sample, regime))
+        self._room_models.update_door_many(door_rows, mode)
+        self._room_models.update_many(room_rows, mode)
 
-        # R29.2: door-closed/door-unknown -> fold into the room model as today.
-        model = self._room_efficiency_models.get(room_key)
-        if model is None:
-            model = new_room_model()
-            self._room_efficiency_models[room_key] = model
-        update_room_efficiency(model, sample, regime, mode)
+    def _archive_cycle(
+        self,
+        hvac_action: str,
+        started_running: datetime,
+        setpoint_target: float | None,
+        samples_by_vent: Mapping[str, list[dict[str, Any]]],
+        contexts: Mapping[str, Context],
+    ) -> None:
+        """Append a finalized cycle's raw readings to the sample archive.
+
+        One :class:`replay.VentCycleSamples` per sampled vent (``contexts``
+        keys), with the door state and house regime the live learners used, so
+        :meth:`async_refit_models` can replay the cycle exactly. The archive
+        Store write is debounced.
+        """
+        if not contexts:
+            return
+        data = self.data or {}
+        vents: list[VentCycleSamples] = []
+        for vent_id, ctx in contexts.items():
+            vent = VentCycleSamples(
+                vent_id=vent_id,
+                room_key=self._get_room_name(vent_id, data) or vent_id,
+                doors_open=ctx.doors_open,
+            )
+            for sample in samples_by_vent.get(vent_id) or []:
+                duct = sample.get("duct")
+                vent.offsets_s.append((sample["t"] - started_running).total_seconds())
+                vent.temps.append(float(sample["temp"]))
+                vent.apertures.append(float(sample["aperture"]))
+                vent.ducts.append(None if duct is None else float(duct))
+            vents.append(vent)
+        # The regime is house-wide (hour, outdoor band, sun): any vent's will do.
+        regime = context_regime_index(next(iter(contexts.values())))
+        self._learned_since = min(self._learned_since, started_running.timestamp())
+        self._cycle_archive.append(
+            CycleRecord(
+                started_s=started_running.timestamp(),
+                action=hvac_action,
+                setpoint=setpoint_target,
+                regime=regime,
+                vents=vents,
+            )
+        )
+        self._archive_store.async_delay_save(self._cycle_archive.to_json, CYCLE_ARCHIVE_SAVE_DELAY_S)
 
     def _record_cycle_sample(self, thermostat_entity: str, vent_id: str, data: dict[str, Any]) -> None:
         dab_state = getattr(self, "_dab_state", {})
@@ -3374,7 +4216,9 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         state = self.hass.states.get(thermostat_entity)
         if not state:
             return None
-        attrs = state.attributes
+        return self._thermostat_target_from_attributes(state.attributes, hvac_action)
+
+    def _thermostat_target_from_attributes(self, attrs: Mapping[str, Any], hvac_action: str) -> float | None:
         if hvac_action == HVACAction.COOLING:
             target = (
                 attrs.get("target_temp_high") or attrs.get("cooling_setpoint") or attrs.get("temperature")
@@ -3412,6 +4256,7 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         export_date = datetime.now(UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
         structure_id = self.entry.data.get(CONF_STRUCTURE_ID)
         room_efficiencies: list[dict[str, Any]] = []
+        room_models: RoomModelStore | None = getattr(self, "_room_models", None)
 
         for vent_id, rates in self._vent_rates.items():
             room = self.get_room_for_vent(vent_id) if self.data else {}
@@ -3443,14 +4288,8 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             },
             "efficiencyModels": getattr(self, "_efficiency_models", {}),
             "vent_effectiveness": getattr(self, "_vent_effectiveness", {}),
-            "room_efficiency": {
-                room: room_model_to_dict(model)
-                for room, model in getattr(self, "_room_efficiency_models", {}).items()
-            },
-            "door_factor": {
-                room: door_factor_to_dict(model)
-                for room, model in getattr(self, "_door_factor_models", {}).items()
-            },
+            "room_efficiency": room_models.efficiency_to_dict() if room_models is not None else {},
+            "door_factor": room_models.door_factor_to_dict() if room_models is not None else {},
         }
 
     @staticmethod
@@ -3513,10 +4352,10 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._vent_effectiveness.update(self._sanitize_vent_effectiveness(imported_ve))
         imported_re = payload.get("room_efficiency")
         if isinstance(imported_re, dict):
-            self._room_efficiency_models.update(self._load_room_efficiency(imported_re))
+            self._room_models.load_efficiency(imported_re)
         imported_df = payload.get("door_factor")
         if isinstance(imported_df, dict):
-            self._door_factor_models.update(self._load_door_factor(imported_df))
+            self._room_models.load_door_factor(imported_df)
 
         entries = data.get("roomEfficiencies") or []
         if not isinstance(entries, list):
@@ -3606,6 +4445,538 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return {"entries": len(entries), "applied": applied, "unmatched": unmatched}
 
+    def _refit_curve_leaks(self) -> dict[str, dict[str, float]]:
+        """Per-vent, per-mode leak that seeds each re-fit curve (read on the loop)."""
+        vent_ids = set(self._vent_effectiveness) | set(self._vent_models)
+        vent_ids |= set((self.data or {}).get("vents", {}))
+        leaks: dict[str, dict[str, float]] = {}
+        for vent_id in vent_ids:
+            modes = self._vent_effectiveness.get(vent_id) or {}
+            per_mode: dict[str, float] = {}
+            for mode, action in (("cooling", HVACAction.COOLING), ("heating", HVACAction.HEATING)):
+                entry = modes.get(mode)
+                if isinstance(entry, dict) and isinstance(entry.get("leak"), (int, float)):
+                    per_mode[mode] = float(entry["leak"])
+                else:
+                    per_mode[mode] = self._get_vent_leak(vent_id, action)
+            leaks[vent_id] = per_mode
+        return leaks
+
+    def _replay_cycle_archive(
+        self,
+        records: Iterable[CycleRecord],
+        leaks: Mapping[str, Mapping[str, float]],
+        refit: _ModelRefit | None = None,
+    ) -> _ModelRefit:
+        """Re-run cycle learning over archived ``records`` into fresh models.
+
+        Each cycle takes the finalize path: one :meth:`_compute_efficiency_sample`
+        per room (the first vent with an accepted sample, as in
+        :meth:`_async_finalize_cycle`), then the door-state split of
+        :meth:`_update_room_efficiency_models` as one batch per cycle against
+        references read before the cycle's writes. A door-closed sample with a
+        positive reference also feeds the vent's :class:`learning.VentCurve`:
+        the observed relative flow at the mean aperture is
+        ``sample * aperture / 100 / ref``. Curve observations are folded in
+        once per vent and mode after the last record
+        (:meth:`learning.VentCurve.update_many`), since no reference reads a
+        curve. Curves start from the near-linear seed for the vent's ``leaks``
+        entry.
+
+        Touches only ``records``, ``leaks`` and ``refit``, so it can run in an
+        executor while the loop keeps learning live.
+        """
+        refit = refit or _ModelRefit(RoomModelStore(), {})
+        store = refit.room_models
+        observed: dict[tuple[str, str], tuple[list[float], list[float]]] = {}
+        for record in records:
+            action = record.action
+            if action is None or action not in (HVACAction.COOLING, HVACAction.HEATING):
+                continue
+            mode = "cooling" if action == HVACAction.COOLING else "heating"
+            started = datetime.fromtimestamp(record.started_s, UTC)
+            refs = store.effective_rates(record.regime, mode)
+            room_rows: list[tuple[str, float, int]] = []
+            door_rows: list[tuple[str, float]] = []
+            seen: set[str] = set()
+            for vent in record.vents:
+                if vent.room_key in seen:
+                    continue
+                samples = [
+                    {
+                        "t": started + timedelta(seconds=offset),
+                        "temp": temp,
+                        "aperture": aperture,
+                        "duct": duct,
+                    }
+                    for offset, temp, aperture, duct in zip(
+                        vent.offsets_s, vent.temps, vent.apertures, vent.ducts, strict=True
+                    )
+                ]
+                sample, _observed, mean_aperture = self._compute_efficiency_sample(
+                    action, started, samples, record.setpoint
+                )
+                if sample is None:
+                    refit.rejected += 1
+                    continue
+                seen.add(vent.room_key)
+                refit.samples += 1
+                ref = refs.get(vent.room_key, 0.0)
+                if vent.doors_open is True:
+                    if ref > 0:
+                        door_rows.append((vent.room_key, sample / ref))
+                    continue
+                room_rows.append((vent.room_key, sample, record.regime))
+                if ref > 0 and mean_aperture is not None:
+                    apertures, flows = observed.setdefault((vent.vent_id, mode), ([], []))
+                    apertures.append(mean_aperture)
+                    flows.append(sample * mean_aperture / 100.0 / ref)
+            store.update_door_many(door_rows, mode)
+            store.update_many(room_rows, mode)
+            refit.cycles += 1
+        for (vent_id, mode), (apertures, flows) in observed.items():
+            curves = refit.curves.setdefault(vent_id, {})
+            curve = curves.get(mode)
+            if curve is None:
+                leak = (leaks.get(vent_id) or {}).get(mode, LEAK_DEFAULT)
+                curve = curves[mode] = VentCurve.from_dict(seed_linear_curve(leak))
+            curve.update_many(apertures, flows)
+        return refit
+
+    async def async_refit_models(self, dry_run: bool = False) -> dict[str, Any]:
+        """Rebuild the room, door-factor and curve models from the cycle archive.
+
+        The archive is snapshotted and replayed in an executor
+        (:meth:`_replay_cycle_archive`). Cycles finalized while that runs are
+        then replayed on the loop, and the rebuilt models are swapped in within
+        the same loop step, so no live update is lost or half-applied. Rooms
+        the archive never saw keep their live models, and so does any room,
+        door or curve mode whose live sample count exceeds the re-fit's
+        (:meth:`_keep_mature_live_models`). Returns the replay counts, the
+        per-room/per-vent ``[before, after]`` differences and what was kept;
+        with ``dry_run`` (or an empty archive) nothing is swapped. Never runs
+        alongside :meth:`async_bootstrap_history`.
+        """
+        async with self._model_lock:
+            archive = self._cycle_archive.copy()
+            leaks = self._refit_curve_leaks()
+            refit = await self.hass.async_add_executor_job(
+                self._replay_cycle_archive, archive.records(), leaks
+            )
+            self._replay_cycle_archive(self._cycle_archive.since(archive.appended), leaks, refit)
+
+            kept = self._keep_mature_live_models(refit)
+            rebuilt = refit.room_models
+            changes = room_model_changes(self._room_models, rebuilt)
+            curve_changes: dict[str, dict[str, Any]] = {}
+            for vent_id, curves in sorted(refit.curves.items()):
+                for mode, curve in curves.items():
+                    action = HVACAction.COOLING if mode == "cooling" else HVACAction.HEATING
+                    live = self._get_vent_curve(vent_id, action)
+                    curve_changes.setdefault(vent_id, {})[mode] = {
+                        "knee_pct": [live.knee(), curve.knee()],
+                        "samples": [live.total_samples(), curve.total_samples()],
+                    }
+            changes["vent_curves"] = curve_changes
+
+            applied = not dry_run and refit.cycles > 0
+            if applied:
+                self._room_models = rebuilt
+                self._store_vent_curves(refit.curves)
+                await self._async_save_state()
+            _LOGGER.info(
+                "Re-fit %d archived cycle(s): %d sample(s) accepted, %d rejected%s",
+                refit.cycles,
+                refit.samples,
+                refit.rejected,
+                "" if applied else " (not applied)",
+            )
+            return {
+                "cycles": refit.cycles,
+                "samples": refit.samples,
+                "rejected": refit.rejected,
+                "applied": applied,
+                "changes": changes,
+                "kept_live": kept,
+            }
+
+    def _keep_mature_live_models(self, refit: _ModelRefit) -> dict[str, dict[str, list[str]]]:
+        """Keep every live model that has seen more samples than its re-fit.
+
+        The archive is bounded and drops its oldest cycles first, so a mature
+        live model can carry history the replay never saw. Per room and mode
+        (efficiency and door factor) and per vent and mode (curves), the live
+        model stays in ``refit`` when its sample count exceeds the rebuilt
+        one's; those are returned as ``room -> modes`` / ``vent -> modes`` per
+        section. Rooms and room modes the archive never saw keep their live
+        models too, unreported.
+        """
+        rebuilt = refit.room_models
+        kept: dict[str, dict[str, list[str]]] = {"room_efficiency": {}, "door_factor": {}, "vent_curves": {}}
+
+        def _merge(live: dict[str, dict], fresh: dict[str, dict], section: str) -> dict[str, dict]:
+            merged: dict[str, dict] = {}
+            for key, live_model in live.items():
+                fresh_model = fresh.get(key)
+                if fresh_model is None:
+                    merged[key] = live_model
+                    continue
+                mature = [
+                    mode for mode in ("cooling", "heating") if live_model[mode]["n"] > fresh_model[mode]["n"]
+                ]
+                unseen = [mode for mode in ("cooling", "heating") if fresh_model[mode]["n"] == 0]
+                if mature or unseen:
+                    merged[key] = {**fresh_model, **{mode: live_model[mode] for mode in mature + unseen}}
+                if mature:
+                    kept[section][key] = mature
+            return merged
+
+        rebuilt.load_efficiency(
+            _merge(self._room_models.efficiency_to_dict(), rebuilt.efficiency_to_dict(), "room_efficiency")
+        )
+        rebuilt.load_door_factor(
+            _merge(self._room_models.door_factor_to_dict(), rebuilt.door_factor_to_dict(), "door_factor")
+        )
+        for vent_id, curves in list(refit.curves.items()):
+            for mode in list(curves):
+                action = HVACAction.COOLING if mode == "cooling" else HVACAction.HEATING
+                if self._get_vent_curve(vent_id, action).total_samples() > curves[mode].total_samples():
+                    del curves[mode]
+                    kept["vent_curves"].setdefault(vent_id, []).append(mode)
+            if not curves:
+                del refit.curves[vent_id]
+        return kept
+
+    def _store_vent_curves(self, curves: Mapping[str, Mapping[str, VentCurve]]) -> None:
+        """Write learned curves into ``vent_effectiveness`` (created when missing)."""
+        for vent_id, per_mode in curves.items():
+            modes = self._vent_effectiveness.setdefault(vent_id, {})
+            for mode, curve in per_mode.items():
+                entry = modes.get(mode)
+                if not isinstance(entry, dict):
+                    entry = modes[mode] = {"leak": curve.flows[0], "n": 0}
+                entry["curve"] = curve.to_dict()
+                entry["knee_pct"] = curve.knee()
+
+    def _history_sources(
+        self,
+    ) -> tuple[dict[str, list[tuple[str, str, str | None]]], dict[str, dict[str, str]]]:
+        """Recorded entities the history bootstrap reads, and what each one feeds.
+
+        Returns ``routes`` (``entity_id -> [(thermostat, kind, vent_id)]``, kinds
+        from :mod:`replay`) and ``rooms`` (``thermostat -> {vent_id: room_key}``).
+        Per assigned vent: the thermostat's ``hvac_action``, the room temperature
+        (the assigned sensor, else this integration's room temperature sensor),
+        the vent's aperture and duct temperature sensors and the door sensor;
+        plus the outdoor entity and ``sun.sun`` for the regime. Entities this
+        integration created are found through the entity registry.
+        """
+        data = self.data or {}
+        registry = er.async_get(self.hass)
+        entry_id = self.entry.entry_id
+        routes: dict[str, list[tuple[str, str, str | None]]] = {}
+        rooms: dict[str, dict[str, str]] = {}
+
+        def _route(entity_id: str | None, thermostat: str, kind: str, vent_id: str | None = None) -> None:
+            if entity_id:
+                routes.setdefault(entity_id, []).append((thermostat, kind, vent_id))
+
+        for vent_id, assignment in self._get_vent_assignments().items():
+            thermostat = assignment.get(CONF_THERMOSTAT_ENTITY)
+            if not thermostat:
+                continue
+            if thermostat not in rooms:
+                rooms[thermostat] = {}
+                _route(thermostat, thermostat, HISTORY_ACTION)
+            rooms[thermostat][vent_id] = self._get_room_name(vent_id, data) or vent_id
+            temp_entity = assignment.get(CONF_TEMP_SENSOR_ENTITY)
+            room_id = self._get_room_data(vent_id, data).get("id")
+            if not temp_entity and room_id:
+                temp_entity = registry.async_get_entity_id(
+                    "sensor", DOMAIN, f"{entry_id}_room_{room_id}_room_temperature"
+                )
+            _route(temp_entity, thermostat, HISTORY_TEMP, vent_id)
+            for key, kind in (("aperture", HISTORY_APERTURE), ("duct_temperature", HISTORY_DUCT)):
+                entity_id = registry.async_get_entity_id("sensor", DOMAIN, f"{entry_id}_vent_{vent_id}_{key}")
+                _route(entity_id, thermostat, kind, vent_id)
+            _route(assignment.get(CONF_DOOR_SENSOR_ENTITY), thermostat, HISTORY_DOOR, vent_id)
+        outdoor = self.entry.options.get(CONF_OUTDOOR_TEMP_ENTITY)
+        for thermostat in rooms:
+            _route(outdoor, thermostat, HISTORY_OUTDOOR)
+            _route("sun.sun", thermostat, HISTORY_SUN)
+        return routes, rooms
+
+    def _history_value(self, entity_id: str, kind: str, state: str, attributes: Mapping[str, Any]) -> Any:
+        """Parse one recorded state into the value a :class:`replay.CycleReconstructor` takes."""
+        if kind == HISTORY_ACTION:
+            action = attributes.get("hvac_action")
+            if action not in (HVACAction.COOLING, HVACAction.HEATING):
+                return None, None
+            return str(action), self._thermostat_target_from_attributes(attributes, action)
+        if kind == HISTORY_OUTDOOR:
+            return _outdoor_temp_c(entity_id, state, attributes)
+        if state in {STATE_UNKNOWN, STATE_UNAVAILABLE}:
+            return None
+        if kind == HISTORY_DOOR:
+            return state == "on"
+        if kind == HISTORY_SUN:
+            return state
+        if kind == HISTORY_APERTURE:
+            try:
+                return float(state)
+            except ValueError:
+                return None
+        return self._coerce_temperature(state, attributes.get("unit_of_measurement"))
+
+    def _history_regime(self, t_s: float, outdoor_temp_c: float | None, sun_state: str | None) -> int:
+        """Regime index at a past time, from the site-local hour and recorded outdoor/sun."""
+        hour = dt_util.as_local(datetime.fromtimestamp(t_s, UTC)).hour
+        return context_regime_index(
+            build_context(hour=hour, outdoor_temp_c=outdoor_temp_c, sun_state=sun_state)
+        )
+
+    def _fetch_history_chunk(
+        self,
+        start: datetime,
+        end: datetime,
+        entity_ids: list[str],
+        attribute_ids: list[str],
+        include_start: bool,
+        limit: int,
+    ) -> list[tuple[float, str, str, Mapping[str, Any]]] | None:
+        """Recorded ``(t_s, entity_id, state, attributes)`` rows in ``[start, end)`` (executor only).
+
+        ``None`` once the window holds more than ``limit`` rows. Each entity in
+        ``entity_ids`` is read with a query capped at the rows still allowed
+        (plus one, to tell "exactly full" from "over"), so no more than
+        ``limit + 1`` rows are ever loaded. ``attribute_ids`` are read first
+        through ``get_significant_states``: their values live in attributes,
+        and the capped query returns state changes only. Those few entities
+        (thermostats, a ``weather`` outdoor entity) are bounded by the span.
+        """
+        from homeassistant.components.recorder import history
+
+        rows: list[tuple[float, str, str, Mapping[str, Any]]] = []
+
+        def _take(states: Mapping[str, list[Any]], entity_id: str) -> bool:
+            rows.extend(
+                (state.last_updated.timestamp(), entity_id, state.state, state.attributes)
+                for state in states.get(entity_id, ())
+            )
+            return len(rows) <= limit
+
+        if attribute_ids:
+            states = history.get_significant_states(
+                self.hass,
+                start,
+                end,
+                attribute_ids,
+                include_start_time_state=include_start,
+                significant_changes_only=False,
+            )
+            for entity_id in attribute_ids:
+                if not _take(states, entity_id):
+                    return None
+        for entity_id in entity_ids:
+            states = history.state_changes_during_period(
+                self.hass,
+                start,
+                end,
+                entity_id,
+                include_start_time_state=include_start,
+                limit=limit - len(rows) + 1,
+            )
+            if not _take(states, entity_id):
+                return None
+        return rows
+
+    def _bootstrap_chunk(
+        self,
+        start: datetime,
+        end: datetime,
+        include_start: bool,
+        routes: Mapping[str, list[tuple[str, str, str | None]]],
+        builders: Mapping[str, CycleReconstructor],
+    ) -> tuple[list[CycleRecord], int] | None:
+        """Read one history chunk and feed it through the cycle reconstructors.
+
+        Runs in the recorder's executor: it touches only the reconstructors,
+        which nothing else uses while a bootstrap runs. Returns the cycles the
+        chunk closed and how many recorded states it held, or ``None`` (and
+        feeds nothing) when it holds more than ``BOOTSTRAP_MAX_CHUNK_STATES``.
+        """
+        attribute_ids = [
+            entity_id
+            for entity_id, targets in routes.items()
+            if any(
+                kind == HISTORY_ACTION or (kind == HISTORY_OUTDOOR and entity_id.startswith("weather."))
+                for _thermostat, kind, _vent_id in targets
+            )
+        ]
+        entity_ids = [entity_id for entity_id in routes if entity_id not in attribute_ids]
+        rows = self._fetch_history_chunk(
+            start, end, entity_ids, attribute_ids, include_start, BOOTSTRAP_MAX_CHUNK_STATES
+        )
+        if rows is None:
+            return None
+        rows.sort(key=lambda row: row[0])
+        records: list[CycleRecord] = []
+        for t_s, entity_id, state, attributes in rows:
+            for thermostat, kind, vent_id in routes.get(entity_id, ()):
+                value = self._history_value(entity_id, kind, state, attributes)
+                record = builders[thermostat].feed(t_s, kind, vent_id, value)
+                if record is not None:
+                    records.append(record)
+        return records, len(rows)
+
+    async def async_bootstrap_history(self, days: int = BOOTSTRAP_DEFAULT_DAYS) -> dict[str, Any]:
+        """Learn from the recorder's history of the assigned entities, in one pass.
+
+        Reads ``days`` of history that ends where learning began (the persisted
+        ``learned_since`` watermark: the first finalized cycle, or the install
+        for stores that predate it), so no cycle is learned twice, even one the
+        byte-capped archive has since evicted. Reading runs
+        chunk by chunk in the recorder's executor. Each chunk's states are
+        rebuilt into cycles (:class:`replay.CycleReconstructor`), and only the
+        rebuilt cycles come back to the loop. There they feed the live room,
+        door-factor and curve learners through :meth:`_replay_cycle_archive` and
+        are added to the archive ahead of the existing records. Memory stays
+        bounded: one chunk of states (queries stop at
+        ``BOOTSTRAP_MAX_CHUNK_STATES``, and an over-full chunk is retried over
+        half the span), the cycles in progress and the byte-capped archive.
+        Progress is logged and kept in :meth:`get_bootstrap_status`.
+        """
+        from homeassistant.components.recorder import get_instance
+
+        if self._bootstrap_status.get("state") == "running":
+            raise ValueError("A history bootstrap is already running")
+        days = max(1, min(BOOTSTRAP_MAX_DAYS, int(days)))
+        async with self._model_lock:
+            routes, rooms = self._history_sources()
+            end = min(datetime.fromtimestamp(self._learned_since, UTC), datetime.now(UTC))
+            start = end - timedelta(days=days)
+            status = self._bootstrap_status = {
+                "state": "running",
+                "start": start.isoformat(),
+                "end": end.isoformat(),
+                "progress_pct": 0.0,
+                "chunks": 0,
+                "states": 0,
+                "cycles": 0,
+                "samples": 0,
+                "rejected": 0,
+            }
+            builders = {
+                thermostat: CycleReconstructor(
+                    vents,
+                    self._history_regime,
+                    stable_s=EFF_ACTION_STABLE_MIN * 60.0,
+                    window_s=EFF_MAX_WINDOW_MIN * 60.0,
+                )
+                for thermostat, vents in rooms.items()
+            }
+            leaks = self._refit_curve_leaks()
+            curves: dict[str, dict[str, VentCurve]] = {}
+            for vents in rooms.values():
+                for vent_id in vents:
+                    curves[vent_id] = {
+                        "cooling": self._get_vent_curve(vent_id, HVACAction.COOLING),
+                        "heating": self._get_vent_curve(vent_id, HVACAction.HEATING),
+                    }
+            seen = {
+                (vent_id, mode): curve.total_samples()
+                for vent_id, per_mode in curves.items()
+                for mode, curve in per_mode.items()
+            }
+            live = _ModelRefit(self._room_models, curves)
+            archive = CycleArchive(self._cycle_archive.max_bytes)
+            recorder = get_instance(self.hass)
+            span = BOOTSTRAP_CHUNK
+            cursor = start
+            logged_pct = 0.0
+            try:
+                while routes and cursor < end:
+                    chunk_end = min(end, cursor + span)
+                    chunk = await recorder.async_add_executor_job(
+                        self._bootstrap_chunk, cursor, chunk_end, cursor == start, routes, builders
+                    )
+                    if chunk is None:
+                        if span <= BOOTSTRAP_CHUNK_MIN:
+                            raise ValueError(
+                                f"More than {BOOTSTRAP_MAX_CHUNK_STATES} recorded states in "
+                                f"{BOOTSTRAP_CHUNK_MIN} from {cursor.isoformat()}"
+                            )
+                        span = max(BOOTSTRAP_CHUNK_MIN, span / 2)
+                        continue
+                    records, states = chunk
+                    self._replay_cycle_archive(records, leaks, live)
+                    for record in records:
+                        archive.append(record)
+                    if states < BOOTSTRAP_MAX_CHUNK_STATES // 4:
+                        span = min(BOOTSTRAP_CHUNK_MAX, span * 2)
+                    cursor = chunk_end
+                    status["chunks"] += 1
+                    status["states"] += states
+                    status["cycles"], status["samples"], status["rejected"] = (
+                        live.cycles,
+                        live.samples,
+                        live.rejected,
+                    )
+                    status["progress_pct"] = round(100.0 * (cursor - start) / (end - start), 1)
+                    if status["progress_pct"] >= logged_pct + 10.0 or cursor >= end:
+                        logged_pct = status["progress_pct"]
+                        _LOGGER.info(
+                            "History bootstrap %.0f%%: %d cycle(s) learned from %d recorded state(s)",
+                            logged_pct,
+                            live.cycles,
+                            status["states"],
+                        )
+                status["state"] = "done"
+            except BaseException:
+                status["state"] = "failed"
+                raise
+            finally:
+                # Learning now reaches back to ``start``. A run that failed part
+                # way leaves ``[cursor, end)`` unread rather than risk reading
+                # ``[start, cursor)`` twice on the next run.
+                if cursor > start:
+                    self._learned_since = min(self._learned_since, start.timestamp())
+                # Whatever was learned is archived, oldest first, ahead of the
+                # cycles the live path archived meanwhile.
+                for record in self._cycle_archive.records():
+                    archive.append(record)
+                self._cycle_archive = archive
+                self._archive_store.async_delay_save(self._cycle_archive.to_json, CYCLE_ARCHIVE_SAVE_DELAY_S)
+                learned: dict[str, dict[str, VentCurve]] = {}
+                for vent_id, per_mode in live.curves.items():
+                    for mode, curve in per_mode.items():
+                        if curve.total_samples() != seen.get((vent_id, mode)):
+                            learned.setdefault(vent_id, {})[mode] = curve
+                self._store_vent_curves(learned)
+            await self._async_save_state()
+        return dict(status)
+
+    def get_bootstrap_status(self) -> dict[str, Any]:
+        """Progress of the last (or running) history bootstrap."""
+        return dict(self._bootstrap_status)
+
+    def get_vent_model_fits(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Each vent's aperture->rate fit with its standard errors, per mode."""
+        fits: dict[str, dict[str, dict[str, Any]]] = {}
+        for vent_id, modes in self._vent_models.items():
+            for mode, stats in modes.items() if isinstance(modes, dict) else ():
+                params = vent_rls_params(stats)
+                if params is None:
+                    continue
+                fits.setdefault(vent_id, {})[mode] = {
+                    "n": stats.get("n", 0),
+                    "weight": stats.get("weight"),
+                    "slope": params[0],
+                    "intercept": params[1],
+                    **(vent_rls_uncertainty(stats) or {}),
+                }
+        return fits
+
     def get_room_for_vent(self, vent_id: str) -> dict[str, Any]:
         vent = (self.data or {}).get("vents", {}).get(vent_id, {})
         return vent.get("room") or {}
@@ -3642,6 +5013,54 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return 0.0
         return round(100.0 * self._hold_count / self._total_active_polls, 1)
 
+    # --- Poll timing / API request telemetry ----------------------------------
+    def get_poll_timings(self) -> dict[str, dict[str, float]]:
+        """Rolling per-phase poll timings in ms (``telemetry.PhaseTimer.summary``)."""
+        return self._poll_timings.summary()
+
+    def get_last_poll_ms(self) -> float | None:
+        """Wall time of the most recent poll in ms (``None`` before the first)."""
+        return self._poll_timings.last_total_ms()
+
+    async def async_capture_profile(self, polls: int) -> ProfileCapture:
+        """Profile the next ``polls`` polls (plus any DAB apply in between).
+
+        Requests an immediate refresh so the first poll doesn't wait a full
+        interval, then waits for the remaining scheduled polls. Raises
+        ``ProfilerBusyError`` if a capture is already running.
+        """
+        self._profiler.arm(polls)
+        interval = self.update_interval.total_seconds() if self.update_interval else 0.0
+        await self.async_request_refresh()
+        return await self._profiler.wait(polls * interval + PROFILE_TIMEOUT_MARGIN_S)
+
+    def get_api_request_counts(self) -> dict[str, int]:
+        """HTTP requests issued per Flair endpoint template since startup."""
+        return self.api.telemetry.counts() if self.api else {}
+
+    def get_api_telemetry(self) -> dict[str, Any]:
+        """Per-endpoint request/error/429/retry/bytes/latency telemetry (``ApiTelemetry``)."""
+        return self.api.telemetry.summary() if self.api else {}
+
+    def get_api_budget(self) -> dict[str, float | None]:
+        """Rolling requests/hour vs the Flair budget, plus per-interval projections.
+
+        ``projected_per_hour_active`` / ``_idle`` scale the last poll's request
+        count by the configured poll intervals: what an hour of polling at
+        each setting would cost against ``hourly_budget``.
+        """
+        if not self.api:
+            return {}
+        out: dict[str, float | None] = dict(self.api.telemetry.budget())
+        per_poll = self._last_poll_requests
+        out["requests_last_poll"] = per_poll
+        for name, interval in (("active", self._poll_interval_active), ("idle", self._poll_interval_idle)):
+            seconds = interval.total_seconds()
+            out[f"projected_per_hour_{name}"] = (
+                round(per_poll * 3600.0 / seconds, 1) if per_poll is not None and seconds > 0 else None
+            )
+        return out
+
     # --- Task 24 observability getters (R13/R14/R5.4/R25.11) ---------------
     def get_active_room_spread(self) -> float:
         """Current active-room temperature spread in °C (R13.1/R13.2).
@@ -3778,7 +5197,7 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         return any_open
 
     @staticmethod
-    def _door_factor_cell_trusted(model: DoorFactorModel | None, mode: str) -> bool:
+    def _door_factor_cell_trusted(model: DoorModelLike | None, mode: str) -> bool:
         """Whether ``mode``'s door-factor cell meets the confidence gate (R30.1).
 
         Inspects the cell directly — ``n >= DOOR_MIN_N`` with a learned
@@ -4013,6 +5432,10 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
 
     async def _async_save_state(self) -> None:
+        with self._poll_timings.measure("save"):
+            await self._async_write_state()
+
+    async def _async_write_state(self) -> None:
         async with self._save_lock:
             # Serialize cycle targets for restart resilience
             serialized_cycle_targets: dict[str, dict[str, Any]] = {}
@@ -4029,6 +5452,12 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             await self._store.async_save(
                 {
                     "version": STORE_SCHEMA_VERSION,
+                    # Fresh state needs no migration: record every one as done.
+                    "migrations": {
+                        **self._migration_ledger,
+                        **dict(STORE_MIGRATIONS),
+                        "sanitize": SANITIZE_REVISION,
+                    },
                     "vent_rates": self._vent_rates,
                     "max_rates": self._max_rates,
                     "max_running_minutes": self._max_running_minutes,
@@ -4036,16 +5465,12 @@ class FlairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     "efficiency_models": self._efficiency_models,
                     "vent_adjustments": self._vent_adjustments,
                     "strategy_metrics": self._strategy_metrics,
-                    "room_efficiency": {
-                        room: room_model_to_dict(model)
-                        for room, model in self._room_efficiency_models.items()
-                    },
-                    "door_factor": {
-                        room: door_factor_to_dict(model) for room, model in self._door_factor_models.items()
-                    },
+                    "room_efficiency": self._room_models.efficiency_to_dict(),
+                    "door_factor": self._room_models.door_factor_to_dict(),
                     "vent_effectiveness": self._vent_effectiveness,
                     "last_hvac_action": self._last_hvac_action,
                     "pre_adjust_flags": self._pre_adjust_flags,
+                    "learned_since": self._learned_since,
                     "cycle_targets": serialized_cycle_targets,
                     "hold_count": self._hold_count,
                     "recalc_count_24h": self._recalc_count_24h,
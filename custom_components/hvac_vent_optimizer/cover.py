@@ -50,6 +50,10 @@ class FlairVentCover(CoordinatorEntity, CoverEntity):
     def device_info(self):
         return self.coordinator.get_room_device_info_for_vent(self._vent_id)
 
+    @property
+    def extra_state_attributes(self):
+        return self.coordinator.get_stale_attributes() or None
+
     @property
     def current_cover_position(self):
         if self._pending_position is not None and self._pending_until:
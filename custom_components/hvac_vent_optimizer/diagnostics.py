@@ -0,0 +1,43 @@
+"""Diagnostics download for HVAC Vent Optimizer."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_CLIENT_ID, CONF_CLIENT_SECRET, DOMAIN
+
+# Credentials never leave the instance (R14.4/R22.4).
+TO_REDACT = {CONF_CLIENT_ID, CONF_CLIENT_SECRET}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return entry config (redacted) plus poll timing, API telemetry, snapshot, bootstrap and vent fits."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    data = coordinator.data or {}
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "devices": {
+            "vents": len(data.get("vents", {})),
+            "pucks": len(data.get("pucks", {})),
+        },
+        "poll_timings_ms": coordinator.get_poll_timings(),
+        "api_budget": coordinator.get_api_budget(),
+        "api": coordinator.get_api_telemetry(),
+        "api_circuit": coordinator.get_api_circuit(),
+        "snapshot": coordinator.get_snapshot_status(),
+        "history_bootstrap": coordinator.get_bootstrap_status(),
+        "vent_model_fits": coordinator.get_vent_model_fits(),
+        "observability": {
+            "hold_status": coordinator.get_hold_status(),
+            "hold_ratio_pct": coordinator.get_hold_ratio(),
+            "active_room_spread_c": coordinator.get_active_room_spread(),
+            "max_active_error_c": coordinator.get_max_active_error(),
+        },
+    }
@@ -10,11 +10,11 @@ optimizer reasons about (R25):
   vent fully closed (duct/return leakage and cross-talk from other rooms).
 
 The aperture→rate model is a simple line ``rate ≈ slope * aperture_pct +
-intercept`` fit by the caller (the regression itself lives elsewhere). Here we
-only interpret its coefficients, so the logic is trivially testable in
-isolation. It is deliberately **pure**: it imports nothing from Home Assistant
-and operates only on already-resolved primitive floats (mirrors ``dab.py`` /
-``context.py``).
+intercept``, fit online by :func:`update_vent_rls` (recursive least squares
+with forgetting). :func:`derive_effectiveness` interprets its coefficients, so
+the logic is trivially testable in isolation. It is deliberately **pure**: it
+imports nothing from Home Assistant and operates only on already-resolved
+primitive floats (mirrors ``dab.py`` / ``context.py``).
 
 Concepts
 --------
@@ -38,9 +38,10 @@ Clamps (all documented at their call sites below)
 from __future__ import annotations
 
 import math
-from collections.abc import Sequence
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping, Sequence
 from dataclasses import dataclass, field
-from typing import NamedTuple
+from typing import Any, NamedTuple, Protocol, TypeVar
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -239,6 +240,177 @@ def seed_vent_effectiveness(
     return entry
 
 
+# ---------------------------------------------------------------------------
+# Aperture→rate regression: recursive least squares with forgetting
+# ---------------------------------------------------------------------------
+# The coordinator keeps one ``rate ≈ slope * aperture_pct + intercept`` fit per
+# vent and mode under ``vent_models[vent][mode]``, one sample per finalized
+# cycle. The state is a plain JSON dict updated in place:
+#
+#   * ``n`` counts every sample folded in (the :data:`MODEL_MIN_N` trust gate);
+#   * until two distinct apertures have been seen it holds the plain sums
+#     (``sum_x``/``sum_y``/``sum_xx``/``sum_xy``/``sum_yy``);
+#   * from then on it holds the cached ``slope``/``intercept``, the 2x2
+#     covariance ``p`` (``[p_ss, p_si, p_ii]``, in units of the noise variance),
+#     the forgetting-weighted sample ``weight`` and the residual ``cost`` with
+#     its own ``cost_weight``.
+#
+# Each update is O(1) and reading the fit is a dict lookup. The forgetting
+# factor ages old cycles out (half-life ~34 samples at 0.98). While ``p``'s
+# trace exceeds :data:`RLS_TRACE_MAX` forgetting is suspended, so a vent that
+# sits at one aperture for weeks doesn't blow its covariance up (windup).
+
+# Weight kept by the previous samples at each update.
+RLS_FORGETTING: float = 0.98
+
+# Covariance trace above which forgetting is suspended (anti-windup).
+RLS_TRACE_MAX: float = 100.0
+
+_RLS_SUMS: tuple[str, ...] = ("sum_x", "sum_y", "sum_xx", "sum_xy", "sum_yy")
+
+
+def new_vent_rls() -> dict:
+    """Build an empty aperture→rate RLS state (no samples, no fit yet)."""
+    return {"n": 0, **dict.fromkeys(_RLS_SUMS, 0.0)}
+
+
+def _as_float(value: object) -> float:
+    try:
+        result = float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return 0.0
+    return result if math.isfinite(result) else 0.0
+
+
+def vent_rls_from_sums(sums: Mapping) -> dict:
+    """Seed an RLS state from plain regression sums (the v1 ``vent_models`` form).
+
+    The seeded fit is the exact least-squares solution of the sums, with
+    ``p = (XᵀX)⁻¹``, so continuing with :func:`update_vent_rls` is the same as
+    having run the recursion from the first sample without forgetting. Sums
+    with fewer than two samples or a single distinct aperture have no fit and
+    are kept as sums. The residual ``cost`` is only known when ``sum_yy`` was
+    tracked (legacy sums lack it), so :func:`vent_rls_uncertainty` reports
+    ``None`` for a migrated fit until it has seen a new sample. Malformed
+    values are read as ``0``.
+    """
+    n = max(0, int(_as_float(sums.get("n"))))
+    sx, sy, sxx, sxy = (_as_float(sums.get(key)) for key in _RLS_SUMS[:4])
+    det = n * sxx - sx * sx
+    if n < 2 or det <= 0.0:
+        sums_state: dict[str, Any] = {"n": n, "sum_x": sx, "sum_y": sy, "sum_xx": sxx, "sum_xy": sxy}
+        if "sum_yy" in sums:
+            sums_state["sum_yy"] = _as_float(sums.get("sum_yy"))
+        return sums_state
+    slope = (n * sxy - sx * sy) / det
+    intercept = (sy - slope * sx) / n
+    state: dict[str, Any] = {
+        "n": n,
+        "weight": float(n),
+        "slope": slope,
+        "intercept": intercept,
+        "p": [n / det, -sx / det, sxx / det],
+        "cost": 0.0,
+        "cost_weight": 0.0,
+    }
+    if "sum_yy" in sums:
+        residual = _as_float(sums.get("sum_yy")) - slope * sxy - intercept * sy
+        state["cost"] = max(0.0, residual)
+        state["cost_weight"] = float(n - 2)
+    return state
+
+
+def _rls_fitted(state: Mapping) -> bool:
+    p = state.get("p")
+    return (
+        isinstance(state.get("slope"), (int, float))
+        and isinstance(state.get("intercept"), (int, float))
+        and isinstance(p, list)
+        and len(p) == 3
+        and all(isinstance(v, (int, float)) and math.isfinite(v) for v in p)
+    )
+
+
+def update_vent_rls(
+    state: dict, aperture_pct: float, rate: float, forgetting: float = RLS_FORGETTING
+) -> dict:
+    """Fold one ``(aperture_pct, rate)`` sample into ``state`` (mutated and returned).
+
+    A non-finite sample leaves the state untouched. Before the fit exists the
+    sample is added to the sums, and the state switches to the recursion as
+    soon as the sums identify a line (:func:`vent_rls_from_sums`). After that
+    the standard RLS step runs with forgetting factor ``forgetting``: gain
+    ``k = p·x / (λ + xᵀ·p·x)``, ``θ += k·e`` for the a-priori error ``e``, and
+    ``p = (p - k·xᵀ·p) / λ``. A fitted state with a malformed ``p`` restarts
+    empty.
+    """
+    if not (math.isfinite(aperture_pct) and math.isfinite(rate)):
+        return state
+    if "slope" in state and not _rls_fitted(state):
+        state.clear()
+        state.update(new_vent_rls())
+    state["n"] = max(0, int(_as_float(state.get("n")))) + 1
+    if "slope" not in state:
+        terms = (aperture_pct, rate, aperture_pct * aperture_pct, aperture_pct * rate, rate * rate)
+        for key, value in zip(_RLS_SUMS, terms, strict=True):
+            if key != "sum_yy" or key in state:  # legacy sums never tracked sum_yy
+                state[key] = _as_float(state.get(key)) + value
+        seeded = vent_rls_from_sums(state)
+        state.clear()
+        state.update(seeded)
+        return state
+
+    p_ss, p_si, p_ii = state["p"]
+    lam = forgetting if p_ss + p_ii <= RLS_TRACE_MAX else 1.0
+    px_s = p_ss * aperture_pct + p_si
+    px_i = p_si * aperture_pct + p_ii
+    denom = lam + aperture_pct * px_s + px_i
+    k_s = px_s / denom
+    k_i = px_i / denom
+    error = rate - (state["slope"] * aperture_pct + state["intercept"])
+    state["slope"] += k_s * error
+    state["intercept"] += k_i * error
+    state["p"] = [(p_ss - k_s * px_s) / lam, (p_si - k_s * px_i) / lam, (p_ii - k_i * px_i) / lam]
+    # The a-posteriori error is ``error * lam / denom``, so this is the exact
+    # growth of the weighted least-squares cost.
+    state["cost"] = lam * _as_float(state.get("cost")) + error * error * lam / denom
+    state["cost_weight"] = lam * _as_float(state.get("cost_weight")) + 1.0
+    state["weight"] = lam * _as_float(state.get("weight")) + 1.0
+    return state
+
+
+def vent_rls_params(state: object) -> tuple[float, float] | None:
+    """Cached ``(slope, intercept)`` of an RLS state, or ``None`` without a fit."""
+    if not isinstance(state, dict):
+        return None
+    slope = state.get("slope")
+    intercept = state.get("intercept")
+    if not isinstance(slope, (int, float)) or not isinstance(intercept, (int, float)):
+        return None
+    return float(slope), float(intercept)
+
+
+def vent_rls_uncertainty(state: object) -> dict[str, float] | None:
+    """Standard errors of the fit: ``{"sigma", "slope_se", "intercept_se"}``.
+
+    ``sigma`` is the residual standard deviation estimated from the weighted
+    cost, and the standard errors scale it by the covariance diagonal. Returns
+    ``None`` without a fit or before any residual has been observed.
+    """
+    if not isinstance(state, dict) or not _rls_fitted(state):
+        return None
+    cost_weight = _as_float(state.get("cost_weight"))
+    if cost_weight < 1.0:
+        return None
+    variance = max(0.0, _as_float(state.get("cost"))) / cost_weight
+    p_ss, _p_si, p_ii = state["p"]
+    return {
+        "sigma": math.sqrt(variance),
+        "slope_se": math.sqrt(max(0.0, variance * p_ss)),
+        "intercept_se": math.sqrt(max(0.0, variance * p_ii)),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Learned non-linear vent curve (R25.2 / 25.3 / 25.12 / 25.13)
 # ---------------------------------------------------------------------------
@@ -364,8 +536,8 @@ class VentCurve:
 
     Wraps the persisted schema-v2 structure ``breakpoints`` / ``flows`` /
     ``counts`` and exposes :meth:`flow`, :meth:`inverse`, :meth:`knee`, plus the
-    online :meth:`update`. ``flows`` is kept monotonic non-decreasing and
-    normalized to ``flows[-1] == 1`` after every update. ``_seed`` holds the
+    online :meth:`update` / :meth:`update_many`. ``flows`` is kept monotonic
+    non-decreasing and normalized to ``flows[-1] == 1`` after every update. ``_seed`` holds the
     cold-start near-linear curve used as a fallback while fewer than
     :data:`MODEL_MIN_N` samples have been observed.
     """
@@ -487,30 +659,49 @@ class VentCurve:
     def update(self, aperture_pct: float, observed_flow: float) -> VentCurve:
         """Fold one ``observed_flow`` (relative airflow) at ``aperture_pct`` in.
 
+        The single-sample case of :meth:`update_many`: binned to the nearest
+        breakpoint, folded via the adaptive-alpha EMA, then re-projected onto the
+        monotonic cone and renormalized. Mutates in place and returns ``self``.
+        """
+        return self.update_many((aperture_pct,), (observed_flow,))
+
+    def update_many(self, apertures: Iterable[float], observed_flows: Iterable[float]) -> VentCurve:
+        """Fold a batch of ``(aperture_pct, observed_flow)`` observations in.
+
         Robust to noise (R25.6): a non-finite observation is ignored; a negative
         one is clamped to ``0`` and observations above full-open clamp to ``1``.
-        The sample is binned to the nearest breakpoint and folded via an
-        adaptive-alpha EMA (first sample seeds the breakpoint outright); the whole
-        curve is then re-projected onto the monotonic non-decreasing cone
-        (weighted isotonic regression) and renormalized so ``flow(100%) = 1``.
-        Mutates in place and returns ``self`` for chaining.
+        Each sample is binned to the nearest breakpoint and folded, in order,
+        via an adaptive-alpha EMA (the first sample seeds the breakpoint
+        outright). The curve is then re-projected onto the monotonic
+        non-decreasing cone (weighted isotonic regression) and renormalized so
+        ``flow(100%) = 1`` once for the whole batch. Sequential :meth:`update`
+        calls project after every sample, so a batch lands within the EMA step
+        of the same samples folded one by one; a single-sample batch is
+        identical. Mutates in place and returns ``self`` for chaining.
         """
-        if not math.isfinite(observed_flow):
+        flows = self.flows
+        counts = self.counts
+        folded = False
+        for aperture_pct, observed_flow in zip(apertures, observed_flows, strict=True):
+            if not math.isfinite(observed_flow):
+                continue
+            sample = _clamp(observed_flow, 0.0, 1.0)
+            idx = self._nearest_index(aperture_pct)
+            count = counts[idx]
+            if count <= 0:
+                flows[idx] = sample
+            else:
+                alpha = max(CURVE_ALPHA_MIN, CURVE_ALPHA0 / math.sqrt(count + 1))
+                flows[idx] = flows[idx] + alpha * (sample - flows[idx])
+            counts[idx] = count + 1
+            folded = True
+        if not folded:
             return self
-        sample = _clamp(observed_flow, 0.0, 1.0)
-        idx = self._nearest_index(aperture_pct)
-        count = self.counts[idx]
-        if count <= 0:
-            self.flows[idx] = sample
-        else:
-            alpha = max(CURVE_ALPHA_MIN, CURVE_ALPHA0 / math.sqrt(count + 1))
-            self.flows[idx] = self.flows[idx] + alpha * (sample - self.flows[idx])
-        self.counts[idx] = count + 1
 
         # Re-impose monotonicity (Property 7), weighting by per-breakpoint counts
         # so well-observed points dominate; the +1 prior keeps unseen seed points
         # in play without letting them anchor.
-        self.flows = _isotonic(self.flows, [c + 1.0 for c in self.counts])
+        self.flows = _isotonic(flows, [c + 1.0 for c in counts])
         self._normalize()
         return self
 
@@ -682,6 +873,39 @@ class RoomEfficiencyModel:
     heating: ModeEfficiency
 
 
+class _RegimeCellLike(Protocol):
+    """What the serializers read from a :class:`RegimeCell` (or a stored view)."""
+
+    @property
+    def rate(self) -> float: ...
+
+    @property
+    def n(self) -> int: ...
+
+
+class _ModeLike(Protocol):
+    """What the serializers read from a :class:`ModeEfficiency` (or a stored view)."""
+
+    @property
+    def baseline(self) -> float | None: ...
+
+    @property
+    def n(self) -> int: ...
+
+    @property
+    def regimes(self) -> Sequence[_RegimeCellLike]: ...
+
+
+class RoomModelLike(Protocol):
+    """A :class:`RoomEfficiencyModel` or a live view of one in :class:`RoomModelStore`."""
+
+    @property
+    def cooling(self) -> _ModeLike: ...
+
+    @property
+    def heating(self) -> _ModeLike: ...
+
+
 # ---------------------------------------------------------------------------
 # Factory
 # ---------------------------------------------------------------------------
@@ -753,7 +977,7 @@ def update_room_efficiency(
 # Effective rate lookup (R11.1 / R11.3 reachable gate)
 # ---------------------------------------------------------------------------
 def effective_rate(
-    model: RoomEfficiencyModel,
+    model: RoomModelLike,
     regime_idx: int,
     mode: str = "cooling",
 ) -> float:
@@ -765,7 +989,7 @@ def effective_rate(
     ``[RATE_MIN, RATE_MAX]``.
     """
     idx = int(_clamp(float(regime_idx), 0.0, float(EFF_REGIME_COUNT - 1)))
-    sub: ModeEfficiency = getattr(model, mode)
+    sub: _ModeLike = getattr(model, mode)
     cell = sub.regimes[idx]
     if cell.n >= REGIME_MIN_N and cell.rate > 0.0:
         return _clamp(cell.rate, RATE_MIN, RATE_MAX)
@@ -781,7 +1005,7 @@ def effective_rate(
 # the persisted shape, so they are unit-tested directly.
 
 
-def _mode_to_dict(mode: ModeEfficiency) -> dict:
+def _mode_to_dict(mode: _ModeLike) -> dict:
     """Serialize one :class:`ModeEfficiency` to its persisted dict shape."""
     return {
         "baseline": mode.baseline,
@@ -797,37 +1021,60 @@ def _mode_from_dict(data: object) -> ModeEfficiency:
     a missing/short ``regimes`` list is padded to :data:`EFF_REGIME_COUNT` cells,
     and non-numeric values fall back to safe defaults.
     """
+    baseline, n, cells = _parse_mode(data)
+    return ModeEfficiency(baseline=baseline, n=n, regimes=[RegimeCell(rate=rate, n=cn) for rate, cn in cells])
+
+
+# Sample counts live in signed 64-bit ``array("q")`` columns (see
+# :class:`RoomModelStore`); a persisted/imported count outside that range would
+# raise ``OverflowError`` on write, so decoding pins it to the column's bounds.
+_COUNT_MAX = 2**63 - 1
+_COUNT_MIN = -(2**63)
+
+
+def _parse_count(raw: object) -> int:
+    """Decode a persisted sample count, clamped to the store's int64 columns.
+
+    Garbled values (non-numeric, NaN, infinite) decode to ``0``.
+    """
+    try:
+        n: int = int(raw or 0)  # type: ignore[call-overload]
+    except (TypeError, ValueError, OverflowError):
+        return 0
+    return max(_COUNT_MIN, min(n, _COUNT_MAX))
+
+
+def _parse_mode(data: object) -> tuple[float | None, int, list[tuple[float, int]]]:
+    """Decode one persisted mode entry to ``(baseline, n, [(rate, n), ...])``.
+
+    The tolerant core of :func:`_mode_from_dict`, shared with
+    :meth:`RoomModelStore.load_efficiency` so both decode identically.
+    """
     if not isinstance(data, dict):
-        return _new_mode()
+        return None, 0, [(0.0, 0)] * EFF_REGIME_COUNT
     baseline = data.get("baseline")
     if baseline is not None and not isinstance(baseline, (int, float)):
         baseline = None
-    try:
-        n = int(data.get("n", 0) or 0)
-    except (TypeError, ValueError):
-        n = 0
-    cells: list[RegimeCell] = []
+    n = _parse_count(data.get("n"))
+    cells: list[tuple[float, int]] = []
     raw_regimes = data.get("regimes")
     if isinstance(raw_regimes, list):
         for raw in raw_regimes[:EFF_REGIME_COUNT]:
             if not isinstance(raw, dict):
-                cells.append(RegimeCell())
+                cells.append((0.0, 0))
                 continue
             try:
                 rate = float(raw.get("rate", 0.0) or 0.0)
             except (TypeError, ValueError):
                 rate = 0.0
-            try:
-                cn = int(raw.get("n", 0) or 0)
-            except (TypeError, ValueError):
-                cn = 0
-            cells.append(RegimeCell(rate=rate, n=cn))
+            cn = _parse_count(raw.get("n"))
+            cells.append((rate, cn))
     while len(cells) < EFF_REGIME_COUNT:
-        cells.append(RegimeCell())
-    return ModeEfficiency(baseline=baseline, n=n, regimes=cells)
+        cells.append((0.0, 0))
+    return baseline, n, cells
 
 
-def room_model_to_dict(model: RoomEfficiencyModel) -> dict:
+def room_model_to_dict(model: RoomModelLike) -> dict:
     """Serialize a :class:`RoomEfficiencyModel` to its persisted dict shape."""
     return {
         "cooling": _mode_to_dict(model.cooling),
@@ -937,6 +1184,26 @@ class DoorFactorModel:
     heating: DoorFactorCell
 
 
+class _DoorCellLike(Protocol):
+    """What the serializers read from a :class:`DoorFactorCell` (or a stored view)."""
+
+    @property
+    def factor(self) -> float | None: ...
+
+    @property
+    def n(self) -> int: ...
+
+
+class DoorModelLike(Protocol):
+    """A :class:`DoorFactorModel` or a live view of one in :class:`RoomModelStore`."""
+
+    @property
+    def cooling(self) -> _DoorCellLike: ...
+
+    @property
+    def heating(self) -> _DoorCellLike: ...
+
+
 # ---------------------------------------------------------------------------
 # Factory
 # ---------------------------------------------------------------------------
@@ -990,7 +1257,7 @@ def update_door_factor(
 # Read-time resolution (R27.1 / R27.2 / R27.3 / R27.4 / R28.1)
 # ---------------------------------------------------------------------------
 def resolve_door_factor(
-    model: DoorFactorModel | None,
+    model: DoorModelLike | None,
     mode: str = "cooling",
     *,
     default: float = DOOR_FACTOR_DEFAULT,
@@ -1017,7 +1284,7 @@ def resolve_door_factor(
 
     other_mode = "heating" if mode == "cooling" else "cooling"
     for candidate in (mode, other_mode):
-        cell: DoorFactorCell = getattr(model, candidate)
+        cell: _DoorCellLike = getattr(model, candidate)
         if cell.n >= DOOR_MIN_N and cell.factor is not None:
             return _clamp(cell.factor, DOOR_FACTOR_MIN, DOOR_FACTOR_MAX)
 
@@ -1031,7 +1298,7 @@ def resolve_door_factor(
 # single source of truth for the door-factor wire shape, so they are unit-tested
 # directly. ``door_factor_from_dict`` NEVER raises: any malformed/partial input
 # decays to a fresh cell, exactly like ``_mode_from_dict``.
-def _door_cell_to_dict(cell: DoorFactorCell) -> dict:
+def _door_cell_to_dict(cell: _DoorCellLike) -> dict:
     """Serialize one :class:`DoorFactorCell` to its persisted dict shape."""
     return {
         "factor": None if cell.factor is None else float(cell.factor),
@@ -1046,8 +1313,14 @@ def _door_cell_from_dict(data: object) -> DoorFactorCell:
     or a garbled ``n`` all decay to safe defaults (``factor=None`` / ``n=0``)
     without raising. An integer ``factor`` is coerced to ``float``.
     """
+    factor, n = _parse_door_cell(data)
+    return DoorFactorCell(factor=factor, n=n)
+
+
+def _parse_door_cell(data: object) -> tuple[float | None, int]:
+    """Decode one persisted door cell to ``(factor, n)``; the core of :func:`_door_cell_from_dict`."""
     if not isinstance(data, dict):
-        return DoorFactorCell()
+        return None, 0
     raw_factor = data.get("factor")
     factor: float | None
     if isinstance(raw_factor, bool) or not isinstance(raw_factor, (int, float)):
@@ -1055,14 +1328,11 @@ def _door_cell_from_dict(data: object) -> DoorFactorCell:
     else:
         f = float(raw_factor)
         factor = f if math.isfinite(f) else None
-    try:
-        n = int(data.get("n", 0) or 0)
-    except (TypeError, ValueError):
-        n = 0
-    return DoorFactorCell(factor=factor, n=n)
+    n = _parse_count(data.get("n"))
+    return factor, n
 
 
-def door_factor_to_dict(model: DoorFactorModel) -> dict:
+def door_factor_to_dict(model: DoorModelLike) -> dict:
     """Serialize a :class:`DoorFactorModel` to its persisted dict shape."""
     return {
         "cooling": _door_cell_to_dict(model.cooling),
@@ -1084,3 +1354,568 @@ def door_factor_from_dict(data: object) -> DoorFactorModel:
         cooling=_door_cell_from_dict(data.get("cooling")),
         heating=_door_cell_from_dict(data.get("heating")),
     )
+
+
+# ===========================================================================
+# Array-backed model store (every room's efficiency + door-factor learners)
+# ===========================================================================
+# The dataclasses above describe one room; the coordinator holds every room's
+# learners for its lifetime and walks all of them on each balance pass, at
+# cycle finalize and on every save. :class:`RoomModelStore` keeps the same
+# numbers column-wise in flat stdlib ``array`` columns addressed by a room-key
+# slot (no numpy: the integration ships with no requirements):
+#
+#   rate / n          slot * 2 * EFF_REGIME_COUNT + mode * EFF_REGIME_COUNT + regime
+#   baseline / base_n slot * 2 + mode   (NaN == no baseline yet)
+#   factor / door_n   slot * 2 + mode   (NaN == no door-open sample yet)
+#
+# Bulk reads (:meth:`RoomModelStore.effective_rates`), batch EMA updates
+# (:meth:`RoomModelStore.update_many` / :meth:`RoomModelStore.update_door_many`)
+# and the persisted sections run straight over the columns. The
+# :attr:`RoomModelStore.efficiency` / :attr:`RoomModelStore.door` mappings hand
+# out live per-room views that duck-type the dataclasses, so every function
+# above (``effective_rate``, ``update_*``, ``resolve_door_factor`` and the
+# ``*_to_dict`` converters) keeps working on a stored room unchanged. The
+# readers are typed against :class:`RoomModelLike` / :class:`DoorModelLike`,
+# which both the dataclasses and the views satisfy.
+_MODE_INDEX: dict[str, int] = {"cooling": 0, "heating": 1}
+_MODES: tuple[str, str] = ("cooling", "heating")
+
+
+def _nan_to_none(value: float) -> float | None:
+    """Column value -> model value (a NaN slot is an unset ``None``)."""
+    return None if math.isnan(value) else value
+
+
+def _none_to_nan(value: float | None) -> float:
+    """Model value -> column value (``None`` is stored as NaN)."""
+    return math.nan if value is None else float(value)
+
+
+class _RegimeCellView:
+    """Live :class:`RegimeCell` view over one ``(room, mode, regime)`` column entry."""
+
+    __slots__ = ("_i", "_store")
+
+    def __init__(self, store: RoomModelStore, i: int) -> None:
+        self._store = store
+        self._i = i
+
+    @property
+    def rate(self) -> float:
+        return self._store._rate[self._i]
+
+    @rate.setter
+    def rate(self, value: float) -> None:
+        self._store._rate[self._i] = float(value)
+
+    @property
+    def n(self) -> int:
+        return self._store._n[self._i]
+
+    @n.setter
+    def n(self, value: int) -> None:
+        self._store._n[self._i] = int(value)
+
+    def __repr__(self) -> str:
+        return f"RegimeCell(rate={self.rate!r}, n={self.n!r})"
+
+
+class _ModeEfficiencyView:
+    """Live :class:`ModeEfficiency` view over one room's ``mode`` columns."""
+
+    __slots__ = ("_i", "_store")
+
+    def __init__(self, store: RoomModelStore, i: int) -> None:
+        self._store = store
+        self._i = i  # slot * 2 + mode
+
+    @property
+    def baseline(self) -> float | None:
+        return _nan_to_none(self._store._baseline[self._i])
+
+    @baseline.setter
+    def baseline(self, value: float | None) -> None:
+        self._store._baseline[self._i] = _none_to_nan(value)
+
+    @property
+    def n(self) -> int:
+        return self._store._base_n[self._i]
+
+    @n.setter
+    def n(self, value: int) -> None:
+        self._store._base_n[self._i] = int(value)
+
+    @property
+    def regimes(self) -> list[_RegimeCellView]:
+        base = self._i * EFF_REGIME_COUNT
+        return [_RegimeCellView(self._store, base + r) for r in range(EFF_REGIME_COUNT)]
+
+    def __repr__(self) -> str:
+        return f"ModeEfficiency(baseline={self.baseline!r}, n={self.n!r}, regimes={self.regimes!r})"
+
+
+class _RoomEfficiencyView:
+    """Live :class:`RoomEfficiencyModel` view over one stored room."""
+
+    __slots__ = ("_slot", "_store")
+
+    def __init__(self, store: RoomModelStore, slot: int) -> None:
+        self._store = store
+        self._slot = slot
+
+    @property
+    def cooling(self) -> _ModeEfficiencyView:
+        return _ModeEfficiencyView(self._store, self._slot * 2)
+
+    @cooling.setter
+    def cooling(self, value: ModeEfficiency) -> None:
+        self._store._put_mode(self._slot * 2, value)
+
+    @property
+    def heating(self) -> _ModeEfficiencyView:
+        return _ModeEfficiencyView(self._store, self._slot * 2 + 1)
+
+    @heating.setter
+    def heating(self, value: ModeEfficiency) -> None:
+        self._store._put_mode(self._slot * 2 + 1, value)
+
+    def snapshot(self) -> RoomEfficiencyModel:
+        """A detached :class:`RoomEfficiencyModel` copy of the stored values."""
+        return room_model_from_dict(room_model_to_dict(self))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _RoomEfficiencyView):
+            other = other.snapshot()
+        return self.snapshot() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"RoomEfficiencyModel(cooling={self.cooling!r}, heating={self.heating!r})"
+
+
+class _DoorCellView:
+    """Live :class:`DoorFactorCell` view over one ``(room, mode)`` column entry."""
+
+    __slots__ = ("_i", "_store")
+
+    def __init__(self, store: RoomModelStore, i: int) -> None:
+        self._store = store
+        self._i = i
+
+    @property
+    def factor(self) -> float | None:
+        return _nan_to_none(self._store._factor[self._i])
+
+    @factor.setter
+    def factor(self, value: float | None) -> None:
+        self._store._factor[self._i] = _none_to_nan(value)
+
+    @property
+    def n(self) -> int:
+        return self._store._door_n[self._i]
+
+    @n.setter
+    def n(self, value: int) -> None:
+        self._store._door_n[self._i] = int(value)
+
+    def __repr__(self) -> str:
+        return f"DoorFactorCell(factor={self.factor!r}, n={self.n!r})"
+
+
+class _DoorFactorView:
+    """Live :class:`DoorFactorModel` view over one stored room."""
+
+    __slots__ = ("_slot", "_store")
+
+    def __init__(self, store: RoomModelStore, slot: int) -> None:
+        self._store = store
+        self._slot = slot
+
+    @property
+    def cooling(self) -> _DoorCellView:
+        return _DoorCellView(self._store, self._slot * 2)
+
+    @cooling.setter
+    def cooling(self, value: DoorFactorCell) -> None:
+        self._store._put_door_cell(self._slot * 2, value.factor, value.n)
+
+    @property
+    def heating(self) -> _DoorCellView:
+        return _DoorCellView(self._store, self._slot * 2 + 1)
+
+    @heating.setter
+    def heating(self, value: DoorFactorCell) -> None:
+        self._store._put_door_cell(self._slot * 2 + 1, value.factor, value.n)
+
+    def snapshot(self) -> DoorFactorModel:
+        """A detached :class:`DoorFactorModel` copy of the stored values."""
+        return door_factor_from_dict(door_factor_to_dict(self))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _DoorFactorView):
+            other = other.snapshot()
+        return self.snapshot() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"DoorFactorModel(cooling={self.cooling!r}, heating={self.heating!r})"
+
+
+_M = TypeVar("_M")
+
+
+class _ModelSection(MutableMapping[str, _M]):
+    """``MutableMapping`` face of one learner kind (efficiency or door) in the store.
+
+    Keys are room keys; values are live views. Assigning a model (dataclass or a
+    view from another section) copies its values into the columns, so the
+    caller's object is never aliased. Deleting a room only clears its presence
+    flag and resets its columns; the slot stays allocated for reuse.
+    """
+
+    def __init__(
+        self,
+        store: RoomModelStore,
+        present: bytearray,
+        view: Callable[[RoomModelStore, int], _M],
+        put: Callable[[int, _M], None],
+        reset: Callable[[int], None],
+    ) -> None:
+        self._store = store
+        self._present = present
+        self._view = view
+        self._put = put
+        self._reset = reset
+
+    def __getitem__(self, key: str) -> _M:
+        slot = self._store._index.get(key)
+        if slot is None or not self._present[slot]:
+            raise KeyError(key)
+        return self._view(self._store, slot)
+
+    def __setitem__(self, key: str, model: _M) -> None:
+        slot = self._store._slot(key)
+        self._put(slot, model)
+        self._present[slot] = 1
+
+    def __delitem__(self, key: str) -> None:
+        slot = self._store._index.get(key)
+        if slot is None or not self._present[slot]:
+            raise KeyError(key)
+        self._reset(slot)
+        self._present[slot] = 0
+
+    def __contains__(self, key: object) -> bool:
+        slot = self._store._index.get(key)  # type: ignore[call-overload]
+        return slot is not None and bool(self._present[slot])
+
+    def __iter__(self) -> Iterator[str]:
+        keys = self._store._keys
+        return iter([keys[slot] for slot, flag in enumerate(self._present) if flag])
+
+    def __len__(self) -> int:
+        return self._present.count(1)
+
+    def replace(self, models: Mapping[str, _M]) -> None:
+        """Make this section hold exactly ``models`` (copied in)."""
+        if models is self:
+            return
+        incoming = list(models.items())
+        self.clear()
+        for key, model in incoming:
+            self[key] = model
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+
+class RoomModelStore:
+    """Every room's efficiency and door-factor learners in flat column arrays.
+
+    One room-key index (``_index`` / ``_keys``) addresses both learner kinds;
+    :attr:`efficiency` and :attr:`door` are the mapping views the coordinator
+    reads and writes through, with independent presence so a room can have one
+    learner without the other (exactly like the two dicts it replaces).
+    """
+
+    def __init__(self) -> None:
+        self._index: dict[str, int] = {}
+        self._keys: list[str] = []
+        self._rate = array("d")
+        self._n = array("q")
+        self._baseline = array("d")
+        self._base_n = array("q")
+        self._factor = array("d")
+        self._door_n = array("q")
+        self._has_efficiency = bytearray()
+        self._has_door = bytearray()
+        self.efficiency: _ModelSection[RoomModelLike] = _ModelSection(
+            self, self._has_efficiency, _RoomEfficiencyView, self._put_room_model, self._reset_efficiency
+        )
+        self.door: _ModelSection[DoorModelLike] = _ModelSection(
+            self, self._has_door, _DoorFactorView, self._put_door_model, self._reset_door
+        )
+
+    # -- slots ---------------------------------------------------------------
+    def _slot(self, key: str) -> int:
+        slot = self._index.get(key)
+        if slot is None:
+            slot = len(self._keys)
+            self._index[key] = slot
+            self._keys.append(key)
+            self._rate.extend([0.0] * (2 * EFF_REGIME_COUNT))
+            self._n.extend([0] * (2 * EFF_REGIME_COUNT))
+            self._baseline.extend((math.nan, math.nan))
+            self._base_n.extend((0, 0))
+            self._factor.extend((math.nan, math.nan))
+            self._door_n.extend((0, 0))
+            self._has_efficiency.append(0)
+            self._has_door.append(0)
+        return slot
+
+    def _efficiency_slot(self, key: str) -> int:
+        """The slot for ``key``, creating a fresh room model when absent."""
+        slot = self._slot(key)
+        if not self._has_efficiency[slot]:
+            self._reset_efficiency(slot)
+            self._has_efficiency[slot] = 1
+        return slot
+
+    def _door_slot(self, key: str) -> int:
+        """The slot for ``key``, creating a fresh door model when absent."""
+        slot = self._slot(key)
+        if not self._has_door[slot]:
+            self._reset_door(slot)
+            self._has_door[slot] = 1
+        return slot
+
+    # -- column writers ------------------------------------------------------
+    def _reset_efficiency(self, slot: int) -> None:
+        lo, hi = slot * 2 * EFF_REGIME_COUNT, (slot + 1) * 2 * EFF_REGIME_COUNT
+        self._rate[lo:hi] = array("d", [0.0] * (hi - lo))
+        self._n[lo:hi] = array("q", [0] * (hi - lo))
+        self._baseline[slot * 2 : slot * 2 + 2] = array("d", (math.nan, math.nan))
+        self._base_n[slot * 2 : slot * 2 + 2] = array("q", (0, 0))
+
+    def _reset_door(self, slot: int) -> None:
+        self._factor[slot * 2 : slot * 2 + 2] = array("d", (math.nan, math.nan))
+        self._door_n[slot * 2 : slot * 2 + 2] = array("q", (0, 0))
+
+    def _put_mode(self, i: int, mode: _ModeLike) -> None:
+        self._baseline[i] = _none_to_nan(mode.baseline)
+        self._base_n[i] = int(mode.n)
+        base = i * EFF_REGIME_COUNT
+        cells = list(mode.regimes)[:EFF_REGIME_COUNT]
+        for r in range(EFF_REGIME_COUNT):
+            cell = cells[r] if r < len(cells) else None
+            self._rate[base + r] = float(cell.rate) if cell is not None else 0.0
+            self._n[base + r] = int(cell.n) if cell is not None else 0
+
+    def _put_room_model(self, slot: int, model: RoomModelLike) -> None:
+        self._put_mode(slot * 2, model.cooling)
+        self._put_mode(slot * 2 + 1, model.heating)
+
+    def _put_door_cell(self, i: int, factor: float | None, n: int) -> None:
+        self._factor[i] = _none_to_nan(factor)
+        self._door_n[i] = int(n)
+
+    def _put_door_model(self, slot: int, model: DoorModelLike) -> None:
+        self._put_door_cell(slot * 2, model.cooling.factor, model.cooling.n)
+        self._put_door_cell(slot * 2 + 1, model.heating.factor, model.heating.n)
+
+    # -- bulk reads / batch updates -------------------------------------------
+    def effective_rates(self, regime_idx: int, mode: str = "cooling") -> dict[str, float]:
+        """:func:`effective_rate` for every stored room in one pass over the columns.
+
+        Same gate and clamp as the per-model function: a regime cell wins once
+        ``n >= REGIME_MIN_N`` and its rate is positive, else the mode baseline
+        (``0.0`` when none). Rooms without an efficiency model are omitted.
+        """
+        idx = int(_clamp(float(regime_idx), 0.0, float(EFF_REGIME_COUNT - 1)))
+        m = _MODE_INDEX[mode]
+        rate, n, baseline = self._rate, self._n, self._baseline
+        out: dict[str, float] = {}
+        for slot, flag in enumerate(self._has_efficiency):
+            if not flag:
+                continue
+            i = (slot * 2 + m) * EFF_REGIME_COUNT + idx
+            if n[i] >= REGIME_MIN_N and rate[i] > 0.0:
+                value = rate[i]
+            else:
+                value = baseline[slot * 2 + m]
+                if math.isnan(value):
+                    value = 0.0
+            out[self._keys[slot]] = _clamp(value, RATE_MIN, RATE_MAX)
+        return out
+
+    def update_many(self, samples: Iterable[tuple[str, float | None, int]], mode: str = "cooling") -> None:
+        """Fold ``(room_key, sample, regime_idx)`` rows into the ``mode`` columns.
+
+        Row for row identical to :func:`update_room_efficiency` (same guards,
+        clamps and adaptive-alpha EMA), applied in order; a room without a model
+        gets a fresh one first, as the coordinator did one call at a time.
+        """
+        m = _MODE_INDEX[mode]
+        rate, n, baseline, base_n = self._rate, self._n, self._baseline, self._base_n
+        for key, sample, regime_idx in samples:
+            if sample is None or not math.isfinite(sample):
+                continue
+            s = max(0.0, sample)
+            idx = int(_clamp(float(regime_idx), 0.0, float(EFF_REGIME_COUNT - 1)))
+            b = self._efficiency_slot(key) * 2 + m
+            base_n[b] += 1
+            baseline[b] = _ema_step(_nan_to_none(baseline[b]), s, base_n[b])
+            i = b * EFF_REGIME_COUNT + idx
+            n[i] += 1
+            rate[i] = _ema_step(rate[i] if n[i] > 1 else None, s, n[i])
+
+    def update_door_many(self, ratios: Iterable[tuple[str, float | None]], mode: str = "cooling") -> None:
+        """Fold ``(room_key, ratio)`` rows into the ``mode`` door cells.
+
+        Row for row identical to :func:`update_door_factor`; a room without a
+        door model gets a fresh one first.
+        """
+        m = _MODE_INDEX[mode]
+        factor, door_n = self._factor, self._door_n
+        for key, ratio in ratios:
+            if ratio is None or not math.isfinite(ratio):
+                continue
+            r = _clamp(ratio, DOOR_FACTOR_MIN, DOOR_FACTOR_MAX)
+            i = self._door_slot(key) * 2 + m
+            door_n[i] += 1
+            factor[i] = _ema_step(_nan_to_none(factor[i]) if door_n[i] > 1 else None, r, door_n[i])
+
+    # -- persistence -----------------------------------------------------------
+    def efficiency_to_dict(self) -> dict[str, dict]:
+        """The persisted ``room_efficiency`` section, read straight off the columns.
+
+        Same shape as :func:`room_model_to_dict` per room (the HA ``Store`` only
+        takes JSON primitives, so this is the one unavoidable copy).
+        """
+        rate, n, baseline, base_n = self._rate, self._n, self._baseline, self._base_n
+        out: dict[str, dict] = {}
+        for slot, flag in enumerate(self._has_efficiency):
+            if not flag:
+                continue
+            room: dict[str, dict] = {}
+            for m, mode in enumerate(_MODES):
+                b = slot * 2 + m
+                base = b * EFF_REGIME_COUNT
+                room[mode] = {
+                    "baseline": _nan_to_none(baseline[b]),
+                    "n": base_n[b],
+                    "regimes": [{"rate": rate[base + r], "n": n[base + r]} for r in range(EFF_REGIME_COUNT)],
+                }
+            out[self._keys[slot]] = room
+        return out
+
+    def door_factor_to_dict(self) -> dict[str, dict]:
+        """The persisted ``door_factor`` section, read straight off the columns."""
+        factor, door_n = self._factor, self._door_n
+        out: dict[str, dict] = {}
+        for slot, flag in enumerate(self._has_door):
+            if not flag:
+                continue
+            out[self._keys[slot]] = {
+                mode: {"factor": _nan_to_none(factor[slot * 2 + m]), "n": door_n[slot * 2 + m]}
+                for m, mode in enumerate(_MODES)
+            }
+        return out
+
+    def load_efficiency(self, data: object) -> None:
+        """Decode a ``room_efficiency`` section straight into the columns.
+
+        ``dict.update`` semantics: listed rooms are (re)written, others are
+        kept. Each entry decodes with the same tolerance as
+        :func:`room_model_from_dict`, so a malformed entry becomes a fresh or
+        padded model and never raises.
+        """
+        if not isinstance(data, dict):
+            return
+        for room, raw in data.items():
+            slot = self._slot(str(room))
+            entry = raw if isinstance(raw, dict) else {}
+            for m, mode in enumerate(_MODES):
+                baseline, n, cells = _parse_mode(entry.get(mode))
+                b = slot * 2 + m
+                self._baseline[b] = _none_to_nan(baseline)
+                self._base_n[b] = n
+                base = b * EFF_REGIME_COUNT
+                for r, (rate, cn) in enumerate(cells):
+                    self._rate[base + r] = rate
+                    self._n[base + r] = cn
+            self._has_efficiency[slot] = 1
+
+    def load_door_factor(self, data: object) -> None:
+        """Decode a ``door_factor`` section straight into the columns.
+
+        Mirrors :meth:`load_efficiency`, with the tolerance of
+        :func:`door_factor_from_dict`.
+        """
+        if not isinstance(data, dict):
+            return
+        for room, raw in data.items():
+            slot = self._slot(str(room))
+            entry = raw if isinstance(raw, dict) else {}
+            for m, mode in enumerate(_MODES):
+                self._put_door_cell(slot * 2 + m, *_parse_door_cell(entry.get(mode)))
+            self._has_door[slot] = 1
+
+
+def _changed(before: float | None, after: float | None, tol: float) -> bool:
+    """Whether two optional values differ by more than ``tol``."""
+    if before is None or after is None:
+        return (before is None) != (after is None)
+    return abs(before - after) > tol
+
+
+def room_model_changes(
+    before: RoomModelStore, after: RoomModelStore, *, tol: float = 1e-9
+) -> dict[str, dict]:
+    """Per-room, per-mode differences between two stores (e.g. a re-fit and the live one).
+
+    ``room_efficiency`` entries carry ``baseline``, ``n`` and the per-regime
+    ``effective`` rate as ``[before, after]`` pairs; ``door_factor`` entries
+    carry ``factor`` and ``n``. Only room/mode pairs that differ are listed; a
+    room missing on one side reads as no baseline/factor and ``n == 0``.
+    """
+    rates = {
+        (side, mode): [store.effective_rates(r, mode) for r in range(EFF_REGIME_COUNT)]
+        for side, store in (("before", before), ("after", after))
+        for mode in _MODES
+    }
+    eff_before, eff_after = before.efficiency_to_dict(), after.efficiency_to_dict()
+    door_before, door_after = before.door_factor_to_dict(), after.door_factor_to_dict()
+    empty_mode = {"baseline": None, "n": 0}
+    empty_cell = {"factor": None, "n": 0}
+    efficiency: dict[str, dict] = {}
+    for room in sorted(set(eff_before) | set(eff_after)):
+        for mode in _MODES:
+            old = eff_before.get(room, {}).get(mode, empty_mode)
+            new = eff_after.get(room, {}).get(mode, empty_mode)
+            old_eff = [per.get(room) for per in rates[("before", mode)]]
+            new_eff = [per.get(room) for per in rates[("after", mode)]]
+            if (
+                old["n"] != new["n"]
+                or _changed(old["baseline"], new["baseline"], tol)
+                or any(_changed(a, b, tol) for a, b in zip(old_eff, new_eff, strict=True))
+            ):
+                efficiency.setdefault(room, {})[mode] = {
+                    "baseline": [old["baseline"], new["baseline"]],
+                    "n": [old["n"], new["n"]],
+                    "effective": [old_eff, new_eff],
+                }
+    door: dict[str, dict] = {}
+    for room in sorted(set(door_before) | set(door_after)):
+        for mode in _MODES:
+            old = door_before.get(room, {}).get(mode, empty_cell)
+            new = door_after.get(room, {}).get(mode, empty_cell)
+            if old["n"] != new["n"] or _changed(old["factor"], new["factor"], tol):
+                door.setdefault(room, {})[mode] = {
+                    "factor": [old["factor"], new["factor"]],
+                    "n": [old["n"], new["n"]],
+                }
+    return {"room_efficiency": efficiency, "door_factor": door}
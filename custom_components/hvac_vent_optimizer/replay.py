@@ -0,0 +1,1033 @@
+"""Compact columnar replay traces of recorded coordinator state (pure, HA-free).
+
+A *trace* is the per-poll state the coordinator observed while conditioning:
+the poll time, the thermostat's action and setpoint, and per room the
+temperature, the representative vent aperture, the active flag and the
+effective rate the allocator would have used. :func:`simulator.replay_trace`
+re-runs any strategy's decisions against a trace offline, so a candidate
+strategy can be evaluated over weeks of a real house's data in minutes.
+
+Layout
+------
+Traces are stored **column-wise** in typed :mod:`array` buffers rather than as
+a list of per-poll dicts (or the YAML efficiency export): one buffer per poll
+field (``t_s``/``mode``/``setpoint``) and, per room, one buffer per room field
+(``temp``/``open``/``active``/``rate``). A week of 1-minute polls for a 20-room
+house is ~1.2 MB in memory, and the replay loop reads plain indexed columns.
+
+* Missing temperatures / setpoints / rates are ``NaN``; an unknown aperture is
+  :data:`OPEN_UNKNOWN`.
+* A room first seen mid-trace gets its earlier rows back-filled as missing, so
+  every column always has exactly :attr:`Trace.rows` entries.
+* ``vents`` (physical vents in the room, R23) and ``leak`` are per-room
+  metadata holding the latest observed value.
+
+File format
+-----------
+``gzip`` over: the 8-byte magic :data:`TRACE_MAGIC`, a ``u8`` format version
+and a ``u32`` header length (little endian), a UTF-8 JSON header (row count,
+room metadata and the ordered ``(name, typecode)`` column list), then every
+column's raw little-endian bytes in header order. Column lengths follow from
+the row count and typecode, so the header carries no offsets.
+
+Decision log
+------------
+:class:`DecisionLog` is a bounded ring of :class:`DecisionRecord` entries, one
+per DAB apply (poll, manual ``run_dab`` or pre-adjust). A record holds what the
+apply decided: the outcome (applied / recalculated / held and why / skipped),
+the recalc reason with the spread and deviation that drove it, and per room
+the observed state, the pre-floor allocation, the post-floor target, the
+applied aperture and what happened to it (moved, or suppressed by deadband,
+min-percent or cooldown). Records are ``struct``-packed into one ``bytes``
+blob each (a 20-room record is ~600 bytes); ids and strategy names are interned
+in a string table. :meth:`DecisionLog.to_jsonl` dumps the ring as JSON Lines,
+and :func:`traces_from_decisions` turns records (live or
+:func:`load_decisions_jsonl`) back into :class:`Trace` objects for
+:func:`simulator.replay_trace`.
+
+Cycle sample archive
+--------------------
+:class:`CycleArchive` keeps the raw per-vent readings of each finalized HVAC
+cycle (times, room temperature, aperture, duct temperature) together with the
+regime and door state they were learned in, struct-packed like the decision
+log. The coordinator persists it and its ``refit_models`` service re-runs the
+learners over it, so discarded samples and changed learning constants can be
+applied after the fact.
+
+Recorder history
+----------------
+:class:`CycleReconstructor` rebuilds the same :class:`CycleRecord` objects from
+a thermostat's recorded history (``hvac_action``, room temperatures, vent
+apertures, duct temperatures, door/outdoor/sun states), fed one reading at a
+time in time order. It only holds the readings of the cycle in progress, so
+months of history stream through it in constant memory.
+
+Like ``balance``/``learning``/``context``, this module imports nothing from
+Home Assistant, so the coordinator records into it and the offline simulator
+replays from it with the same code.
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+import math
+import struct
+import sys
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+TRACE_MAGIC = b"HVOTRACE"
+TRACE_VERSION = 1
+# Default file suffix for exported traces.
+TRACE_SUFFIX = ".hvotrace"
+
+# Thermostat action codes stored in the ``mode`` column. The names match the
+# ``balance.MODE_*`` / HA ``HVACAction`` strings.
+MODE_IDLE = 0
+MODE_COOLING = 1
+MODE_HEATING = 2
+_MODE_CODES = {"cooling": MODE_COOLING, "heating": MODE_HEATING}
+_MODE_NAMES = {MODE_COOLING: "cooling", MODE_HEATING: "heating"}
+
+# Aperture sentinel for "not reported" (valid apertures are 0..100).
+OPEN_UNKNOWN = 255
+
+_NAN = math.nan
+_HEADER = struct.Struct("<8sBI")
+
+# (column, typecode) for each trace-level column, in file order.
+_TRACE_FIELDS: tuple[tuple[str, str], ...] = (("t_s", "d"), ("mode", "b"), ("setpoint", "f"))
+
+# (column, typecode, missing value) for each per-room field, in file order.
+_ROOM_FIELDS: tuple[tuple[str, str, float | int], ...] = (
+    ("temp", "f", _NAN),
+    ("open", "B", OPEN_UNKNOWN),
+    ("active", "B", 0),
+    ("rate", "f", _NAN),
+)
+
+
+class TraceFormatError(ValueError):
+    """A trace file is not a readable :data:`TRACE_VERSION` trace."""
+
+
+def mode_code(action: str | None) -> int:
+    """Map an HVAC action string to its ``mode`` column code (idle otherwise)."""
+    return _MODE_CODES.get(action or "", MODE_IDLE)
+
+
+def mode_name(code: int) -> str | None:
+    """Inverse of :func:`mode_code`; ``None`` for idle/unknown."""
+    return _MODE_NAMES.get(code)
+
+
+# ---------------------------------------------------------------------------
+# Model
+# ---------------------------------------------------------------------------
+@dataclass(frozen=True)
+class RoomSample:
+    """One room's observation at one poll (the :meth:`Trace.append` input).
+
+    ``temp_c``/``rate`` may be ``None`` when unknown; ``open_pct`` is the
+    representative vent's reported aperture (``None`` if not reported).
+    """
+
+    temp_c: float | None
+    open_pct: float | None
+    active: bool = True
+    rate: float | None = None
+    leak: float = 0.0
+    vents: int = 1
+
+
+@dataclass
+class RoomColumns:
+    """Per-room column buffers plus the room's latest metadata."""
+
+    temp: array[float] = field(default_factory=lambda: array("f"))
+    open: array[int] = field(default_factory=lambda: array("B"))
+    active: array[int] = field(default_factory=lambda: array("B"))
+    rate: array[float] = field(default_factory=lambda: array("f"))
+    vents: int = 1
+    leak: float = 0.0
+
+    def column(self, name: str) -> array[Any]:
+        col: array[Any] = getattr(self, name)
+        return col
+
+
+class Trace:
+    """Columnar per-poll trace (see module docs).
+
+    ``max_rows`` bounds the in-memory trace for continuous recording: once it
+    is exceeded the oldest rows are dropped in batches (an eighth of the
+    capacity at a time) so trimming stays amortized O(1) per append. ``0``
+    means unbounded.
+    """
+
+    def __init__(self, max_rows: int = 0) -> None:
+        self.max_rows = max(0, int(max_rows))
+        self.t_s: array[float] = array("d")
+        self.mode: array[int] = array("b")
+        self.setpoint: array[float] = array("f")
+        self.rooms: dict[str, RoomColumns] = {}
+
+    @property
+    def rows(self) -> int:
+        return len(self.t_s)
+
+    def __len__(self) -> int:
+        return len(self.t_s)
+
+    @property
+    def room_ids(self) -> list[str]:
+        return list(self.rooms)
+
+    @property
+    def span_s(self) -> float:
+        """Seconds between the first and last recorded poll (0 for < 2 rows)."""
+        return self.t_s[-1] - self.t_s[0] if len(self.t_s) >= 2 else 0.0
+
+    # -- recording -----------------------------------------------------------
+    def _new_room(self) -> RoomColumns:
+        cols = RoomColumns()
+        n = self.rows
+        for name, typecode, missing in _ROOM_FIELDS:
+            cols.column(name).extend(array(typecode, [missing]) * n)
+        return cols
+
+    def append(
+        self,
+        t_s: float,
+        action: str | None,
+        setpoint_c: float | None,
+        rooms: Mapping[str, RoomSample],
+    ) -> None:
+        """Record one poll. Rooms absent from ``rooms`` are recorded as missing."""
+        for room_id in rooms:
+            if room_id not in self.rooms:
+                self.rooms[room_id] = self._new_room()
+        self.t_s.append(float(t_s))
+        self.mode.append(mode_code(action))
+        self.setpoint.append(_NAN if setpoint_c is None else float(setpoint_c))
+        for room_id, cols in self.rooms.items():
+            sample = rooms.get(room_id)
+            if sample is None:
+                cols.temp.append(_NAN)
+                cols.open.append(OPEN_UNKNOWN)
+                cols.active.append(0)
+                cols.rate.append(_NAN)
+                continue
+            cols.temp.append(_NAN if sample.temp_c is None else float(sample.temp_c))
+            cols.open.append(
+                OPEN_UNKNOWN if sample.open_pct is None else max(0, min(100, round(sample.open_pct)))
+            )
+            cols.active.append(1 if sample.active else 0)
+            cols.rate.append(_NAN if sample.rate is None else float(sample.rate))
+            cols.vents = max(1, int(sample.vents))
+            cols.leak = float(sample.leak)
+        if self.max_rows and self.rows > self.max_rows:
+            self.drop_oldest(self.rows - self.max_rows + max(1, self.max_rows // 8))
+
+    def drop_oldest(self, count: int) -> None:
+        """Drop the ``count`` oldest rows from every column."""
+        count = max(0, min(int(count), self.rows))
+        if not count:
+            return
+        del self.t_s[:count]
+        del self.mode[:count]
+        del self.setpoint[:count]
+        for cols in self.rooms.values():
+            for name, _typecode, _missing in _ROOM_FIELDS:
+                del cols.column(name)[:count]
+
+    def copy(self) -> Trace:
+        """Independent snapshot (column memcpy), e.g. to serialize off-loop."""
+        other = Trace(self.max_rows)
+        other.t_s = array("d", self.t_s)
+        other.mode = array("b", self.mode)
+        other.setpoint = array("f", self.setpoint)
+        for room_id, cols in self.rooms.items():
+            other.rooms[room_id] = RoomColumns(
+                temp=array("f", cols.temp),
+                open=array("B", cols.open),
+                active=array("B", cols.active),
+                rate=array("f", cols.rate),
+                vents=cols.vents,
+                leak=cols.leak,
+            )
+        return other
+
+    def clear(self) -> None:
+        self.drop_oldest(self.rows)
+        self.rooms.clear()
+
+    # -- reading -------------------------------------------------------------
+    def mode_at(self, row: int) -> str | None:
+        return mode_name(self.mode[row])
+
+    def samples_at(self, row: int) -> Iterator[tuple[str, RoomSample]]:
+        """Yield ``(room_id, RoomSample)`` for every room with a temperature at ``row``."""
+        for room_id, cols in self.rooms.items():
+            temp = cols.temp[row]
+            if math.isnan(temp):
+                continue
+            opened = cols.open[row]
+            rate = cols.rate[row]
+            yield room_id, RoomSample(
+                temp_c=temp,
+                open_pct=None if opened == OPEN_UNKNOWN else float(opened),
+                active=bool(cols.active[row]),
+                rate=None if math.isnan(rate) else rate,
+                leak=cols.leak,
+                vents=cols.vents,
+            )
+
+    # -- persistence ---------------------------------------------------------
+    def _columns(self) -> list[tuple[str, array[Any]]]:
+        cols: list[tuple[str, array[Any]]] = [
+            ("t_s", self.t_s),
+            ("mode", self.mode),
+            ("setpoint", self.setpoint),
+        ]
+        for idx, room in enumerate(self.rooms.values()):
+            for name, _typecode, _missing in _ROOM_FIELDS:
+                cols.append((f"{name}:{idx}", room.column(name)))
+        return cols
+
+    def to_bytes(self) -> bytes:
+        """Serialize to the gzip'd columnar file format (see module docs)."""
+        columns = self._columns()
+        header = {
+            "rows": self.rows,
+            "rooms": [{"id": rid, "vents": c.vents, "leak": c.leak} for rid, c in self.rooms.items()],
+            "columns": [[name, col.typecode] for name, col in columns],
+        }
+        head = json.dumps(header, separators=(",", ":")).encode()
+        parts = [_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, len(head)), head]
+        for _name, col in columns:
+            parts.append(_le_bytes(col))
+        return gzip.compress(b"".join(parts), compresslevel=6)
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> Trace:
+        """Inverse of :meth:`to_bytes`; raises :class:`TraceFormatError`."""
+        try:
+            raw = gzip.decompress(blob)
+        except (OSError, EOFError) as err:
+            raise TraceFormatError(f"not a gzip trace: {err}") from err
+        if len(raw) < _HEADER.size:
+            raise TraceFormatError("truncated trace header")
+        magic, version, head_len = _HEADER.unpack_from(raw)
+        if magic != TRACE_MAGIC:
+            raise TraceFormatError("bad trace magic")
+        if version != TRACE_VERSION:
+            raise TraceFormatError(f"unsupported trace version {version}")
+        offset = _HEADER.size
+        try:
+            header = json.loads(raw[offset : offset + head_len])
+            rows = int(header["rows"])
+            room_meta = list(header["rooms"])
+            column_spec = [(str(n), str(t)) for n, t in header["columns"]]
+            room_cols = [RoomColumns(vents=int(m["vents"]), leak=float(m["leak"])) for m in room_meta]
+            room_ids = [str(m["id"]) for m in room_meta]
+        except (ValueError, KeyError, TypeError) as err:
+            raise TraceFormatError(f"bad trace header: {err}") from err
+        offset += head_len
+
+        trace = cls()
+        trace_types = dict(_TRACE_FIELDS)
+        room_types = {name: typecode for name, typecode, _missing in _ROOM_FIELDS}
+        for name, typecode in column_spec:
+            base, _, idx = name.partition(":")
+            expected = room_types.get(base) if idx else trace_types.get(base)
+            if expected != typecode:
+                raise TraceFormatError(f"unknown trace column {name!r} ({typecode!r})")
+            if idx and not (idx.isdigit() and int(idx) < len(room_cols)):
+                raise TraceFormatError(f"column {name!r} names no room in the room table")
+            col: array[Any] = array(typecode)
+            size = rows * col.itemsize
+            if offset + size > len(raw):
+                raise TraceFormatError(f"truncated column {name!r}")
+            col.frombytes(raw[offset : offset + size])
+            if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+                col.byteswap()
+            offset += size
+            if idx:
+                target = room_cols[int(idx)]
+                setattr(target, base, col)
+            else:
+                setattr(trace, base, col)
+        # Exactly one of each trace and per-room column: a repeated (or
+        # aliased, e.g. ``temp:01``) column silently replaces another, and a
+        # missing one leaves a room shorter than ``rows``.
+        names = [name for name, _typecode in column_spec]
+        expected_names = {name for name, _typecode in _TRACE_FIELDS}
+        expected_names.update(
+            f"{name}:{idx}" for idx in range(len(room_cols)) for name, _typecode, _missing in _ROOM_FIELDS
+        )
+        if len(set(names)) != len(names):
+            raise TraceFormatError("duplicate trace column")
+        if set(names) != expected_names:
+            mismatch = sorted(expected_names.symmetric_difference(names))
+            raise TraceFormatError(f"trace columns do not match the room table: {', '.join(mismatch)}")
+        trace.rooms = dict(zip(room_ids, room_cols, strict=True))
+        return trace
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> Trace:
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+def _le_bytes(col: array[Any]) -> bytes:
+    """Raw little-endian bytes of a column (byteswapped copy on big-endian hosts)."""
+    if sys.byteorder == "little":
+        return col.tobytes()
+    swapped = array(col.typecode, col)  # pragma: no cover - big-endian hosts
+    swapped.byteswap()  # pragma: no cover
+    return swapped.tobytes()  # pragma: no cover
+
+
+# ---------------------------------------------------------------------------
+# Decision log
+# ---------------------------------------------------------------------------
+# Records kept by default: one day of 1-minute active polls.
+DECISION_LOG_MAX_RECORDS = 1440
+DECISION_LOG_SUFFIX = ".jsonl"
+
+# Why an apply ran. Only ``poll`` records are replayed by default.
+DECISION_KINDS: tuple[str, ...] = ("poll", "manual", "pre_adjust")
+# What the apply decided as a whole.
+DECISION_OUTCOMES: tuple[str, ...] = (
+    "applied",
+    "recalc",
+    "hold_tracking",
+    "hold_recalc_cap",
+    "hold_batch_cycle",
+    "hold_batch_window",
+    "skipped_idle",
+    "no_setpoint",
+    "no_data",
+)
+# Why a hold was broken (``recalc``).
+RECALC_REASONS: tuple[str, ...] = ("", "spread_guardrail", "deviation")
+# What happened to one room's vents. ``pending`` means the apply stopped before
+# dispatch (a hold or skip).
+ROOM_OUTCOMES: tuple[str, ...] = (
+    "pending",
+    "moved",
+    "at_target",
+    "deadband",
+    "min_percent",
+    "cooldown",
+    "inactive_held",
+    "safety_open",
+    "command_failed",
+    "no_reading",
+)
+
+# t_s, thermostat, kind, mode, strategy, setpoint, spread, max deviation,
+# outcome, reason, recalc count, room count.
+_DECISION = struct.Struct("<dHBBHfffBBBH")
+# room, vents, temp, open, active, rate, leak, pre-floor, target, applied, outcome.
+_ROOM_DECISION = struct.Struct("<HBfBBffffBB")
+
+
+def _code(names: tuple[str, ...], name: str) -> int:
+    try:
+        return names.index(name)
+    except ValueError:
+        return 0
+
+
+def _f(value: float | None) -> float:
+    return _NAN if value is None else float(value)
+
+
+def _opt(value: float) -> float | None:
+    return None if math.isnan(value) else value
+
+
+def _pct(value: float | None) -> int:
+    return OPEN_UNKNOWN if value is None else max(0, min(100, round(value)))
+
+
+@dataclass
+class RoomDecision:
+    """One room group's state and outcome within a :class:`DecisionRecord`."""
+
+    temp_c: float | None
+    open_pct: float | None
+    active: bool = True
+    rate: float | None = None
+    leak: float = 0.0
+    vents: int = 1
+    pre_floor_pct: float | None = None
+    target_pct: float | None = None
+    applied_pct: int | None = None
+    outcome: str = "pending"
+
+    def sample(self) -> RoomSample:
+        return RoomSample(self.temp_c, self.open_pct, self.active, self.rate, self.leak, self.vents)
+
+
+@dataclass
+class DecisionRecord:
+    """Everything one DAB apply decided (see module docs)."""
+
+    t_s: float
+    thermostat: str
+    action: str | None
+    setpoint_c: float | None = None
+    kind: str = "poll"
+    strategy: str = ""
+    outcome: str = "applied"
+    reason: str = ""
+    spread_c: float | None = None
+    max_deviation_c: float | None = None
+    recalc_count: int = 0
+    rooms: dict[str, RoomDecision] = field(default_factory=dict)
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "t_s": self.t_s,
+            "thermostat": self.thermostat,
+            "kind": self.kind,
+            "action": self.action,
+            "strategy": self.strategy,
+            "setpoint_c": self.setpoint_c,
+            "outcome": self.outcome,
+            "reason": self.reason,
+            "spread_c": self.spread_c,
+            "max_deviation_c": self.max_deviation_c,
+            "recalc_count": self.recalc_count,
+            "rooms": {
+                room_id: {
+                    "temp_c": room.temp_c,
+                    "open_pct": room.open_pct,
+                    "active": room.active,
+                    "rate": room.rate,
+                    "leak": room.leak,
+                    "vents": room.vents,
+                    "pre_floor_pct": room.pre_floor_pct,
+                    "target_pct": room.target_pct,
+                    "applied_pct": room.applied_pct,
+                    "outcome": room.outcome,
+                }
+                for room_id, room in self.rooms.items()
+            },
+        }
+
+    @classmethod
+    def from_json(cls, obj: Mapping[str, Any]) -> DecisionRecord:
+        rooms = {
+            str(room_id): RoomDecision(
+                temp_c=room.get("temp_c"),
+                open_pct=room.get("open_pct"),
+                active=bool(room.get("active", True)),
+                rate=room.get("rate"),
+                leak=float(room.get("leak") or 0.0),
+                vents=int(room.get("vents") or 1),
+                pre_floor_pct=room.get("pre_floor_pct"),
+                target_pct=room.get("target_pct"),
+                applied_pct=room.get("applied_pct"),
+                outcome=str(room.get("outcome") or "pending"),
+            )
+            for room_id, room in (obj.get("rooms") or {}).items()
+        }
+        return cls(
+            t_s=float(obj["t_s"]),
+            thermostat=str(obj.get("thermostat") or ""),
+            action=obj.get("action"),
+            setpoint_c=obj.get("setpoint_c"),
+            kind=str(obj.get("kind") or "poll"),
+            strategy=str(obj.get("strategy") or ""),
+            outcome=str(obj.get("outcome") or "applied"),
+            reason=str(obj.get("reason") or ""),
+            spread_c=obj.get("spread_c"),
+            max_deviation_c=obj.get("max_deviation_c"),
+            recalc_count=int(obj.get("recalc_count") or 0),
+            rooms=rooms,
+        )
+
+
+class DecisionLog:
+    """Bounded ring of struct-packed :class:`DecisionRecord` blobs."""
+
+    def __init__(self, max_records: int = DECISION_LOG_MAX_RECORDS) -> None:
+        self._blobs: deque[bytes] = deque(maxlen=max(1, int(max_records)))
+        self._strings: list[str] = []
+        self._string_ids: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    @property
+    def nbytes(self) -> int:
+        """Packed size of the records currently held."""
+        return sum(len(blob) for blob in self._blobs)
+
+    def _intern(self, text: str) -> int:
+        idx = self._string_ids.get(text)
+        if idx is None:
+            idx = self._string_ids[text] = len(self._strings)
+            self._strings.append(text)
+        return idx
+
+    def append(self, record: DecisionRecord) -> None:
+        parts = [
+            _DECISION.pack(
+                record.t_s,
+                self._intern(record.thermostat),
+                _code(DECISION_KINDS, record.kind),
+                mode_code(record.action),
+                self._intern(record.strategy),
+                _f(record.setpoint_c),
+                _f(record.spread_c),
+                _f(record.max_deviation_c),
+                _code(DECISION_OUTCOMES, record.outcome),
+                _code(RECALC_REASONS, record.reason),
+                min(255, max(0, record.recalc_count)),
+                len(record.rooms),
+            )
+        ]
+        for room_id, room in record.rooms.items():
+            parts.append(
+                _ROOM_DECISION.pack(
+                    self._intern(room_id),
+                    min(255, max(1, room.vents)),
+                    _f(room.temp_c),
+                    _pct(room.open_pct),
+                    1 if room.active else 0,
+                    _f(room.rate),
+                    float(room.leak),
+                    _f(room.pre_floor_pct),
+                    _f(room.target_pct),
+                    _pct(room.applied_pct),
+                    _code(ROOM_OUTCOMES, room.outcome),
+                )
+            )
+        self._blobs.append(b"".join(parts))
+
+    def _decode(self, blob: bytes) -> DecisionRecord:
+        strings = self._strings
+        (t_s, thermostat, kind, mode, strategy, setpoint, spread, max_dev, outcome, reason, recalcs, n) = (
+            _DECISION.unpack_from(blob)
+        )
+        record = DecisionRecord(
+            t_s=t_s,
+            thermostat=strings[thermostat],
+            action=mode_name(mode),
+            setpoint_c=_opt(setpoint),
+            kind=DECISION_KINDS[kind],
+            strategy=strings[strategy],
+            outcome=DECISION_OUTCOMES[outcome],
+            reason=RECALC_REASONS[reason],
+            spread_c=_opt(spread),
+            max_deviation_c=_opt(max_dev),
+            recalc_count=recalcs,
+        )
+        for i in range(n):
+            (room, vents, temp, opened, active, rate, leak, pre, target, applied, room_outcome) = (
+                _ROOM_DECISION.unpack_from(blob, _DECISION.size + i * _ROOM_DECISION.size)
+            )
+            record.rooms[strings[room]] = RoomDecision(
+                temp_c=_opt(temp),
+                open_pct=None if opened == OPEN_UNKNOWN else float(opened),
+                active=bool(active),
+                rate=_opt(rate),
+                leak=leak,
+                vents=vents,
+                pre_floor_pct=_opt(pre),
+                target_pct=_opt(target),
+                applied_pct=None if applied == OPEN_UNKNOWN else applied,
+                outcome=ROOM_OUTCOMES[room_outcome],
+            )
+        return record
+
+    def records(self, thermostat: str | None = None) -> Iterator[DecisionRecord]:
+        """Decoded records, oldest first (optionally one thermostat's)."""
+        for blob in list(self._blobs):
+            record = self._decode(blob)
+            if thermostat is None or record.thermostat == thermostat:
+                yield record
+
+    def to_jsonl(self, thermostat: str | None = None) -> str:
+        """The ring as JSON Lines (one :meth:`DecisionRecord.to_json` per line)."""
+        return "".join(
+            json.dumps(record.to_json(), separators=(",", ":")) + "\n" for record in self.records(thermostat)
+        )
+
+    def copy(self) -> DecisionLog:
+        """Independent snapshot, e.g. to serialize off-loop."""
+        other = DecisionLog(self._blobs.maxlen or DECISION_LOG_MAX_RECORDS)
+        other._blobs.extend(self._blobs)
+        other._strings = list(self._strings)
+        other._string_ids = dict(self._string_ids)
+        return other
+
+    def clear(self) -> None:
+        self._blobs.clear()
+        self._strings.clear()
+        self._string_ids.clear()
+
+
+def load_decisions_jsonl(path: str) -> list[DecisionRecord]:
+    """Read a :meth:`DecisionLog.to_jsonl` dump (blank lines are skipped)."""
+    with open(path, encoding="utf-8") as file:
+        return [DecisionRecord.from_json(json.loads(line)) for line in file if line.strip()]
+
+
+def traces_from_decisions(
+    records: Iterable[DecisionRecord], kinds: tuple[str, ...] = ("poll",)
+) -> dict[str, Trace]:
+    """Per-thermostat replay traces from decision records of the given ``kinds``."""
+    traces: dict[str, Trace] = {}
+    for record in records:
+        if record.kind not in kinds or not record.rooms:
+            continue
+        trace = traces.get(record.thermostat)
+        if trace is None:
+            trace = traces[record.thermostat] = Trace()
+        trace.append(
+            record.t_s,
+            record.action,
+            record.setpoint_c,
+            {room_id: room.sample() for room_id, room in record.rooms.items()},
+        )
+    return traces
+
+
+# ---------------------------------------------------------------------------
+# Cycle sample archive
+# ---------------------------------------------------------------------------
+# Packed size kept by default; the oldest cycles are dropped past it. At a few
+# KB per cycle this is several weeks of cycles for a typical house.
+CYCLE_ARCHIVE_MAX_BYTES = 2 * 1024 * 1024
+CYCLE_ARCHIVE_VERSION = 1
+
+# started_s, mode, setpoint, regime, vent count.
+_CYCLE = struct.Struct("<dBfBH")
+# vent, room key, doors open (0/1, 2 = unknown), sample count.
+_CYCLE_VENT = struct.Struct("<HHBH")
+_DOORS_UNKNOWN = 2
+
+
+@dataclass
+class VentCycleSamples:
+    """One vent's raw readings over a cycle, as ``_record_cycle_sample`` took them.
+
+    ``offsets_s`` are seconds from the cycle's ``started_s``; apertures are whole
+    percent and a missing duct reading is ``None``.
+    """
+
+    vent_id: str
+    room_key: str
+    doors_open: bool | None
+    offsets_s: list[float] = field(default_factory=list)
+    temps: list[float] = field(default_factory=list)
+    apertures: list[float] = field(default_factory=list)
+    ducts: list[float | None] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.offsets_s)
+
+
+@dataclass
+class CycleRecord:
+    """A finalized cycle's inputs to learning: its readings plus the context they were learned in."""
+
+    started_s: float
+    action: str | None
+    setpoint: float | None
+    regime: int
+    vents: list[VentCycleSamples] = field(default_factory=list)
+
+
+class CycleArchive:
+    """Bounded ring of struct-packed :class:`CycleRecord` blobs.
+
+    Keeps the raw per-vent readings of every finalized cycle so learning can be
+    re-run offline with different rules. ``appended`` counts every record ever
+    appended, so a reader can pick up exactly the records added after it took a
+    snapshot (:meth:`since`).
+    """
+
+    def __init__(self, max_bytes: int = CYCLE_ARCHIVE_MAX_BYTES) -> None:
+        self.max_bytes = max(1, int(max_bytes))
+        self._blobs: deque[bytes] = deque()
+        self._nbytes = 0
+        self._strings: list[str] = []
+        self._string_ids: dict[str, int] = {}
+        self.appended = 0
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    @property
+    def nbytes(self) -> int:
+        """Packed size of the records currently held."""
+        return self._nbytes
+
+    def _intern(self, text: str) -> int:
+        idx = self._string_ids.get(text)
+        if idx is None:
+            idx = self._string_ids[text] = len(self._strings)
+            self._strings.append(text)
+        return idx
+
+    def _push(self, blob: bytes) -> None:
+        self._blobs.append(blob)
+        self._nbytes += len(blob)
+        self.appended += 1
+        while self._nbytes > self.max_bytes and len(self._blobs) > 1:
+            self._nbytes -= len(self._blobs.popleft())
+
+    def append(self, record: CycleRecord) -> None:
+        vents = record.vents[:0xFFFF]
+        parts = [
+            _CYCLE.pack(
+                record.started_s,
+                mode_code(record.action),
+                _f(record.setpoint),
+                min(255, max(0, record.regime)),
+                len(vents),
+            )
+        ]
+        for vent in vents:
+            n = min(len(vent), 0xFFFF)
+            doors = _DOORS_UNKNOWN if vent.doors_open is None else int(vent.doors_open)
+            parts.append(_CYCLE_VENT.pack(self._intern(vent.vent_id), self._intern(vent.room_key), doors, n))
+            parts.append(_le_bytes(array("f", vent.offsets_s[:n])))
+            parts.append(_le_bytes(array("f", vent.temps[:n])))
+            parts.append(_le_bytes(array("B", [_pct(a) for a in vent.apertures[:n]])))
+            parts.append(_le_bytes(array("f", [_f(d) for d in vent.ducts[:n]])))
+        self._push(b"".join(parts))
+
+    def _decode(self, blob: bytes) -> CycleRecord:
+        strings = self._strings
+        started_s, mode, setpoint, regime, count = _CYCLE.unpack_from(blob)
+        record = CycleRecord(
+            started_s=started_s, action=mode_name(mode), setpoint=_opt(setpoint), regime=regime
+        )
+        offset = _CYCLE.size
+        for _ in range(count):
+            vent_id, room_key, doors, n = _CYCLE_VENT.unpack_from(blob, offset)
+            offset += _CYCLE_VENT.size
+            columns = []
+            for typecode in ("f", "f", "B", "f"):
+                col = array(typecode)
+                size = n * col.itemsize
+                col.frombytes(blob[offset : offset + size])
+                if sys.byteorder != "little" and col.itemsize > 1:
+                    col.byteswap()
+                offset += size
+                columns.append(col)
+            offsets, temps, apertures, ducts = columns
+            record.vents.append(
+                VentCycleSamples(
+                    vent_id=strings[vent_id],
+                    room_key=strings[room_key],
+                    doors_open=None if doors == _DOORS_UNKNOWN else bool(doors),
+                    offsets_s=[float(x) for x in offsets],
+                    temps=[float(x) for x in temps],
+                    apertures=[float(a) for a in apertures],
+                    ducts=[_opt(d) for d in ducts],
+                )
+            )
+        if offset != len(blob):
+            raise ValueError("cycle record length does not match its header")
+        return record
+
+    def records(self) -> Iterator[CycleRecord]:
+        """Decoded records, oldest first."""
+        for blob in list(self._blobs):
+            yield self._decode(blob)
+
+    def since(self, appended: int) -> list[CycleRecord]:
+        """Records appended since :attr:`appended` was ``appended``, if still held."""
+        count = min(len(self._blobs), max(0, self.appended - appended))
+        return [self._decode(blob) for blob in list(self._blobs)[len(self._blobs) - count :]]
+
+    def copy(self) -> CycleArchive:
+        """Independent snapshot, e.g. to decode off-loop."""
+        other = CycleArchive(self.max_bytes)
+        other._blobs.extend(self._blobs)
+        other._nbytes = self._nbytes
+        other._strings = list(self._strings)
+        other._string_ids = dict(self._string_ids)
+        other.appended = self.appended
+        return other
+
+    def to_json(self) -> dict[str, Any]:
+        """JSON-safe form for the HA ``Store``: the string table plus base64 blobs."""
+        return {
+            "version": CYCLE_ARCHIVE_VERSION,
+            "strings": list(self._strings),
+            "records": [base64.b64encode(blob).decode("ascii") for blob in self._blobs],
+        }
+
+    @classmethod
+    def from_json(cls, obj: object, max_bytes: int = CYCLE_ARCHIVE_MAX_BYTES) -> CycleArchive:
+        """Rebuild from :meth:`to_json`; anything unreadable yields an empty archive.
+
+        Each record is checked by decoding it, so a truncated or garbled blob is
+        dropped on its own instead of failing the load.
+        """
+        archive = cls(max_bytes)
+        if not isinstance(obj, Mapping) or obj.get("version") != CYCLE_ARCHIVE_VERSION:
+            return archive
+        strings = obj.get("strings")
+        records = obj.get("records")
+        if not isinstance(strings, list) or not isinstance(records, list):
+            return archive
+        archive._strings = [str(s) for s in strings]
+        archive._string_ids = {s: i for i, s in enumerate(archive._strings)}
+        for text in records:
+            try:
+                blob = base64.b64decode(text, validate=True)
+                archive._decode(blob)
+            except (TypeError, ValueError, IndexError, struct.error):
+                continue
+            archive._push(blob)
+        return archive
+
+    def clear(self) -> None:
+        self._blobs.clear()
+        self._nbytes = 0
+        self._strings.clear()
+        self._string_ids.clear()
+
+
+# ---------------------------------------------------------------------------
+# Cycles rebuilt from recorder history
+# ---------------------------------------------------------------------------
+# Reading kinds fed to CycleReconstructor.feed, with their value types.
+HISTORY_ACTION = "action"  # (hvac_action | None, setpoint °C | None)
+HISTORY_TEMP = "temp"  # room °C | None
+HISTORY_APERTURE = "aperture"  # percent open | None
+HISTORY_DUCT = "duct"  # duct °C | None
+HISTORY_DOOR = "door"  # door open: bool | None
+HISTORY_OUTDOOR = "outdoor"  # outdoor °C | None
+HISTORY_SUN = "sun"  # sun.sun state | None
+_CYCLE_ACTIONS = ("cooling", "heating")
+
+
+class CycleReconstructor:
+    """Rebuild one thermostat's :class:`CycleRecord` objects from recorded readings.
+
+    A cycle runs while the thermostat's ``hvac_action`` is cooling or heating.
+    Like the live coordinator, samples count from ``stable_s`` after the
+    action starts, and only the first ``window_s`` of them are kept (the
+    learners ignore the rest). Every room-temperature or aperture reading adds
+    one sample per vent from the latest temperature, aperture and duct values.
+    A cycle is emitted when the action ends, with the setpoint, door states
+    and regime (``regime_of(t_s, outdoor_c, sun_state)``) current at that time.
+
+    The first action reading only primes the state: a cycle already running
+    when the history starts has no known start, so it is skipped. A cycle
+    still running at the end of the history is never emitted.
+    """
+
+    def __init__(
+        self,
+        rooms: Mapping[str, str],
+        regime_of: Callable[[float, float | None, str | None], int],
+        *,
+        stable_s: float,
+        window_s: float,
+    ) -> None:
+        self._rooms = dict(rooms)
+        self._regime_of = regime_of
+        self.stable_s = stable_s
+        self.window_s = window_s
+        self._primed = False
+        self._action: str | None = None
+        self._setpoint: float | None = None
+        self._started_s: float | None = None
+        self._temp: dict[str, float | None] = {}
+        self._aperture: dict[str, float | None] = {}
+        self._duct: dict[str, float | None] = {}
+        self._door: dict[str, bool | None] = {}
+        self._outdoor: float | None = None
+        self._sun: str | None = None
+        self._vents: dict[str, VentCycleSamples] = {}
+
+    def feed(self, t_s: float, kind: str, vent_id: str | None, value: Any) -> CycleRecord | None:
+        """Apply one reading; returns the cycle it closed, if any."""
+        if kind == HISTORY_ACTION:
+            action, setpoint = value
+            return self._on_action(t_s, action if action in _CYCLE_ACTIONS else None, setpoint)
+        if kind == HISTORY_OUTDOOR:
+            self._outdoor = value
+        elif kind == HISTORY_SUN:
+            self._sun = value
+        elif vent_id is not None and vent_id in self._rooms:
+            if kind == HISTORY_TEMP:
+                self._temp[vent_id] = value
+                self._sample(t_s, vent_id)
+            elif kind == HISTORY_APERTURE:
+                self._aperture[vent_id] = value
+                self._sample(t_s, vent_id)
+            elif kind == HISTORY_DUCT:
+                self._duct[vent_id] = value
+            elif kind == HISTORY_DOOR:
+                self._door[vent_id] = value
+        return None
+
+    def _on_action(self, t_s: float, action: str | None, setpoint: float | None) -> CycleRecord | None:
+        if self._primed and action == self._action:
+            if action is not None and setpoint is not None:
+                self._setpoint = setpoint
+            return None
+        record = self._close(t_s) if self._primed else None
+        if action is not None and setpoint is not None:
+            self._setpoint = setpoint
+        # A cycle already running when the history starts has no known start.
+        self._started_s = t_s + self.stable_s if action is not None and self._primed else None
+        self._primed = True
+        self._action = action
+        self._vents = {}
+        return record
+
+    def _sample(self, t_s: float, vent_id: str) -> None:
+        started = self._started_s
+        if started is None or not started <= t_s <= started + self.window_s:
+            return
+        temp = self._temp.get(vent_id)
+        aperture = self._aperture.get(vent_id)
+        if temp is None or aperture is None:
+            return
+        vent = self._vents.get(vent_id)
+        if vent is None:
+            vent = self._vents[vent_id] = VentCycleSamples(vent_id, self._rooms[vent_id], None)
+        vent.offsets_s.append(t_s - started)
+        vent.temps.append(temp)
+        vent.apertures.append(aperture)
+        vent.ducts.append(self._duct.get(vent_id))
+
+    def _close(self, t_s: float) -> CycleRecord | None:
+        if not self._vents or self._started_s is None:
+            return None
+        for vent in self._vents.values():
+            vent.doors_open = self._door.get(vent.vent_id)
+        return CycleRecord(
+            started_s=self._started_s,
+            action=self._action,
+            setpoint=self._setpoint,
+            regime=self._regime_of(t_s, self._outdoor, self._sun),
+            vents=list(self._vents.values()),
+        )
@@ -9,8 +9,10 @@ from homeassistant.components.sensor import SensorEntity, SensorEntityDescriptio
 from homeassistant.const import (
     PERCENTAGE,
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    EntityCategory,
     UnitOfPressure,
     UnitOfTemperature,
+    UnitOfTime,
 )
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
@@ -162,6 +164,30 @@ HOLDS_24H_DESCRIPTION = SensorEntityDescription(
     state_class=SensorStateClass.MEASUREMENT,
     icon="mdi:counter",
 )
+POLL_TIMING_DESCRIPTION = SensorEntityDescription(
+    key="poll_timing",
+    name="Poll Duration",
+    native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+    state_class=SensorStateClass.MEASUREMENT,
+    icon="mdi:timer-outline",
+    entity_category=EntityCategory.DIAGNOSTIC,
+)
+API_REQUESTS_HOUR_DESCRIPTION = SensorEntityDescription(
+    key="api_requests_hour",
+    name="Flair API Requests (1h)",
+    native_unit_of_measurement="requests",
+    state_class=SensorStateClass.MEASUREMENT,
+    icon="mdi:api",
+    entity_category=EntityCategory.DIAGNOSTIC,
+)
+API_BUDGET_USED_DESCRIPTION = SensorEntityDescription(
+    key="api_budget_used",
+    name="Flair API Budget Used",
+    native_unit_of_measurement=PERCENTAGE,
+    state_class=SensorStateClass.MEASUREMENT,
+    icon="mdi:speedometer",
+    entity_category=EntityCategory.DIAGNOSTIC,
+)
 STRATEGY_METRIC_DESCRIPTIONS: tuple[StrategyMetricSensorDescription, ...] = (
     StrategyMetricSensorDescription(
         key="dab_avg_temp_error",
@@ -399,6 +425,9 @@ async def async_setup_entry(hass, entry, async_add_entities):
     entities.append(DabHoldStatusSensor(coordinator, entry.entry_id, MAX_ACTIVE_ERROR_DESCRIPTION))
     entities.append(DabHoldStatusSensor(coordinator, entry.entry_id, RECALC_24H_DESCRIPTION))
     entities.append(DabHoldStatusSensor(coordinator, entry.entry_id, HOLDS_24H_DESCRIPTION))
+    entities.append(PollTimingSensor(coordinator, entry.entry_id))
+    entities.append(ApiTelemetrySensor(coordinator, entry.entry_id, API_REQUESTS_HOUR_DESCRIPTION))
+    entities.append(ApiTelemetrySensor(coordinator, entry.entry_id, API_BUDGET_USED_DESCRIPTION))
 
     async_add_entities(entities)
 
@@ -454,6 +483,10 @@ class FlairPuckSensor(CoordinatorEntity, SensorEntity):
 
         return value
 
+    @property
+    def extra_state_attributes(self):
+        return self.coordinator.get_stale_attributes() or None
+
 
 class FlairVentSensor(CoordinatorEntity, SensorEntity):
     """Representation of a Flair vent sensor."""
@@ -516,10 +549,11 @@ class FlairVentSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def extra_state_attributes(self):
-        # Per-vent learned leakage diagnostic on the efficiency sensors (R25.11).
+        # Per-vent learned leakage diagnostic on the efficiency sensors (R25.11);
+        # the reading sensors only carry the stale marker.
         mode = self.entity_description.efficiency_mode
         if not mode:
-            return None
+            return self.coordinator.get_stale_attributes() or None
         return {"leak": self.coordinator.get_vent_leak(self._vent_id, mode)}
 
 
@@ -586,6 +620,12 @@ class FlairRoomSensor(CoordinatorEntity, SensorEntity):
         self._room_id = room_id
         self._attr_unique_id = f"{entry_id}_room_{room_id}_{description.key}"
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self.entity_description.room_field == "temperature":
+            # The signed error and airflow flag follow room sensors between polls.
+            self.async_on_remove(self.coordinator.async_add_observability_listener(self.async_write_ha_state))
+
     @property
     def name(self):
         room = self.coordinator.get_room_by_id(self._room_id)
@@ -619,10 +659,12 @@ class FlairRoomSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self):
         # Per-room observability diagnostics (R13.3/R5.4/R25.11). Only attached
-        # to the room temperature sensor; thermostat sensor has none.
+        # to the room temperature sensor; the thermostat sensor only carries the
+        # stale marker.
         if self.entity_description.room_field != "temperature":
-            return None
+            return self.coordinator.get_stale_attributes() or None
         attrs: dict[str, object] = {
+            **self.coordinator.get_stale_attributes(),
             "signed_error_c": self.coordinator.get_room_signed_error(self._room_id),
             "airflow_limited": self.coordinator.is_room_airflow_limited(self._room_id),
             "cooling_efficiency": self.coordinator.get_room_efficiency_percent(self._room_id, "cooling"),
@@ -754,6 +796,12 @@ class DabHoldStatusSensor(_CelsiusDeltaMixin, CoordinatorEntity, SensorEntity):
         self._entry_id = entry_id
         self._attr_unique_id = f"{entry_id}_{description.key}"
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self.entity_description.key in ("dab_active_room_spread", "dab_max_active_error"):
+            # Both follow room sensors between polls.
+            self.async_on_remove(self.coordinator.async_add_observability_listener(self.async_write_ha_state))
+
     @property
     def name(self):
         return self.entity_description.name
@@ -782,6 +830,80 @@ class DabHoldStatusSensor(_CelsiusDeltaMixin, CoordinatorEntity, SensorEntity):
         return None
 
 
+class PollTimingSensor(CoordinatorEntity, SensorEntity):
+    """Last poll duration, with rolling per-phase percentiles as attributes.
+
+    Attributes carry one ``{n, last_ms, mean_ms, p50_ms, p90_ms, p99_ms,
+    max_ms}`` summary per poll phase (plus ``lock_wait``/``lock_hold`` for the
+    DAB lock and ``total``) and the Flair requests issued per endpoint.
+    """
+
+    def __init__(self, coordinator, entry_id: str) -> None:
+        super().__init__(coordinator)
+        self._entry_id = entry_id
+        self.entity_description = POLL_TIMING_DESCRIPTION
+        self._attr_unique_id = f"{entry_id}_{POLL_TIMING_DESCRIPTION.key}"
+
+    @property
+    def name(self):
+        return self.entity_description.name
+
+    @property
+    def native_value(self):
+        return self.coordinator.get_last_poll_ms()
+
+    @property
+    def extra_state_attributes(self):
+        return {
+            "phases": self.coordinator.get_poll_timings(),
+            "requests_by_endpoint": self.coordinator.get_api_request_counts(),
+        }
+
+
+class ApiTelemetrySensor(CoordinatorEntity, SensorEntity):
+    """Rolling Flair request rate vs the hourly budget.
+
+    ``api_requests_hour`` reads the requests issued in the last hour and
+    ``api_budget_used`` the same as a percentage of the budget. Both carry the
+    budget projections for the active/idle poll intervals, error/429/retry
+    totals, the client's circuit-breaker state and the per-endpoint request
+    count and p90 latency.
+    """
+
+    def __init__(self, coordinator, entry_id: str, description: SensorEntityDescription) -> None:
+        super().__init__(coordinator)
+        self._entry_id = entry_id
+        self.entity_description = description
+        self._attr_unique_id = f"{entry_id}_{description.key}"
+
+    @property
+    def name(self):
+        return self.entity_description.name
+
+    @property
+    def native_value(self):
+        budget = self.coordinator.get_api_budget()
+        if not budget:
+            return None
+        if self.entity_description.key == "api_budget_used":
+            return budget["budget_used_pct"]
+        return int(budget["requests_last_hour"])
+
+    @property
+    def extra_state_attributes(self):
+        telemetry = self.coordinator.get_api_telemetry()
+        endpoints = telemetry.get("endpoints", {})
+        return {
+            **self.coordinator.get_api_budget(),
+            **telemetry.get("totals", {}),
+            "circuit": self.coordinator.get_api_circuit().get("state"),
+            "endpoints": {
+                key: {"requests": stats["requests"], "p90_ms": stats["latency_p90_ms"]}
+                for key, stats in endpoints.items()
+            },
+        }
+
+
 class ManualSuggestedApertureSensor(CoordinatorEntity, SensorEntity):
     """Suggested aperture sensor for manual vents."""
 
@@ -19,26 +19,47 @@ from homeassistant.components import persistent_notification
 
 from .const import (
     CONF_ACTIVE,
+    CONF_DAYS,
+    CONF_DECISION_PATH,
+    CONF_DRY_RUN,
     CONF_EFFICIENCY_PATH,
     CONF_EFFICIENCY_PAYLOAD,
     CONF_ENTRY_ID,
     CONF_HOLD_UNTIL,
+    CONF_PROFILE_PATH,
+    CONF_PROFILE_POLLS,
+    CONF_PROFILE_SORT,
+    CONF_PROFILE_TOP,
     CONF_ROOM_ID,
     CONF_SET_POINT_C,
     CONF_STRUCTURE_ID,
     CONF_STRUCTURE_MODE,
     CONF_THERMOSTAT_ENTITY,
+    CONF_TRACE_PATH,
     CONF_VENT_ID,
     DOMAIN,
+    SERVICE_BOOTSTRAP_HISTORY,
+    SERVICE_EXPORT_DECISION_LOG,
     SERVICE_EXPORT_EFFICIENCY,
+    SERVICE_EXPORT_REPLAY_TRACE,
     SERVICE_IMPORT_EFFICIENCY,
+    SERVICE_PROFILE,
+    SERVICE_REFIT_MODELS,
     SERVICE_REFRESH_DEVICES,
     SERVICE_RUN_DAB,
     SERVICE_SET_ROOM_ACTIVE,
     SERVICE_SET_ROOM_SETPOINT,
     SERVICE_SET_STRUCTURE_MODE,
 )
-from .coordinator import FlairCoordinator
+from .coordinator import BOOTSTRAP_DEFAULT_DAYS, BOOTSTRAP_MAX_DAYS, FlairCoordinator
+from .replay import DECISION_LOG_SUFFIX, TRACE_SUFFIX, DecisionLog, Trace
+from .telemetry import (
+    PROFILE_DEFAULT_TOP,
+    PROFILE_MAX_POLLS,
+    PROFILE_SORT_KEYS,
+    ProfileCapture,
+    top_functions,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -97,6 +118,52 @@ EXPORT_EFFICIENCY_SCHEMA = vol.Schema(
     }
 )
 
+EXPORT_REPLAY_TRACE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_ENTRY_ID): str,
+        vol.Optional(CONF_THERMOSTAT_ENTITY): str,
+        vol.Optional(CONF_TRACE_PATH): str,
+    }
+)
+
+EXPORT_DECISION_LOG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_ENTRY_ID): str,
+        vol.Optional(CONF_THERMOSTAT_ENTITY): str,
+        vol.Optional(CONF_DECISION_PATH): str,
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_ENTRY_ID): str,
+        vol.Optional(CONF_PROFILE_POLLS, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=PROFILE_MAX_POLLS)
+        ),
+        vol.Optional(CONF_PROFILE_TOP, default=PROFILE_DEFAULT_TOP): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=200)
+        ),
+        vol.Optional(CONF_PROFILE_SORT, default="cumulative"): vol.In(PROFILE_SORT_KEYS),
+        vol.Optional(CONF_PROFILE_PATH): str,
+    }
+)
+
+REFIT_MODELS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_ENTRY_ID): str,
+        vol.Optional(CONF_DRY_RUN, default=False): bool,
+    }
+)
+
+BOOTSTRAP_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_ENTRY_ID): str,
+        vol.Optional(CONF_DAYS, default=BOOTSTRAP_DEFAULT_DAYS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=BOOTSTRAP_MAX_DAYS)
+        ),
+    }
+)
+
 IMPORT_EFFICIENCY_SCHEMA = vol.Any(
     vol.Schema(
         {
@@ -304,6 +371,141 @@ async def async_register_services(hass: HomeAssistant) -> None:
                 title="HVAC Vent Optimizer error",
             )
 
+    async def handle_export_replay_trace(call: ServiceCall) -> dict[str, Any]:
+        coordinator = _get_coordinator(hass, call.data.get(CONF_ENTRY_ID))
+        if not coordinator:
+            return {"error": "No coordinator found"}
+
+        try:
+            traces = coordinator.get_replay_traces()
+            thermostat = call.data.get(CONF_THERMOSTAT_ENTITY)
+            if thermostat:
+                traces = {k: v for k, v in traces.items() if k == thermostat}
+            if not traces:
+                return {"error": "No replay trace recorded yet"}
+            path_input = call.data.get(CONF_TRACE_PATH)
+            saved: dict[str, str] = {}
+            rows: dict[str, int] = {}
+            for thermostat_entity, trace in traces.items():
+                # One file per thermostat; a user path gets a thermostat suffix
+                # only when several traces would otherwise collide.
+                name = path_input
+                if not name or len(traces) > 1:
+                    stem = (
+                        os.path.splitext(path_input)[0]
+                        if path_input
+                        else f"{DOMAIN}_replay_{coordinator.entry.entry_id}"
+                    )
+                    name = f"{stem}_{thermostat_entity.replace('.', '_')}{TRACE_SUFFIX}"
+                path = _resolve_efficiency_path(hass, name, name)
+                await hass.async_add_executor_job(_dump_replay_trace, path, trace)
+                saved[thermostat_entity] = path
+                rows[thermostat_entity] = trace.rows
+            _LOGGER.info("Exported replay traces to %s", ", ".join(saved.values()))
+            return {"saved_to": saved, "rows": rows}
+        except Exception as err:
+            _LOGGER.exception("Failed to export replay trace: %s", err)
+            persistent_notification.async_create(
+                hass,
+                f"Failed to export replay trace: {err}",
+                title="HVAC Vent Optimizer error",
+            )
+            return {"error": str(err)}
+
+    async def handle_export_decision_log(call: ServiceCall) -> dict[str, Any]:
+        coordinator = _get_coordinator(hass, call.data.get(CONF_ENTRY_ID))
+        if not coordinator:
+            return {"error": "No coordinator found"}
+
+        try:
+            log = coordinator.get_decision_log()
+            if not len(log):
+                return {"error": "No decisions recorded yet"}
+            default_name = f"{DOMAIN}_decisions_{coordinator.entry.entry_id}{DECISION_LOG_SUFFIX}"
+            path = _resolve_efficiency_path(hass, call.data.get(CONF_DECISION_PATH), default_name)
+            records = await hass.async_add_executor_job(
+                _dump_decision_log, path, log, call.data.get(CONF_THERMOSTAT_ENTITY)
+            )
+            _LOGGER.info("Exported %s decision records to %s", records, path)
+            return {"saved_to": path, "records": records}
+        except Exception as err:
+            _LOGGER.exception("Failed to export decision log: %s", err)
+            persistent_notification.async_create(
+                hass,
+                f"Failed to export decision log: {err}",
+                title="HVAC Vent Optimizer error",
+            )
+            return {"error": str(err)}
+
+    async def handle_profile(call: ServiceCall) -> dict[str, Any]:
+        coordinator = _get_coordinator(hass, call.data.get(CONF_ENTRY_ID))
+        if not coordinator:
+            return {"error": "No coordinator found"}
+
+        try:
+            capture = await coordinator.async_capture_profile(call.data.get(CONF_PROFILE_POLLS, 1))
+            default_name = f"{DOMAIN}_profile_{coordinator.entry.entry_id}.prof"
+            path = _resolve_efficiency_path(hass, call.data.get(CONF_PROFILE_PATH), default_name)
+            # Dumping and ranking walk the whole capture: keep them off the loop.
+            top = await hass.async_add_executor_job(
+                _dump_profile,
+                path,
+                capture,
+                call.data.get(CONF_PROFILE_TOP, PROFILE_DEFAULT_TOP),
+                call.data.get(CONF_PROFILE_SORT, "cumulative"),
+            )
+            _LOGGER.info("Wrote profile of %s poll(s) to %s", capture.polls, path)
+            response: dict[str, Any] = {
+                "saved_to": path,
+                "polls": capture.polls,
+                "elapsed_s": round(capture.elapsed_s, 2),
+                "timed_out": capture.timed_out,
+                "top": top,
+            }
+            if capture.error:
+                response["error"] = capture.error
+            return response
+        except Exception as err:
+            _LOGGER.exception("Failed to profile polls: %s", err)
+            persistent_notification.async_create(
+                hass,
+                f"Failed to profile polls: {err}",
+                title="HVAC Vent Optimizer error",
+            )
+            return {"error": str(err)}
+
+    async def handle_refit_models(call: ServiceCall) -> dict[str, Any]:
+        coordinator = _get_coordinator(hass, call.data.get(CONF_ENTRY_ID))
+        if not coordinator:
+            return {"error": "No coordinator found"}
+
+        try:
+            return await coordinator.async_refit_models(call.data.get(CONF_DRY_RUN, False))
+        except Exception as err:
+            _LOGGER.exception("Failed to re-fit learned models: %s", err)
+            persistent_notification.async_create(
+                hass,
+                f"Failed to re-fit learned models: {err}",
+                title="HVAC Vent Optimizer error",
+            )
+            return {"error": str(err)}
+
+    async def handle_bootstrap_history(call: ServiceCall) -> dict[str, Any]:
+        coordinator = _get_coordinator(hass, call.data.get(CONF_ENTRY_ID))
+        if not coordinator:
+            return {"error": "No coordinator found"}
+
+        try:
+            return await coordinator.async_bootstrap_history(call.data.get(CONF_DAYS, BOOTSTRAP_DEFAULT_DAYS))
+        except Exception as err:
+            _LOGGER.exception("Failed to bootstrap learning from history: %s", err)
+            persistent_notification.async_create(
+                hass,
+                f"Failed to bootstrap learning from history: {err}",
+                title="HVAC Vent Optimizer error",
+            )
+            return {"error": str(err)}
+
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_ROOM_ACTIVE,
@@ -337,6 +539,10 @@ async def async_register_services(hass: HomeAssistant) -> None:
     export_kwargs = {}
     if SupportsResponse is not None:
         export_kwargs["supports_response"] = SupportsResponse.ONLY
+    # Re-fit and bootstrap change state, so automations may call them without a response.
+    refit_kwargs = {}
+    if SupportsResponse is not None:
+        refit_kwargs["supports_response"] = SupportsResponse.OPTIONAL
     hass.services.async_register(
         DOMAIN,
         SERVICE_EXPORT_EFFICIENCY,
@@ -350,6 +556,41 @@ async def async_register_services(hass: HomeAssistant) -> None:
         handle_import_efficiency,
         schema=IMPORT_EFFICIENCY_SCHEMA,
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_REPLAY_TRACE,
+        handle_export_replay_trace,
+        schema=EXPORT_REPLAY_TRACE_SCHEMA,
+        **export_kwargs,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_DECISION_LOG,
+        handle_export_decision_log,
+        schema=EXPORT_DECISION_LOG_SCHEMA,
+        **export_kwargs,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        handle_profile,
+        schema=PROFILE_SCHEMA,
+        **export_kwargs,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFIT_MODELS,
+        handle_refit_models,
+        schema=REFIT_MODELS_SCHEMA,
+        **refit_kwargs,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BOOTSTRAP_HISTORY,
+        handle_bootstrap_history,
+        schema=BOOTSTRAP_HISTORY_SCHEMA,
+        **refit_kwargs,
+    )
 
     domain_data["_services_registered"] = True
 
@@ -369,6 +610,11 @@ async def async_unregister_services(hass: HomeAssistant) -> None:
         hass.services.async_remove(DOMAIN, SERVICE_REFRESH_DEVICES)
         hass.services.async_remove(DOMAIN, SERVICE_EXPORT_EFFICIENCY)
         hass.services.async_remove(DOMAIN, SERVICE_IMPORT_EFFICIENCY)
+        hass.services.async_remove(DOMAIN, SERVICE_EXPORT_REPLAY_TRACE)
+        hass.services.async_remove(DOMAIN, SERVICE_EXPORT_DECISION_LOG)
+        hass.services.async_remove(DOMAIN, SERVICE_PROFILE)
+        hass.services.async_remove(DOMAIN, SERVICE_REFIT_MODELS)
+        hass.services.async_remove(DOMAIN, SERVICE_BOOTSTRAP_HISTORY)
 
 
 def _get_coordinator(hass: HomeAssistant, entry_id: str | None) -> FlairCoordinator | None:
@@ -427,3 +673,22 @@ def _load_efficiency_file(path: str) -> Any:
     """
     with open(path, encoding="utf-8") as file:
         return yaml.safe_load(file)
+
+
+def _dump_replay_trace(path: str, trace: Trace) -> None:
+    """Write a replay trace snapshot in the compact columnar format (replay.py)."""
+    trace.save(path)
+
+
+def _dump_decision_log(path: str, log: DecisionLog, thermostat: str | None) -> int:
+    """Write the decision ring as JSON Lines and return the record count."""
+    text = log.to_jsonl(thermostat)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(text)
+    return text.count("\n")
+
+
+def _dump_profile(path: str, capture: ProfileCapture, top: int, sort: str) -> list[dict[str, object]]:
+    """Write the raw cProfile stats (``pstats``/snakeviz) and return the top rows."""
+    capture.profile.dump_stats(path)
+    return top_functions(capture.profile, top, sort)
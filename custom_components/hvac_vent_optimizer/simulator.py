@@ -14,8 +14,12 @@ Each ``dt`` (default 1 min) the simulator:
 1. builds the ambient :class:`~context.Context` for the sim-clock (folding in an
    optional outdoor/weather drift profile, R15.7);
 2. recomputes the **selected production strategy** (``balance`` via
-   :func:`balance.allocate`, or ``dab`` via the ``dab.py`` curve) — the same code
-   the coordinator runs (R15.2);
+   :func:`balance.allocate_exact`, ``mpc`` via :func:`balance.plan_mpc`, or
+   ``dab`` via the ``dab.py`` curve) — the same code the coordinator runs
+   (R15.2). ``balance`` / ``mpc`` plans then pass through
+   :func:`balance.select_fewest_moves` against the vents' tracked positions, as
+   in the coordinator (``move_aware=False`` skips it to benchmark the saving as
+   ``RunResult.moves_per_allocation``);
 3. routes the pre-floor targets through the single
    :func:`balance.apply_safety_floor` choke point, so the airflow-safety floor is
    honored in simulation exactly as in production (R15.2);
@@ -34,6 +38,42 @@ The run **ends when the average of the active-room temperatures reaches the
 shared setpoint** (matching the real runtime governance, R15.1) or when the
 horizon is hit.
 
+Adaptive clock
+--------------
+``run(..., adaptive=True)`` keeps the same ``dt`` grid but only re-runs steps
+2-3 at *events*. Between allocations the apertures and context are constant, so
+every room's temperature is linear in time (``dT_i/dt = r_i``) and the time to
+the next event is solved directly: an active room reaching setpoint or its
+hysteresis edge, the active average reaching setpoint, the next context-hour
+boundary, or ``max_step_min``. The clock jumps to the first ``dt`` boundary at
+or after that event; the per-step metrics in between are reconstructed from the
+linear segment, which is also where a guardrail crossing is detected (the
+segment is cut at the step it happens). Metrics stay step-aligned with the
+fixed-``dt`` mode; only the number of strategy evaluations (``allocations``)
+drops.
+
+Streaming
+---------
+:func:`stream_run` returns a :class:`RunStream` that yields one
+:class:`StepRecord` per ``dt`` and folds the summary metrics online
+(:class:`RunningMetrics`), so long horizons and large batches run in constant
+memory. :func:`run` is the same loop with an optional per-step ``sink`` callback
+and ``history_every`` to keep full (default), down-sampled or no histories.
+
+Trace replay
+------------
+:func:`replay_trace` re-runs a strategy's decisions against a recorded
+:class:`replay.Trace` (the coordinator's per-poll state, stored column-wise)
+instead of a synthetic scenario. Every conditioning poll goes through the same
+pre-floor strategy and :func:`balance.apply_safety_floor` as :func:`run`, with
+the strategy's own previous targets as the movement baseline. Recorded
+temperatures already reflect the *recorded* apertures, so the outcome metric is
+a one-step counterfactual: each room's next observed temperature is corrected
+by ``sign * rate * (flow(a_strategy) - flow(a_recorded)) * dt`` and the spread of
+those predictions is compared with the spread actually observed.
+A decision log exported as JSON Lines (``replay.DecisionLog``) converts to one
+trace per thermostat via :func:`replay.traces_from_decisions`.
+
 Purity / imports
 ----------------
 The pure sibling modules (``balance``/``learning``/``context``/``dab``) are loaded
@@ -56,11 +96,13 @@ from __future__ import annotations
 
 import argparse
 import importlib.util
+import math
 import pathlib
 import random
 import sys
-from collections.abc import Callable, Sequence
-from dataclasses import dataclass, field
+import time
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any
 
 # ---------------------------------------------------------------------------
@@ -97,11 +139,13 @@ if TYPE_CHECKING:
     import context
     import dab
     import learning
+    import replay
 else:
     balance = _load_sibling("balance")
     learning = _load_sibling("learning")
     context = _load_sibling("context")
     dab = _load_sibling("dab")
+    replay = _load_sibling("replay")
 
 
 # ---------------------------------------------------------------------------
@@ -311,6 +355,92 @@ class RunResult:
     spread_history: list[float]
     combined_open_history: list[float]
     min_combined_open_pct: float
+    # Strategy evaluations (allocate + floor) performed; equals ``steps`` for the
+    # fixed clock, usually far fewer with ``adaptive=True``.
+    allocations: int = 0
+
+    @property
+    def moves_per_allocation(self) -> float:
+        """Physical-vent moves per control cycle (the write-traffic benchmark)."""
+        return self.total_moves / self.allocations if self.allocations else 0.0
+
+
+@dataclass(frozen=True)
+class StepRecord:
+    """One simulated ``dt`` step, as streamed by :class:`RunStream`.
+
+    Metrics describe the pre-advance state of the step (the same convention
+    :class:`RunResult` aggregates): ``spread`` / errors over the active rooms at
+    the start of the step and ``combined_open_pct`` of the commanded targets.
+    ``moves`` is the number of physical-vent moves issued at this step (only
+    non-zero when ``allocated``). ``mean_error`` is ``None`` when no room is
+    active. ``temps`` is a snapshot the consumer may keep or drop.
+    """
+
+    step: int
+    minute: float
+    spread: float
+    above_guardrail: bool
+    mean_error: float | None
+    max_error: float
+    combined_open_pct: float
+    moves: int
+    allocated: bool
+    temps: dict[str, float]
+
+
+class RunningMetrics:
+    """Online accumulator for the :class:`RunResult` summary metrics.
+
+    Folds :class:`StepRecord` s one at a time in O(1) memory. Histories are
+    optional: ``history_every=1`` keeps every step (the :func:`run` default and
+    the pre-streaming behavior), ``k > 1`` keeps every k-th step, and ``0``
+    keeps none.
+    """
+
+    def __init__(self, dt_min: float, history_every: int = 1) -> None:
+        self.dt_min = dt_min
+        self.history_every = max(0, int(history_every))
+        self.steps = 0
+        self.max_spread = 0.0
+        self.time_above_guardrail_min = 0.0
+        self.max_active_error = 0.0
+        self.total_moves = 0
+        self.spread_history: list[float] = []
+        self.combined_open_history: list[float] = []
+        self._spread_sum = 0.0
+        self._error_sum = 0.0
+        self._error_steps = 0
+        self._min_combined: float | None = None
+
+    def add(self, record: StepRecord) -> None:
+        self.steps += 1
+        self._spread_sum += record.spread
+        self.max_spread = max(self.max_spread, record.spread)
+        if record.above_guardrail:
+            self.time_above_guardrail_min += self.dt_min
+        if record.mean_error is not None:
+            self._error_sum += record.mean_error
+            self._error_steps += 1
+            self.max_active_error = max(self.max_active_error, record.max_error)
+        if self._min_combined is None or record.combined_open_pct < self._min_combined:
+            self._min_combined = record.combined_open_pct
+        self.total_moves += record.moves
+        if self.history_every and record.step % self.history_every == 0:
+            self.spread_history.append(record.spread)
+            self.combined_open_history.append(record.combined_open_pct)
+
+    @property
+    def avg_spread(self) -> float:
+        return self._spread_sum / self.steps if self.steps else 0.0
+
+    @property
+    def avg_active_error(self) -> float:
+        return self._error_sum / self._error_steps if self._error_steps else 0.0
+
+    @property
+    def min_combined_open_pct(self) -> float:
+        return self._min_combined if self._min_combined is not None else 0.0
 
 
 # ---------------------------------------------------------------------------
@@ -356,11 +486,21 @@ def advance_temp(
     context-adjusted efficiency, and ``flow_i`` is the room's learned saturating
     curve. Pure and deterministic.
     """
+    return temp_c + room_rate(aperture_pct, room, ctx, mode) * dt_min
+
+
+def room_rate(aperture_pct: float, room: RoomScenario, ctx: context.Context, mode: str) -> float:
+    """Constant temperature slope ``dT/dt`` (°C/min) at a fixed aperture + context.
+
+    The closed-loop law is linear in time while the aperture and context hold,
+    so ``advance_temp(T, a, ..., dt) == T + room_rate(a, ...) * dt``; the
+    adaptive clock uses this to jump between events.
+    """
     assert room.curve is not None  # set in __post_init__
     flow = flow_from_curve(room.curve, aperture_pct)
-    eff = context.apply_context_multipliers(room.efficiency, ctx, mode)
+    eff: float = context.apply_context_multipliers(room.efficiency, ctx, mode)
     sign = -1.0 if mode == balance.MODE_COOLING else 1.0
-    return temp_c + sign * eff * flow * dt_min - room.idle_drift * dt_min
+    return sign * eff * flow - room.idle_drift
 
 
 # ---------------------------------------------------------------------------
@@ -371,6 +511,7 @@ def _build_alloc_inputs(
     temps: dict[str, float],
     observed: dict[str, float],
     ctx: context.Context,
+    positions: dict[str, float] | None = None,
 ) -> list[balance.RoomAllocInput]:
     """Build the per-room :class:`balance.RoomAllocInput` list for this step.
 
@@ -378,8 +519,10 @@ def _build_alloc_inputs(
     both strategies and the floor see the same physics the stepper applies. The
     ``observed`` temperature (physics + optional measurement noise) is what the
     strategy reasons about; ``signed_error_c`` is derived from it so the floor's
-    bias-to-need set is consistent with the strategy's view.
+    bias-to-need set is consistent with the strategy's view. ``positions`` are
+    the rooms' current apertures (the scenario's ``current_open`` when absent).
     """
+    positions = positions or {}
     inputs: list[balance.RoomAllocInput] = []
     for room in scenario.rooms:
         eff = context.apply_context_multipliers(room.efficiency, ctx, scenario.mode)
@@ -392,7 +535,7 @@ def _build_alloc_inputs(
                 active=room.active,
                 efficiency=eff,
                 leak=room.leak,
-                current_open=room.current_open,
+                current_open=positions.get(room.room_id, room.current_open),
                 vent_ids=room.vent_ids,
                 signed_error_c=signed,
             )
@@ -401,17 +544,36 @@ def _build_alloc_inputs(
 
 
 def _pre_floor_balance(
-    scenario: Scenario,
     inputs: list[balance.RoomAllocInput],
+    setpoint_c: float,
+    mode: str,
+    settings: balance.AllocSettings,
+) -> dict[str, float]:
+    """``balance`` targets via :func:`balance.allocate_exact`, as the coordinator plans.
+
+    The lattice plan already meets the floor when it can, so the floor step
+    after it is the same re-check the coordinator runs.
+    """
+    result = balance.allocate_exact(inputs, setpoint_c, mode, settings)
+    return dict(result.targets)
+
+
+def _pre_floor_mpc(
+    inputs: list[balance.RoomAllocInput],
+    setpoint_c: float,
+    mode: str,
+    settings: balance.AllocSettings,
 ) -> dict[str, float]:
-    """``balance`` pre-floor targets via :func:`balance.allocate`."""
-    result = balance.allocate(inputs, scenario.setpoint_c, scenario.mode, scenario.settings)
+    """``mpc`` pre-floor targets via :func:`balance.plan_mpc`."""
+    result = balance.plan_mpc(inputs, setpoint_c, mode, settings)
     return dict(result.targets)
 
 
 def _pre_floor_dab(
-    scenario: Scenario,
     inputs: list[balance.RoomAllocInput],
+    setpoint_c: float,
+    mode: str,
+    settings: balance.AllocSettings,
 ) -> dict[str, float]:
     """``dab`` pre-floor targets via the legacy ``dab.py`` curve.
 
@@ -431,21 +593,29 @@ def _pre_floor_dab(
             "active": inp.active,
         }
     longest = dab.calculate_longest_minutes_to_target(
-        rate_and_temp, scenario.mode, scenario.setpoint_c, dab.DEFAULT_SETTINGS.max_minutes_to_setpoint
+        rate_and_temp, mode, setpoint_c, dab.DEFAULT_SETTINGS.max_minutes_to_setpoint
     )
     pre = dab.calculate_open_percentage_for_all_vents(
-        rate_and_temp, scenario.mode, scenario.setpoint_c, longest, close_inactive=True
+        rate_and_temp, mode, setpoint_c, longest, close_inactive=True
     )
     # Keep only active rooms pre-floor (inactive held closed); the floor adds
     # inactive last-resort capacity itself when truly needed.
     return {rid: pct for rid, pct in pre.items() if rate_and_temp[rid]["active"]}
 
 
-_STRATEGIES: dict[str, Callable[[Scenario, list[balance.RoomAllocInput]], dict[str, float]]] = {
+# Pre-floor strategy: (inputs, setpoint_c, mode, settings) -> room targets. The
+# scenario-free signature lets trace replay drive the same functions per poll.
+_PreFloor = Callable[[list[balance.RoomAllocInput], float, str, balance.AllocSettings], dict[str, float]]
+
+_STRATEGIES: dict[str, _PreFloor] = {
     "balance": _pre_floor_balance,
     "dab": _pre_floor_dab,
+    "mpc": _pre_floor_mpc,
 }
 
+# Strategies whose plan goes through :func:`balance.select_fewest_moves`.
+_MOVE_AWARE_STRATEGIES = frozenset({"balance", "mpc"})
+
 
 # ---------------------------------------------------------------------------
 # Combined open % over physical vents (for the in-sim floor check / metric).
@@ -495,128 +665,326 @@ def _active_errors(scenario: Scenario, temps: dict[str, float]) -> list[float]:
 
 
 # ---------------------------------------------------------------------------
-# The run loop
+# Adaptive clock: time to the next event under constant apertures
 # ---------------------------------------------------------------------------
-def run(scenario: Scenario, strategy: str = "balance") -> RunResult:
-    """Run the closed-loop simulation for ``strategy`` and return its metrics.
+# Default cap on one adaptive segment (minutes). Even with no threshold ahead the
+# allocation is refreshed at least this often, since ``balance`` targets drift
+# continuously with the room errors.
+DEFAULT_MAX_STEP_MIN = 15.0
 
-    Steps the model forward in ``scenario.dt_min`` increments until the average
-    of the active-room temperatures reaches the setpoint (R15.1) or the horizon
-    is hit. Each step recomputes the production strategy, routes through
-    :func:`balance.apply_safety_floor`, advances the physics, and records the
-    spread / error / combined-open / movement metrics. Deterministic for a fixed
-    ``scenario.seed`` (R15.5).
-    """
-    if strategy not in _STRATEGIES:
-        raise ValueError(f"unknown strategy {strategy!r}; expected one of {sorted(_STRATEGIES)}")
-    pre_floor = _STRATEGIES[strategy]
+# Slack when snapping an event time onto the ``dt`` grid, so an event landing on
+# a grid point (up to float noise) is not pushed one step later.
+_GRID_EPS = 1e-9
 
-    rng = random.Random(scenario.seed)
-    temps: dict[str, float] = {r.room_id: float(r.temp_c) for r in scenario.rooms}
-    guardrail = scenario.settings.spread_guardrail_c
 
-    # Movement baseline: each physical vent starts at its room's current_open.
-    prev_vents: dict[str, float] = {}
-    for room in scenario.rooms:
-        for i in range(len(room.vent_ids)):
-            prev_vents[f"{room.room_id}\x00{i}"] = float(room.current_open)
-    moves_per_room: dict[str, int] = {r.room_id: 0 for r in scenario.rooms if r.active}
-
-    spread_history: list[float] = []
-    combined_history: list[float] = []
-    error_means: list[float] = []
-    max_spread = 0.0
-    max_error = 0.0
-    time_above_guardrail = 0.0
-
-    steps = 0
-    minutes = 0.0
-    ended_reason = "horizon"
-
-    max_steps = round(scenario.horizon_min / scenario.dt_min) if scenario.dt_min > 0 else 0
-    while steps < max_steps:
-        # End BEFORE stepping if the active average has already converged.
-        if _active_average_reached(scenario, temps):
-            ended_reason = "setpoint"
-            break
+def _time_to_boundary(value: float, slope: float, boundary: float) -> float | None:
+    """Minutes until ``value + slope * t`` reaches ``boundary`` (None if never)."""
+    gap = boundary - value
+    if gap == 0.0 or slope == 0.0 or (gap > 0.0) != (slope > 0.0):
+        return None
+    return gap / slope
 
-        ctx = context_at(scenario, minutes)
 
-        # Strategy observes (optionally noisy) temperatures; physics uses true.
-        if scenario.sensor_noise_c > 0.0:
-            observed = {rid: t + rng.gauss(0.0, scenario.sensor_noise_c) for rid, t in temps.items()}
-        else:
-            observed = dict(temps)
+def _minutes_to_next_event(
+    scenario: Scenario,
+    temps: dict[str, float],
+    rates: dict[str, float],
+    minute: float,
+    max_step_min: float,
+) -> float:
+    """Minutes until the next event that needs a fresh allocation.
 
-        inputs = _build_alloc_inputs(scenario, temps, observed, ctx)
-        targets = pre_floor(scenario, inputs)
-        floored, _binding = balance.apply_safety_floor(targets, inputs, scenario.settings)
+    Events (all under the current, constant per-room ``rates``):
 
-        # --- Metrics for this step (pre-advance state + commanded targets).
-        spread = _active_spread(scenario, temps)
-        spread_history.append(spread)
-        max_spread = max(max_spread, spread)
-        if spread > guardrail:
-            time_above_guardrail += scenario.dt_min
+    * an active room's signed error reaching ``0`` (setpoint) or
+      ``-hysteresis_c`` (the ``classify`` satisfied edge);
+    * the active-average signed error reaching ``0`` (run termination);
+    * the next context-hour boundary (``context_at`` buckets by whole hours);
+    * ``max_step_min`` — always, and the only bound on how often an
+      ``outdoor_profile`` is re-sampled.
+    """
+    sign = 1.0 if scenario.mode == balance.MODE_COOLING else -1.0
+    hysteresis = scenario.settings.hysteresis_c
+    next_event = max_step_min
+    next_hour = (minute // 60.0 + 1.0) * 60.0 - minute
+    next_event = min(next_event, next_hour)
+
+    active = [r.room_id for r in scenario.rooms if r.active]
+    for rid in active:
+        error = sign * (temps[rid] - scenario.setpoint_c)
+        slope = sign * rates[rid]
+        for boundary in (0.0, -hysteresis):
+            t = _time_to_boundary(error, slope, boundary)
+            if t is not None:
+                next_event = min(next_event, t)
+    if active:
+        mean_error = sum(sign * (temps[rid] - scenario.setpoint_c) for rid in active) / len(active)
+        mean_slope = sum(sign * rates[rid] for rid in active) / len(active)
+        t = _time_to_boundary(mean_error, mean_slope, 0.0)
+        if t is not None:
+            next_event = min(next_event, t)
+    return next_event
 
-        errs = _active_errors(scenario, temps)
-        if errs:
-            error_means.append(sum(errs) / len(errs))
-            max_error = max(max_error, max(errs))
 
-        combined = _combined_open_pct(floored, scenario)
-        combined_history.append(combined)
+# ---------------------------------------------------------------------------
+# The run loop
+# ---------------------------------------------------------------------------
+class RunStream:
+    """Iterable closed-loop run that streams one :class:`StepRecord` per step.
+
+    Iterating drives the simulation (see :func:`run` for the loop semantics);
+    summary metrics are folded online into :attr:`metrics`, so a consumer that
+    drops the records runs in constant memory regardless of horizon.
+    :attr:`result` is available once the stream is exhausted. A stream can be
+    iterated once.
+    """
 
-        # --- Movement accounting (per physical vent, R23).
-        new_vents = _expand_to_vents(floored, scenario)
+    def __init__(
+        self,
+        scenario: Scenario,
+        strategy: str = "balance",
+        *,
+        adaptive: bool = False,
+        max_step_min: float = DEFAULT_MAX_STEP_MIN,
+        history_every: int = 1,
+        move_aware: bool = True,
+    ) -> None:
+        if strategy not in _STRATEGIES:
+            raise ValueError(f"unknown strategy {strategy!r}; expected one of {sorted(_STRATEGIES)}")
+        self.scenario = scenario
+        self.strategy = strategy
+        self.adaptive = adaptive
+        self.max_step_min = max_step_min
+        self.move_aware = move_aware and strategy in _MOVE_AWARE_STRATEGIES
+        self.metrics = RunningMetrics(scenario.dt_min, history_every)
+        self._result: RunResult | None = None
+        self._started = False
+
+    @property
+    def result(self) -> RunResult:
+        if self._result is None:
+            raise RuntimeError("RunStream.result is only available once the stream is exhausted")
+        return self._result
+
+    def __iter__(self) -> Iterator[StepRecord]:
+        if self._started:
+            raise RuntimeError("a RunStream can only be iterated once")
+        self._started = True
+        return self._steps()
+
+    def _steps(self) -> Iterator[StepRecord]:
+        scenario = self.scenario
+        pre_floor = _STRATEGIES[self.strategy]
+        adaptive = self.adaptive
+        metrics = self.metrics
+        dt = scenario.dt_min
+
+        rng = random.Random(scenario.seed)
+        temps: dict[str, float] = {r.room_id: float(r.temp_c) for r in scenario.rooms}
+        guardrail = scenario.settings.spread_guardrail_c
         by_room = {r.room_id: r for r in scenario.rooms}
-        for vent_key, pct in new_vents.items():
-            rid = vent_key.split("\x00", 1)[0]
-            mv_room = by_room.get(rid)
-            if abs(pct - prev_vents.get(vent_key, 0.0)) > 1e-9 and mv_room is not None and mv_room.active:
-                moves_per_room[rid] = moves_per_room.get(rid, 0) + 1
-            prev_vents[vent_key] = pct
-
-        # --- Advance the physics.
+
+        # Movement baseline: each physical vent starts at its room's current_open.
+        prev_vents: dict[str, float] = {}
         for room in scenario.rooms:
-            a_pct = floored.get(room.room_id, 0.0)
-            temps[room.room_id] = advance_temp(
-                temps[room.room_id], a_pct, room, ctx, scenario.mode, scenario.dt_min
-            )
+            for i in range(len(room.vent_ids)):
+                prev_vents[f"{room.room_id}\x00{i}"] = float(room.current_open)
+        moves_per_room: dict[str, int] = {r.room_id: 0 for r in scenario.rooms if r.active}
+        positions: dict[str, float] = {r.room_id: float(r.current_open) for r in scenario.rooms}
+
+        steps = 0
+        minutes = 0.0
+        allocations = 0
+        ended_reason = "horizon"
 
-        steps += 1
-        minutes += scenario.dt_min
+        max_steps = round(scenario.horizon_min / dt) if dt > 0 else 0
+        while steps < max_steps:
+            # End BEFORE stepping if the active average has already converged.
+            if _active_average_reached(scenario, temps):
+                ended_reason = "setpoint"
+                break
+
+            ctx = context_at(scenario, minutes)
+
+            # Strategy observes (optionally noisy) temperatures; physics uses true.
+            if scenario.sensor_noise_c > 0.0:
+                observed = {rid: t + rng.gauss(0.0, scenario.sensor_noise_c) for rid, t in temps.items()}
+            else:
+                observed = dict(temps)
+
+            inputs = _build_alloc_inputs(scenario, temps, observed, ctx, positions)
+            targets = pre_floor(inputs, scenario.setpoint_c, scenario.mode, scenario.settings)
+            if self.move_aware:
+                targets, _held = balance.select_fewest_moves(
+                    targets, inputs, scenario.mode, scenario.setpoint_c, scenario.settings
+                )
+            floored, _binding = balance.apply_safety_floor(targets, inputs, scenario.settings)
+            allocations += 1
+            combined = _combined_open_pct(floored, scenario)
+            positions.update(floored)
+
+            # --- Movement accounting (per physical vent, R23). Targets are held
+            # for the whole segment, so moves can only happen at an allocation.
+            step_moves = 0
+            new_vents = _expand_to_vents(floored, scenario)
+            for vent_key, pct in new_vents.items():
+                rid = vent_key.split("\x00", 1)[0]
+                mv_room = by_room.get(rid)
+                if abs(pct - prev_vents.get(vent_key, 0.0)) > 1e-9 and mv_room is not None and mv_room.active:
+                    moves_per_room[rid] = moves_per_room.get(rid, 0) + 1
+                    step_moves += 1
+                prev_vents[vent_key] = pct
+
+            # --- Segment length: one step, or up to the next event.
+            rates: dict[str, float] = {}
+            segment = 1
+            if adaptive:
+                rates = {
+                    room.room_id: room_rate(floored.get(room.room_id, 0.0), room, ctx, scenario.mode)
+                    for room in scenario.rooms
+                }
+                horizon_left = max_steps - steps
+                until = _minutes_to_next_event(scenario, temps, rates, minutes, max(dt, self.max_step_min))
+                segment = max(1, min(horizon_left, math.ceil(until / dt - _GRID_EPS)))
+
+            spread_above_at_alloc = _active_spread(scenario, temps) > guardrail
+            for j in range(segment):
+                spread = _active_spread(scenario, temps)
+                above = spread > guardrail
+                if j > 0 and (_active_average_reached(scenario, temps) or above != spread_above_at_alloc):
+                    # Termination or a guardrail crossing inside the segment:
+                    # stop here and let the outer loop re-decide at this step.
+                    break
+
+                # --- Metrics for this step (pre-advance state + commanded targets).
+                errs = _active_errors(scenario, temps)
+                record = StepRecord(
+                    step=steps,
+                    minute=minutes,
+                    spread=spread,
+                    above_guardrail=above,
+                    mean_error=sum(errs) / len(errs) if errs else None,
+                    max_error=max(errs) if errs else 0.0,
+                    combined_open_pct=combined,
+                    moves=step_moves if j == 0 else 0,
+                    allocated=j == 0,
+                    temps=dict(temps),
+                )
+                metrics.add(record)
+                yield record
+
+                # --- Advance the physics.
+                if adaptive:
+                    for rid, rate in rates.items():
+                        temps[rid] += rate * dt
+                else:
+                    for room in scenario.rooms:
+                        a_pct = floored.get(room.room_id, 0.0)
+                        temps[room.room_id] = advance_temp(
+                            temps[room.room_id], a_pct, room, ctx, scenario.mode, dt
+                        )
+
+                steps += 1
+                minutes += dt
 
-    else:
-        # Loop exhausted the horizon without converging.
-        ended_reason = "horizon"
+        else:
+            # Loop exhausted the horizon without converging.
+            ended_reason = "horizon"
 
-    # Final convergence check (covers the dt that just completed the loop).
-    if ended_reason != "setpoint" and _active_average_reached(scenario, temps):
-        ended_reason = "setpoint"
+        # Final convergence check (covers the dt that just completed the loop).
+        if ended_reason != "setpoint" and _active_average_reached(scenario, temps):
+            ended_reason = "setpoint"
 
-    avg_spread = sum(spread_history) / len(spread_history) if spread_history else 0.0
-    avg_error = sum(error_means) / len(error_means) if error_means else 0.0
-    total_moves = sum(moves_per_room.values())
-    min_combined = min(combined_history) if combined_history else 0.0
+        self._result = RunResult(
+            strategy=self.strategy,
+            ended_reason=ended_reason,
+            steps=steps,
+            minutes=minutes,
+            avg_spread=metrics.avg_spread,
+            max_spread=metrics.max_spread,
+            time_above_guardrail_min=metrics.time_above_guardrail_min,
+            total_moves=sum(moves_per_room.values()),
+            moves_per_room=moves_per_room,
+            avg_active_error=metrics.avg_active_error,
+            max_active_error=metrics.max_active_error,
+            final_temps=dict(temps),
+            spread_history=metrics.spread_history,
+            combined_open_history=metrics.combined_open_history,
+            min_combined_open_pct=metrics.min_combined_open_pct,
+            allocations=allocations,
+        )
 
-    return RunResult(
-        strategy=strategy,
-        ended_reason=ended_reason,
-        steps=steps,
-        minutes=minutes,
-        avg_spread=avg_spread,
-        max_spread=max_spread,
-        time_above_guardrail_min=time_above_guardrail,
-        total_moves=total_moves,
-        moves_per_room=moves_per_room,
-        avg_active_error=avg_error,
-        max_active_error=max_error,
-        final_temps=dict(temps),
-        spread_history=spread_history,
-        combined_open_history=combined_history,
-        min_combined_open_pct=min_combined,
+
+def stream_run(
+    scenario: Scenario,
+    strategy: str = "balance",
+    *,
+    adaptive: bool = False,
+    max_step_min: float = DEFAULT_MAX_STEP_MIN,
+    history_every: int = 0,
+    move_aware: bool = True,
+) -> RunStream:
+    """Return a :class:`RunStream` for ``scenario``; histories are off by default.
+
+    Use it as a generator of per-step records (``for rec in stream: ...``) and
+    read ``stream.result`` afterwards. Memory stays constant in the horizon
+    unless ``history_every`` asks for (down-sampled) histories.
+    """
+    return RunStream(
+        scenario,
+        strategy,
+        adaptive=adaptive,
+        max_step_min=max_step_min,
+        history_every=history_every,
+        move_aware=move_aware,
+    )
+
+
+def run(
+    scenario: Scenario,
+    strategy: str = "balance",
+    *,
+    adaptive: bool = False,
+    max_step_min: float = DEFAULT_MAX_STEP_MIN,
+    sink: Callable[[StepRecord], None] | None = None,
+    history_every: int = 1,
+    move_aware: bool = True,
+) -> RunResult:
+    """Run the closed-loop simulation for ``strategy`` and return its metrics.
+
+    Steps the model forward in ``scenario.dt_min`` increments until the average
+    of the active-room temperatures reaches the setpoint (R15.1) or the horizon
+    is hit. Each step recomputes the production strategy, routes through
+    :func:`balance.apply_safety_floor`, advances the physics, and records the
+    spread / error / combined-open / movement metrics. Deterministic for a fixed
+    ``scenario.seed`` (R15.5).
+
+    With ``adaptive=True`` the strategy is only recomputed at events (see the
+    module docs, "Adaptive clock"): the apertures are held over a segment of
+    whole steps whose per-step metrics are reconstructed from the linear
+    temperature trajectory. Segments never exceed ``max_step_min``. Sensor
+    noise, when configured, is drawn once per allocation, so noisy adaptive runs
+    are deterministic per seed but not draw-for-draw identical to fixed runs.
+
+    Summary metrics are accumulated online (:class:`RunningMetrics`). ``sink``
+    receives every :class:`StepRecord` as it is produced; ``history_every``
+    down-samples (``k``) or drops (``0``) the stored spread / combined-open
+    histories — the default keeps every step. ``move_aware=False`` skips the
+    :func:`balance.select_fewest_moves` stage for ``balance`` / ``mpc``, to
+    measure what it saves.
+    """
+    stream = RunStream(
+        scenario,
+        strategy,
+        adaptive=adaptive,
+        max_step_min=max_step_min,
+        history_every=history_every,
+        move_aware=move_aware,
     )
+    for record in stream:
+        if sink is not None:
+            sink(record)
+    return stream.result
 
 
 # ---------------------------------------------------------------------------
@@ -706,6 +1074,7 @@ def render_comparison_table(results: dict[str, RunResult], strategies: Sequence[
             [_fmt(results[s].time_above_guardrail_min, 0) for s in strat_list],
         ),
         ("total_moves", [str(results[s].total_moves) for s in strat_list]),
+        ("moves_per_allocation", [_fmt(results[s].moves_per_allocation, 2) for s in strat_list]),
         ("avg_active_error", [_fmt(results[s].avg_active_error) for s in strat_list]),
         ("max_active_error", [_fmt(results[s].max_active_error) for s in strat_list]),
     ]
@@ -742,6 +1111,9 @@ def compare(
     strategies: Sequence[str],
     *,
     to_stdout: bool = True,
+    adaptive: bool = False,
+    history_every: int = 1,
+    move_aware: bool = True,
 ) -> CompareResult:
     """Run each strategy against the same scenario and tabulate the metrics (R15.3).
 
@@ -751,6 +1123,10 @@ def compare(
     moves/room, avg/max active error). Prints the table to stdout when
     ``to_stdout`` is set (the default, used by the CLI) and always returns a
     :class:`CompareResult` for programmatic use (e.g. the R15.6 evidence gate).
+    ``adaptive`` selects the event-driven clock for every run and
+    ``history_every`` down-samples (or, at ``0``, drops) the per-step histories
+    each retained :class:`RunResult` carries (see :func:`run`), and
+    ``move_aware`` is passed through to every run.
 
     Raises:
         ValueError: if ``strategies`` is empty, or names an unknown strategy
@@ -760,7 +1136,12 @@ def compare(
     if not strat_list:
         raise ValueError("compare() requires at least one strategy")
 
-    results = {strat: run(scenario, strategy=strat) for strat in strat_list}
+    results = {
+        strat: run(
+            scenario, strategy=strat, adaptive=adaptive, history_every=history_every, move_aware=move_aware
+        )
+        for strat in strat_list
+    }
     table = render_comparison_table(results, strat_list)
     if to_stdout:
         print(table)
@@ -796,6 +1177,409 @@ def default_scenario() -> Scenario:
     return Scenario(rooms=rooms, setpoint_c=26.1, mode="cooling", horizon_min=600.0, seed=1)
 
 
+# ---------------------------------------------------------------------------
+# Procedural large-house scenarios (stress)
+# ---------------------------------------------------------------------------
+@dataclass(frozen=True)
+class ScenarioSpec:
+    """Distributions for :func:`generate_scenario` (all draws from ``seed``).
+
+    Ranges are inclusive ``(lo, hi)`` uniform draws unless noted:
+
+    * ``efficiency_range`` is drawn **log-uniformly** (°C/min at full flow) —
+      real houses span more than an order of magnitude between the slowest
+      bedroom and a small bathroom;
+    * ``saturation_range`` blends each vent curve between the near-linear seed
+      (``0``) and :func:`representative_saturating_curve` (``1``), moving the
+      knee;
+    * ``vents_per_room`` is a ``{count: weight}`` mapping;
+    * ``inactive_fraction`` / ``overcooled_fraction`` are per-room
+      probabilities (an overcooled room starts already past setpoint);
+    * ``drift_range`` is the "drift away from setpoint" magnitude
+      (see :func:`drift_away_from_setpoint`);
+    * ``door_fraction`` of rooms get an injected ``door_open_factor`` from
+      ``door_factor_range`` with ``door_samples`` observations.
+    """
+
+    rooms: int
+    seed: int = 0
+    mode: str = balance.MODE_COOLING
+    setpoint_c: float = 24.0
+    temp_offset_range: tuple[float, float] = (0.2, 2.5)
+    efficiency_range: tuple[float, float] = (0.012, 0.3)
+    leak_range: tuple[float, float] = (0.03, 0.2)
+    saturation_range: tuple[float, float] = (0.3, 1.0)
+    vents_per_room: tuple[tuple[int, float], ...] = ((1, 0.7), (2, 0.25), (3, 0.05))
+    inactive_fraction: float = 0.1
+    overcooled_fraction: float = 0.05
+    drift_range: tuple[float, float] = (0.0, 0.006)
+    door_fraction: float = 0.3
+    door_factor_range: tuple[float, float] = (0.5, 1.0)
+    door_samples: int = 10
+    conventional_vents: int = 0
+    safety_floor_pct: float = 40.0
+    horizon_min: float = 600.0
+
+
+def blended_curve(leak: float, saturation: float) -> dict[str, list[float]]:
+    """Vent curve between the linear seed (``0``) and the saturating shape (``1``).
+
+    Both endpoints are monotonic with ``flow(0)=leak`` and ``flow(100%)=1``, so
+    any convex blend is too; ``saturation`` moves the knee from 100 % down to
+    the representative ~50 %.
+    """
+    lam = max(0.0, min(1.0, saturation))
+    linear = learning.seed_linear_curve(leak)
+    saturating = representative_saturating_curve(leak)
+    flows = [
+        round((1.0 - lam) * float(lin) + lam * float(sat), 6)
+        for lin, sat in zip(linear["flow"], saturating["flow"], strict=True)
+    ]
+    flows[-1] = 1.0
+    return {
+        "breakpoints": list(saturating["breakpoints"]),
+        "flow": flows,
+        "counts": list(saturating["counts"]),
+    }
+
+
+def generate_scenario(spec: ScenarioSpec) -> Scenario:
+    """Build a deterministic procedural scenario from ``spec``.
+
+    The same ``spec`` always yields the same rooms (one ``random.Random`` seeded
+    from ``spec.seed``). At least one room is kept active so the run has a
+    termination condition.
+    """
+    rng = random.Random(spec.seed)
+    counts = [count for count, _ in spec.vents_per_room]
+    weights = [weight for _, weight in spec.vents_per_room]
+    sign = 1.0 if spec.mode == balance.MODE_COOLING else -1.0
+    log_lo, log_hi = math.log(spec.efficiency_range[0]), math.log(spec.efficiency_range[1])
+
+    rooms: list[RoomScenario] = []
+    for idx in range(spec.rooms):
+        room_id = f"room_{idx:03d}"
+        offset = rng.uniform(*spec.temp_offset_range)
+        if rng.random() < spec.overcooled_fraction:
+            offset = -rng.uniform(0.2, 0.8)
+        leak = rng.uniform(*spec.leak_range)
+        n_vents = rng.choices(counts, weights)[0]
+        door_factor = rng.uniform(*spec.door_factor_range) if rng.random() < spec.door_fraction else None
+        rooms.append(
+            RoomScenario(
+                room_id=room_id,
+                temp_c=round(spec.setpoint_c + sign * offset, 3),
+                efficiency=math.exp(rng.uniform(log_lo, log_hi)),
+                leak=leak,
+                idle_drift=drift_away_from_setpoint(rng.uniform(*spec.drift_range), spec.mode),
+                active=rng.random() >= spec.inactive_fraction,
+                vent_ids=tuple(f"{room_id}_v{v}" for v in range(n_vents)),
+                curve=blended_curve(leak, rng.uniform(*spec.saturation_range)),
+                door_open_factor=door_factor,
+                door_open_samples=spec.door_samples if door_factor is not None else 0,
+            )
+        )
+    if rooms and not any(room.active for room in rooms):
+        rooms[0].active = True
+
+    # Inactive vents are held closed but counted, as the coordinator does, so the
+    # floor's last-resort reopen (R3.9) is reachable in large houses.
+    settings = balance.AllocSettings(
+        safety_floor_pct=spec.safety_floor_pct,
+        conventional_vents=spec.conventional_vents,
+        inactive_count=sum(len(room.vent_ids) for room in rooms if not room.active),
+    )
+    return Scenario(
+        rooms=rooms,
+        setpoint_c=spec.setpoint_c,
+        mode=spec.mode,
+        settings=settings,
+        horizon_min=spec.horizon_min,
+        seed=spec.seed,
+    )
+
+
+# Stock stress scenarios shared by the evidence gate and the benchmark suite.
+# Sizes bracket a large house (40 rooms) up to a small commercial floor (200).
+# Each carries conventional capacity: satisfied rooms are never reopened (R3.4),
+# so without it the floor is unreachable in the last minutes of a cycle once
+# most rooms have satisfied (house_40 bottoms out near 38 % with none).
+STRESS_SCENARIOS: dict[str, ScenarioSpec] = {
+    "house_40": ScenarioSpec(rooms=40, seed=40, conventional_vents=8),
+    "house_80_multivent": ScenarioSpec(
+        rooms=80, seed=80, vents_per_room=((1, 0.4), (2, 0.4), (3, 0.2)), conventional_vents=6
+    ),
+    "house_120_inactive": ScenarioSpec(rooms=120, seed=120, inactive_fraction=0.35, overcooled_fraction=0.1),
+    "floor_200": ScenarioSpec(rooms=200, seed=200, drift_range=(0.0, 0.01), conventional_vents=10),
+}
+
+
+def stress_scenario(name: str) -> Scenario:
+    """Build the stock stress scenario ``name`` (see :data:`STRESS_SCENARIOS`)."""
+    spec = STRESS_SCENARIOS.get(name)
+    if spec is None:
+        raise ValueError(f"unknown stress scenario {name!r}; expected one of {sorted(STRESS_SCENARIOS)}")
+    return generate_scenario(spec)
+
+
+@dataclass(frozen=True)
+class RunTiming:
+    """Wall-clock cost of one :func:`run` (see :func:`time_run`)."""
+
+    result: RunResult
+    rooms: int
+    vents: int
+    elapsed_s: float
+
+    @property
+    def ms_per_allocation(self) -> float:
+        return self.elapsed_s * 1000.0 / self.result.allocations if self.result.allocations else 0.0
+
+    @property
+    def ms_per_sim_hour(self) -> float:
+        hours = self.result.minutes / 60.0
+        return self.elapsed_s * 1000.0 / hours if hours > 0 else 0.0
+
+
+def time_run(
+    scenario: Scenario,
+    strategy: str = "balance",
+    *,
+    adaptive: bool = False,
+    move_aware: bool = True,
+) -> RunTiming:
+    """Run ``scenario`` once, histories off, and report time per allocation / sim hour."""
+    started = time.perf_counter()
+    result = run(scenario, strategy=strategy, adaptive=adaptive, history_every=0, move_aware=move_aware)
+    elapsed = time.perf_counter() - started
+    return RunTiming(
+        result=result,
+        rooms=len(scenario.rooms),
+        vents=sum(len(room.vent_ids) for room in scenario.rooms),
+        elapsed_s=elapsed,
+    )
+
+
+def render_timing_table(timings: dict[str, RunTiming]) -> str:
+    """Fixed-width table of :class:`RunTiming` rows keyed by a label."""
+    header = (
+        f"{'scenario':<28}{'rooms':>6}{'vents':>6}{'ended':>10}{'minutes':>9}"
+        f"{'allocs':>8}{'ms/alloc':>10}{'ms/sim-h':>10}{'moves':>7}{'mv/alloc':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for label, timing in timings.items():
+        res = timing.result
+        lines.append(
+            f"{label:<28}{timing.rooms:>6}{timing.vents:>6}{res.ended_reason:>10}{res.minutes:>9.0f}"
+            f"{res.allocations:>8}{timing.ms_per_allocation:>10.3f}{timing.ms_per_sim_hour:>10.1f}"
+            f"{res.total_moves:>7}{res.moves_per_allocation:>9.2f}"
+        )
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Trace replay (recorded coordinator state, see module docs)
+# ---------------------------------------------------------------------------
+# Poll pairs further apart than this (minutes) are not used for the one-step
+# counterfactual: across a long gap (idle period, HA restart) the "next"
+# temperature no longer reflects the previous poll's apertures.
+REPLAY_MAX_GAP_MIN = 15.0
+
+
+@dataclass
+class ReplayResult:
+    """Metrics produced by :func:`replay_trace` for one strategy.
+
+    ``recorded_moves`` counts the aperture changes actually made in the trace
+    (per physical vent, same rule as ``total_moves``), so the two can be
+    compared directly. ``avg_divergence_pct`` is the mean absolute difference
+    between the strategy's targets and the recorded apertures. The spread pair
+    is averaged over the ``transitions`` usable poll pairs: the spread observed
+    at the next poll, and the spread predicted had the strategy's targets been
+    applied instead.
+    """
+
+    strategy: str
+    polls: int
+    decisions: int
+    total_moves: int
+    moves_per_room: dict[str, int]
+    recorded_moves: int
+    min_combined_open_pct: float
+    avg_divergence_pct: float
+    transitions: int
+    avg_recorded_spread: float
+    avg_predicted_spread: float
+    elapsed_s: float = 0.0
+
+
+def _spread(values: Sequence[float]) -> float:
+    return max(values) - min(values) if len(values) >= 2 else 0.0
+
+
+def replay_trace(
+    trace: replay.Trace,
+    strategy: str = "balance",
+    *,
+    settings: balance.AllocSettings | None = None,
+    max_gap_min: float = REPLAY_MAX_GAP_MIN,
+) -> ReplayResult:
+    """Re-run ``strategy`` against every conditioning poll of ``trace``.
+
+    Idle polls and polls without a setpoint are skipped (the strategy's targets
+    are held across them). Per poll, inactive rooms count toward the floor's
+    last-resort capacity exactly as in the coordinator, and rooms with no rate
+    are held. ``settings`` defaults to the production :class:`balance.AllocSettings`.
+    """
+    if strategy not in _STRATEGIES:
+        raise ValueError(f"unknown strategy {strategy!r}; expected one of {sorted(_STRATEGIES)}")
+    started = time.perf_counter()
+    pre_floor = _STRATEGIES[strategy]
+    base = settings if settings is not None else balance.AllocSettings()
+    t_s = trace.t_s
+    curves: dict[float, dict[str, Any]] = {}
+
+    held: dict[str, float] = {}  # strategy target per room (all its vents)
+    last_recorded: dict[str, float] = {}
+    moves_per_room: dict[str, int] = {}
+    total_moves = 0
+    recorded_moves = 0
+    decisions = 0
+    min_combined = math.inf
+    div_sum = 0.0
+    div_n = 0
+    transitions = 0
+    rec_spread_sum = 0.0
+    pred_spread_sum = 0.0
+    # (row, mode, targets, samples) of the previous decision, awaiting the next poll.
+    pending: tuple[int, str, dict[str, float], dict[str, replay.RoomSample]] | None = None
+
+    for row in range(trace.rows):
+        samples = dict(trace.samples_at(row))
+        for rid, sample in samples.items():
+            if sample.open_pct is None:
+                continue
+            prev = last_recorded.get(rid)
+            if prev is not None and prev != sample.open_pct:
+                recorded_moves += sample.vents
+            last_recorded[rid] = sample.open_pct
+
+        if pending is not None:
+            p_row, p_mode, p_targets, p_samples = pending
+            pending = None
+            dt = (t_s[row] - t_s[p_row]) / 60.0
+            if 0.0 < dt <= max_gap_min:
+                sign = -1.0 if p_mode == balance.MODE_COOLING else 1.0
+                observed: list[float] = []
+                predicted: list[float] = []
+                for rid, before in p_samples.items():
+                    after = samples.get(rid)
+                    if after is None or after.temp_c is None or before.open_pct is None:
+                        continue
+                    curve = curves.get(before.leak)
+                    if curve is None:
+                        curve = curves[before.leak] = learning.seed_linear_curve(before.leak)
+                    delta_flow = flow_from_curve(curve, p_targets.get(rid, 0.0)) - flow_from_curve(
+                        curve, before.open_pct
+                    )
+                    observed.append(after.temp_c)
+                    predicted.append(after.temp_c + sign * (before.rate or 0.0) * delta_flow * dt)
+                if len(observed) >= 2:
+                    transitions += 1
+                    rec_spread_sum += _spread(observed)
+                    pred_spread_sum += _spread(predicted)
+
+        mode = trace.mode_at(row)
+        setpoint = trace.setpoint[row]
+        if mode is None or math.isnan(setpoint):
+            continue
+
+        inputs: list[balance.RoomAllocInput] = []
+        considered: dict[str, replay.RoomSample] = {}
+        inactive_vents = 0
+        for rid, sample in samples.items():
+            if not sample.active:
+                inactive_vents += sample.vents
+                continue
+            if sample.temp_c is None or sample.rate is None or sample.rate <= 0:
+                continue
+            temp = sample.temp_c
+            signed = temp - setpoint if mode == balance.MODE_COOLING else setpoint - temp
+            current = held.get(rid, sample.open_pct if sample.open_pct is not None else 0.0)
+            inputs.append(
+                balance.RoomAllocInput(
+                    room_id=rid,
+                    temp_c=temp,
+                    active=True,
+                    efficiency=sample.rate,
+                    leak=sample.leak,
+                    current_open=current,
+                    vent_ids=tuple(f"{rid}\x00{i}" for i in range(sample.vents)),
+                    signed_error_c=signed,
+                )
+            )
+            considered[rid] = sample
+        if not inputs:
+            continue
+
+        row_settings = replace(base, inactive_count=base.inactive_count + inactive_vents)
+        targets = pre_floor(inputs, setpoint, mode, row_settings)
+        floored, _binding = balance.apply_safety_floor(targets, inputs, row_settings)
+        decisions += 1
+
+        per_vent: dict[str, float] = {}
+        for inp in inputs:
+            rid = inp.room_id
+            pct = floored.get(rid, 0.0)
+            for vent_key in inp.vent_ids:
+                per_vent[vent_key] = pct
+            baseline = held.get(rid)
+            if baseline is None:
+                rec = considered[rid].open_pct
+                baseline = rec if rec is not None else 0.0
+            if abs(pct - baseline) > 1e-9:
+                moves_per_room[rid] = moves_per_room.get(rid, 0) + len(inp.vent_ids)
+                total_moves += len(inp.vent_ids)
+            held[rid] = pct
+            rec_open = considered[rid].open_pct
+            if rec_open is not None:
+                div_sum += abs(pct - rec_open)
+                div_n += 1
+        min_combined = min(min_combined, balance.combined_open_pct(per_vent, row_settings))
+        pending = (row, mode, floored, considered)
+
+    return ReplayResult(
+        strategy=strategy,
+        polls=trace.rows,
+        decisions=decisions,
+        total_moves=total_moves,
+        moves_per_room=moves_per_room,
+        recorded_moves=recorded_moves,
+        min_combined_open_pct=min_combined if decisions else 0.0,
+        avg_divergence_pct=div_sum / div_n if div_n else 0.0,
+        transitions=transitions,
+        avg_recorded_spread=rec_spread_sum / transitions if transitions else 0.0,
+        avg_predicted_spread=pred_spread_sum / transitions if transitions else 0.0,
+        elapsed_s=time.perf_counter() - started,
+    )
+
+
+def render_replay_table(results: dict[str, ReplayResult]) -> str:
+    """Fixed-width table of :class:`ReplayResult` rows keyed by strategy."""
+    header = (
+        f"{'strategy':<10}{'polls':>8}{'decided':>9}{'moves':>7}{'rec.moves':>10}"
+        f"{'min open%':>10}{'diverge%':>10}{'rec.spread':>11}{'pred.spread':>12}{'sec':>7}"
+    )
+    lines = [header, "-" * len(header)]
+    for name, res in results.items():
+        lines.append(
+            f"{name:<10}{res.polls:>8}{res.decisions:>9}{res.total_moves:>7}{res.recorded_moves:>10}"
+            f"{res.min_combined_open_pct:>10.1f}{res.avg_divergence_pct:>10.1f}"
+            f"{res.avg_recorded_spread:>11.3f}{res.avg_predicted_spread:>12.3f}{res.elapsed_s:>7.2f}"
+        )
+    return "\n".join(lines)
+
+
 def _format_result(result: RunResult) -> str:
     """One-line human summary of a run (full table is Task 25.2)."""
     return (
@@ -805,7 +1589,9 @@ def _format_result(result: RunResult) -> str:
         f"time_above_guardrail={result.time_above_guardrail_min:.0f} "
         f"moves={result.total_moves} "
         f"avg_err={result.avg_active_error:.3f} max_err={result.max_active_error:.3f} "
-        f"min_combined={result.min_combined_open_pct:.1f}"
+        f"min_combined={result.min_combined_open_pct:.1f} "
+        f"allocations={result.allocations} "
+        f"moves_per_allocation={result.moves_per_allocation:.2f}"
     )
 
 
@@ -829,12 +1615,67 @@ def _main(argv: list[str] | None = None) -> int:
             f"(default '{','.join(sorted(_STRATEGIES))}')"
         ),
     )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="event-driven clock: re-allocate only at threshold crossings (see module docs)",
+    )
+    parser.add_argument(
+        "--no-move-aware",
+        dest="move_aware",
+        action="store_false",
+        help="skip the fewest-moves plan selection for balance/mpc (baseline vent moves)",
+    )
+    parser.add_argument(
+        "--stress",
+        nargs="?",
+        const="all",
+        default=None,
+        metavar="NAME",
+        help=(
+            "time the stock stress scenarios (or one of "
+            f"{', '.join(sorted(STRESS_SCENARIOS))}) and print ms per allocation / simulated hour"
+        ),
+    )
+    parser.add_argument(
+        "--replay",
+        default=None,
+        metavar="PATH",
+        help=(
+            "replay a recorded trace file or a decision log (.jsonl, see replay.py) through each "
+            "strategy and print the metrics"
+        ),
+    )
     args = parser.parse_args(argv)
+    if args.replay is not None:
+        if args.replay.lower().endswith(replay.DECISION_LOG_SUFFIX):
+            traces = replay.traces_from_decisions(replay.load_decisions_jsonl(args.replay))
+        else:
+            traces = {"": replay.Trace.load(args.replay)}
+        for thermostat, trace in traces.items():
+            if thermostat:
+                print(thermostat)
+            results = {strat: replay_trace(trace, strat) for strat in sorted(_STRATEGIES)}
+            print(render_replay_table(results))
+        return 0
+    if args.stress is not None:
+        names = sorted(STRESS_SCENARIOS) if args.stress == "all" else [args.stress]
+        timings = {
+            f"{name}/{strat}": time_run(
+                stress_scenario(name), strat, adaptive=args.adaptive, move_aware=args.move_aware
+            )
+            for name in names
+            for strat in sorted(_STRATEGIES)
+        }
+        print(render_timing_table(timings))
+        return 0
     if args.compare is not None:
         strategies = [s.strip() for s in args.compare.split(",") if s.strip()]
-        compare(default_scenario(), strategies)
+        compare(default_scenario(), strategies, adaptive=args.adaptive, move_aware=args.move_aware)
         return 0
-    result = run(default_scenario(), strategy=args.strategy)
+    result = run(
+        default_scenario(), strategy=args.strategy, adaptive=args.adaptive, move_aware=args.move_aware
+    )
     print(_format_result(result))
     return 0
 
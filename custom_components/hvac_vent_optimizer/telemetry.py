@@ -0,0 +1,534 @@
+"""Rolling poll-phase timing for the coordinator (pure, HA-free).
+
+The coordinator times each phase of a poll (structure mode, device fetch, vent
+and puck enrichment, DAB decide, vent dispatch, observability, save) plus the
+``_dab_lock`` wait/hold, and keeps the last :data:`DEFAULT_WINDOW` samples per
+phase so a slow poll can be attributed. The summaries feed the poll-timing
+diagnostic sensor and the diagnostics download.
+
+Model
+-----
+* :class:`RollingWindow` — fixed-size ring of millisecond samples with
+  nearest-rank percentiles over the window (sorted on read; reads are rare, the
+  window is small).
+* :class:`PhaseTimer` — one window per phase. Between :meth:`begin_poll` and
+  :meth:`end_poll` the time spent in each phase is **accumulated** (a phase can
+  run several times per poll, e.g. once per thermostat group) and becomes one
+  sample per phase when the poll ends, alongside the poll's ``total``. Outside a
+  poll (a manual ``run_dab``, a pre-adjust) each measurement is its own sample.
+  :meth:`spent` exposes a monotonic per-phase running total so a caller can
+  derive an *exclusive* time (e.g. decide = apply - dispatch - observability).
+* :class:`PollProfiler` — on-demand ``cProfile`` capture of the next N polls
+  (the ``profile`` service). The profiler is enabled while a poll or a DAB apply
+  runs; ``cProfile`` is per thread, so tasks interleaved on the event loop at
+  the poll's ``await`` points are captured too. :func:`top_functions` turns a
+  capture into the service's summary rows.
+* :class:`ApiTelemetry` — per Flair endpoint template (``GET /api/vents/{id}/room``)
+  counters for requests, errors, 429s, retries and response bytes plus a fixed
+  latency histogram, and a 60 x 1-minute ring of request counts giving the
+  rolling requests-per-hour against :data:`API_HOURLY_BUDGET`.
+
+Like ``balance``/``learning``/``context``, this module imports nothing from
+Home Assistant and never touches the Flair API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import math
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from types import TracebackType
+
+# Samples kept per phase: two hours of 1-minute active polls.
+DEFAULT_WINDOW = 120
+
+# Percentiles reported by :meth:`RollingWindow.summary`.
+SUMMARY_PERCENTILES: tuple[int, ...] = (50, 90, 99)
+
+# Poll phases in execution order. ``lock_wait``/``lock_hold`` overlap the DAB
+# phases (the lock is held across decide + dispatch) and are reported beside
+# them rather than as part of the poll breakdown.
+POLL_PHASES: tuple[str, ...] = (
+    "structure_mode",
+    "fetch",
+    "enrich_vents",
+    "enrich_pucks",
+    "decide",
+    "dispatch",
+    "observability",
+    "save",
+)
+LOCK_PHASES: tuple[str, ...] = ("lock_wait", "lock_hold")
+TOTAL = "total"
+
+# ``profile`` service bounds: polls captured per call and summary rows returned.
+PROFILE_MAX_POLLS = 10
+PROFILE_DEFAULT_TOP = 25
+# Summary sort keys accepted by :func:`top_functions`.
+PROFILE_SORT_KEYS: tuple[str, ...] = ("cumulative", "tottime", "calls")
+
+# Upper bounds (ms) of the Flair request latency histogram; the last bucket is
+# open-ended. Requests time out at 10 s, so the top bound is the timeout.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0, 10000.0)
+
+# Flair's documented basic-tier limit is 4 requests/s (the client's
+# ``AsyncRateLimiter``); sustained for an hour that is the hourly budget.
+API_HOURLY_BUDGET = 4 * 3600
+
+
+def percentile(ordered: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of an **ascending** sequence (0.0 when empty)."""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return float(ordered[min(rank, len(ordered)) - 1])
+
+
+class RollingWindow:
+    """The last ``size`` samples (ms) with count/mean/percentile summaries."""
+
+    __slots__ = ("_samples", "count")
+
+    def __init__(self, size: int = DEFAULT_WINDOW) -> None:
+        self._samples: deque[float] = deque(maxlen=max(1, int(size)))
+        # Samples ever added (the window only keeps the last ``size``).
+        self.count = 0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, value_ms: float) -> None:
+        self._samples.append(float(value_ms))
+        self.count += 1
+
+    @property
+    def last(self) -> float:
+        return self._samples[-1] if self._samples else 0.0
+
+    def summary(self, percentiles: Iterable[int] = SUMMARY_PERCENTILES) -> dict[str, float]:
+        """``{n, last_ms, mean_ms, p<q>_ms..., max_ms}`` over the window, rounded to 0.01 ms."""
+        ordered = sorted(self._samples)
+        n = len(ordered)
+        out: dict[str, float] = {
+            "n": float(self.count),
+            "last_ms": round(self.last, 2),
+            "mean_ms": round(sum(ordered) / n, 2) if n else 0.0,
+        }
+        for q in percentiles:
+            out[f"p{q}_ms"] = round(percentile(ordered, q), 2)
+        out["max_ms"] = round(ordered[-1], 2) if n else 0.0
+        return out
+
+
+class _Span:
+    """Context manager adding the elapsed wall time of its block to a phase."""
+
+    __slots__ = ("_phase", "_started", "_timer")
+
+    def __init__(self, timer: PhaseTimer, phase: str) -> None:
+        self._timer = timer
+        self._phase = phase
+        self._started = 0.0
+
+    def __enter__(self) -> _Span:
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._timer.add(self._phase, time.perf_counter() - self._started)
+
+
+class PhaseTimer:
+    """Per-phase rolling timings with per-poll accumulation (see module docs)."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW) -> None:
+        self.window = max(1, int(window))
+        self._windows: dict[str, RollingWindow] = {}
+        self._spent: dict[str, float] = {}
+        self._open: dict[str, float] | None = None
+        self._poll_started = 0.0
+
+    def _window(self, phase: str) -> RollingWindow:
+        win = self._windows.get(phase)
+        if win is None:
+            win = self._windows[phase] = RollingWindow(self.window)
+        return win
+
+    @property
+    def in_poll(self) -> bool:
+        return self._open is not None
+
+    def begin_poll(self) -> None:
+        self._open = {}
+        self._poll_started = time.perf_counter()
+
+    def end_poll(self) -> None:
+        """Close the poll: one sample per phase that ran, plus ``total``."""
+        if self._open is None:
+            return
+        for phase, seconds in self._open.items():
+            self._window(phase).add(seconds * 1000.0)
+        self._window(TOTAL).add((time.perf_counter() - self._poll_started) * 1000.0)
+        self._open = None
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Record ``seconds`` spent in ``phase`` (negative values clamp to 0)."""
+        seconds = max(0.0, seconds)
+        self._spent[phase] = self._spent.get(phase, 0.0) + seconds
+        if self._open is not None:
+            self._open[phase] = self._open.get(phase, 0.0) + seconds
+        else:
+            self._window(phase).add(seconds * 1000.0)
+
+    def measure(self, phase: str) -> _Span:
+        """``with timer.measure("fetch"): ...`` — time a block (works around awaits)."""
+        return _Span(self, phase)
+
+    def spent(self, phases: Iterable[str]) -> float:
+        """Total seconds ever recorded for ``phases`` (monotonic)."""
+        return sum(self._spent.get(phase, 0.0) for phase in phases)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Rolling summary per phase, in poll order then lock phases then total."""
+        order = (*POLL_PHASES, *LOCK_PHASES, TOTAL)
+        names = [p for p in order if p in self._windows]
+        names += sorted(p for p in self._windows if p not in order)
+        return {phase: self._windows[phase].summary() for phase in names}
+
+    def last_total_ms(self) -> float | None:
+        win = self._windows.get(TOTAL)
+        return round(win.last, 2) if win is not None and len(win) else None
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a capture is requested while another one is still armed."""
+
+
+@dataclass
+class ProfileCapture:
+    """A finished :class:`PollProfiler` capture."""
+
+    profile: cProfile.Profile
+    polls: int
+    elapsed_s: float
+    timed_out: bool = False
+    error: str | None = None
+
+
+class _ProfileSpan:
+    __slots__ = ("_poll", "_profiler")
+
+    def __init__(self, profiler: PollProfiler, poll: bool) -> None:
+        self._profiler = profiler
+        self._poll = poll
+
+    def __enter__(self) -> _ProfileSpan:
+        self._profiler._enter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._profiler._exit(self._poll)
+
+
+class PollProfiler:
+    """Capture ``cProfile`` data around the next N polls (see module docs).
+
+    Spans nest (a poll runs the DAB apply inside it): the profiler is enabled
+    when the outermost span enters and disabled when it exits, and only poll
+    spans count towards N. Unarmed spans cost one attribute check.
+    """
+
+    def __init__(self) -> None:
+        self._profile: cProfile.Profile | None = None
+        self._remaining = 0
+        self._polls = 0
+        self._depth = 0
+        self._enabled = False
+        self._started = 0.0
+        self._error: str | None = None
+        self._done: asyncio.Event | None = None
+        self._capture: ProfileCapture | None = None
+
+    @property
+    def armed(self) -> bool:
+        return self._profile is not None
+
+    def arm(self, polls: int) -> None:
+        """Start capturing at the next span; finish after ``polls`` polls."""
+        if self._profile is not None:
+            raise ProfilerBusyError("A profile capture is already in progress")
+        self._profile = cProfile.Profile()
+        self._remaining = max(1, min(int(polls), PROFILE_MAX_POLLS))
+        self._polls = 0
+        self._depth = 0
+        self._error = None
+        self._capture = None
+        self._done = asyncio.Event()
+        self._started = time.perf_counter()
+
+    def span(self, poll: bool = False) -> _ProfileSpan:
+        """``with profiler.span(poll=True): ...`` around a poll or DAB apply."""
+        return _ProfileSpan(self, poll)
+
+    def _enter(self) -> None:
+        if self._profile is None:
+            return
+        self._depth += 1
+        if self._depth == 1 and not self._enabled:
+            try:
+                self._profile.enable()
+            except ValueError as err:
+                # Python 3.12+ allows one profiler per thread (e.g. py-spy is
+                # not affected, but another cProfile/sys.monitoring tool is).
+                self._error = str(err)
+                self._finish()
+                return
+            self._enabled = True
+
+    def _exit(self, poll: bool) -> None:
+        if self._profile is None or self._depth == 0:
+            return
+        self._depth -= 1
+        if poll:
+            self._polls += 1
+            self._remaining -= 1
+        if self._depth == 0:
+            self._disable()
+            if self._remaining <= 0:
+                self._finish()
+
+    def _disable(self) -> None:
+        if self._enabled and self._profile is not None:
+            self._profile.disable()
+            self._enabled = False
+
+    def _finish(self, timed_out: bool = False) -> None:
+        if self._profile is None:
+            return
+        self._disable()
+        self._capture = ProfileCapture(
+            profile=self._profile,
+            polls=self._polls,
+            elapsed_s=time.perf_counter() - self._started,
+            timed_out=timed_out,
+            error=self._error,
+        )
+        self._profile = None
+        self._depth = 0
+        if self._done is not None:
+            self._done.set()
+
+    async def wait(self, timeout_s: float) -> ProfileCapture:
+        """Wait for the armed capture; on timeout return what was captured so far."""
+        if self._capture is None and self._done is not None:
+            try:
+                await asyncio.wait_for(self._done.wait(), timeout_s)
+            except TimeoutError:
+                self._finish(timed_out=True)
+        if self._capture is None:
+            raise RuntimeError("No profile capture was armed")
+        return self._capture
+
+    def cancel(self) -> None:
+        """Drop an armed capture (e.g. on unload)."""
+        self._finish()
+
+
+def top_functions(
+    profile: cProfile.Profile, limit: int = PROFILE_DEFAULT_TOP, sort: str = "cumulative"
+) -> list[dict[str, object]]:
+    """The ``limit`` most expensive functions of a capture, as JSON-friendly rows.
+
+    ``sort`` is one of :data:`PROFILE_SORT_KEYS`; times are in milliseconds.
+    The full capture is written with ``profile.dump_stats`` for ``pstats`` /
+    snakeviz.
+    """
+    if sort not in PROFILE_SORT_KEYS:
+        raise ValueError(f"Unknown sort key {sort!r}; expected one of {PROFILE_SORT_KEYS}")
+    # ``getstats()`` entries: ``totaltime`` is cumulative, ``inlinetime`` is
+    # the function's own time (pstats' cumtime / tottime).
+    key = {
+        "calls": lambda e: e.callcount,
+        "tottime": lambda e: e.inlinetime,
+        "cumulative": lambda e: e.totaltime,
+    }[sort]
+    ranked = sorted(profile.getstats(), key=key, reverse=True)
+    rows: list[dict[str, object]] = []
+    for entry in ranked[: max(1, limit)]:
+        code = entry.code
+        label = code if isinstance(code, str) else f"{code.co_filename}:{code.co_firstlineno}({code.co_name})"
+        rows.append(
+            {
+                "function": label,
+                "calls": entry.callcount,
+                "tottime_ms": round(entry.inlinetime * 1000.0, 3),
+                "cumtime_ms": round(entry.totaltime * 1000.0, 3),
+            }
+        )
+    return rows
+
+
+class EndpointStats:
+    """Counters and latency histogram for one endpoint template."""
+
+    __slots__ = (
+        "bytes",
+        "errors",
+        "latency_buckets",
+        "latency_max_ms",
+        "latency_sum_ms",
+        "rate_limited",
+        "requests",
+        "retries",
+    )
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.retries = 0
+        self.bytes = 0
+        self.latency_sum_ms = 0.0
+        self.latency_max_ms = 0.0
+        # One slot per LATENCY_BUCKETS_MS bound plus the open-ended overflow.
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def latency_percentile(self, pct: float) -> float:
+        """Upper bound (ms) of the bucket holding the ``pct`` percentile."""
+        timed = sum(self.latency_buckets)
+        if not timed:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100.0 * timed))
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.latency_buckets, strict=False):
+            seen += count
+            if seen >= rank:
+                return bound
+        return round(self.latency_max_ms, 1)
+
+    def summary(self) -> dict[str, object]:
+        timed = sum(self.latency_buckets)
+        labels = [f"le_{bound:g}" for bound in LATENCY_BUCKETS_MS] + ["inf"]
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rate_limited": self.rate_limited,
+            "retries": self.retries,
+            "bytes": self.bytes,
+            "latency_mean_ms": round(self.latency_sum_ms / timed, 1) if timed else 0.0,
+            "latency_p50_ms": self.latency_percentile(50),
+            "latency_p90_ms": self.latency_percentile(90),
+            "latency_p99_ms": self.latency_percentile(99),
+            "latency_max_ms": round(self.latency_max_ms, 1),
+            "latency_histogram": dict(zip(labels, self.latency_buckets, strict=True)),
+        }
+
+
+class ApiTelemetry:
+    """Per-endpoint Flair request telemetry plus a rolling hourly request rate.
+
+    :meth:`record` is called once per HTTP attempt when its outcome is known:
+    ``status`` is the HTTP status, or ``None`` for a transport failure
+    (timeout, connection error). 429s count as ``rate_limited``, any other
+    failure as an ``error``; :meth:`record_error` adds an error found after a
+    successful status (e.g. a non-JSON body). ``retry`` marks an attempt that
+    repeats a failed one (token refresh, 429 back-off).
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.total = 0
+        # Request counts per wall minute for the last hour: (minute, count).
+        self._minutes: deque[list[int]] = deque(maxlen=60)
+
+    def _stats(self, key: str) -> EndpointStats:
+        stats = self.endpoints.get(key)
+        if stats is None:
+            stats = self.endpoints[key] = EndpointStats()
+        return stats
+
+    def record(
+        self,
+        key: str,
+        status: int | None,
+        latency_s: float,
+        nbytes: int = 0,
+        retry: bool = False,
+    ) -> None:
+        stats = self._stats(key)
+        stats.requests += 1
+        self.total += 1
+        if retry:
+            stats.retries += 1
+        if status == 429:
+            stats.rate_limited += 1
+        elif status is None or status >= 400:
+            stats.errors += 1
+        stats.bytes += max(0, nbytes)
+        latency_ms = max(0.0, latency_s) * 1000.0
+        stats.latency_sum_ms += latency_ms
+        stats.latency_max_ms = max(stats.latency_max_ms, latency_ms)
+        slot = len(LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if latency_ms <= bound:
+                slot = i
+                break
+        stats.latency_buckets[slot] += 1
+
+        minute = int(self._clock() // 60)
+        if self._minutes and self._minutes[-1][0] == minute:
+            self._minutes[-1][1] += 1
+        else:
+            self._minutes.append([minute, 1])
+
+    def record_error(self, key: str) -> None:
+        self._stats(key).errors += 1
+
+    def requests_last_hour(self) -> int:
+        horizon = int(self._clock() // 60) - 59
+        return sum(count for minute, count in self._minutes if minute >= horizon)
+
+    def counts(self) -> dict[str, int]:
+        """Requests per endpoint template, sorted by template."""
+        return {key: self.endpoints[key].requests for key in sorted(self.endpoints)}
+
+    def totals(self) -> dict[str, int]:
+        out = {"requests": 0, "errors": 0, "rate_limited": 0, "retries": 0, "bytes": 0}
+        for stats in self.endpoints.values():
+            out["requests"] += stats.requests
+            out["errors"] += stats.errors
+            out["rate_limited"] += stats.rate_limited
+            out["retries"] += stats.retries
+            out["bytes"] += stats.bytes
+        return out
+
+    def budget(self, hourly_budget: int = API_HOURLY_BUDGET) -> dict[str, float]:
+        """Rolling requests in the last hour against ``hourly_budget``."""
+        last_hour = self.requests_last_hour()
+        return {
+            "requests_last_hour": float(last_hour),
+            "hourly_budget": float(hourly_budget),
+            "budget_used_pct": round(100.0 * last_hour / hourly_budget, 2) if hourly_budget else 0.0,
+        }
+
+    def summary(self) -> dict[str, object]:
+        return {
+            "totals": self.totals(),
+            **self.budget(),
+            "endpoints": {key: self.endpoints[key].summary() for key in sorted(self.endpoints)},
+        }
@@ -4,7 +4,15 @@ from __future__ import annotations
 
 import asyncio
 import time
-from typing import Any
+from collections import deque
+from collections.abc import Callable, Hashable
+from typing import Any, Protocol
+
+
+class RateLimiter(Protocol):
+    """Anything a request can ``await limiter.acquire()`` on before it is sent."""
+
+    async def acquire(self) -> None: ...
 
 
 class AsyncRateLimiter:
@@ -25,6 +33,160 @@ class AsyncRateLimiter:
             self._next_time = max(now, self._next_time) + self._min_interval
 
 
+class FairRateLimiter:
+    """Minimum-interval limiter shared by several clients, served round-robin.
+
+    Each client takes a slot through :meth:`for_client`. While the budget is
+    saturated, waiters are granted one per interval, rotating across the
+    clients that have a request pending, so a busy client cannot starve the
+    others. A client that is alone gets the full rate.
+    """
+
+    def __init__(self, rate_per_sec: float) -> None:
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be > 0")
+        self._min_interval = 1.0 / rate_per_sec
+        self._next_time = 0.0
+        self._waiters: dict[Hashable, deque[asyncio.Future[None]]] = {}
+        self._order: deque[Hashable] = deque()
+        self._pump: asyncio.Task[None] | None = None
+
+    def for_client(self, key: Hashable) -> _FairSlot:
+        """An ``acquire()``-only view of this limiter billed to ``key``."""
+        return _FairSlot(self, key)
+
+    async def acquire(self, key: Hashable) -> None:
+        loop = asyncio.get_running_loop()
+        waiter: asyncio.Future[None] = loop.create_future()
+        queue = self._waiters.get(key)
+        if queue is None:
+            queue = self._waiters[key] = deque()
+            self._order.append(key)
+        queue.append(waiter)
+        if self._pump is None or self._pump.done():
+            self._pump = loop.create_task(self._run())
+        await waiter
+
+    def _pop_next(self) -> asyncio.Future[None] | None:
+        """Next live waiter, taking clients in rotation; drops idle clients."""
+        while self._order:
+            key = self._order.popleft()
+            queue = self._waiters[key]
+            while queue and queue[0].done():
+                # Cancelled while waiting.
+                queue.popleft()
+            if not queue:
+                del self._waiters[key]
+                continue
+            waiter = queue.popleft()
+            if queue:
+                self._order.append(key)
+            else:
+                del self._waiters[key]
+            return waiter
+        return None
+
+    async def _run(self) -> None:
+        while True:
+            delay = self._next_time - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            waiter = self._pop_next()
+            if waiter is None:
+                return
+            self._next_time = max(time.monotonic(), self._next_time) + self._min_interval
+            waiter.set_result(None)
+
+
+class _FairSlot:
+    """One client's handle on a :class:`FairRateLimiter`."""
+
+    def __init__(self, limiter: FairRateLimiter, key: Hashable) -> None:
+        self._limiter = limiter
+        self._key = key
+
+    async def acquire(self) -> None:
+        await self._limiter.acquire(self._key)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe.
+
+    ``closed``: requests flow; ``failure_threshold`` consecutive failures trip
+    it ``open``. ``open``: :meth:`allow` refuses every request until
+    ``cooldown_s`` has passed, then lets exactly one probe through
+    (``half_open``) while still refusing the rest. The probe's success closes
+    the breaker; its failure re-opens it for another cooldown.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        cooldown_s: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown_s = max(0.0, float(cooldown_s))
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.trips = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.cooldown_s:
+            return self.HALF_OPEN
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """True while requests are being short-circuited (open or probing)."""
+        return self._state != self.CLOSED
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now (claims the probe when half-open)."""
+        if self._state == self.CLOSED:
+            return True
+        if not self._probing and self.state == self.HALF_OPEN:
+            self._probing = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self._state = self.CLOSED
+        self._failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._probing or (self._state == self.CLOSED and self._failures >= self.failure_threshold):
+            if self._state == self.CLOSED:
+                self.trips += 1
+            self._state = self.OPEN
+            self._opened_at = self._clock()
+        self._probing = False
+
+    def release(self) -> None:
+        """Give back an unused probe (the request ended neither way, e.g. cancelled)."""
+        self._probing = False
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "trips": self.trips,
+            "rejected": self.rejected,
+        }
+
+
 def is_fahrenheit_unit(unit: str | None) -> bool:
     """Return True if the unit represents Fahrenheit."""
     if not unit:
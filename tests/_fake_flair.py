@@ -0,0 +1,319 @@
+"""In-process fake of the Flair cloud API for benchmarks and end-to-end runs.
+
+``FlairApi`` only touches two methods of the ``aiohttp.ClientSession`` it is
+handed: ``post()`` for the OAuth token (used as ``async with``) and
+``await request()`` for everything else (the returned response is used as
+``async with``). ``FakeFlairSession`` implements exactly that surface on top of
+a ``FakeFlairServer`` that holds a generated structure (vents, pucks, rooms and
+remote sensors). This keeps the real request/retry/429 code in ``api.py`` on the
+hot path without needing a socket or a real ``aiohttp`` install.
+
+The server can be tuned per endpoint:
+
+* ``latency_ms`` — base service time, either one number for every endpoint or
+  a ``{template: ms}`` mapping (templates as in ``ENDPOINTS``, e.g.
+  ``"GET /api/vents/{id}/room"``; unlisted endpoints use ``"*"`` or 0);
+* ``jitter`` — uniform +/- fraction applied to every latency sample;
+* ``rate_limit_prob`` — probability that a request is answered with ``429``
+  (with ``Retry-After: retry_after_s``).
+
+All randomness comes from one seeded ``random.Random`` so a run is reproducible.
+Every served request is counted by endpoint template so callers can report
+requests per poll.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import re
+from collections import Counter
+from typing import Any
+
+# (method, template) -> compiled path regex. Templates are what the counters
+# and latency mapping are keyed by.
+ENDPOINTS: dict[str, re.Pattern[str]] = {
+    "POST /oauth2/token": re.compile(r"^/oauth2/token$"),
+    "GET /api/structures/{id}/vents": re.compile(r"^/api/structures/(?P<id>[^/]+)/vents$"),
+    "GET /api/structures/{id}/pucks": re.compile(r"^/api/structures/(?P<id>[^/]+)/pucks$"),
+    "GET /api/vents/{id}/current-reading": re.compile(r"^/api/vents/(?P<id>[^/]+)/current-reading$"),
+    "GET /api/vents/{id}/room": re.compile(r"^/api/vents/(?P<id>[^/]+)/room$"),
+    "GET /api/pucks/{id}/current-reading": re.compile(r"^/api/pucks/(?P<id>[^/]+)/current-reading$"),
+    "GET /api/pucks/{id}/room": re.compile(r"^/api/pucks/(?P<id>[^/]+)/room$"),
+    "GET /api/remote-sensors/{id}/current-reading": re.compile(
+        r"^/api/remote-sensors/(?P<id>[^/]+)/current-reading$"
+    ),
+    "PATCH /api/vents/{id}": re.compile(r"^/api/vents/(?P<id>[^/]+)$"),
+    "PATCH /api/rooms/{id}": re.compile(r"^/api/rooms/(?P<id>[^/]+)$"),
+    "PATCH /api/structures/{id}": re.compile(r"^/api/structures/(?P<id>[^/]+)$"),
+}
+
+
+def endpoint_template(method: str, path: str) -> str | None:
+    """Return the ``ENDPOINTS`` template matching ``method`` + ``path`` (or None)."""
+    for template, pattern in ENDPOINTS.items():
+        if template.split(" ", 1)[0] == method.upper() and pattern.match(path):
+            return template
+    return None
+
+
+class FakeFlairResponse:
+    """The subset of ``aiohttp.ClientResponse`` that ``FlairApi`` reads."""
+
+    def __init__(
+        self,
+        status: int,
+        payload: Any = None,
+        *,
+        headers: dict[str, str] | None = None,
+        delay_s: float = 0.0,
+    ) -> None:
+        self.status = status
+        self._body = "" if payload is None else json.dumps(payload)
+        self.headers = {"Content-Length": str(len(self._body.encode())), **(headers or {})}
+        self._delay_s = delay_s
+
+    async def __aenter__(self) -> FakeFlairResponse:
+        # ``post()`` is synchronous in aiohttp, so the token latency is paid on
+        # entry; ``request()`` pays it before returning (delay_s is then 0).
+        if self._delay_s > 0:
+            await asyncio.sleep(self._delay_s)
+        return self
+
+    async def __aexit__(self, *exc: Any) -> bool:
+        return False
+
+    async def text(self) -> str:
+        return self._body
+
+    async def json(self) -> Any:
+        # ``json.JSONDecodeError`` is one of the two errors FlairApi maps to a
+        # non-JSON FlairApiError, and unlike ContentTypeError it exists whether
+        # or not the real aiohttp is installed.
+        return json.loads(self._body)
+
+
+class FakeFlairServer:
+    """A generated Flair structure plus the knobs that shape its responses."""
+
+    STRUCTURE_ID = "s1"
+
+    def __init__(
+        self,
+        *,
+        vents: int = 50,
+        pucks: int = 20,
+        rooms: int | None = None,
+        seed: int = 0,
+        latency_ms: float | dict[str, float] = 0.0,
+        jitter: float = 0.0,
+        rate_limit_prob: float = 0.0,
+        retry_after_s: float = 0.0,
+        start_temp_c: float = 26.0,
+    ) -> None:
+        self._rng = random.Random(seed)
+        self.latency_ms = latency_ms
+        self.jitter = max(0.0, float(jitter))
+        self.rate_limit_prob = max(0.0, min(1.0, float(rate_limit_prob)))
+        self.retry_after_s = max(0.0, float(retry_after_s))
+
+        room_count = rooms if rooms is not None else max(1, (vents * 2) // 3)
+        self.rooms: dict[str, dict[str, Any]] = {}
+        for idx in range(room_count):
+            room_id = f"room{idx + 1}"
+            self.rooms[room_id] = {
+                "name": f"Room {idx + 1}",
+                "active": True,
+                "temp_c": start_temp_c + self._rng.uniform(-1.5, 1.5),
+                # Degrees per minute at 100 % open; spread wide enough that the
+                # allocator has real work to do.
+                "rate": self._rng.uniform(0.02, 0.15),
+                # Every other room carries a remote occupancy sensor so the
+                # per-poll remote cache is exercised.
+                "remote_sensor": f"rs{idx + 1}" if idx % 2 == 0 else None,
+            }
+        room_ids = list(self.rooms)
+        self.vents: dict[str, dict[str, Any]] = {
+            f"v{idx + 1}": {"room": room_ids[idx % room_count], "percent_open": 50} for idx in range(vents)
+        }
+        self.pucks: dict[str, dict[str, Any]] = {
+            f"p{idx + 1}": {"room": room_ids[idx % room_count]} for idx in range(pucks)
+        }
+
+        self.requests: Counter[str] = Counter()
+        self.throttled: Counter[str] = Counter()
+        self.service_ms: dict[str, list[float]] = {}
+
+    # ------------------------------------------------------------------
+    # Harness helpers
+    # ------------------------------------------------------------------
+    def session(self) -> FakeFlairSession:
+        return FakeFlairSession(self)
+
+    def reset_counters(self) -> None:
+        self.requests.clear()
+        self.throttled.clear()
+        self.service_ms.clear()
+
+    def advance(self, minutes: float, *, cooling: bool = True, drift_c_per_min: float = 0.01) -> None:
+        """Advance every room's temperature by ``minutes`` of conditioned airflow.
+
+        Each room moves by ``rate * mean_open_fraction * minutes`` toward the
+        supply direction, less a small idle drift the other way. This is only
+        meant to keep the allocator's inputs changing between polls, not to be
+        a thermal model (``simulator.py`` is that).
+        """
+        sign = -1.0 if cooling else 1.0
+        openings: dict[str, list[int]] = {}
+        for vent in self.vents.values():
+            openings.setdefault(vent["room"], []).append(vent["percent_open"])
+        for room_id, room in self.rooms.items():
+            apertures = openings.get(room_id) or [0]
+            frac = sum(apertures) / (100.0 * len(apertures))
+            room["temp_c"] += sign * room["rate"] * frac * minutes - sign * drift_c_per_min * minutes
+
+    # ------------------------------------------------------------------
+    # Request handling
+    # ------------------------------------------------------------------
+    def _latency_s(self, template: str) -> float:
+        if isinstance(self.latency_ms, dict):
+            base = self.latency_ms.get(template, self.latency_ms.get("*", 0.0))
+        else:
+            base = self.latency_ms
+        if base <= 0:
+            return 0.0
+        if self.jitter:
+            base *= 1.0 + self._rng.uniform(-self.jitter, self.jitter)
+        return max(0.0, base) / 1000.0
+
+    def _room_payload(self, room_id: str) -> dict[str, Any]:
+        room = self.rooms[room_id]
+        payload: dict[str, Any] = {
+            "id": room_id,
+            "type": "rooms",
+            "attributes": {
+                "name": room["name"],
+                "active": room["active"],
+                "current-temperature-c": round(room["temp_c"], 2),
+            },
+        }
+        if room["remote_sensor"]:
+            payload["relationships"] = {
+                "remote-sensors": {"data": [{"id": room["remote_sensor"], "type": "remote-sensors"}]}
+            }
+        return payload
+
+    def handle(self, method: str, path: str, body: Any = None) -> tuple[int, Any]:
+        """Serve one request synchronously; returns ``(status, payload)``."""
+        template = endpoint_template(method, path)
+        if template is None:
+            return 404, {"errors": [{"detail": f"no route for {method} {path}"}]}
+        match = ENDPOINTS[template].match(path)
+        item_id = match.group("id") if match and "id" in match.groupdict() else None
+
+        if template == "POST /oauth2/token":
+            return 200, {"access_token": "fake-token", "expires_in": 3600}
+        if template == "GET /api/structures/{id}/vents":
+            return 200, {
+                "data": [
+                    {"id": vid, "type": "vents", "attributes": {"name": f"Vent {vid}"}} for vid in self.vents
+                ]
+            }
+        if template == "GET /api/structures/{id}/pucks":
+            return 200, {
+                "data": [
+                    {"id": pid, "type": "pucks", "attributes": {"name": f"Puck {pid}"}} for pid in self.pucks
+                ]
+            }
+        if template == "GET /api/vents/{id}/current-reading":
+            vent = self.vents.get(item_id or "")
+            if vent is None:
+                return 404, {"errors": []}
+            return 200, {
+                "data": {
+                    "type": "vent-states",
+                    "attributes": {
+                        "percent-open": vent["percent_open"],
+                        "duct-temperature-c": 14.0,
+                        "duct-pressure": 30.0,
+                    },
+                }
+            }
+        if template == "GET /api/vents/{id}/room":
+            vent = self.vents.get(item_id or "")
+            if vent is None:
+                return 404, {"errors": []}
+            return 200, {"data": self._room_payload(vent["room"])}
+        if template == "GET /api/pucks/{id}/current-reading":
+            puck = self.pucks.get(item_id or "")
+            if puck is None:
+                return 404, {"errors": []}
+            temp = self.rooms[puck["room"]]["temp_c"]
+            return 200, {"data": {"attributes": {"current-temperature-c": round(temp, 2)}}}
+        if template == "GET /api/pucks/{id}/room":
+            puck = self.pucks.get(item_id or "")
+            if puck is None:
+                return 404, {"errors": []}
+            return 200, {"data": self._room_payload(puck["room"])}
+        if template == "GET /api/remote-sensors/{id}/current-reading":
+            return 200, {"data": {"attributes": {"occupied": True}}}
+        if template == "PATCH /api/vents/{id}":
+            vent = self.vents.get(item_id or "")
+            if vent is None:
+                return 404, {"errors": []}
+            attrs = ((body or {}).get("data") or {}).get("attributes") or {}
+            if "percent-open" in attrs:
+                vent["percent_open"] = int(attrs["percent-open"])
+            return 200, {"data": {"id": item_id, "type": "vents", "attributes": attrs}}
+        if template == "PATCH /api/rooms/{id}":
+            room = self.rooms.get(item_id or "")
+            if room is None:
+                return 404, {"errors": []}
+            attrs = ((body or {}).get("data") or {}).get("attributes") or {}
+            if "active" in attrs:
+                room["active"] = bool(attrs["active"])
+            return 200, {"data": self._room_payload(item_id or "")}
+        # PATCH /api/structures/{id}
+        return 200, {"data": {"id": item_id, "type": "structures"}}
+
+    def respond(self, method: str, path: str, body: Any = None) -> tuple[FakeFlairResponse, float]:
+        """Build the response for one request and the latency it should incur."""
+        template = endpoint_template(method, path) or f"{method.upper()} {path}"
+        self.requests[template] += 1
+        delay = self._latency_s(template)
+        self.service_ms.setdefault(template, []).append(delay * 1000.0)
+        if template != "POST /oauth2/token" and self._rng.random() < self.rate_limit_prob:
+            self.throttled[template] += 1
+            headers = {"Retry-After": f"{self.retry_after_s:g}"}
+            return FakeFlairResponse(429, {"errors": [{"status": "429"}]}, headers=headers), delay
+        status, payload = self.handle(method, path, body)
+        return FakeFlairResponse(status, payload), delay
+
+
+class FakeFlairSession:
+    """Stands in for the ``aiohttp.ClientSession`` handed to ``FlairApi``."""
+
+    def __init__(self, server: FakeFlairServer) -> None:
+        self.server = server
+        self.closed = False
+
+    @staticmethod
+    def _path(url: str) -> str:
+        # FlairApi always builds f"{BASE_URL}{path}".
+        return re.sub(r"^https?://[^/]+", "", url)
+
+    def post(self, url: str, **kwargs: Any) -> FakeFlairResponse:
+        response, delay = self.server.respond("POST", self._path(url))
+        response._delay_s = delay
+        return response
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> FakeFlairResponse:
+        response, delay = self.server.respond(method, self._path(url), kwargs.get("json"))
+        if delay > 0:
+            await asyncio.sleep(delay)
+        else:
+            # Yield once even at zero latency so concurrent enrichment tasks
+            # interleave the way they would on a real socket.
+            await asyncio.sleep(0)
+        return response
@@ -6,6 +6,7 @@ Imported only after conftest has installed the stub modules.
 from __future__ import annotations
 
 import asyncio
+from datetime import UTC, datetime
 from typing import Any
 
 
@@ -59,6 +60,9 @@ class FakeHass:
         self.created_tasks.append(task)
         return task
 
+    async def async_add_executor_job(self, target, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, target, *args)
+
 
 class FakeEntry:
     def __init__(
@@ -68,11 +72,13 @@ class FakeEntry:
         options: dict | None = None,
         entry_id: str = "entry1",
         title: str = "Test",
+        created_at: datetime | None = None,
     ):
         self.data = data or {}
         self.options = options or {}
         self.entry_id = entry_id
         self.title = title
+        self.created_at = created_at or datetime.now(UTC)
 
     def add_update_listener(self, listener):
         return lambda: None
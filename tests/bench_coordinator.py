@@ -0,0 +1,330 @@
+"""End-to-end coordinator throughput benchmark against the fake Flair server.
+
+Builds the real ``FlairCoordinator`` + ``FlairApi`` from the ``tests/_fakes.py``
+stand-ins (``FakeHass``/``FakeEntry``) and the in-process Flair fake in
+``tests/_fake_flair.py``, then drives ``_async_update_data`` — fetch, per-device
+enrichment and the DAB apply path — for N polls of a 50-vent / 20-puck
+structure (by default). Reported per run:
+
+* requests per poll, in total and per endpoint template (plus 429s served);
+* wall time per phase per poll (structure mode, fetch, enrich, DAB, ``_dab_lock``
+  wait/hold, vent dispatch) as mean / p50 / p95 / p99 / max;
+* vent commands issued and polls that raised ``UpdateFailed``.
+
+The coordinator is instrumented by wrapping bound methods on the instance, so
+nothing in the component changes for the benchmark. ``FlairApi``'s own rate
+limiters (4 req/s) are bypassed unless ``respect_rate_limits`` is set, so the
+numbers measure the integration rather than the documented Flair budget.
+
+    python -m tests.bench_coordinator --cycles 20 --latency-ms 40 --jitter 0.5
+    python -m tests.bench_coordinator --rate-limit-prob 0.02 --retry-after 0.05 --json
+
+The module is not collected by pytest (no ``test_`` prefix);
+``tests/test_bench_coordinator.py`` runs a tiny configuration as a smoke test.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+if "homeassistant" not in sys.modules:  # standalone run: install the HA/aiohttp stubs
+    import tests.conftest  # noqa: F401
+
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from hvac_vent_optimizer import const
+from hvac_vent_optimizer.api import FlairApi
+from hvac_vent_optimizer.coordinator import FlairCoordinator
+from tests._fake_flair import FakeFlairServer
+from tests._fakes import FakeEntry, FakeHass, FakeState
+
+THERMOSTAT = "climate.bench"
+
+# Phases reported per poll, in pipeline order. ``lock_wait`` is derived
+# (apply wall time minus lock hold); ``poll`` is the whole update.
+PHASES = (
+    "structure_mode",
+    "fetch",
+    "enrich_vents",
+    "enrich_pucks",
+    "dab",
+    "lock_wait",
+    "lock_hold",
+    "dispatch",
+    "poll",
+)
+
+
+@dataclass
+class BenchConfig:
+    vents: int = 50
+    pucks: int = 20
+    cycles: int = 20
+    warmup: int = 1
+    latency_ms: float | dict[str, float] = 0.0
+    jitter: float = 0.0
+    rate_limit_prob: float = 0.0
+    retry_after_s: float = 0.0
+    strategy: str = const.CONTROL_STRATEGY_BALANCE
+    setpoint_c: float = 23.5
+    minutes_per_poll: float = 3.0
+    respect_rate_limits: bool = False
+    seed: int = 0
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BenchReport:
+    config: BenchConfig
+    cycles: int
+    failed_polls: int
+    requests_per_poll: float
+    requests_by_endpoint: dict[str, float]
+    throttled: int
+    vent_commands: int
+    phases_ms: dict[str, dict[str, float]]
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def format(self) -> str:
+        cfg = self.config
+        lines = [
+            f"coordinator benchmark: {cfg.vents} vents / {cfg.pucks} pucks, {self.cycles} polls "
+            f"(strategy={cfg.strategy}, latency={cfg.latency_ms} ms, jitter={cfg.jitter}, "
+            f"429 p={cfg.rate_limit_prob})",
+            f"  requests/poll: {self.requests_per_poll:.1f}   429s served: {self.throttled}   "
+            f"vent commands: {self.vent_commands}   failed polls: {self.failed_polls}",
+        ]
+        for template, per_poll in sorted(self.requests_by_endpoint.items()):
+            lines.append(f"    {per_poll:7.2f}  {template}")
+        lines.append(f"  {'phase (ms/poll)':<16}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+        for phase in PHASES:
+            stats = self.phases_ms.get(phase)
+            if not stats:
+                continue
+            lines.append(
+                f"  {phase:<16}{stats['mean']:9.2f}{stats['p50']:9.2f}{stats['p95']:9.2f}"
+                f"{stats['p99']:9.2f}{stats['max']:9.2f}"
+            )
+        return "\n".join(lines)
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Linear-interpolated ``q``-th percentile (0..100) of ``values`` (0.0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * max(0.0, min(100.0, q)) / 100.0
+    lo = math.floor(rank)
+    hi = math.ceil(rank)
+    if lo == hi:
+        return ordered[lo]
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (rank - lo)
+
+
+def summarize(values: list[float]) -> dict[str, float]:
+    """Mean / p50 / p95 / p99 / max of a sample list."""
+    return {
+        "mean": sum(values) / len(values) if values else 0.0,
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": max(values) if values else 0.0,
+    }
+
+
+class _PhaseClock:
+    """Accumulates wall time per phase for the poll in progress."""
+
+    def __init__(self) -> None:
+        self.current: dict[str, float] = {}
+        self.samples: dict[str, list[float]] = {phase: [] for phase in PHASES}
+
+    def instrument(self, obj: Any, name: str, phase: str) -> None:
+        original = getattr(obj, name)
+
+        async def timed(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return await original(*args, **kwargs)
+            finally:
+                elapsed = (time.perf_counter() - started) * 1000.0
+                self.current[phase] = self.current.get(phase, 0.0) + elapsed
+
+        setattr(obj, name, timed)
+
+    def reset(self) -> None:
+        """Drop collected samples (the instrumented wrappers stay in place)."""
+        self.current = {}
+        self.samples = {phase: [] for phase in PHASES}
+
+    def close_poll(self, poll_ms: float) -> None:
+        current = self.current
+        current["poll"] = poll_ms
+        current["lock_wait"] = max(0.0, current.pop("apply", 0.0) - current.get("lock_hold", 0.0))
+        for phase in PHASES:
+            self.samples[phase].append(current.get(phase, 0.0))
+        self.current = {}
+
+
+class _NoLimit:
+    async def acquire(self) -> None:
+        return None
+
+
+def build_harness(cfg: BenchConfig) -> tuple[FlairCoordinator, FakeHass, FakeFlairServer]:
+    """Wire a real coordinator + API to a fresh fake server for ``cfg``."""
+    server = FakeFlairServer(
+        vents=cfg.vents,
+        pucks=cfg.pucks,
+        seed=cfg.seed,
+        latency_ms=cfg.latency_ms,
+        jitter=cfg.jitter,
+        rate_limit_prob=cfg.rate_limit_prob,
+        retry_after_s=cfg.retry_after_s,
+    )
+    api = FlairApi(server.session(), "bench-client", "bench-secret")
+    if not cfg.respect_rate_limits:
+        api._basic_limiter = _NoLimit()
+        api._search_limiter = _NoLimit()
+
+    options: dict[str, Any] = {
+        const.CONF_VENT_BRAND: const.BRAND_FLAIR,
+        const.CONF_DAB_ENABLED: True,
+        const.CONF_CONTROL_STRATEGY: cfg.strategy,
+        # No cooldown: every poll is allowed to dispatch, so the dispatch phase
+        # is measured rather than masked by the anti-chatter clock.
+        const.CONF_MIN_ADJUSTMENT_INTERVAL: 0,
+        const.CONF_VENT_ASSIGNMENTS: {
+            vent_id: {const.CONF_THERMOSTAT_ENTITY: THERMOSTAT, const.CONF_TEMP_SENSOR_ENTITY: None}
+            for vent_id in server.vents
+        },
+    }
+    options.update(cfg.options)
+    entry = FakeEntry(
+        data={
+            const.CONF_STRUCTURE_ID: server.STRUCTURE_ID,
+            const.CONF_CLIENT_ID: "bench-client",
+            const.CONF_CLIENT_SECRET: "bench-secret",
+        },
+        options=options,
+    )
+    hass = FakeHass()
+    hass.states.set(
+        THERMOSTAT,
+        FakeState(
+            "cool",
+            {
+                "hvac_action": "cooling",
+                "current_temperature": 25.0,
+                "temperature": cfg.setpoint_c,
+                "temperature_unit": "°C",
+            },
+        ),
+    )
+    coord = FlairCoordinator(hass, api, entry)
+    return coord, hass, server
+
+
+async def run_benchmark(cfg: BenchConfig) -> BenchReport:
+    """Run ``cfg.warmup + cfg.cycles`` polls and summarize the measured ones."""
+    coord, _hass, server = build_harness(cfg)
+    await coord.async_initialize()
+
+    clock = _PhaseClock()
+    clock.instrument(coord, "async_ensure_structure_mode", "structure_mode")
+    clock.instrument(coord.api, "async_get_vents", "fetch")
+    clock.instrument(coord.api, "async_get_pucks", "fetch")
+    clock.instrument(coord, "_async_enrich_vents", "enrich_vents")
+    clock.instrument(coord, "_async_enrich_pucks", "enrich_pucks")
+    clock.instrument(coord, "_async_process_dab", "dab")
+    clock.instrument(coord, "_async_apply_dab_adjustments", "apply")
+    clock.instrument(coord, "_apply_dab_adjustments_impl", "lock_hold")
+    clock.instrument(coord, "_command_vent", "dispatch")
+
+    failed = 0
+    for poll in range(cfg.warmup + cfg.cycles):
+        if poll == cfg.warmup:
+            # Token fetch and the first-poll cycle start are not steady state.
+            server.reset_counters()
+            clock.reset()
+        started = time.perf_counter()
+        try:
+            coord.data = await coord._async_update_data()
+        except UpdateFailed:
+            if poll >= cfg.warmup:
+                failed += 1
+        clock.close_poll((time.perf_counter() - started) * 1000.0)
+        server.advance(cfg.minutes_per_poll)
+
+    coord.async_shutdown()
+
+    polls = max(1, cfg.cycles)
+    total_requests = sum(server.requests.values())
+    return BenchReport(
+        config=cfg,
+        cycles=cfg.cycles,
+        failed_polls=failed,
+        requests_per_poll=total_requests / polls,
+        requests_by_endpoint={tpl: count / polls for tpl, count in server.requests.items()},
+        throttled=sum(server.throttled.values()),
+        vent_commands=server.requests.get("PATCH /api/vents/{id}", 0),
+        phases_ms={phase: summarize(samples) for phase, samples in clock.samples.items()},
+    )
+
+
+def _parse_args(argv: list[str] | None) -> tuple[BenchConfig, bool]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vents", type=int, default=50)
+    parser.add_argument("--pucks", type=int, default=20)
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0, help="uniform +/- fraction of latency")
+    parser.add_argument("--rate-limit-prob", type=float, default=0.0, help="probability of a 429")
+    parser.add_argument("--retry-after", type=float, default=0.0, help="Retry-After seconds on a 429")
+    parser.add_argument(
+        "--strategy", default=const.CONTROL_STRATEGY_BALANCE, choices=const.CONTROL_STRATEGIES
+    )
+    parser.add_argument("--respect-rate-limits", action="store_true", help="keep FlairApi's limiters")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="emit the report as JSON")
+    parser.add_argument("--verbose", action="store_true", help="keep the component's warning logs")
+    args = parser.parse_args(argv)
+    if not args.verbose:
+        # 429s and batch-cap holds are expected under load; keep the report readable.
+        logging.getLogger("hvac_vent_optimizer").setLevel(logging.ERROR)
+    cfg = BenchConfig(
+        vents=args.vents,
+        pucks=args.pucks,
+        cycles=args.cycles,
+        warmup=args.warmup,
+        latency_ms=args.latency_ms,
+        jitter=args.jitter,
+        rate_limit_prob=args.rate_limit_prob,
+        retry_after_s=args.retry_after,
+        strategy=args.strategy,
+        respect_rate_limits=args.respect_rate_limits,
+        seed=args.seed,
+    )
+    return cfg, args.json
+
+
+def main(argv: list[str] | None = None) -> int:
+    cfg, as_json = _parse_args(argv)
+    report = asyncio.run(run_benchmark(cfg))
+    print(json.dumps(report.to_dict(), indent=2, sort_keys=True) if as_json else report.format())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
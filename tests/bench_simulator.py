@@ -0,0 +1,88 @@
+"""Simulator scaling benchmark over the stock stress scenarios.
+
+Runs every ``simulator.STRESS_SCENARIOS`` entry (40-200 rooms, multi-vent rooms,
+inactive zones) for each strategy and reports wall time per allocation and per
+simulated hour, next to the movement and safety-floor outcomes the evidence
+gate checks. Pure: loads ``simulator`` by path, no Home
+Assistant.
+
+    python -m tests.bench_simulator                 # all scenarios, fixed clock
+    python -m tests.bench_simulator --adaptive      # event-driven clock
+    python -m tests.bench_simulator --scenario floor_200
+    python -m tests.bench_simulator --no-move-aware # skip plan selection (baseline moves)
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import logging
+import pathlib
+import sys
+
+_ROOT = pathlib.Path(__file__).resolve().parent.parent / "custom_components" / "hvac_vent_optimizer"
+
+
+def _load(name: str):
+    path = _ROOT / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(f"hvo_{name}", path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+simulator = _load("simulator")
+
+
+def run_suite(
+    names: list[str], strategies: list[str], *, adaptive: bool = False, move_aware: bool = True
+) -> dict:
+    """Time each (scenario, strategy) pair; returns ``label -> RunTiming``."""
+    return {
+        f"{name}/{strategy}": simulator.time_run(
+            simulator.stress_scenario(name), strategy, adaptive=adaptive, move_aware=move_aware
+        )
+        for name in names
+        for strategy in strategies
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Simulator scaling benchmark (stress scenarios)")
+    parser.add_argument("--scenario", action="append", choices=sorted(simulator.STRESS_SCENARIOS))
+    parser.add_argument("--strategy", action="append", choices=sorted(simulator._STRATEGIES))
+    parser.add_argument("--adaptive", action="store_true", help="use the event-driven clock")
+    parser.add_argument(
+        "--no-move-aware",
+        dest="move_aware",
+        action="store_false",
+        help="skip the fewest-moves plan selection (compare moves per allocation)",
+    )
+    args = parser.parse_args(argv)
+    # Last-resort floor reopens log a warning per allocation; keep the table readable.
+    logging.getLogger(simulator.balance.__name__).setLevel(logging.ERROR)
+
+    names = args.scenario or list(simulator.STRESS_SCENARIOS)
+    strategies = args.strategy or ["dab", "balance"]
+    timings = run_suite(names, strategies, adaptive=args.adaptive, move_aware=args.move_aware)
+    print(simulator.render_timing_table(timings))
+
+    for name in names:
+        spec = simulator.STRESS_SCENARIOS[name]
+        floor = spec.safety_floor_pct
+        bal = timings.get(f"{name}/balance")
+        dab = timings.get(f"{name}/dab")
+        if bal is None:
+            continue
+        floor_ok = bal.result.min_combined_open_pct >= floor - 1e-6
+        line = f"{name}: balance floor {'ok' if floor_ok else 'VIOLATED'} "
+        line += f"(min combined {bal.result.min_combined_open_pct:.1f}% vs {floor:.0f}%)"
+        if dab is not None and dab.result.total_moves:
+            line += f", moves {bal.result.total_moves / dab.result.total_moves * 100.0:.0f}% of dab"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
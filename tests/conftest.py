@@ -174,8 +174,19 @@ def _install_homeassistant() -> None:
     class UnitOfPressure:
         KPA = "kPa"
 
+    class UnitOfTime:
+        MILLISECONDS = "ms"
+        SECONDS = "s"
+        MINUTES = "min"
+
+    class EntityCategory:
+        CONFIG = "config"
+        DIAGNOSTIC = "diagnostic"
+
     const.UnitOfTemperature = UnitOfTemperature
     const.UnitOfPressure = UnitOfPressure
+    const.UnitOfTime = UnitOfTime
+    const.EntityCategory = EntityCategory
 
     # homeassistant.core
     core = _ensure("homeassistant.core")
@@ -259,6 +270,33 @@ def _install_homeassistant() -> None:
     logbook.async_log_entry = lambda *a, **k: None
     components.logbook = logbook
 
+    diagnostics = _ensure("homeassistant.components.diagnostics")
+
+    def async_redact_data(data, to_redact):
+        if isinstance(data, dict):
+            return {
+                k: ("**REDACTED**" if k in to_redact else async_redact_data(v, to_redact))
+                for k, v in data.items()
+            }
+        if isinstance(data, list):
+            return [async_redact_data(v, to_redact) for v in data]
+        return data
+
+    diagnostics.async_redact_data = async_redact_data
+    components.diagnostics = diagnostics
+
+    # homeassistant.components.recorder (+ .history): the history bootstrap
+    # reads recorded states through these; tests replace both history queries.
+    recorder = _ensure("homeassistant.components.recorder")
+    recorder.get_instance = lambda hass: hass
+    recorder_history = _ensure("homeassistant.components.recorder.history")
+    recorder_history.get_significant_states = lambda hass, start_time, end_time=None, entity_ids=None, **k: {}
+    recorder_history.state_changes_during_period = (
+        lambda hass, start_time, end_time=None, entity_id=None, **k: {}
+    )
+    recorder.history = recorder_history
+    components.recorder = recorder
+
     # homeassistant.components.climate + .const
     climate = _ensure("homeassistant.components.climate")
 
@@ -300,6 +338,18 @@ def _install_homeassistant() -> None:
     event = _ensure("homeassistant.helpers.event")
     event.async_track_state_change_event = lambda hass, entity, cb: (lambda: None)
 
+    entity_registry = _ensure("homeassistant.helpers.entity_registry")
+
+    class EntityRegistry:
+        def __init__(self):
+            # (domain, platform, unique_id) -> entity_id
+            self.entity_ids: dict[tuple[str, str, str], str] = {}
+
+        def async_get_entity_id(self, domain, platform, unique_id):
+            return self.entity_ids.get((domain, platform, unique_id))
+
+    entity_registry.async_get = lambda hass: hass.data.setdefault("entity_registry", EntityRegistry())
+
     storage = _ensure("homeassistant.helpers.storage")
 
     class Store:
@@ -315,6 +365,9 @@ def _install_homeassistant() -> None:
         async def async_save(self, data):
             self.saved = data
 
+        def async_delay_save(self, data_func, delay=0):
+            self.saved = data_func()
+
     storage.Store = Store
 
     update_coordinator = _ensure("homeassistant.helpers.update_coordinator")
@@ -337,6 +390,13 @@ def _install_homeassistant() -> None:
         async def async_config_entry_first_refresh(self):
             return None
 
+        async def async_refresh(self):
+            try:
+                self.data = await self._async_update_data()
+                self.last_update_success = True
+            except Exception:  # mirrors HA: a failed refresh is logged, not raised
+                self.last_update_success = False
+
         def async_set_updated_data(self, data):
             self.data = data
 
@@ -350,6 +410,9 @@ def _install_homeassistant() -> None:
         def async_write_ha_state(self):
             return None
 
+        def async_on_remove(self, func):
+            return None
+
         async def async_added_to_hass(self):
             return None
 
@@ -370,6 +433,7 @@ def _install_homeassistant() -> None:
         return value
 
     dt.as_utc = _as_utc
+    dt.as_local = lambda value: value.astimezone()
 
     json_util = _ensure("homeassistant.util.json")
     json_util.load_json = lambda path: {}
@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+from types import SimpleNamespace
 
 import aiohttp
 import pytest
 
-from hvac_vent_optimizer.api import FlairApi, FlairApiAuthError
+from hvac_vent_optimizer.api import (
+    FlairApi,
+    FlairApiAuthError,
+    FlairApiError,
+    FlairApiHub,
+    FlairApiTransientError,
+    FlairApiUnavailable,
+    RetryPolicy,
+)
+from hvac_vent_optimizer.utils import CircuitBreaker, FairRateLimiter
 
 
 class FakeResp:
@@ -59,6 +70,13 @@ def _make_api(request_responses):
 
     api._basic_limiter = _NoLimit()
     api._search_limiter = _NoLimit()
+    # Record back-off delays instead of sleeping.
+    api.sleeps = []
+
+    async def _sleep(delay):
+        api.sleeps.append(delay)
+
+    api._sleep = _sleep
     return api, session
 
 
@@ -98,3 +116,187 @@ async def test_429_still_retries_once():
     result = await api._async_request("GET", "/api/structures")
     assert result == {"ok": 3}
     assert len(session.request_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_telemetry_counts_429_retries_and_non_json_errors():
+    api, _session = _make_api(
+        [
+            FakeResp(429, headers={"Retry-After": "0"}),
+            FakeResp(200, json_data={"ok": 4}, headers={"Content-Length": "10"}),
+            FakeResp(200, text="<html>"),
+        ]
+    )
+    await api._async_request("GET", "/api/vents/v1/current-reading")
+    with pytest.raises(FlairApiError):
+        await api._async_request("GET", "/api/vents/v2/current-reading")
+
+    stats = api.telemetry.summary()["endpoints"]["GET /api/vents/{id}/current-reading"]
+    assert stats["requests"] == 3
+    assert stats["rate_limited"] == 1
+    assert stats["retries"] == 1
+    assert stats["errors"] == 1  # the non-JSON body
+    assert stats["bytes"] == 10
+    token = api.telemetry.summary()["endpoints"]["POST /oauth2/token"]
+    assert token["requests"] == 1 and token["retries"] == 0
+    assert api.request_counts == {"GET /api/vents/{id}/current-reading": 3, "POST /oauth2/token": 1}
+
+
+@pytest.mark.asyncio
+async def test_telemetry_counts_auth_refresh_and_transport_errors():
+    api, session = _make_api([FakeResp(401), FakeResp(200, json_data={"ok": 5})])
+    await api._async_request("GET", "/api/structures")
+    token = api.telemetry.endpoints["POST /oauth2/token"]
+    assert token.requests == 2 and token.retries == 1  # the 401-driven refresh
+
+    async def _timeout(method, url, **kwargs):
+        raise TimeoutError
+
+    session.request = _timeout
+    with pytest.raises(TimeoutError):
+        await api._async_request("GET", "/api/structures")
+    structures = api.telemetry.endpoints["GET /api/structures"]
+    assert structures.requests == 5  # timeouts are retried twice for reads
+    assert structures.errors == 4  # the 401 and three timeouts
+    assert structures.retries == 3
+
+
+@pytest.mark.asyncio
+async def test_5xx_backs_off_with_jitter_then_raises_transient():
+    api, session = _make_api([FakeResp(503), FakeResp(502), FakeResp(500)])
+    api.retry_policies["read"] = RetryPolicy(retries=2, base_s=1.0, max_s=1.5)
+    with pytest.raises(FlairApiTransientError):
+        await api._async_request("GET", "/api/structures")
+    assert len(session.request_calls) == 3
+    assert len(api.sleeps) == 2
+    assert 0.0 <= api.sleeps[0] <= 1.0  # full jitter over base * 2**0
+    assert 0.0 <= api.sleeps[1] <= 1.5  # capped at max_s
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honored_and_writes_retry_less():
+    api, session = _make_api(
+        [FakeResp(429, headers={"Retry-After": "2"}), FakeResp(429, headers={"Retry-After": "2"})]
+    )
+    with pytest.raises(FlairApiTransientError):
+        await api._async_request("PATCH", "/api/vents/v1", json={})
+    assert len(session.request_calls) == 2  # one retry for writes
+    assert 2.0 <= api.sleeps[0] <= 2.2
+
+
+@pytest.mark.asyncio
+async def test_breaker_trips_short_circuits_and_recovers_via_probe():
+    clock = [0.0]
+    api, session = _make_api([FakeResp(500) for _ in range(4)] + [FakeResp(200, json_data={"ok": 6})])
+    api.retry_policies["read"] = RetryPolicy(retries=0, base_s=0.0, max_s=0.0)
+    api.breaker = CircuitBreaker(failure_threshold=2, cooldown_s=30.0, clock=lambda: clock[0])
+
+    for _ in range(2):
+        with pytest.raises(FlairApiTransientError):
+            await api._async_request("GET", "/api/structures")
+    assert api.breaker.state == "open"
+    with pytest.raises(FlairApiUnavailable):
+        await api._async_request("GET", "/api/vents/v1/room")
+    assert len(session.request_calls) == 2  # refused without a request
+
+    # Half-open: one failing probe re-opens for another cooldown.
+    clock[0] = 31.0
+    assert api.breaker.state == "half_open"
+    with pytest.raises(FlairApiTransientError):
+        await api._async_request("GET", "/api/structures")
+    assert api.breaker.state == "open"
+    clock[0] = 62.0
+    with pytest.raises(FlairApiTransientError):
+        await api._async_request("GET", "/api/structures")
+    clock[0] = 93.0
+    assert await api._async_request("GET", "/api/structures") == {"ok": 6}
+    assert api.breaker.state == "closed"
+    assert api.breaker.snapshot()["trips"] == 1
+    assert api.breaker.snapshot()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_client_errors_do_not_trip_the_breaker():
+    api, _session = _make_api([FakeResp(404, text="missing") for _ in range(6)])
+    api.breaker = CircuitBreaker(failure_threshold=2)
+    for _ in range(6):
+        with pytest.raises(FlairApiError):
+            await api._async_request("GET", "/api/vents/v1/room")
+    assert api.breaker.state == "closed"
+
+
+def test_half_open_admits_a_single_probe():
+    clock = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_s=10.0, clock=lambda: clock[0])
+    breaker.record_failure()
+    assert not breaker.allow()
+    clock[0] = 10.0
+    assert breaker.allow()  # the probe
+    assert not breaker.allow()  # concurrent requests still short-circuit
+    breaker.release()  # probe cancelled: the next request may probe
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_hub_shares_one_token_between_entries_and_refcounts():
+    session = FakeSession(
+        {"access_token": "tok", "expires_in": 3600}, [FakeResp(200, json_data={}) for _ in range(2)]
+    )
+    hub = FlairApiHub(session, "cid", "secret")
+    hub.basic_limiter = FairRateLimiter(1000.0)
+    first = hub.acquire("entry_a", "secret")
+    second = hub.acquire("entry_b", "secret")
+    assert hub.acquire("entry_a", "secret") is first
+    assert hub.refcount == 2
+
+    await first._async_request("GET", "/api/structures")
+    await second._async_request("GET", "/api/structures")
+    assert len(session.post_calls) == 1  # one token for the account
+    # Telemetry stays per entry.
+    assert first.telemetry.total == 2 and second.telemetry.total == 1
+
+    # A rotated secret invalidates the shared token.
+    hub.acquire("entry_b", "new-secret")
+    assert hub.token.access_token is None and first._client_secret == "new-secret"
+
+    assert hub.release("entry_a") is False
+    assert hub.release("entry_b") is True
+
+
+@pytest.mark.asyncio
+async def test_fair_limiter_round_robins_between_clients():
+    limiter = FairRateLimiter(1000.0)
+    busy, quiet = limiter.for_client("busy"), limiter.for_client("quiet")
+    granted = []
+
+    async def _take(slot, name):
+        await slot.acquire()
+        granted.append(name)
+
+    await asyncio.gather(*[_take(busy, "busy") for _ in range(4)], *[_take(quiet, "quiet") for _ in range(2)])
+    # The quiet entry is not queued behind the busy one's backlog.
+    assert granted == ["busy", "quiet", "busy", "quiet", "busy", "busy"]
+
+    # A cancelled waiter gives up its turn without stalling the others.
+    blocked = asyncio.ensure_future(busy.acquire())
+    blocked.cancel()
+    await asyncio.wait_for(quiet.acquire(), timeout=1.0)
+
+
+def test_hubs_live_beside_coordinators_in_domain_data():
+    from hvac_vent_optimizer import _acquire_api, _release_api, const
+
+    class _Entry:
+        def __init__(self, entry_id):
+            self.entry_id = entry_id
+            self.data = {const.CONF_CLIENT_ID: "cid", const.CONF_CLIENT_SECRET: "secret"}
+
+    hass, one, two = SimpleNamespace(data={const.DOMAIN: {}}), _Entry("one"), _Entry("two")
+    api_one, api_two = _acquire_api(hass, one), _acquire_api(hass, two)
+    assert api_one._token is api_two._token
+    _release_api(hass, one)
+    assert "cid" in hass.data[const.DOMAIN]["_api_hubs"]
+    _release_api(hass, two)
+    assert hass.data[const.DOMAIN]["_api_hubs"] == {}
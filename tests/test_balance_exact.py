@@ -0,0 +1,136 @@
+"""Tests for ``balance.allocate_exact`` (the lattice allocator the coordinator plans with).
+
+``allocate_exact`` plans the same synchronized convergence as
+:func:`balance.allocate` but picks apertures on the granularity lattice
+directly and folds the airflow-safety floor in, so
+:func:`balance.apply_safety_floor` is a no-op re-check afterwards. These tests
+pin that contract: lattice-aligned targets, the floor met in one pass in the
+choke point's own order, ``pre_floor_targets`` for cooldown bookkeeping, and
+determinism.
+
+balance.py is loaded standalone by path (no Home Assistant), like the other
+``test_balance_*`` modules.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import pathlib
+import random
+import sys
+from dataclasses import replace
+
+_BALANCE_PATH = (
+    pathlib.Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "hvac_vent_optimizer"
+    / "balance.py"
+)
+_spec = importlib.util.spec_from_file_location("hvo_balance", _BALANCE_PATH)
+balance = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = balance
+_spec.loader.exec_module(balance)
+
+MODE = "cooling"
+SETPOINT_C = 26.1
+SETTINGS = balance.AllocSettings(crosscoupling=False)
+
+
+def _room(room_id, temp_c, efficiency, *, active=True, vents=1):
+    return balance.RoomAllocInput(
+        room_id=room_id,
+        temp_c=temp_c,
+        active=active,
+        efficiency=efficiency,
+        leak=0.1,
+        current_open=0.0,
+        vent_ids=tuple(f"{room_id}-{i}" for i in range(vents)),
+        signed_error_c=temp_c - SETPOINT_C,
+    )
+
+
+def _combined(targets, rooms, settings):
+    by_id = {room.room_id: room for room in rooms}
+    expanded = {f"{rid}\x00{i}": pct for rid, pct in targets.items() for i in range(len(by_id[rid].vent_ids))}
+    return balance.combined_open_pct(expanded, settings)
+
+
+def test_lattice_targets_converge_together_satisfied_closed_inactive_excluded():
+    rooms = [
+        _room("hot", 27.6, 0.1),
+        _room("warm", 26.9, 0.1),
+        _room("cold", 25.7, 0.4),
+        _room("off", 28.0, 0.1, active=False),
+    ]
+    settings = replace(SETTINGS, safety_floor_pct=0.0)
+    result = balance.allocate_exact(rooms, SETPOINT_C, MODE, settings)
+
+    assert set(result.targets) == {"hot", "warm", "cold"}
+    assert all(pct % settings.granularity == 0 for pct in result.targets.values())
+    assert result.targets["hot"] == 100.0
+    assert result.targets["cold"] == 0.0
+    assert 0.0 < result.targets["warm"] < result.targets["hot"]
+    assert result.floor_binding is False
+    assert result.pre_floor_targets is None
+    assert balance.allocate_exact(rooms, SETPOINT_C, MODE, settings) == result
+
+
+def test_floor_met_in_one_pass_and_choke_point_is_a_no_op():
+    rooms = [
+        _room("hot", 27.2, 0.2),
+        _room("warm", 26.6, 0.2),
+        _room("mild", 26.35, 0.2),
+        _room("cold", 25.9, 0.2),
+        _room("cool", 25.9, 0.2),
+    ]
+    result = balance.allocate_exact(rooms, SETPOINT_C, MODE, SETTINGS)
+
+    assert result.floor_binding is True
+    assert _combined(result.targets, rooms, SETTINGS) >= SETTINGS.safety_floor_pct
+    floored, binding = balance.apply_safety_floor(result.targets, rooms, SETTINGS)
+    assert binding is False
+    assert floored == result.targets
+    # The raise only ever opens, and the unfloored plan is kept for the cooldown.
+    assert result.pre_floor_targets is not None
+    assert all(result.targets[rid] >= pct for rid, pct in result.pre_floor_targets.items())
+    assert _combined(result.pre_floor_targets, rooms, SETTINGS) < SETTINGS.safety_floor_pct
+
+
+def test_floor_raise_matches_choke_point_padding_order():
+    rooms = [
+        _room("a", 26.5, 0.3, vents=2),
+        _room("b", 27.0, 0.3),
+        _room("c", 26.3, 0.3),
+        _room("d", 25.8, 0.3),
+        _room("e", 25.8, 0.3, vents=2),
+    ]
+    result = balance.allocate_exact(rooms, SETPOINT_C, MODE, SETTINGS)
+    padded, binding = balance.apply_safety_floor(result.pre_floor_targets, rooms, SETTINGS)
+
+    # Same rooms raised to the same apertures as step-by-step padding would reach.
+    assert binding is True
+    assert result.targets == padded
+
+
+def test_random_houses_need_no_padding_when_active_capacity_suffices():
+    rng = random.Random(7)
+    for _ in range(200):
+        rooms = [
+            _room(
+                f"r{i}",
+                SETPOINT_C + rng.uniform(-0.5, 2.0),
+                rng.uniform(0.02, 0.5),
+                vents=rng.choice((1, 1, 2)),
+            )
+            for i in range(rng.randint(2, 12))
+        ]
+        settings = replace(SETTINGS, granularity=rng.choice((1, 5, 10)), conventional_vents=rng.randint(0, 3))
+        result = balance.allocate_exact(rooms, SETPOINT_C, MODE, settings)
+
+        assert all(pct % settings.granularity == 0 for pct in result.targets.values())
+        floored, binding = balance.apply_safety_floor(result.targets, rooms, settings)
+        eligible = [room for room in rooms if room.signed_error_c > 0.0]
+        capacity = dict(result.targets, **{room.room_id: 100.0 for room in eligible})
+        if _combined(capacity, rooms, settings) >= settings.safety_floor_pct:
+            assert binding is False
+            assert floored == result.targets
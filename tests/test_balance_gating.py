@@ -236,3 +236,63 @@ class TestPurity:
         r1 = balance.should_apply(current, proposed, rooms, _settings(), _gate())
         r2 = balance.should_apply(current, proposed, rooms, _settings(), _gate())
         assert r1 == r2 is True
+
+
+# ---------------------------------------------------------------------------
+# Movement-aware plan selection — select_fewest_moves
+# ---------------------------------------------------------------------------
+class TestSelectFewestMoves:
+    def test_marginal_move_is_held_and_laggard_keeps_its_plan(self):
+        # A's 50 -> 55 shifts its projection by 0.03 C; the laggard's plan is kept.
+        rooms = [_room("A", 27.0, current_open=50.0), _room("L", 28.0, current_open=60.0)]
+        plan = {"A": 55.0, "L": 100.0}
+        new, held = balance.select_fewest_moves(plan, rooms, MODE, SETPOINT_C, _settings())
+        assert held == frozenset({"A"})
+        assert new == {"A": 50.0, "L": 100.0}
+        assert plan == {"A": 55.0, "L": 100.0}
+
+    def test_hold_never_grows_the_largest_error(self):
+        # Holding L at 90 is within the spread deadband but would slow the laggard.
+        rooms = [_room("A", 26.5, current_open=20.0), _room("L", 28.0, current_open=90.0)]
+        plan = {"A": 20.0, "L": 100.0}
+        new, held = balance.select_fewest_moves(plan, rooms, MODE, SETPOINT_C, _settings())
+        assert held == frozenset()
+        assert new == plan
+
+    def test_hold_does_not_break_the_floor(self):
+        rooms = [
+            _room("A", 26.9, efficiency=0.001),
+            _room("L", 28.0, current_open=100.0),
+            _room("S1", 25.0),
+            _room("S2", 25.0),
+        ]
+        plan = {"A": 60.0, "L": 100.0, "S1": 0.0, "S2": 0.0}  # combined exactly 40 %
+        _, held = balance.select_fewest_moves(plan, rooms, MODE, SETPOINT_C, _settings())
+        assert held == frozenset()
+        headroom = _settings(conventional_vents=2, conventional_open_pct=100.0)
+        _, held = balance.select_fewest_moves(plan, rooms, MODE, SETPOINT_C, headroom)
+        assert held == frozenset({"A"})
+
+    def test_sticky_rooms_are_held_first(self):
+        # Floor margin for exactly one 60 % hold: A wins by id, B when it is sticky.
+        rooms = [
+            _room("A", 26.9, efficiency=0.001),
+            _room("B", 26.9, efficiency=0.001),
+            _room("L", 28.0, current_open=100.0),
+            _room("S", 25.0),
+        ]
+        plan = {"A": 60.0, "B": 60.0, "L": 100.0, "S": 0.0}
+        _, held = balance.select_fewest_moves(plan, rooms, MODE, SETPOINT_C, _settings())
+        assert held == frozenset({"A"})
+        _, held = balance.select_fewest_moves(
+            plan, rooms, MODE, SETPOINT_C, _settings(), sticky=frozenset({"B"})
+        )
+        assert held == frozenset({"B"})
+
+    def test_satisfied_room_is_not_held_open(self):
+        # The projection clamps S at setpoint, so only R8 keeps it from staying open.
+        rooms = [_room("S", 25.5, current_open=50.0), _room("L", 27.0, current_open=100.0)]
+        plan = {"S": 0.0, "L": 100.0}
+        new, held = balance.select_fewest_moves(plan, rooms, MODE, SETPOINT_C, _settings())
+        assert held == frozenset()
+        assert new == plan
@@ -0,0 +1,178 @@
+"""Tests for ``balance.plan_mpc`` (the model-predictive ``mpc`` strategy).
+
+The planner scores whole aperture plans by rolling the closed-loop law
+forward over the horizon, warm-started from :func:`balance.allocate`. These
+tests pin the contract it shares with ``allocate`` (active rooms only,
+satisfied rooms closed, knee cap, determinism) and the parts that are its
+own (the rollout that holds a room at setpoint, movement cost, bounded
+search on a large house).
+
+balance.py (and learning.py, for real vent curves) is loaded standalone by
+path (no Home Assistant), like the other ``test_balance_*`` modules.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import pathlib
+import random
+import sys
+import time
+from dataclasses import replace
+
+_PKG = pathlib.Path(__file__).resolve().parent.parent / "custom_components" / "hvac_vent_optimizer"
+
+
+def _load(name, filename):
+    spec = importlib.util.spec_from_file_location(name, _PKG / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+balance = _load("hvo_balance", "balance.py")
+learning = _load("hvo_learning", "learning.py")
+
+MODE = "cooling"
+SETPOINT_C = 26.1
+SETTINGS = balance.AllocSettings(crosscoupling=False)
+
+
+def _room(room_id, temp_c, efficiency, *, active=True, current=0.0, curve=None):
+    return balance.RoomAllocInput(
+        room_id=room_id,
+        temp_c=temp_c,
+        active=active,
+        efficiency=efficiency,
+        leak=0.1,
+        current_open=current,
+        vent_ids=(room_id,),
+        signed_error_c=temp_c - SETPOINT_C,
+        curve=curve,
+    )
+
+
+class _KneeCurve:
+    """Duck-typed ``VentCurve``: linear to 50 %, flat above."""
+
+    def flow(self, pct):
+        return min(1.0, 0.1 + 0.9 * min(pct, 50.0) / 50.0)
+
+    def inverse(self, flow):
+        return max(0.0, min(50.0, (flow - 0.1) / 0.9 * 50.0))
+
+    def knee(self):
+        return 50
+
+
+def test_rooms_converge_together_satisfied_closes_inactive_excluded():
+    rooms = [
+        _room("hot", 27.0, 0.05),
+        _room("warm", 26.8, 0.05),
+        _room("cold", 25.7, 0.438, current=60.0),
+        _room("off", 28.0, 0.05, active=False),
+    ]
+    result = balance.plan_mpc(rooms, SETPOINT_C, MODE, SETTINGS)
+
+    assert set(result.targets) == {"hot", "warm", "cold"}
+    assert result.targets["cold"] == 0.0
+    # The less-behind room is throttled below the laggard so they land together.
+    assert 0.0 < result.targets["warm"] < result.targets["hot"]
+    assert result.floor_binding is False
+    assert balance.plan_mpc(rooms, SETPOINT_C, MODE, SETTINGS) == result
+
+
+def test_laggard_that_cannot_finish_runs_full_open():
+    rooms = [_room("hot", 27.9, 0.017), _room("warm", 26.8, 0.05)]
+    result = balance.plan_mpc(rooms, SETPOINT_C, MODE, SETTINGS)
+    assert result.targets["hot"] == 100.0
+    assert result.targets["warm"] < result.targets["hot"]
+
+
+def test_movement_cost_trades_spread_for_travel():
+    rooms = [_room("hot", 27.9, 0.017, current=100.0), _room("warm", 26.8, 0.05, current=100.0)]
+    free = balance.plan_mpc(rooms, SETPOINT_C, MODE, replace(SETTINGS, mpc_movement_cost_c=0.0))
+    sticky = balance.plan_mpc(rooms, SETPOINT_C, MODE, replace(SETTINGS, mpc_movement_cost_c=50.0))
+
+    assert free.targets["warm"] < 100.0
+    assert sticky.targets == {"hot": 100.0, "warm": 100.0}
+
+
+def test_rollout_holds_a_room_at_setpoint_once_reached():
+    times = [5.0, 10.0, 20.0]
+    assert balance._mpc_rollout(1.0, 0.1, times) == (0.5, 0.0, 0.0)
+    # Already past setpoint (leak through a closed vent): it does not drift further.
+    assert balance._mpc_rollout(-0.4, 0.1, times) == (-0.4, -0.4, -0.4)
+
+
+def test_overshoot_the_controller_stops_is_not_scored_as_spread():
+    # The fast room would pass setpoint well inside the horizon. It stops
+    # there (closed next poll), so it is not pulled shut just to avoid an
+    # overshoot the rollout used to count as spread.
+    rooms = [_room("fast", 26.8, 0.3, current=100.0), _room("slow", 27.2, 0.05, current=100.0)]
+    result = balance.plan_mpc(rooms, SETPOINT_C, MODE, SETTINGS)
+    assert result.targets == {"fast": 100.0, "slow": 100.0}
+
+
+def test_candidates_stop_at_the_knee():
+    rooms = [_room("hot", 28.5, 0.017, curve=_KneeCurve()), _room("warm", 26.8, 0.05, curve=_KneeCurve())]
+    result = balance.plan_mpc(rooms, SETPOINT_C, MODE, SETTINGS)
+    assert result.targets["hot"] == 50.0
+    assert "hot" in result.airflow_limited
+    assert result.targets["warm"] <= 50.0
+
+
+def _thirty_rooms():
+    # Learned (regression-seeded) curves, as in production: a curve lookup is
+    # far dearer than the linear model, and a knee below 100 % adds levels.
+    rng = random.Random(7)
+    return [
+        _room(
+            f"r{i}",
+            SETPOINT_C + rng.uniform(-0.5, 3.0),
+            rng.uniform(0.02, 0.15),
+            current=rng.choice([0, 50, 100]),
+            curve=learning.VentCurve.seed_from_regression(
+                rng.uniform(1e-4, 3e-4), rng.uniform(1e-3, 1e-2), 20
+            ),
+        )
+        for i in range(30)
+    ]
+
+
+def test_thirty_rooms_stays_within_the_score_budget(monkeypatch):
+    rooms = _thirty_rooms()
+    calls = 0
+    score = balance._mpc_score
+
+    def _counting_score(*args):
+        nonlocal calls
+        calls += 1
+        return score(*args)
+
+    monkeypatch.setattr(balance, "_mpc_score", _counting_score)
+    result = balance.plan_mpc(rooms, SETPOINT_C, MODE, SETTINGS)
+
+    assert set(result.targets) == {room.room_id for room in rooms}
+    assert all(0.0 <= pct <= 100.0 and pct % SETTINGS.granularity == 0 for pct in result.targets.values())
+    # The budget is about three rollout scores per room (99 here); a search
+    # that stops pruning or sweeps twice (158) blows straight through it.
+    assert calls <= 4 * len(rooms)
+
+
+def _best_of(runs, plan, rooms):
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        plan(rooms, SETPOINT_C, MODE, SETTINGS)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def test_thirty_rooms_plans_within_a_few_allocates():
+    rooms = _thirty_rooms()
+    # About 1.5 ms at 30 rooms with learned curves, two to three times
+    # ``allocate``. Timing against ``allocate`` on the same machine keeps the
+    # bound meaningful on slow CI.
+    assert _best_of(20, balance.plan_mpc, rooms) < 4 * _best_of(20, balance.allocate, rooms)
@@ -0,0 +1,112 @@
+"""Tests for ``balance.ActiveRoomStats`` (incremental active-room observability).
+
+The coordinator keeps the active-room spread, max error, signed errors and
+airflow-limited set incrementally, one room at a time. These tests pin that
+after any sequence of room updates, discards and setpoint changes the
+incremental state equals a from-scratch rebuild, and that an unchanged room is
+a no-op.
+
+balance.py is loaded standalone by path as ``hvo_balance`` (no Home Assistant),
+like the other ``test_balance_*`` modules.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import pathlib
+import random
+import sys
+
+import pytest
+
+_BALANCE_PATH = (
+    pathlib.Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "hvac_vent_optimizer"
+    / "balance.py"
+)
+_spec = importlib.util.spec_from_file_location("hvo_balance", _BALANCE_PATH)
+balance = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = balance
+_spec.loader.exec_module(balance)
+
+ROOMS = ("master", "guest", "office", "bath", "den")
+
+
+def _rebuilt(cells, mode, setpoint, margin, error_c):
+    """The pre-incremental per-poll computation over ``room -> (temp, open, vents)``."""
+    temps = [temp for temp, _, _ in cells.values()]
+    signed = {
+        room: (temp - setpoint) if mode == balance.MODE_COOLING else (setpoint - temp)
+        for room, (temp, _, _) in cells.items()
+    }
+    limited = {
+        room for room, (_, pct, _) in cells.items() if pct >= 100.0 - margin and signed[room] > error_c
+    }
+    return {
+        "spread": (max(temps) - min(temps)) if len(temps) >= 2 else 0.0,
+        "max_error": max((abs(value) for value in signed.values()), default=0.0),
+        "signed": {room: round(value, 2) for room, value in signed.items()},
+        "rooms": limited,
+        "vents": {vent for room in limited for vent in cells[room][2]},
+    }
+
+
+def _state(stats):
+    return {
+        "spread": stats.spread,
+        "max_error": stats.max_error,
+        "signed": dict(stats.signed_errors),
+        "rooms": set(stats.airflow_rooms),
+        "vents": set(stats.airflow_vents),
+    }
+
+
+def test_incremental_state_matches_a_rebuild():
+    rng = random.Random(7)
+    stats = balance.ActiveRoomStats()
+    cells: dict[str, tuple[float, float, tuple[str, ...]]] = {}
+    config = (balance.MODE_COOLING, 23.0, 5.0, 1.0)
+    stats.configure(*config)
+    for step in range(500):
+        room = rng.choice(ROOMS)
+        roll = rng.random()
+        if roll < 0.15:
+            stats.discard(room)
+            cells.pop(room, None)
+        elif roll < 0.2:
+            config = (rng.choice((balance.MODE_COOLING, balance.MODE_HEATING)), rng.uniform(19, 25), 5.0, 1.0)
+            stats.configure(*config)
+        else:
+            vents = tuple(f"{room}_{i}" for i in range(rng.randint(1, 2)))
+            cell = (round(rng.uniform(17, 29), 1), float(rng.choice((0, 50, 95, 100))), vents)
+            stats.update_room(room, *cell)
+            cells[room] = cell
+        expected = _rebuilt(cells, *config)
+        state = _state(stats)
+        assert state.pop("spread") == pytest.approx(expected.pop("spread")), step
+        assert state.pop("max_error") == pytest.approx(expected.pop("max_error")), step
+        assert state == expected, step
+    assert len(stats) == len(cells)
+
+
+def test_unchanged_room_and_settings_are_no_ops():
+    stats = balance.ActiveRoomStats()
+    stats.configure(balance.MODE_COOLING, 23.0, 5.0, 1.0)
+    assert stats.update_room("master", 25.5, 100.0, ("v1", "v2")) is True
+    assert stats.update_room("guest", 22.0, 0.0, ("v3",)) is True
+    assert stats.update_room("master", 25.5, 100.0, ("v1", "v2")) is False
+    assert stats.configure(balance.MODE_COOLING, 23.0, 5.0, 1.0) is False
+    assert stats.spread == pytest.approx(3.5) and stats.max_error == pytest.approx(2.5)
+    assert stats.airflow_rooms == {"master"} and stats.airflow_vents == {"v1", "v2"}
+    assert stats.room_for_vent("v2") == "master" and stats.vents("master") == ("v1", "v2")
+
+    # Heating at the same setpoint: master is now overheated, guest is short.
+    assert stats.configure(balance.MODE_HEATING, 23.0, 5.0, 1.0) is True
+    assert stats.signed_errors == {"master": -2.5, "guest": 1.0}
+    assert stats.airflow_rooms == set() and stats.airflow_vents == set()
+
+    assert stats.retain(["guest"]) == {"master"}
+    assert stats.spread == 0.0 and stats.max_error == pytest.approx(1.0)
+    assert stats.room_for_vent("v1") is None and "master" not in stats
+    assert stats.discard("master") is False
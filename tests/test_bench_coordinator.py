@@ -0,0 +1,58 @@
+"""Smoke tests for the coordinator throughput benchmark (``tests/bench_coordinator.py``).
+
+Runs a tiny structure against the in-process fake Flair server so the harness,
+its request accounting and the percentile summary stay working as the
+coordinator evolves. The benchmark itself is run by hand:
+
+    python -m tests.bench_coordinator --cycles 20 --latency-ms 40 --jitter 0.5
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from tests import bench_coordinator as bench
+
+
+def test_percentile_interpolates_between_ranks():
+    values = [10.0, 20.0, 30.0, 40.0]
+    assert bench.percentile(values, 0) == 10.0
+    assert bench.percentile(values, 100) == 40.0
+    assert bench.percentile(values, 50) == pytest.approx(25.0)
+    assert bench.percentile([], 95) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_benchmark_counts_requests_per_poll():
+    cfg = bench.BenchConfig(vents=6, pucks=2, cycles=3)
+    report = await bench.run_benchmark(cfg)
+
+    assert report.failed_polls == 0
+    per_poll = report.requests_by_endpoint
+    # One list call each, then a reading + room call per device every poll.
+    assert per_poll["GET /api/structures/{id}/vents"] == 1
+    assert per_poll["GET /api/structures/{id}/pucks"] == 1
+    assert per_poll["PATCH /api/structures/{id}"] == 1
+    assert per_poll["GET /api/vents/{id}/current-reading"] == 6
+    assert per_poll["GET /api/vents/{id}/room"] == 6
+    assert per_poll["GET /api/pucks/{id}/current-reading"] == 2
+    # 4 rooms, every other one with a remote sensor: fetched once per poll each.
+    assert per_poll["GET /api/remote-sensors/{id}/current-reading"] == 2
+    # Token is fetched during warm-up only.
+    assert "POST /oauth2/token" not in per_poll
+    assert report.requests_per_poll == pytest.approx(sum(per_poll.values()))
+
+    for phase in bench.PHASES:
+        stats = report.phases_ms[phase]
+        assert 0.0 <= stats["p50"] <= stats["p95"] <= stats["p99"] <= stats["max"]
+    assert report.phases_ms["poll"]["mean"] >= report.phases_ms["lock_hold"]["mean"]
+
+
+@pytest.mark.asyncio
+async def test_benchmark_survives_injected_429s():
+    cfg = bench.BenchConfig(vents=6, pucks=2, cycles=4, rate_limit_prob=0.3, seed=3)
+    report = await bench.run_benchmark(cfg)
+
+    assert report.throttled > 0
+    assert report.cycles == 4
+    assert "429s served" in report.format()
@@ -6,7 +6,8 @@ when ``control_strategy == "balance"`` the coordinator:
 
 * gathers a ``RoomAllocInput`` per room (room temp in Celsius, active flag,
   current %open, group vent_ids, effective_rate, leak),
-* calls ``balance.allocate`` then routes the result through the single
+* calls ``balance.allocate_exact``, holds what ``balance.select_fewest_moves``
+  allows, then routes the result through the single
   ``balance.apply_safety_floor`` choke point (no bypass), and
 * dispatches vent commands (Flair API rate-limiting preserved),
 
@@ -265,20 +266,87 @@ def test_legacy_strategies_do_not_route_through_balance(monkeypatch, strategy):
     from hvac_vent_optimizer import coordinator as coord_mod
 
     called = {"allocate": False}
-    real = coord_mod.allocate
+    real = coord_mod.allocate_exact
 
     def spy(*a, **k):
         called["allocate"] = True
         return real(*a, **k)
 
-    monkeypatch.setattr(coord_mod, "allocate", spy)
+    monkeypatch.setattr(coord_mod, "allocate_exact", spy)
 
     coord, _api, thermostat, data = _build(
         [{"id": "v1", "name": "Room1", "temp": 27.0, "active": True, "open": 0, "eff": 0.5}],
         strategy=strategy,
     )
     _run(coord, thermostat, data)
-    assert called["allocate"] is False, f"legacy strategy '{strategy}' must not call balance.allocate"
+    assert called["allocate"] is False, f"legacy strategy '{strategy}' must not call the balance allocator"
+
+
+def test_mpc_strategy_plans_by_rollout_and_keeps_the_floor(monkeypatch):
+    from hvac_vent_optimizer import coordinator as coord_mod
+
+    seen = {"plan_mpc": False, "floor": False}
+    real_plan, real_floor = coord_mod.plan_mpc, coord_mod.apply_safety_floor
+
+    def plan_spy(*a, **k):
+        seen["plan_mpc"] = True
+        return real_plan(*a, **k)
+
+    def floor_spy(targets, rooms, settings):
+        seen["floor"] = True
+        return real_floor(targets, rooms, settings)
+
+    monkeypatch.setattr(coord_mod, "plan_mpc", plan_spy)
+    monkeypatch.setattr(coord_mod, "apply_safety_floor", floor_spy)
+
+    coord, api, thermostat, data = _build(
+        [
+            {"id": "hot", "name": "Bedroom 2", "temp": 27.9, "active": True, "open": 0, "eff": 0.017},
+            {"id": "cold", "name": "Bathroom", "temp": 22.0, "active": True, "open": 0, "eff": 0.438},
+        ],
+        strategy="mpc",
+    )
+    _run(coord, thermostat, data)
+
+    assert seen == {"plan_mpc": True, "floor": True}
+    calls = _calls(api)
+    assert calls.get("cold", 0) == 0
+    assert calls.get("hot", 0) > calls.get("cold", 0)
+
+
+def test_balance_plan_selection_skips_marginal_moves_and_marks_cooldown_sticky(monkeypatch):
+    from datetime import UTC, datetime
+
+    from hvac_vent_optimizer import coordinator as coord_mod
+
+    seen = {}
+    real = coord_mod.select_fewest_moves
+
+    def spy(*a, **k):
+        seen["sticky"] = k.get("sticky")
+        seen["plan"] = dict(a[0])
+        seen["selected"], seen["held"] = real(*a, **k)
+        return seen["selected"], seen["held"]
+
+    monkeypatch.setattr(coord_mod, "select_fewest_moves", spy)
+
+    coord, api, thermostat, data = _build(
+        [
+            {"id": "hot", "name": "Bedroom 2", "temp": 27.9, "active": True, "open": 100, "eff": 0.017},
+            {"id": "warm", "name": "Bedroom 3", "temp": 24.4, "active": True, "open": 40, "eff": 0.05},
+            {"id": "mid", "name": "Bedroom 1", "temp": 24.6, "active": True, "open": 30, "eff": 0.05},
+        ]
+    )
+    coord._vent_last_commanded["warm"] = datetime.now(UTC)
+    _run(coord, thermostat, data)
+
+    # The cooldown room is offered first; the plan's 30 -> 20 move on mid is
+    # worth less than the spread deadband, so mid holds and is never PATCHed.
+    assert seen["sticky"] == frozenset({"Bedroom 3"})
+    assert seen["plan"]["Bedroom 1"] != 30.0
+    assert "Bedroom 1" in seen["held"]
+    assert seen["selected"]["Bedroom 1"] == 30.0
+    assert "mid" not in _calls(api)
 
 
 # ---------------------------------------------------------------------------
@@ -308,13 +376,13 @@ def test_balance_gather_passes_ventcurve_on_room_alloc_input(monkeypatch):
     from hvac_vent_optimizer.learning import VentCurve
 
     captured = {}
-    real = coord_mod.allocate
+    real = coord_mod.allocate_exact
 
     def spy(rooms, setpoint, mode, settings, *a, **k):
         captured["rooms"] = rooms
         return real(rooms, setpoint, mode, settings, *a, **k)
 
-    monkeypatch.setattr(coord_mod, "allocate", spy)
+    monkeypatch.setattr(coord_mod, "allocate_exact", spy)
 
     coord, _api, thermostat, data = _build(
         [
@@ -324,7 +392,7 @@ def test_balance_gather_passes_ventcurve_on_room_alloc_input(monkeypatch):
     )
     _run(coord, thermostat, data)
 
-    assert "rooms" in captured, "balance.allocate must be called for the balance strategy"
+    assert "rooms" in captured, "balance.allocate_exact must be called for the balance strategy"
     assert captured["rooms"], "at least one room must be gathered"
     for room in captured["rooms"]:
         assert room.curve is not None, f"room {room.room_id} must carry a VentCurve"
@@ -0,0 +1,257 @@
+"""Coordinator history bootstrap (``bootstrap_history``).
+
+The bootstrap reads the recorder's history of the assigned entities in chunks,
+rebuilds the HVAC cycles from it and feeds them to the live learners. These
+tests replace the ``recorder.history`` queries with an in-memory history and
+pin that a recorded cycle teaches the same room rate as a live finalize, that
+history ends where learning began (the persisted ``learned_since`` watermark,
+not the evictable archive) and is archived ahead of the live cycles, that a
+chunk stops loading at the state cap and is retried over a shorter span, and
+that a second run is refused while one is in progress.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from homeassistant.components.recorder import history
+from homeassistant.helpers import entity_registry as er
+
+from hvac_vent_optimizer import coordinator as coordinator_mod
+from hvac_vent_optimizer.const import DOMAIN
+from tests.test_coordinator_learning import _build, _seed_cycle_with_samples
+
+ROOMS = [{"id": "v1", "name": "Room1", "temp": 25.0, "active": True, "open": 50, "eff": 0.5}]
+THERMOSTAT = "climate.t"
+ROOM_TEMP = "sensor.room1_temperature"
+APERTURE = "sensor.room1_vent_aperture"
+
+
+def _register(hass):
+    registry = er.async_get(hass)
+    registry.entity_ids[("sensor", DOMAIN, "entry1_room_room_v1_room_temperature")] = ROOM_TEMP
+    registry.entity_ids[("sensor", DOMAIN, "entry1_vent_v1_aperture")] = APERTURE
+
+
+def _cycle_history(started):
+    """One recorded cooling cycle matching ``_seed_cycle_with_samples``'s readings."""
+    cycle_start = started - timedelta(minutes=1)  # started_running = action start + 1 min
+    climate = {"temperature": 23.0, "temperature_unit": "°C"}
+    return [
+        (cycle_start - timedelta(hours=2), THERMOSTAT, "cool", {**climate, "hvac_action": "idle"}),
+        (cycle_start - timedelta(hours=1), APERTURE, "50", {"unit_of_measurement": "%"}),
+        (cycle_start, THERMOSTAT, "cool", {**climate, "hvac_action": "cooling"}),
+        (started + timedelta(minutes=3), ROOM_TEMP, "26.0", {"unit_of_measurement": "°C"}),
+        (started + timedelta(minutes=9), ROOM_TEMP, "77.0", {"unit_of_measurement": "°F"}),
+        (started + timedelta(minutes=20), THERMOSTAT, "cool", {**climate, "hvac_action": "idle"}),
+    ]
+
+
+@pytest.fixture
+def recorded(monkeypatch):
+    """Serve ``rows`` as the recorder history.
+
+    ``calls`` records each chunk fetched as ``(start, end, include_start)``, and
+    ``loaded`` how many states each attempt loaded. ``state_changes_during_period``
+    honours ``limit`` like the recorder's.
+    """
+    rows: list[tuple[datetime, str, str, dict]] = []
+    calls: list[tuple[datetime, datetime, bool]] = []
+    loaded: list[int] = []
+
+    def _states(start_time, end_time, entity_ids):
+        states: dict[str, list] = {}
+        for t, entity_id, state, attributes in rows:
+            if start_time <= t < end_time and entity_id in entity_ids:
+                states.setdefault(entity_id, []).append(
+                    SimpleNamespace(last_updated=t, state=state, attributes=attributes)
+                )
+        return states
+
+    def _query(start_time, end_time, include_start):
+        if not calls or calls[-1] != (start_time, end_time, include_start):
+            calls.append((start_time, end_time, include_start))
+            loaded.append(0)
+
+    def get_significant_states(hass, start_time, end_time=None, entity_ids=None, **kwargs):
+        _query(start_time, end_time, kwargs.get("include_start_time_state"))
+        states = _states(start_time, end_time, entity_ids)
+        loaded[-1] += sum(len(found) for found in states.values())
+        return states
+
+    def state_changes_during_period(hass, start_time, end_time=None, entity_id=None, **kwargs):
+        _query(start_time, end_time, kwargs.get("include_start_time_state"))
+        states = {
+            key: found[: kwargs.get("limit")]
+            for key, found in _states(start_time, end_time, [entity_id]).items()
+        }
+        loaded[-1] += sum(len(found) for found in states.values())
+        return states
+
+    monkeypatch.setattr(history, "get_significant_states", get_significant_states)
+    monkeypatch.setattr(history, "state_changes_during_period", state_changes_during_period)
+    return SimpleNamespace(rows=rows, calls=calls, loaded=loaded)
+
+
+def test_recorded_cycle_teaches_what_a_live_finalize_would(recorded):
+    live, _hass, _api, thermostat, _data = _build(ROOMS, target_temp=23.0)
+    _seed_cycle_with_samples(live, thermostat, "v1")
+    asyncio.run(live._async_finalize_cycle(thermostat, "cooling", ["v1"], None))
+
+    coord, hass, _api, _thermostat, _data = _build(ROOMS, target_temp=23.0)
+    _register(hass)
+    recorded.rows.extend(_cycle_history(datetime.now(UTC) - timedelta(hours=10)))
+    report = asyncio.run(coord.async_bootstrap_history(days=1))
+
+    assert report["state"] == "done" and report["progress_pct"] == 100.0
+    assert (report["cycles"], report["samples"], report["rejected"]) == (1, 1, 0)
+    model = coord._room_efficiency_models["Room1"]
+    assert model.cooling.n == 1
+    assert model.cooling.baseline == pytest.approx(live._room_efficiency_models["Room1"].cooling.baseline)
+    (record,) = coord._cycle_archive.records()
+    assert record.vents[0].temps == [26.0, 25.0]
+    assert coord.get_bootstrap_status() == report
+    # Sparse chunks double the span (6 h, 12 h, then the last 6 h); only the
+    # first chunk asks for the state at its start.
+    assert [(end - start) / timedelta(hours=1) for start, end, _ in recorded.calls] == [6, 12, 6]
+    assert [include for _, _, include in recorded.calls] == [True, False, False]
+
+
+def test_history_ends_where_live_learning_began(recorded):
+    coord, hass, _api, thermostat, _data = _build(ROOMS, target_temp=23.0)
+    _register(hass)
+    _seed_cycle_with_samples(coord, thermostat, "v1")
+    asyncio.run(coord._async_finalize_cycle(thermostat, "cooling", ["v1"], None))
+    (archived,) = coord._cycle_archive.records()
+
+    # The archived cycle is also in the history; only the older one is learned.
+    recorded.rows.extend(_cycle_history(datetime.now(UTC) - timedelta(hours=10)))
+    recorded.rows.extend(_cycle_history(datetime.fromtimestamp(archived.started_s, UTC)))
+    report = asyncio.run(coord.async_bootstrap_history(days=1))
+
+    assert report["cycles"] == 1
+    assert coord._room_efficiency_models["Room1"].cooling.n == 2
+    records = list(coord._cycle_archive.records())
+    assert len(records) == 2 and records[1] == archived
+    assert records[0].started_s < archived.started_s
+    assert coord._archive_store.saved == coord._cycle_archive.to_json()
+    # Learning now reaches back the whole day read.
+    assert coord._learned_since == pytest.approx(archived.started_s - timedelta(days=1).total_seconds())
+
+
+def test_cycles_evicted_from_the_archive_are_not_learned_again(recorded):
+    coord, hass, _api, thermostat, _data = _build(ROOMS, target_temp=23.0)
+    _seed_cycle_with_samples(coord, thermostat, "v1")
+    asyncio.run(coord._async_finalize_cycle(thermostat, "cooling", ["v1"], None))
+    (archived,) = coord._cycle_archive.records()
+    asyncio.run(coord._async_save_state())
+
+    # After a restart the archive has evicted the cycle; the watermark is kept.
+    fresh, hass, _api, _thermostat, _data = _build(ROOMS, target_temp=23.0)
+    _register(hass)
+    saved = coord._store.saved
+
+    async def _load():
+        return saved
+
+    fresh._store.async_load = _load
+    asyncio.run(fresh.async_initialize())
+    assert list(fresh._cycle_archive.records()) == []
+    assert fresh._learned_since == archived.started_s
+
+    recorded.rows.extend(_cycle_history(datetime.now(UTC) - timedelta(hours=10)))
+    recorded.rows.extend(_cycle_history(datetime.fromtimestamp(archived.started_s, UTC)))
+    report = asyncio.run(fresh.async_bootstrap_history(days=1))
+
+    assert report["cycles"] == 1
+    assert report["end"] == datetime.fromtimestamp(archived.started_s, UTC).isoformat()
+
+
+def test_store_without_a_watermark_reads_history_from_before_the_install(recorded):
+    coord, hass, _api, _thermostat, _data = _build(ROOMS, target_temp=23.0)
+    _register(hass)
+    installed = datetime.now(UTC) - timedelta(hours=5)
+    coord.entry.created_at = installed
+
+    async def _load():
+        return {"hold_count": 0}  # saved before ``learned_since`` existed
+
+    coord._store.async_load = _load
+    asyncio.run(coord.async_initialize())
+
+    # The later cycle was learned live after the install; only the older one is read.
+    recorded.rows.extend(_cycle_history(datetime.now(UTC) - timedelta(hours=10)))
+    recorded.rows.extend(_cycle_history(datetime.now(UTC) - timedelta(hours=2)))
+    report = asyncio.run(coord.async_bootstrap_history(days=1))
+
+    assert report["end"] == installed.isoformat()
+    assert report["cycles"] == 1
+    assert coord._learned_since == pytest.approx((installed - timedelta(days=1)).timestamp())
+    assert coord._store.saved["learned_since"] == coord._learned_since
+
+
+def test_chunk_span_shrinks_under_the_state_cap(recorded, monkeypatch):
+    monkeypatch.setattr(coordinator_mod, "BOOTSTRAP_MAX_CHUNK_STATES", 4)
+    coord, hass, _api, _thermostat, _data = _build(ROOMS, target_temp=23.0)
+    _register(hass)
+    recorded.rows.extend(_cycle_history(datetime.now(UTC) - timedelta(hours=20)))
+    report = asyncio.run(coord.async_bootstrap_history(days=1))
+
+    # The first chunk holds the whole cycle (6 states > 4): loading stops at
+    # the cap and the same start is retried over half the span.
+    spans = [(end - start) / timedelta(hours=1) for start, end, _ in recorded.calls]
+    assert spans[:2] == [6, 3]
+    assert recorded.calls[0][0] == recorded.calls[1][0]
+    assert max(recorded.loaded) <= 4 + 1
+    assert report["cycles"] == 1 and report["states"] == 6
+    assert report["chunks"] < len(spans)
+
+
+def test_thermostat_is_read_with_its_attributes_and_sensors_are_capped(recorded, monkeypatch):
+    queries: list[tuple[str, object]] = []
+    significant, changes = history.get_significant_states, history.state_changes_during_period
+
+    def _significant(hass, start_time, end_time=None, entity_ids=None, **kwargs):
+        queries.extend((entity_id, None) for entity_id in entity_ids)
+        return significant(hass, start_time, end_time, entity_ids, **kwargs)
+
+    def _changes(hass, start_time, end_time=None, entity_id=None, **kwargs):
+        queries.append((entity_id, kwargs["limit"]))
+        return changes(hass, start_time, end_time, entity_id, **kwargs)
+
+    monkeypatch.setattr(history, "get_significant_states", _significant)
+    monkeypatch.setattr(history, "state_changes_during_period", _changes)
+    coord, hass, _api, _thermostat, _data = _build(ROOMS, target_temp=23.0)
+    _register(hass)
+    recorded.rows.extend(_cycle_history(datetime.now(UTC) - timedelta(hours=3)))
+    asyncio.run(coord.async_bootstrap_history(days=1))
+
+    first = queries[:3]
+    cap = coordinator_mod.BOOTSTRAP_MAX_CHUNK_STATES
+    assert first[0] == (THERMOSTAT, None)  # hvac_action is an attribute: not a state change
+    assert {entity_id for entity_id, _limit in first[1:]} == {ROOM_TEMP, APERTURE}
+    assert all(limit is not None and limit <= cap + 1 for _entity_id, limit in first[1:])
+
+
+def test_chunk_over_the_cap_at_the_smallest_span_fails(recorded, monkeypatch):
+    monkeypatch.setattr(coordinator_mod, "BOOTSTRAP_MAX_CHUNK_STATES", 1)
+    coord, hass, _api, _thermostat, _data = _build(ROOMS, target_temp=23.0)
+    _register(hass)
+    started = datetime.now(UTC) - timedelta(hours=20)
+    for offset in (0, 10, 20):
+        recorded.rows.append((started + timedelta(seconds=offset), ROOM_TEMP, "25.0", {}))
+    with pytest.raises(ValueError):
+        asyncio.run(coord.async_bootstrap_history(days=1))
+    assert coord.get_bootstrap_status()["state"] == "failed"
+
+
+def test_second_bootstrap_while_running_is_refused(recorded):
+    coord, hass, _api, _thermostat, _data = _build(ROOMS, target_temp=23.0)
+    _register(hass)
+    coord._bootstrap_status = {"state": "running"}
+    with pytest.raises(ValueError):
+        asyncio.run(coord.async_bootstrap_history(days=1))
+    assert recorded.calls == []
@@ -22,6 +22,7 @@ room model falls back to the existing effective-rate source — never crashing.
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Mapping
 from datetime import UTC, datetime, timedelta
 
 import pytest
@@ -227,6 +228,40 @@ def test_build_context_graceful_when_outdoor_unavailable():
     assert ctx.doors_open is None  # unknown door -> tri-state None
 
 
+def test_build_context_is_cached_per_room_within_a_poll():
+    rooms = [
+        {"id": "v1", "name": "Room1", "temp": 27.0, "active": True, "open": 0, "eff": 0.05},
+        {"id": "v2", "name": "Room1", "temp": 27.0, "active": True, "open": 0, "eff": 0.05},  # same room
+        {"id": "v3", "name": "Room2", "temp": 27.0, "active": True, "open": 0, "eff": 0.05},
+    ]
+    coord, hass, _api, _therm, data = _build(
+        rooms,
+        outdoor_entity="sensor.outdoor",
+        door_assignments={"v1": "binary_sensor.door", "v2": "binary_sensor.door"},
+    )
+    hass.states.set("sensor.outdoor", FakeState("30.0", {"unit_of_measurement": "°C"}))
+    hass.states.set("binary_sensor.door", FakeState("on"))
+    reads: list[str] = []
+    get = hass.states.get
+    hass.states.get = lambda entity_id: reads.append(entity_id) or get(entity_id)
+
+    coord._room_contexts = {}  # what _async_update_data opens for a poll
+    contexts = [coord._build_context(vent_id, data) for vent_id in ("v1", "v2", "v3", "v1", "v3")]
+    assert reads.count("sensor.outdoor") == 1 and reads.count("sun.sun") == 1
+    assert reads.count("binary_sensor.door") == 1
+    assert contexts[0] is contexts[1] is contexts[3] and contexts[2] is contexts[4]
+    assert contexts[0].doors_open is True and contexts[2].doors_open is None
+    assert contexts[2].outdoor_band == 2
+
+    # Outside a poll every build reads the current states.
+    coord._house_context = coord._room_contexts = None
+    hass.states.set("binary_sensor.door", FakeState("off"))
+    reads.clear()
+    assert coord._build_context("v1", data).doors_open is False
+    assert coord._build_context("v1", data).doors_open is False
+    assert reads.count("sensor.outdoor") == 2
+
+
 # ---------------------------------------------------------------------------
 # 3. effective_rate is sourced from the learned per-room model + regime.
 # ---------------------------------------------------------------------------
@@ -434,7 +469,7 @@ def test_fresh_coordinator_has_empty_door_factor_models():
         [{"id": "v1", "name": "Room1", "temp": 27.0, "active": True, "open": 0, "eff": 0.05}],
     )
     # A fresh coordinator exposes an empty door-factor store (R26.4).
-    assert isinstance(coord._door_factor_models, dict)
+    assert isinstance(coord._door_factor_models, Mapping)
     assert coord._door_factor_models == {}
 
 
@@ -444,7 +479,7 @@ def test_door_factor_models_keyed_by_room_name_falling_back_to_vent_id():
     )
     door_models = coord._door_factor_models
     room_models = coord._room_efficiency_models
-    assert isinstance(door_models, dict)
+    assert isinstance(door_models, Mapping)
     assert door_models == {}
 
     # Named room -> key is the room name, identical to the room-efficiency
@@ -26,6 +26,9 @@ from __future__ import annotations
 import asyncio
 import json
 from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
 
 from hvac_vent_optimizer import const
 from tests._fakes import FakeApi, FakeEntry, FakeHass, FakeState
@@ -172,6 +175,65 @@ def test_airflow_limited_flag_set_for_pinned_hot_room():
     assert coord.is_room_airflow_limited("room_guest") is False
 
 
+def test_room_temp_sensor_updates_observability_between_polls(monkeypatch):
+    from hvac_vent_optimizer import coordinator as coordinator_mod
+
+    tracked = []
+    monkeypatch.setattr(
+        coordinator_mod,
+        "async_track_state_change_event",
+        lambda hass, entity_id, action: tracked.append(entity_id) or (lambda: None),
+    )
+    coord, _api, thermostat, data = _build(_ROOMS)
+    coord.entry.options[const.CONF_VENT_ASSIGNMENTS]["bath"][const.CONF_TEMP_SENSOR_ENTITY] = "sensor.bath"
+    coord.hass.states.set("sensor.bath", FakeState("22.0", {"unit_of_measurement": "°C"}))
+    asyncio.run(coord.async_setup_thermostat_listeners())
+    assert "sensor.bath" in tracked
+    _run(coord, thermostat, data)
+    assert coord.get_active_room_spread() == 5.9
+    notified = []
+    coord.async_add_observability_listener(lambda: notified.append(True))
+    coord.async_update_listeners = lambda: pytest.fail("every coordinator listener was notified")
+
+    # Bathroom warms to 77 °F (25 °C): spread and its signed error follow
+    # without a poll; the bedroom still bounds the spread. Only the
+    # observability entities are refreshed.
+    coord.hass.states.set("sensor.bath", FakeState("77.0", {"unit_of_measurement": "°F"}))
+    coord._handle_room_temp_event(SimpleNamespace(data={"entity_id": "sensor.bath"}))
+    assert coord.get_active_room_spread() == 2.9
+    assert notified == [True]
+    setpoint = coord._get_thermostat_setpoint(thermostat, "cooling")
+    assert coord.get_room_signed_error("room_bath") == round(25.0 - setpoint, 2)
+
+    # The next poll drops a room that went inactive.
+    data["vents"]["bedroom_2"]["room"]["attributes"]["active"] = False
+    _run(coord, thermostat, data)
+    assert coord.get_active_room_spread() == 0.0
+    assert coord.is_room_airflow_limited("room_bedroom_2") is False
+    assert coord.get_room_signed_error("room_bedroom_2") is None
+
+
+def test_room_temp_event_after_an_idle_poll_is_ignored():
+    coord, _api, thermostat, data = _build(_ROOMS)
+    coord.entry.options[const.CONF_VENT_ASSIGNMENTS]["bath"][const.CONF_TEMP_SENSOR_ENTITY] = "sensor.bath"
+    coord.hass.states.set("sensor.bath", FakeState("22.0", {"unit_of_measurement": "°C"}))
+    asyncio.run(coord.async_setup_thermostat_listeners())
+    asyncio.run(coord._async_process_dab(data))
+    assert coord.get_active_room_spread() == 5.9
+    notified = []
+    coord.async_add_observability_listener(lambda: notified.append(True))
+
+    # The thermostat goes idle: the next poll leaves the last cycle's stats
+    # and a room sensor change no longer moves them.
+    state = coord.hass.states.get(thermostat)
+    coord.hass.states.set(thermostat, FakeState("cool", {**state.attributes, "hvac_action": "idle"}))
+    asyncio.run(coord._async_process_dab(data))
+    coord.hass.states.set("sensor.bath", FakeState("77.0", {"unit_of_measurement": "°F"}))
+    coord._handle_room_temp_event(SimpleNamespace(data={"entity_id": "sensor.bath"}))
+    assert coord.get_active_room_spread() == 5.9
+    assert notified == []
+
+
 # ---------------------------------------------------------------------------
 # Per-strategy spread metrics (R13.4)
 # ---------------------------------------------------------------------------
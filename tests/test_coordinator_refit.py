@@ -0,0 +1,146 @@
+"""Coordinator cycle sample archive and the ``refit_models`` re-fit.
+
+Every finalize appends the cycle's raw per-vent readings to the archive. The
+re-fit replays the archive through the finalize learning path in an executor
+and swaps the rebuilt room, door-factor and curve models in. These tests pin
+that a replay of the same cycles rebuilds the live room model exactly, that the
+report lists what differs, that ``dry_run`` and an empty archive leave the live
+models alone, that live models with more samples than the bounded archive holds
+are kept, and that the archive survives a restart.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from hvac_vent_optimizer import learning
+from tests.test_coordinator_learning import _build, _seed_cycle_with_samples
+
+ROOMS = [
+    {"id": "v1", "name": "Room1", "temp": 25.0, "active": True, "open": 50, "eff": 0.5},
+    {"id": "v2", "name": "Room2", "temp": 25.0, "active": True, "open": 50, "eff": 0.5},
+]
+
+
+def _run_cycles(coord, thermostat, count):
+    for _ in range(count):
+        _seed_cycle_with_samples(coord, thermostat, "v1")
+        asyncio.run(coord._async_finalize_cycle(thermostat, "cooling", ["v1", "v2"], None))
+
+
+def test_finalize_archives_raw_samples():
+    coord, _hass, _api, thermostat, _data = _build(ROOMS, target_temp=23.0)
+    _run_cycles(coord, thermostat, 1)
+
+    (record,) = coord._cycle_archive.records()
+    assert record.action == "cooling" and record.setpoint == pytest.approx(23.0)
+    (vent,) = record.vents  # v2 had no samples this cycle
+    assert (vent.vent_id, vent.room_key, vent.doors_open) == ("v1", "Room1", None)
+    assert vent.offsets_s == [180.0, 540.0]
+    assert vent.temps == [26.0, 25.0] and vent.apertures == [50.0, 50.0] and vent.ducts == [None, None]
+    assert coord._archive_store.saved == coord._cycle_archive.to_json()
+
+
+def test_refit_rebuilds_live_models_and_reports_differences():
+    coord, _hass, _api, thermostat, _data = _build(ROOMS, target_temp=23.0)
+    _run_cycles(coord, thermostat, 3)
+    live = coord._room_models.efficiency_to_dict()
+
+    report = asyncio.run(coord.async_refit_models(dry_run=True))
+    assert (report["cycles"], report["samples"], report["rejected"]) == (3, 3, 0)
+    assert report["applied"] is False
+    assert report["changes"]["room_efficiency"] == {}
+    # Cycles 2 and 3 had a positive door-closed reference to shape v1's curve.
+    assert report["changes"]["vent_curves"]["v1"]["cooling"]["samples"] == [0, 2]
+    assert "v1" not in coord._vent_effectiveness
+
+    # Drift the live model and keep an unarchived room: the re-fit restores the
+    # archived room, lists the drift, and leaves the other room as it was.
+    coord._room_efficiency_models["Room1"] = learning.seed_room_model_from_v1({"cooling": 0.5})
+    coord._room_efficiency_models["Attic"] = learning.seed_room_model_from_v1({"heating": 0.1})
+    report = asyncio.run(coord.async_refit_models())
+
+    assert report["applied"] is True
+    changed = report["changes"]["room_efficiency"]
+    assert list(changed) == ["Room1"]
+    assert changed["Room1"]["cooling"]["baseline"] == [0.5, live["Room1"]["cooling"]["baseline"]]
+    assert coord._room_models.efficiency_to_dict() == {
+        **live,
+        "Attic": learning.room_model_to_dict(learning.seed_room_model_from_v1({"heating": 0.1})),
+    }
+    curve = coord._vent_effectiveness["v1"]["cooling"]["curve"]
+    assert sum(curve["counts"]) == 2
+    assert coord._store.saved["room_efficiency"]["Room1"] == live["Room1"]
+
+
+def test_refit_with_empty_archive_keeps_live_models():
+    coord, _hass, _api, _thermostat, _data = _build(ROOMS, target_temp=23.0)
+    coord._room_efficiency_models["Room1"] = learning.seed_room_model_from_v1({"cooling": 0.5})
+
+    report = asyncio.run(coord.async_refit_models())
+    assert report["cycles"] == 0 and report["applied"] is False
+    assert report["changes"] == {"room_efficiency": {}, "door_factor": {}, "vent_curves": {}}
+    assert coord._room_efficiency_models["Room1"].cooling.baseline == 0.5
+
+
+def test_refit_keeps_mature_live_models_the_short_archive_cannot_rebuild():
+    coord, _hass, _api, thermostat, _data = _build(ROOMS, target_temp=23.0)
+    _run_cycles(coord, thermostat, 3)
+
+    # Months of live learning, most of it long gone from the bounded archive.
+    mature = learning.room_model_from_dict(
+        {
+            "cooling": {"baseline": 0.2, "n": 500, "regimes": [{"rate": 0.2, "n": 500}]},
+            "heating": {"baseline": 0.1, "n": 0},
+        }
+    )
+    coord._room_efficiency_models["Room1"] = mature
+    coord._door_factor_models["Room1"] = learning.door_factor_from_dict({"cooling": {"factor": 0.6, "n": 80}})
+    curve = learning.VentCurve.from_dict(learning.seed_linear_curve(0.1))
+    curve.update_many([float(a) for a in range(0, 101, 5)] * 20, [a / 100.0 for a in range(0, 101, 5)] * 20)
+    coord._vent_effectiveness["v1"] = {"cooling": {"leak": 0.1, "n": 0, "curve": curve.to_dict()}}
+
+    report = asyncio.run(coord.async_refit_models())
+
+    assert report["applied"] is True
+    assert report["kept_live"] == {
+        "room_efficiency": {"Room1": ["cooling"]},
+        "door_factor": {},  # no door-open cycle archived: kept outright, as an unseen room
+        "vent_curves": {"v1": ["cooling"]},
+    }
+    assert report["changes"]["room_efficiency"] == {} and report["changes"]["vent_curves"] == {}
+    assert coord._room_models.efficiency_to_dict()["Room1"] == learning.room_model_to_dict(mature)
+    assert coord._door_factor_models["Room1"].cooling.n == 80
+    assert coord._vent_effectiveness["v1"]["cooling"]["curve"] == curve.to_dict()
+
+
+def test_archive_survives_restart_and_late_cycles_are_replayed():
+    coord, _hass, _api, thermostat, _data = _build(ROOMS, target_temp=23.0)
+    _run_cycles(coord, thermostat, 2)
+    saved = coord._archive_store.saved
+
+    fresh, _hass, _api, _thermostat, _data = _build(ROOMS, target_temp=23.0)
+
+    async def _load():
+        return saved
+
+    fresh._archive_store.async_load = _load
+    asyncio.run(fresh.async_initialize())
+    assert list(fresh._cycle_archive.records()) == list(coord._cycle_archive.records())
+
+    # A cycle archived after the executor snapshot is replayed before the swap.
+    late = coord._cycle_archive.since(coord._cycle_archive.appended - 1)[0]
+    replay_on_executor = fresh._replay_cycle_archive
+
+    def _replay_then_archive(records, leaks, refit=None):
+        result = replay_on_executor(records, leaks, refit)
+        if refit is None:  # the executor pass, not the catch-up
+            fresh._cycle_archive.append(late)
+        return result
+
+    fresh._replay_cycle_archive = _replay_then_archive
+    report = asyncio.run(fresh.async_refit_models())
+    assert report["cycles"] == 3
+    assert fresh._room_models.efficiency["Room1"].cooling.n == 3
@@ -243,6 +243,22 @@ def test_safety_floor_never_violated(name):
     )
 
 
+# Procedural large-house scenarios (``simulator.STRESS_SCENARIOS``), all run on
+# the adaptive clock (about 7 s for the four together, most of it floor_200).
+# ``python -m tests.bench_simulator`` reports the same outcomes with timings.
+@pytest.mark.parametrize("name", sorted(simulator.STRESS_SCENARIOS))
+def test_stress_scenarios_hold_floor_and_movement(name):
+    """At 40-200 rooms ``balance`` keeps the floor and stays within R15.6(c)."""
+    cmp = simulator.compare(
+        simulator.stress_scenario(name), ["dab", "balance"], to_stdout=False, adaptive=True
+    )
+    bal = cmp.results["balance"]
+    dab = cmp.results["dab"]
+    floor = simulator.STRESS_SCENARIOS[name].safety_floor_pct
+    assert bal.min_combined_open_pct >= floor - 1e-6
+    assert bal.total_moves <= dab.total_moves * MOVES_RATIO_MAX / 100.0
+
+
 def test_comparison_tables_render():
     """Each scenario renders a deterministic side-by-side table (R15.3)."""
     for name in SCENARIOS:
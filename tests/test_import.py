@@ -209,3 +209,25 @@ async def test_import_without_door_factor_is_backward_compatible(make_coordinato
     )
     # An unknown room (no model) resolves to the legacy 0.9 default.
     assert resolve_door_factor(coord._door_factor_models.get("Unknown Room"), "cooling") == 0.9
+
+
+@pytest.mark.asyncio
+async def test_import_clamps_oversized_counts_instead_of_failing_midway(make_coordinator):
+    """A count past int64 must not raise and leave the room models half-imported."""
+    coord, *_ = make_coordinator()
+    payload = {
+        "version": 2,
+        "efficiencyData": {"roomEfficiencies": [], "globalRates": {}},
+        "room_efficiency": {
+            "Den": {"cooling": {"baseline": 0.02, "n": 10**20, "regimes": [{"rate": 0.02, "n": 2**70}]}},
+            "Office": {"heating": {"baseline": 0.03, "n": 4}},
+        },
+        "door_factor": {"Den": {"cooling": {"factor": 0.7, "n": 2**64}}},
+    }
+
+    await coord.async_import_efficiency(payload)
+
+    assert coord._room_efficiency_models["Den"].cooling.n == 2**63 - 1
+    assert coord._room_efficiency_models["Den"].cooling.regimes[0].n == 2**63 - 1
+    assert coord._room_efficiency_models["Office"].heating.n == 4
+    assert coord._door_factor_models["Den"].cooling.n == 2**63 - 1
@@ -31,6 +31,9 @@ and ``counts`` (per-breakpoint sample counts). Aperture inputs/outputs are
     curve.knee() -> int                             # smallest bp >= (1-KNEE_EPS)*flow[-1]
     curve.update(aperture_pct: float, observed_flow: float) -> VentCurve
         bins to nearest breakpoint, EMA + count, isotonic clamp, renormalize.
+    curve.update_many(apertures, observed_flows) -> VentCurve
+        same per-sample binning + EMA in order, one isotonic clamp + renormalize
+        for the whole batch (within tolerance of sequential update()).
     curve.total_samples() -> int                    # == sum(counts)
     curve.to_dict() -> {"breakpoints":..,"flow":..,"counts":..}
     VentCurve.from_dict(data) -> VentCurve
@@ -44,6 +47,7 @@ from __future__ import annotations
 
 import importlib.util as _importlib_util
 import pathlib as _pathlib
+import random
 import sys as _sys
 
 import pytest
@@ -304,6 +308,36 @@ def test_update_ignores_non_finite_and_clamps_negative(learn):
     assert all(f >= 0.0 for f in curve.to_dict()["flow"])
 
 
+def test_update_many_matches_sequential_updates(learn):
+    rng = random.Random(8)
+    bps = list(learn.CURVE_BREAKPOINTS)
+    apertures, flows = [], []
+    for _ in range(300):
+        i = rng.randrange(len(bps))
+        apertures.append(bps[i] + rng.uniform(-1.0, 1.0))
+        flows.append(_SAT_TARGET[i] + rng.gauss(0.0, 0.05))
+    sequential = learn.VentCurve.seed_from_regression(0.002, 0.05, 50)
+    for a, f in zip(apertures, flows, strict=True):
+        sequential.update(a, f)
+    batch = learn.VentCurve.seed_from_regression(0.002, 0.05, 50).update_many(apertures, flows)
+
+    assert batch.counts == sequential.counts
+    assert batch.flows == pytest.approx(sequential.flows, abs=0.02)
+    assert _is_monotonic(batch.flows) and batch.flows[-1] == pytest.approx(1.0, abs=1e-9)
+
+
+def test_update_many_single_sample_and_empty_batches(learn):
+    one = learn.VentCurve.seed_from_regression(0.002, 0.05, 50).update(35, 0.9)
+    many = learn.VentCurve.seed_from_regression(0.002, 0.05, 50).update_many([35], [0.9])
+    assert many == one
+
+    curve = learn.VentCurve.seed_from_regression(0.002, 0.05, 50)
+    before = curve.to_dict()
+    curve.update_many([], [])
+    curve.update_many([50, 75], [float("nan"), float("inf")])
+    assert curve.to_dict() == before
+
+
 # ===========================================================================
 # Cold-start fallback below MODEL_MIN_N (R25.2)
 # ===========================================================================
@@ -0,0 +1,137 @@
+"""Tests for the aperture→rate RLS fit (``learning.update_vent_rls`` and friends).
+
+The per-vent ``rate ≈ slope * aperture_pct + intercept`` fit is recursive least
+squares with a forgetting factor. These tests pin that without forgetting it is
+exactly the batch least-squares fit, that forgetting lets it follow a vent
+whose response changed, that the reported standard errors are calibrated, that
+the seed from legacy sums continues the same fit, and that a stuck aperture
+neither identifies a line nor winds the covariance up.
+
+learning.py is loaded standalone by path as ``hvo_learning`` (no Home
+Assistant), like the other ``test_learning_*`` modules.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import pathlib
+import random
+import sys
+
+import pytest
+
+_LEARNING_PATH = (
+    pathlib.Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "hvac_vent_optimizer"
+    / "learning.py"
+)
+_spec = importlib.util.spec_from_file_location("hvo_learning", _LEARNING_PATH)
+learning = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = learning
+_spec.loader.exec_module(learning)
+
+
+def _samples(rng, count, slope=0.0002, intercept=0.004, noise=0.0005):
+    points = []
+    for _ in range(count):
+        aperture = float(rng.choice(range(0, 101, 5)))
+        points.append((aperture, slope * aperture + intercept + rng.gauss(0.0, noise)))
+    return points
+
+
+def _sums(points):
+    return {
+        "n": len(points),
+        "sum_x": sum(x for x, _ in points),
+        "sum_y": sum(y for _, y in points),
+        "sum_xx": sum(x * x for x, _ in points),
+        "sum_xy": sum(x * y for x, y in points),
+        "sum_yy": sum(y * y for _, y in points),
+    }
+
+
+def test_without_forgetting_the_recursion_is_batch_least_squares():
+    points = _samples(random.Random(1), 60)
+    state = learning.new_vent_rls()
+    for x, y in points:
+        learning.update_vent_rls(state, x, y, forgetting=1.0)
+    batch = learning.vent_rls_from_sums(_sums(points))
+
+    assert state["n"] == 60
+    assert learning.vent_rls_params(state) == pytest.approx(learning.vent_rls_params(batch), rel=1e-9)
+    assert state["p"] == pytest.approx(batch["p"], rel=1e-9)
+    assert state["cost"] == pytest.approx(batch["cost"], rel=1e-6)
+
+
+def test_forgetting_follows_a_changed_vent():
+    rng = random.Random(2)
+    points = _samples(rng, 200) + _samples(rng, 150, slope=0.0001, intercept=0.002, noise=0.0)
+    forgetting, plain = learning.new_vent_rls(), learning.new_vent_rls()
+    for x, y in points:
+        learning.update_vent_rls(forgetting, x, y)
+        learning.update_vent_rls(plain, x, y, forgetting=1.0)
+
+    slope, intercept = learning.vent_rls_params(forgetting)
+    assert slope == pytest.approx(0.0001, rel=0.1)
+    assert intercept == pytest.approx(0.002, rel=0.1)
+    assert learning.vent_rls_params(plain)[0] > 0.00014  # the sums never forget
+    assert forgetting["weight"] == pytest.approx(1.0 / (1.0 - learning.RLS_FORGETTING), rel=0.01)
+
+
+def test_standard_errors_are_calibrated_and_shrink_with_data():
+    rng = random.Random(3)
+    state = learning.new_vent_rls()
+    errors = []
+    for x, y in _samples(rng, 400, noise=0.001):
+        learning.update_vent_rls(state, x, y, forgetting=1.0)
+        if state["n"] in (20, 400):
+            errors.append(learning.vent_rls_uncertainty(state))
+
+    early, late = errors
+    assert late["sigma"] == pytest.approx(0.001, rel=0.1)
+    assert late["slope_se"] < early["slope_se"] and late["intercept_se"] < early["intercept_se"]
+    slope, intercept = learning.vent_rls_params(state)
+    assert abs(slope - 0.0002) < 4 * late["slope_se"]
+    assert abs(intercept - 0.004) < 4 * late["intercept_se"]
+
+
+def test_seed_from_legacy_sums_continues_the_same_fit():
+    points = _samples(random.Random(4), 30)
+    legacy = {key: value for key, value in _sums(points[:20]).items() if key != "sum_yy"}
+    state = learning.vent_rls_from_sums(legacy)
+
+    assert learning.vent_rls_params(state) == pytest.approx(
+        learning.vent_rls_params(learning.vent_rls_from_sums(_sums(points[:20])))
+    )
+    assert learning.vent_rls_uncertainty(state) is None  # no residual evidence yet
+    for x, y in points[20:]:
+        learning.update_vent_rls(state, x, y, forgetting=1.0)
+    assert learning.vent_rls_params(state) == pytest.approx(
+        learning.vent_rls_params(learning.vent_rls_from_sums(_sums(points))), rel=1e-9
+    )
+    assert learning.vent_rls_uncertainty(state) is not None
+
+
+def test_stuck_aperture_has_no_fit_and_never_winds_up():
+    state = learning.new_vent_rls()
+    for _ in range(5):
+        learning.update_vent_rls(state, 50.0, 0.01)
+    assert learning.vent_rls_params(state) is None and state["n"] == 5
+
+    learning.update_vent_rls(state, 100.0, 0.02)
+    assert learning.vent_rls_params(state) == pytest.approx((0.0002, 0.0))
+    for _ in range(2000):
+        learning.update_vent_rls(state, 100.0, 0.02)
+    p_ss, _p_si, p_ii = state["p"]
+    assert p_ss + p_ii <= learning.RLS_TRACE_MAX * 1.1
+
+
+def test_malformed_state_is_tolerated():
+    assert learning.vent_rls_params({"slope": "x", "intercept": 1.0}) is None
+    assert learning.vent_rls_params(None) is None
+    state = {"n": 3, "slope": 0.1, "intercept": 0.0, "p": "garbled"}
+    assert learning.vent_rls_uncertainty(state) is None
+    learning.update_vent_rls(state, 10.0, 0.01)
+    assert state["n"] == 1 and "slope" not in state and state["sum_x"] == 10.0
+    assert learning.vent_rls_from_sums({"n": "?", "sum_x": None}) == learning.vent_rls_from_sums({})
@@ -0,0 +1,193 @@
+"""Tests for ``learning.RoomModelStore`` (the column-wise room/door learner store).
+
+The store keeps every room's efficiency and door-factor learners in flat
+arrays and hands out live views that duck-type the dataclasses. These tests pin
+that it is a drop-in for the per-room dataclass API: batch updates and bulk
+lookups match the per-model functions row for row, the persisted sections keep
+the exact schema, and the mapping views copy on assignment. ``room_model_changes``
+lists exactly the room/mode pairs that differ between two stores.
+
+learning.py is loaded standalone by path as ``hvo_learning`` (no Home
+Assistant), like the other ``test_learning_*`` modules.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import math
+import pathlib
+import random
+import sys
+
+import pytest
+
+_LEARNING_PATH = (
+    pathlib.Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "hvac_vent_optimizer"
+    / "learning.py"
+)
+_spec = importlib.util.spec_from_file_location("hvo_learning", _LEARNING_PATH)
+learning = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = learning
+_spec.loader.exec_module(learning)
+
+ROOMS = ("Master", "Guest", "Office", "v9")
+
+
+def _random_rows(rng, count):
+    samples = (0.0, -0.01, math.nan, math.inf, None)
+    return [
+        (
+            rng.choice(ROOMS),
+            rng.choice(samples) if rng.random() < 0.1 else rng.uniform(0.0, 0.2),
+            rng.randint(-1, learning.EFF_REGIME_COUNT),
+        )
+        for _ in range(count)
+    ]
+
+
+def test_batch_updates_and_bulk_lookup_match_per_model_functions():
+    rng = random.Random(11)
+    store = learning.RoomModelStore()
+    reference: dict[str, object] = {}
+    for mode in ("cooling", "heating", "cooling"):
+        rows = _random_rows(rng, 120)
+        store.update_many(rows, mode)
+        for key, sample, regime in rows:
+            if sample is None or not math.isfinite(sample):
+                continue
+            model = reference.setdefault(key, learning.new_room_model())
+            learning.update_room_efficiency(model, sample, regime, mode)
+
+    assert set(store.efficiency) == set(reference)
+    for key, model in reference.items():
+        assert store.efficiency[key] == model
+    for mode in ("cooling", "heating"):
+        for regime in range(-1, learning.EFF_REGIME_COUNT + 1):
+            expected = {key: learning.effective_rate(model, regime, mode) for key, model in reference.items()}
+            assert store.effective_rates(regime, mode) == pytest.approx(expected)
+
+
+def test_batch_door_updates_match_update_door_factor():
+    rng = random.Random(3)
+    store = learning.RoomModelStore()
+    reference: dict[str, object] = {}
+    for mode in ("cooling", "heating"):
+        rows = [
+            (rng.choice(ROOMS), rng.choice((None, math.nan, 1.4, rng.uniform(0.2, 1.2)))) for _ in range(80)
+        ]
+        store.update_door_many(rows, mode)
+        for key, ratio in rows:
+            if ratio is None or not math.isfinite(ratio):
+                continue
+            model = reference.setdefault(key, learning.new_door_factor_model())
+            learning.update_door_factor(model, ratio, mode)
+
+    assert dict(store.door.items()) == reference
+    for key, model in reference.items():
+        for mode in ("cooling", "heating"):
+            assert learning.resolve_door_factor(store.door[key], mode) == learning.resolve_door_factor(
+                model, mode
+            )
+    # Efficiency and door learners share the room index but not their presence.
+    assert len(store.efficiency) == 0
+
+
+def test_sections_keep_the_persisted_schema_and_round_trip():
+    rng = random.Random(5)
+    store = learning.RoomModelStore()
+    store.update_many(_random_rows(rng, 60), "cooling")
+    store.update_door_many([("Master", 0.7), ("Attic", 0.95)], "heating")
+
+    efficiency = store.efficiency_to_dict()
+    door = store.door_factor_to_dict()
+    assert efficiency == {key: learning.room_model_to_dict(model) for key, model in store.efficiency.items()}
+    assert door == {key: learning.door_factor_to_dict(model) for key, model in store.door.items()}
+
+    restored = learning.RoomModelStore()
+    restored.load_efficiency(efficiency)
+    restored.load_door_factor(door)
+    assert restored.efficiency_to_dict() == efficiency
+    assert restored.door_factor_to_dict() == door
+
+
+def test_load_is_tolerant_and_has_update_semantics():
+    store = learning.RoomModelStore()
+    store.efficiency["Keep"] = learning.seed_room_model_from_v1({"cooling": 0.03})
+    store.load_efficiency(
+        {"Bad": "garbled", "Short": {"cooling": {"baseline": 0.02, "regimes": [{"rate": "x"}]}}}
+    )
+    store.load_door_factor({"Bad": 7, "Odd": {"cooling": {"factor": math.inf, "n": "?"}}})
+
+    assert set(store.efficiency) == {"Keep", "Short", "Bad"}
+    assert store.efficiency["Keep"].cooling.baseline == 0.03
+    assert store.efficiency["Bad"] == learning.room_model_from_dict("garbled")
+    assert store.efficiency["Short"] == learning.room_model_from_dict(
+        {"cooling": {"baseline": 0.02, "regimes": [{"rate": "x"}]}}
+    )
+    assert store.door["Odd"] == learning.new_door_factor_model()
+    assert learning.resolve_door_factor(store.door.get("Bad"), "cooling") == learning.DOOR_FACTOR_DEFAULT
+
+
+def test_load_clamps_counts_beyond_the_int64_columns():
+    store = learning.RoomModelStore()
+    store.load_efficiency(
+        {"Huge": {"cooling": {"baseline": 0.02, "n": 10**20, "regimes": [{"rate": 0.02, "n": 2**70}]}}}
+    )
+    store.load_door_factor({"Huge": {"heating": {"factor": 0.8, "n": 2**64}, "cooling": {"n": math.inf}}})
+
+    model = store.efficiency["Huge"]
+    assert model.cooling.n == 2**63 - 1
+    assert model.cooling.regimes[0].n == 2**63 - 1
+    assert store.door["Huge"].heating.n == 2**63 - 1
+    assert store.door["Huge"].cooling.n == 0
+
+
+def test_views_copy_on_assignment_and_write_through():
+    store = learning.RoomModelStore()
+    model = learning.new_room_model()
+    store.efficiency["Master"] = model
+    view = store.efficiency["Master"]
+
+    learning.update_room_efficiency(view, 0.05, 1, "cooling")
+    assert model.cooling.n == 0  # the caller's object is never aliased
+    assert view.cooling.n == 1
+    assert store.efficiency["Master"].cooling.regimes[1].rate == pytest.approx(0.05)
+    assert store.effective_rates(1, "cooling") == {"Master": pytest.approx(0.05)}
+
+    del store.efficiency["Master"]
+    assert "Master" not in store.efficiency
+    assert store.efficiency.get("Master") is None
+    store.update_many([("Master", 0.02, 0)], "cooling")
+    assert store.efficiency["Master"].cooling.n == 1  # recreated fresh, not resurrected
+
+    store.efficiency.replace({"Guest": learning.new_room_model()})
+    assert list(store.efficiency) == ["Guest"]
+    store.efficiency.replace(store.efficiency)
+    assert list(store.efficiency) == ["Guest"]
+
+
+def test_room_model_changes_lists_only_differing_pairs():
+    before = learning.RoomModelStore()
+    before.update_many([("Master", 0.04, 1), ("Guest", 0.03, 0)], "cooling")
+    before.update_door_many([("Master", 0.8)], "cooling")
+    after = learning.RoomModelStore()
+    after.load_efficiency(before.efficiency_to_dict())
+    after.load_door_factor(before.door_factor_to_dict())
+    assert learning.room_model_changes(before, after) == {"room_efficiency": {}, "door_factor": {}}
+
+    after.update_many([("Master", 0.06, 1), ("Office", 0.02, 0)], "cooling")
+    after.update_door_many([("Guest", 0.7)], "heating")
+    changes = learning.room_model_changes(before, after)
+
+    assert set(changes["room_efficiency"]) == {"Master", "Office"}
+    master = changes["room_efficiency"]["Master"]["cooling"]
+    assert master["n"] == [1, 2]
+    assert master["baseline"][0] == pytest.approx(0.04)
+    assert master["effective"][0][1] == pytest.approx(0.04)
+    assert master["effective"][1][1] == after.effective_rates(1, "cooling")["Master"]
+    assert changes["room_efficiency"]["Office"]["cooling"]["baseline"] == [None, pytest.approx(0.02)]
+    assert changes["door_factor"] == {
+        "Guest": {"heating": {"factor": [None, pytest.approx(0.7)], "n": [0, 1]}}
+    }
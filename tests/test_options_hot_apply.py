@@ -0,0 +1,132 @@
+"""Options handling on the live coordinator.
+
+Covers the parsed ``CoordinatorSettings`` (built once per options mapping,
+malformed values degrade to defaults, prebuilt ``AllocSettings``) and options
+updates: hot options apply in place, structural ones reload the entry.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+
+class _ConfigEntries:
+    def __init__(self):
+        self.reloaded: list[str] = []
+
+    async def async_reload(self, entry_id: str) -> None:
+        self.reloaded.append(entry_id)
+
+
+def _wire(make_coordinator, **options):
+    from hvac_vent_optimizer import const
+
+    coord, hass, api, entry = make_coordinator(options=options)
+    hass.config_entries = _ConfigEntries()
+    hass.data[const.DOMAIN] = {entry.entry_id: coord}
+    return coord, hass, api, entry
+
+
+@pytest.mark.asyncio
+async def test_hot_options_apply_in_place_and_keep_cycle_state(make_coordinator):
+    from hvac_vent_optimizer import _async_update_listener, const
+
+    coord, hass, _api, entry = _wire(make_coordinator, **{const.CONF_POLL_INTERVAL_IDLE: 10})
+    coord._cycle_targets["climate.t"] = {"targets": {"v1": 40}}
+    entry.options = {
+        **entry.options,
+        const.CONF_POLL_INTERVAL_IDLE: 15,
+        const.CONF_POLL_INTERVAL_ACTIVE: 2,
+        const.CONF_DEADBAND_PERCENT: 7,
+        const.CONF_NOTIFY_EFFICIENCY_CHANGES: False,
+    }
+
+    await _async_update_listener(hass, entry)
+
+    assert hass.config_entries.reloaded == []
+    assert coord._poll_interval_idle == timedelta(minutes=15)
+    assert coord._poll_interval_active == timedelta(minutes=2)
+    assert coord.update_interval == timedelta(minutes=15)  # no thermostats -> idle
+    assert coord._notify_efficiency_changes is False
+    assert coord._cycle_targets["climate.t"] == {"targets": {"v1": 40}}
+
+    # Re-applying the same options is a no-op, not a reload.
+    await _async_update_listener(hass, entry)
+    assert hass.config_entries.reloaded == []
+
+
+@pytest.mark.asyncio
+async def test_enabling_dab_hot_applies_structure_mode(make_coordinator):
+    from hvac_vent_optimizer import const
+
+    coord, _hass, api, entry = _wire(make_coordinator, **{const.CONF_DAB_ENABLED: False})
+    entry.options = {**entry.options, const.CONF_DAB_ENABLED: True}
+    assert await coord.async_apply_options() is True
+    assert api.set_structure_mode_calls == [("s1", "manual")]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("structural", ["options", "data"])
+async def test_structural_changes_reload_the_entry(make_coordinator, structural):
+    from hvac_vent_optimizer import _async_update_listener, const
+
+    coord, hass, _api, entry = _wire(make_coordinator)
+    if structural == "options":
+        entry.options = {
+            **entry.options,
+            const.CONF_DEADBAND_PERCENT: 7,  # hot, but bundled with a structural change
+            const.CONF_VENT_ASSIGNMENTS: {"v1": {const.CONF_THERMOSTAT_ENTITY: "climate.t"}},
+        }
+    else:
+        entry.data = {**entry.data, const.CONF_CLIENT_SECRET: "rotated"}
+
+    await _async_update_listener(hass, entry)
+
+    assert hass.config_entries.reloaded == [entry.entry_id]
+    # Nothing was half-applied: a refused update leaves the baseline untouched.
+    assert const.CONF_DEADBAND_PERCENT not in coord._applied_options
+
+
+def test_settings_built_once_per_options_version(make_coordinator):
+    from hvac_vent_optimizer import const
+
+    coord, _hass, _api, entry = make_coordinator(
+        options={
+            const.CONF_VENT_GRANULARITY: 10,
+            const.CONF_SPREAD_GUARDRAIL_C: 0.8,
+            const.CONF_OPEN_INACTIVE_ROOMS: False,
+            const.CONF_CONVENTIONAL_VENTS_BY_THERMOSTAT: {"climate.t": "2"},
+        }
+    )
+    settings = coord.settings
+    assert coord.settings is settings  # cached while the options mapping is unchanged
+    assert settings.granularity == settings.alloc.granularity == 10
+    assert settings.alloc.spread_guardrail_c == pytest.approx(0.8)
+    assert settings.close_inactive is True
+    assert settings.conventional_vents == {"climate.t": 2}
+    with pytest.raises(AttributeError):
+        settings.deadband = 1  # frozen
+
+    entry.options = {**entry.options, const.CONF_DEADBAND_PERCENT: 9}
+    assert coord.settings is not settings
+    assert coord.settings.deadband == 9
+
+
+def test_malformed_options_degrade_to_defaults():
+    from hvac_vent_optimizer import const
+    from hvac_vent_optimizer.coordinator import CoordinatorSettings
+
+    settings = CoordinatorSettings.from_options(
+        {
+            const.CONF_VENT_GRANULARITY: "abc",
+            const.CONF_SAFETY_FLOOR_PCT: float("nan"),
+            const.CONF_MAX_RECALC_PER_CYCLE: None,
+            const.CONF_CONVENTIONAL_VENTS_BY_THERMOSTAT: "garbled",
+        }
+    )
+    assert settings.granularity == const.DEFAULT_VENT_GRANULARITY
+    assert settings.alloc.safety_floor_pct == pytest.approx(const.DEFAULT_SAFETY_FLOOR_PCT)
+    assert settings.max_recalc == const.DEFAULT_MAX_RECALC_PER_CYCLE
+    assert settings.conventional_vents == {}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import UTC, datetime
 
 import pytest
@@ -202,6 +203,25 @@ async def test_room_efficiency_models_roundtrip_through_initialize(make_coordina
     assert restored.cooling.regimes[2].n == model.cooling.regimes[2].n
 
 
+@pytest.mark.asyncio
+async def test_initialize_tolerates_counts_beyond_int64(make_coordinator):
+    coord, *_ = make_coordinator()
+    await coord._async_save_state()
+    payload = coord._store.saved
+    payload["room_efficiency"] = {"Guest": {"cooling": {"baseline": 0.02, "n": 10**20}}}
+    payload["door_factor"] = {"Guest": {"heating": {"factor": 0.8, "n": 2**64}}}
+
+    coord2, *_ = make_coordinator()
+
+    async def _load():
+        return payload
+
+    coord2._store.async_load = _load
+    await coord2.async_initialize()
+    assert coord2._room_efficiency_models["Guest"].cooling.n == 2**63 - 1
+    assert coord2._door_factor_models["Guest"].heating.n == 2**63 - 1
+
+
 # --- v1 -> v2 migration -----------------------------------------------------
 def _v1_store():
     points = [(a, 0.005 + 0.00015 * a) for a in range(0, 100, 10)]
@@ -362,11 +382,132 @@ async def test_migration_malformed_sections_never_lose_data(make_coordinator):
     assert coord._vent_rates == {"v1": {"cooling": 0.02}}
     # Malformed sections degrade to safe empty/seeded dicts, never crash.
     assert isinstance(coord._vent_effectiveness, dict)
-    assert isinstance(coord._room_efficiency_models, dict)
+    assert isinstance(coord._room_efficiency_models, Mapping)
     # The valid regression still seeds a vent-effectiveness curve.
     assert "curve" in coord._vent_effectiveness["v1"]["cooling"]
 
 
+@pytest.mark.asyncio
+async def test_v1_regression_sums_seed_the_rls_fit(make_coordinator):
+    coord, *_ = make_coordinator()
+
+    async def _load():
+        return _v1_store()
+
+    coord._store.async_load = _load
+    await coord.async_initialize()
+
+    stats = coord._vent_models["v1"]["cooling"]
+    assert "sum_x" not in stats and stats["n"] == 10
+    assert coord._get_model_params("v1", "cooling") == pytest.approx((0.00015, 0.005))
+    fit = coord.get_vent_model_fits()["v1"]["cooling"]
+    assert fit["slope"] == pytest.approx(0.00015) and "slope_se" not in fit  # no residuals yet
+
+    # Migrated once: a reload keeps the fit verbatim.
+    await coord._async_save_state()
+    coord2, *_ = make_coordinator()
+
+    async def _load2():
+        return coord._store.saved
+
+    coord2._store.async_load = _load2
+    await coord2.async_initialize()
+    assert coord2._vent_models == coord._vent_models
+
+
+# --- Migration ledger -------------------------------------------------------
+@pytest.mark.asyncio
+async def test_saved_store_records_every_migration_in_the_ledger(make_coordinator):
+    from hvac_vent_optimizer.coordinator import SANITIZE_REVISION, STORE_MIGRATIONS
+
+    coord, *_ = make_coordinator()
+    await coord._async_save_state()
+    ledger = coord._store.saved["migrations"]
+    assert ledger == {**dict(STORE_MIGRATIONS), "sanitize": SANITIZE_REVISION}
+
+
+@pytest.mark.asyncio
+async def test_restart_with_current_ledger_skips_migrations_and_sanitation(make_coordinator, monkeypatch):
+    coord, *_ = make_coordinator()
+
+    async def _load():
+        return _v1_store()
+
+    coord._store.async_load = _load
+    await coord.async_initialize()
+    await coord._async_save_state()
+    saved = coord._store.saved
+
+    coord2, *_ = make_coordinator()
+
+    async def _load2():
+        return saved
+
+    def _boom(*_args, **_kwargs):
+        raise AssertionError("ran on a store the ledger marks as done")
+
+    coord2._store.async_load = _load2
+    for name in ("_migrate_symmetric_offsets", "_backfill_metric_fields", "_sanitize_vent_effectiveness"):
+        monkeypatch.setattr(coord2, name, _boom)
+    await coord2.async_initialize()
+    assert coord2._vent_effectiveness == saved["vent_effectiveness"]
+    assert set(coord2._room_efficiency_models) == set(saved["room_efficiency"])
+
+
+@pytest.mark.asyncio
+async def test_vents_and_rooms_learned_after_the_migration_are_seeded_at_load(make_coordinator):
+    coord, *_ = make_coordinator()
+
+    async def _load():
+        return _v1_store()
+
+    coord._store.async_load = _load
+    await coord.async_initialize()
+    await coord._async_save_state()
+    saved = coord._store.saved
+    learned = dict(saved["vent_effectiveness"])
+
+    # A vent and a room first learned after the ledger recorded the migrations.
+    saved["vent_rates"] = {**saved["vent_rates"], "v9": {"cooling": 0.04}}
+    saved["room_efficiency"].pop("v9", None)
+    coord2, *_ = make_coordinator()
+
+    async def _load2():
+        return saved
+
+    coord2._store.async_load = _load2
+    await coord2.async_initialize()
+    assert "cooling" in coord2._vent_effectiveness["v9"]
+    assert coord2._room_efficiency_models["v9"].cooling.baseline == pytest.approx(0.04)
+    # Entries already present are left exactly as saved.
+    assert {key: coord2._vent_effectiveness[key] for key in learned} == learned
+
+
+@pytest.mark.asyncio
+async def test_outdated_ledger_entries_rerun_only_those_steps(make_coordinator, monkeypatch):
+    from hvac_vent_optimizer.coordinator import SANITIZE_REVISION, STORE_MIGRATIONS
+
+    coord, *_ = make_coordinator()
+    ran: list[str] = []
+    for name in ("_migrate_symmetric_offsets", "_backfill_metric_fields"):
+        monkeypatch.setattr(coord, name, lambda name=name: ran.append(name))
+    ledger = {**dict(STORE_MIGRATIONS), "sanitize": SANITIZE_REVISION - 1}
+    ledger["regime_offsets"] -= 1  # e.g. stored before the regime count grew
+
+    async def _load():
+        return {
+            "version": 2,
+            "migrations": ledger,
+            "vent_effectiveness": {"v1": {"cooling": {"leak": "bad"}}},
+        }
+
+    coord._store.async_load = _load
+    await coord.async_initialize()
+    assert ran == ["_migrate_symmetric_offsets"]
+    # A stale sanitize revision re-validates the section.
+    assert coord._vent_effectiveness == {}
+
+
 # --- Pure room-model (de)serialization helpers -----------------------------
 from hvac_vent_optimizer.learning import (  # noqa: E402
     EFF_REGIME_COUNT,
@@ -544,7 +685,7 @@ async def test_malformed_door_factor_section_dropped_without_losing_other_sectio
     await coord.async_initialize()
 
     # The malformed section degrades to a safe empty map.
-    assert isinstance(coord._door_factor_models, dict)
+    assert isinstance(coord._door_factor_models, Mapping)
     assert coord._door_factor_models == {}
     # Other sections are completely unaffected.
     assert "Master" in coord._room_efficiency_models
@@ -579,3 +720,107 @@ async def test_load_door_factor_tolerates_garbled_entry_keeps_valid(make_coordin
         DOOR_FACTOR_DEFAULT
     )
     assert resolve_door_factor(coord._door_factor_models.get("Guest"), "cooling") == pytest.approx(0.7)
+
+
+# ---------------------------------------------------------------------------
+# Last-known Flair snapshot (fast startup)
+# ---------------------------------------------------------------------------
+async def _polled_snapshot():
+    from tests import bench_coordinator as bench
+
+    coord, _hass, _server = bench.build_harness(bench.BenchConfig(vents=3, pucks=1))
+    await coord.async_initialize()
+    await coord._async_update_data()
+    coord.async_shutdown()
+    return coord._snapshot_store.saved
+
+
+@pytest.mark.asyncio
+async def test_good_poll_saves_snapshot_and_restore_seeds_stale_data():
+    import asyncio
+
+    from hvac_vent_optimizer import sensor as sensor_mod
+    from hvac_vent_optimizer.cover import FlairVentCover
+    from tests import bench_coordinator as bench
+
+    payload = await _polled_snapshot()
+    assert len(payload["vents"]) == 3 and len(payload["pucks"]) == 1
+    assert datetime.fromisoformat(payload["saved_at"])
+
+    coord, hass, server = bench.build_harness(bench.BenchConfig(vents=3, pucks=1))
+
+    async def _load():
+        return payload
+
+    coord._snapshot_store.async_load = _load
+    assert await coord.async_restore_snapshot() is True
+    # Entities have data before any Flair request is made.
+    assert sum(server.requests.values()) == 0
+    assert coord.data["stale"] is True and coord.data["stale_since"] == payload["saved_at"]
+    assert coord.data["vents"] == payload["vents"]
+    assert coord.get_snapshot_status()["restored_at_startup"] is True
+    # ...and the entities say so.
+    vent_id = next(iter(payload["vents"]))
+    cover = FlairVentCover(coord, "e1", vent_id)
+    stale_attrs = {"stale": True, "stale_since": payload["saved_at"]}
+    assert cover.extra_state_attributes == stale_attrs
+    reading = next(d for d in sensor_mod.VENT_SENSOR_DESCRIPTIONS if not d.efficiency_mode)
+    assert sensor_mod.FlairVentSensor(coord, "e1", vent_id, reading).extra_state_attributes == stale_attrs
+
+    coord.async_start_background_refresh()
+    await asyncio.gather(*hass.created_tasks)
+    assert coord.last_update_success is True
+    assert coord.data["stale"] is False
+    assert set(coord.data["vents"]) == set(payload["vents"])
+    assert coord.get_snapshot_status()["stale"] is False
+    assert cover.extra_state_attributes is None
+    coord.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_writes_are_throttled_not_rearmed_each_poll():
+    from datetime import timedelta
+
+    from hvac_vent_optimizer.coordinator import SNAPSHOT_SAVE_INTERVAL
+    from tests import bench_coordinator as bench
+
+    coord, _hass, _server = bench.build_harness(bench.BenchConfig(vents=3, pucks=1))
+    delays = []
+    coord._snapshot_store.async_delay_save = lambda data_func, delay=0: delays.append(delay)
+    await coord.async_initialize()
+    for _ in range(3):
+        await coord._async_update_data()
+    # The first good poll writes at once; polls inside the interval do not
+    # touch (and so cannot keep postponing) the pending write.
+    assert delays == [0]
+
+    coord._snapshot_saved_at -= SNAPSHOT_SAVE_INTERVAL + timedelta(seconds=1)
+    await coord._async_update_data()
+    assert delays == [0, 0]
+    coord.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_restore_rejects_missing_old_or_malformed_snapshots(make_coordinator):
+    from datetime import timedelta
+
+    from hvac_vent_optimizer.coordinator import SNAPSHOT_MAX_AGE
+
+    payload = await _polled_snapshot()
+    old = datetime.now(UTC) - SNAPSHOT_MAX_AGE - timedelta(minutes=1)
+    for stored in (
+        None,
+        "garbage",
+        {**payload, "saved_at": old.isoformat()},
+        {**payload, "saved_at": "not-a-date"},
+        {**payload, "vents": {}},
+        {**payload, "pucks": []},
+    ):
+        coord, *_ = make_coordinator()
+
+        async def _load(stored=stored):
+            return stored
+
+        coord._snapshot_store.async_load = _load
+        assert await coord.async_restore_snapshot() is False
+        assert "stale" not in coord.data and coord.get_snapshot_status()["restored_at_startup"] is False
@@ -0,0 +1,459 @@
+"""Tests for the columnar replay trace (``replay.py``) and trace replay.
+
+Covers:
+
+* rows append column-wise, rooms first seen mid-trace are back-filled as
+  missing, and ``max_rows`` trims the oldest rows in batches;
+* the gzip'd columnar file round-trips exactly and rejects foreign input;
+* ``simulator.replay_trace`` evaluates every conditioning poll through the
+  strategy + safety floor, skips idle polls, honors the counterfactual gap and
+  reports recorded vs strategy movement;
+* the coordinator appends one row per counted active poll, and the exported
+  snapshot replays offline;
+* the packed decision log round-trips records, stays bounded, and its JSONL
+  export converts back into replayable traces;
+* the cycle sample archive round-trips through its JSON Store form, stays
+  within its byte budget and drops unreadable records on load;
+* recorded history is rebuilt into the same cycle records, skipping cycles cut
+  by either end of the history.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import importlib.util
+import json
+import math
+import pathlib
+import sys
+
+import pytest
+
+_ROOT = pathlib.Path(__file__).resolve().parent.parent / "custom_components" / "hvac_vent_optimizer"
+
+
+def _load(name: str):
+    path = _ROOT / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(f"hvo_{name}", path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+replay = _load("replay")
+simulator = _load("simulator")
+
+RoomSample = replay.RoomSample
+
+
+def _cooling_trace(polls=10, *, open_pct=100.0, dt_s=60.0, setpoint=24.0):
+    """Three active rooms all held fully open while cooling at different rates."""
+    trace = replay.Trace()
+    temps = {"hot": 27.0, "mid": 25.5, "cold": 24.2}
+    rates = {"hot": 0.02, "mid": 0.05, "cold": 0.1}
+    for i in range(polls):
+        trace.append(
+            1_700_000_000 + i * dt_s,
+            "cooling",
+            setpoint,
+            {rid: RoomSample(temps[rid], open_pct, True, rates[rid], 0.1) for rid in temps},
+        )
+        for rid in temps:
+            temps[rid] -= rates[rid] * dt_s / 60.0
+    return trace
+
+
+# ---------------------------------------------------------------------------
+# Columnar model
+# ---------------------------------------------------------------------------
+def test_append_backfills_late_rooms_and_records_missing():
+    trace = replay.Trace()
+    trace.append(0.0, "cooling", 24.0, {"a": RoomSample(25.0, 40.0, True, 0.05, 0.1, vents=2)})
+    trace.append(60.0, None, None, {"b": RoomSample(23.0, None, False)})
+    assert trace.rows == 2
+    assert trace.room_ids == ["a", "b"]
+    b = trace.rooms["b"]
+    assert math.isnan(b.temp[0]) and b.open[0] == replay.OPEN_UNKNOWN
+    assert b.temp[1] == pytest.approx(23.0) and b.active[1] == 0
+    a = trace.rooms["a"]
+    assert math.isnan(a.temp[1])  # absent at row 1
+    assert a.vents == 2
+    assert trace.mode_at(0) == "cooling" and trace.mode_at(1) is None
+    assert math.isnan(trace.setpoint[1])
+    assert [rid for rid, _ in trace.samples_at(1)] == ["b"]
+    assert trace.span_s == 60.0
+
+
+def test_max_rows_trims_oldest_rows_in_batches():
+    trace = replay.Trace(max_rows=16)
+    for i in range(40):
+        trace.append(float(i), "heating", 20.0, {"a": RoomSample(19.0, 50.0)})
+        assert trace.rows <= 16
+    assert trace.t_s[-1] == 39.0
+    assert len(trace.rooms["a"].temp) == trace.rows
+
+
+def _header(trace):
+    """The JSON header of ``trace``'s serialized form."""
+    raw = gzip.decompress(trace.to_bytes())
+    _magic, _version, head_len = replay._HEADER.unpack_from(raw)
+    return json.loads(raw[replay._HEADER.size : replay._HEADER.size + head_len])
+
+
+def _with_header(trace, **changes):
+    """``trace`` serialized with the header fields in ``changes`` replaced."""
+    raw = gzip.decompress(trace.to_bytes())
+    magic, version, head_len = replay._HEADER.unpack_from(raw)
+    start = replay._HEADER.size
+    header = {**json.loads(raw[start : start + head_len]), **changes}
+    head = json.dumps(header).encode()
+    body = raw[start + head_len :]
+    return gzip.compress(replay._HEADER.pack(magic, version, len(head)) + head + body)
+
+
+def test_file_round_trip_and_format_errors(tmp_path):
+    trace = _cooling_trace(polls=5)
+    trace.append(2e9, "heating", 21.0, {"late": RoomSample(None, 30.0, True, None, 0.2, vents=3)})
+    path = tmp_path / "t.hvotrace"
+    trace.save(str(path))
+    loaded = replay.Trace.load(str(path))
+    assert loaded.rows == trace.rows
+    assert list(loaded.t_s) == list(trace.t_s)
+    assert list(loaded.mode) == list(trace.mode)
+    for rid, cols in trace.rooms.items():
+        other = loaded.rooms[rid]
+        assert (other.vents, other.leak) == (cols.vents, cols.leak)
+        for name in ("temp", "open", "active", "rate"):
+            assert list(other.column(name)) == pytest.approx(list(cols.column(name)), nan_ok=True)
+    # Compact: well under the per-poll dict/YAML footprint.
+    assert path.stat().st_size < 1024
+
+    with pytest.raises(replay.TraceFormatError):
+        replay.Trace.from_bytes(b"not gzip")
+    with pytest.raises(replay.TraceFormatError):
+        replay.Trace.from_bytes(gzip.compress(b"XXXXXXXX\x01\x00\x00\x00\x00"))
+    with pytest.raises(replay.TraceFormatError):
+        replay.Trace.from_bytes(trace.to_bytes()[:-40])
+    # A header naming an unknown column or a room outside the room table.
+    for bad in (("__class__", "d"), ("temp:9", "f"), ("temp:-1", "f"), ("open:0", "f")):
+        with pytest.raises(replay.TraceFormatError):
+            replay.Trace.from_bytes(_with_header(trace, columns=[list(bad)]))
+    with pytest.raises(replay.TraceFormatError):
+        replay.Trace.from_bytes(_with_header(trace, rooms=[{"id": "a"}]))
+
+
+def test_from_bytes_requires_each_column_exactly_once():
+    trace = _cooling_trace(polls=3)
+    columns = [[name, col.typecode] for name, col in trace._columns()]
+    assert any(name == "temp:0" for name, _typecode in columns)
+
+    # A missing room column would leave samples_at indexing past its end.
+    without_temp = [c for c in columns if c[0] != "temp:0"]
+    with pytest.raises(replay.TraceFormatError, match="temp:0"):
+        replay.Trace.from_bytes(_with_header(trace, columns=without_temp))
+    # A repeated column would silently replace the first one's data.
+    doubled = [c if c[0] != "rate:0" else ["temp:0", "f"] for c in columns]
+    with pytest.raises(replay.TraceFormatError, match="duplicate"):
+        replay.Trace.from_bytes(_with_header(trace, columns=doubled))
+    aliased = [c if c[0] != "temp:0" else ["temp:00", "f"] for c in columns]
+    with pytest.raises(replay.TraceFormatError, match="temp:00"):
+        replay.Trace.from_bytes(_with_header(trace, columns=aliased))
+
+
+def test_from_bytes_rejects_a_room_without_an_id():
+    trace = _cooling_trace(polls=3)
+    rooms = [{k: v for k, v in room.items() if k != "id"} for room in _header(trace)["rooms"]]
+    with pytest.raises(replay.TraceFormatError, match="bad trace header"):
+        replay.Trace.from_bytes(_with_header(trace, rooms=rooms))
+
+
+def test_copy_is_independent():
+    trace = _cooling_trace(polls=3)
+    snap = trace.copy()
+    trace.append(9e9, "cooling", 24.0, {"hot": RoomSample(26.0, 50.0)})
+    assert snap.rows == 3 and trace.rows == 4
+
+
+# ---------------------------------------------------------------------------
+# simulator.replay_trace
+# ---------------------------------------------------------------------------
+def test_replay_balance_reduces_predicted_spread_and_holds_floor():
+    trace = _cooling_trace()
+    res = simulator.replay_trace(trace, "balance")
+    assert res.polls == res.decisions == 10
+    assert res.recorded_moves == 0  # the recorded vents never moved
+    assert res.total_moves > 0
+    assert res.min_combined_open_pct >= 40.0 - 1e-6
+    assert res.transitions == 9
+    # Throttling the already-cool room narrows the spread the house would have seen.
+    assert res.avg_predicted_spread < res.avg_recorded_spread
+    assert res.avg_divergence_pct > 0.0
+
+
+def test_replay_skips_idle_polls_and_long_gaps():
+    trace = _cooling_trace(polls=4)
+    trace.append(trace.t_s[-1] + 60.0, None, 24.0, {"hot": RoomSample(26.0, 100.0, True, 0.02, 0.1)})
+    # Next conditioning poll after a two-hour gap: not a usable transition.
+    trace.append(
+        trace.t_s[-1] + 7200.0,
+        "cooling",
+        24.0,
+        {rid: RoomSample(25.0, 100.0, True, 0.05, 0.1) for rid in ("hot", "mid", "cold")},
+    )
+    res = simulator.replay_trace(trace, "dab")
+    assert res.decisions == 5
+    assert res.transitions == 3
+
+
+def test_replay_counts_recorded_moves_per_vent_and_rejects_unknown_strategy():
+    trace = replay.Trace()
+    for i, pct in enumerate((0.0, 50.0, 50.0, 100.0)):
+        trace.append(i * 60.0, "cooling", 24.0, {"a": RoomSample(26.0, pct, True, 0.05, 0.1, vents=2)})
+    assert simulator.replay_trace(trace).recorded_moves == 4
+    with pytest.raises(ValueError):
+        simulator.replay_trace(trace, "nope")
+    assert "balance" in simulator.render_replay_table({"balance": simulator.replay_trace(trace)})
+
+
+# ---------------------------------------------------------------------------
+# Coordinator capture
+# ---------------------------------------------------------------------------
+def test_coordinator_records_one_row_per_active_poll():
+    from tests.test_coordinator_observability import _ROOMS, _build
+
+    coord, _api, thermostat, data = _build(_ROOMS)
+    vent_ids = list(data["vents"].keys())
+    for _ in range(3):
+        asyncio.run(
+            coord._async_apply_dab_adjustments(thermostat, "cooling", vent_ids, data, count_as_poll=True)
+        )
+    # Manual / pre-adjust runs are not polls and add no row.
+    asyncio.run(coord._async_apply_dab_adjustments(thermostat, "cooling", vent_ids, data))
+
+    traces = coord.get_replay_traces()
+    trace = traces[thermostat]
+    assert trace.rows == 3
+    assert set(trace.room_ids) == {"room_bedroom_2", "room_bath", "room_guest", "room_attic"}
+    assert trace.mode_at(0) == "cooling"
+    attic = dict(trace.samples_at(0))["room_attic"]
+    assert attic.active is False and attic.rate is None
+
+    # The exported snapshot is independent of the live trace and replays offline.
+    loaded = replay.Trace.from_bytes(trace.to_bytes())
+    res = simulator.replay_trace(loaded, "balance")
+    assert res.decisions == 3
+
+
+# ---------------------------------------------------------------------------
+# Decision log
+# ---------------------------------------------------------------------------
+def _decision(t_s, thermostat="climate.up", kind="poll", **rooms):
+    return replay.DecisionRecord(
+        t_s=t_s,
+        thermostat=thermostat,
+        action="cooling",
+        setpoint_c=24.0,
+        kind=kind,
+        strategy="balance",
+        outcome="recalc",
+        reason="deviation",
+        spread_c=1.5,
+        max_deviation_c=0.8,
+        recalc_count=2,
+        rooms=rooms,
+    )
+
+
+def test_decision_log_round_trips_packed_records():
+    log = replay.DecisionLog()
+    record = _decision(
+        1_700_000_000.5,
+        hot=replay.RoomDecision(26.5, 40.0, True, 0.03, 0.1, 2, 72.4, 75.0, 75, "moved"),
+        attic=replay.RoomDecision(None, None, False, outcome="no_reading"),
+    )
+    log.append(record)
+    log.append(_decision(1_700_000_060.0, thermostat="climate.down", kind="manual"))
+    assert len(log) == 2
+
+    back = list(log.records())
+    got, want = back[0].to_json(), record.to_json()
+    assert got.pop("rooms")["attic"] == want.pop("rooms")["attic"]
+    assert got == pytest.approx(want)
+    assert back[0].rooms["hot"].rate == pytest.approx(0.03)
+    assert back[0].rooms["hot"].pre_floor_pct == pytest.approx(72.4)
+    assert back[0].rooms["hot"].outcome == "moved" and back[0].rooms["hot"].applied_pct == 75
+    assert back[0].rooms["attic"].temp_c is None and back[0].rooms["attic"].open_pct is None
+    assert [r.thermostat for r in log.records("climate.down")] == ["climate.down"]
+    # Unknown codes degrade to the first entry rather than failing the apply.
+    log.append(replay.DecisionRecord(0.0, "climate.up", None, outcome="bogus"))
+    assert list(log.records())[-1].outcome == replay.DECISION_OUTCOMES[0]
+
+
+def test_decision_log_is_bounded_and_copy_is_independent():
+    log = replay.DecisionLog(max_records=5)
+    for i in range(12):
+        log.append(_decision(float(i), a=replay.RoomDecision(25.0, 50.0)))
+    assert len(log) == 5
+    assert [r.t_s for r in log.records()] == [7.0, 8.0, 9.0, 10.0, 11.0]
+    snap = log.copy()
+    log.clear()
+    assert len(snap) == 5 and len(log) == 0
+
+
+def test_decision_jsonl_converts_to_replayable_traces(tmp_path):
+    log = replay.DecisionLog()
+    trace = _cooling_trace(polls=6)
+    for row in range(trace.rows):
+        rooms = {
+            rid: replay.RoomDecision(s.temp_c, s.open_pct, s.active, s.rate, s.leak, s.vents)
+            for rid, s in trace.samples_at(row)
+        }
+        log.append(_decision(trace.t_s[row], **rooms))
+    # Non-poll records and records without rooms are not replay rows.
+    log.append(_decision(9e9, kind="manual", a=replay.RoomDecision(25.0, 50.0)))
+    log.append(_decision(9e9))
+
+    path = tmp_path / f"d{replay.DECISION_LOG_SUFFIX}"
+    path.write_text(log.to_jsonl(), encoding="utf-8")
+    traces = replay.traces_from_decisions(replay.load_decisions_jsonl(str(path)))
+    assert list(traces) == ["climate.up"]
+    rebuilt = traces["climate.up"]
+    assert rebuilt.rows == trace.rows
+    expected = simulator.replay_trace(trace, "balance")
+    assert simulator.replay_trace(rebuilt, "balance").avg_predicted_spread == pytest.approx(
+        expected.avg_predicted_spread, rel=1e-5
+    )
+
+
+def test_coordinator_logs_every_apply_with_outcomes():
+    from tests.test_coordinator_observability import _ROOMS, _build
+
+    coord, _api, thermostat, data = _build(_ROOMS)
+    vent_ids = list(data["vents"].keys())
+    for _ in range(2):
+        asyncio.run(
+            coord._async_apply_dab_adjustments(thermostat, "cooling", vent_ids, data, count_as_poll=True)
+        )
+    asyncio.run(coord._async_apply_dab_adjustments(thermostat, "cooling", vent_ids, data))
+
+    records = list(coord.get_decision_log().records())
+    assert [r.kind for r in records] == ["poll", "poll", "manual"]
+    first = records[0]
+    assert first.thermostat == thermostat and first.action == "cooling"
+    assert first.setpoint_c is not None and first.strategy
+    assert first.outcome in replay.DECISION_OUTCOMES
+    assert set(first.rooms) == {"room_bedroom_2", "room_bath", "room_guest", "room_attic"}
+    # A fresh cycle dispatches: every room gets a dispatch outcome.
+    assert all(room.outcome != "pending" for room in first.rooms.values())
+    assert any(room.target_pct is not None for room in first.rooms.values())
+
+    traces = replay.traces_from_decisions(records)
+    assert traces[thermostat].rows == 2
+
+
+def _cycle(started_s, *vent_ids, doors_open=None, n=4):
+    return replay.CycleRecord(
+        started_s,
+        "cooling",
+        23.5,
+        2,
+        [
+            replay.VentCycleSamples(
+                vent_id,
+                f"Room {vent_id}",
+                doors_open,
+                [180.0 + 60.0 * i for i in range(n)],
+                [26.0 - 0.25 * i for i in range(n)],
+                [50.0] * n,
+                [None if i % 2 else 14.5 for i in range(n)],
+            )
+            for vent_id in vent_ids
+        ],
+    )
+
+
+def test_cycle_archive_round_trips_through_json():
+    archive = replay.CycleArchive()
+    archive.append(_cycle(1_700_000_000.25, "v1", "v2", doors_open=True))
+    archive.append(_cycle(1_700_003_600.0, "v2", n=0))
+    archive.append(replay.CycleRecord(1_700_007_200.0, None, None, 0))
+
+    restored = replay.CycleArchive.from_json(json.loads(json.dumps(archive.to_json())))
+    assert list(restored.records()) == list(archive.records())
+    first = next(restored.records())
+    assert first == _cycle(1_700_000_000.25, "v1", "v2", doors_open=True)
+    assert [len(vent) for record in restored.records() for vent in record.vents] == [4, 4, 0]
+    assert list(restored.records())[-1].action is None
+    assert restored.since(restored.appended - 1) == [replay.CycleRecord(1_700_007_200.0, None, None, 0)]
+
+
+def test_cycle_archive_is_bounded_and_drops_bad_records():
+    one = replay.CycleArchive()
+    one.append(_cycle(0.0, "v1"))
+    archive = replay.CycleArchive(max_bytes=3 * one.nbytes)
+    for i in range(10):
+        archive.append(_cycle(float(i), "v1"))
+    assert len(archive) == 3 and archive.appended == 10
+    assert [r.started_s for r in archive.records()] == [7.0, 8.0, 9.0]
+    snap = archive.copy()
+    archive.append(_cycle(10.0, "v1"))
+    assert [r.started_s for r in archive.since(snap.appended)] == [10.0]
+    assert len(snap) == 3
+
+    payload = archive.to_json()
+    payload["records"][0] = payload["records"][0][:-8]
+    payload["records"].append("not base64!")
+    restored = replay.CycleArchive.from_json(payload)
+    assert [r.started_s for r in restored.records()] == [9.0, 10.0]
+    assert len(replay.CycleArchive.from_json({"version": 99, "records": []})) == 0
+    assert len(replay.CycleArchive.from_json("garbled")) == 0
+
+
+def test_cycle_reconstructor_rebuilds_cycles_from_recorded_readings():
+    regimes = []
+
+    def regime_of(t_s, outdoor, sun):
+        regimes.append((t_s, outdoor, sun))
+        return 3
+
+    builder = replay.CycleReconstructor(
+        {"v1": "Room1", "v2": "Room2"}, regime_of, stable_s=60.0, window_s=600.0
+    )
+    feed = builder.feed
+    # History opens mid-cycle: no start time, so that cycle is never emitted.
+    assert feed(0.0, replay.HISTORY_ACTION, None, ("cooling", 24.0)) is None
+    feed(10.0, replay.HISTORY_APERTURE, "v1", 50.0)
+    feed(20.0, replay.HISTORY_TEMP, "v1", 27.0)
+    assert feed(100.0, replay.HISTORY_ACTION, None, (None, None)) is None
+
+    feed(150.0, replay.HISTORY_DUCT, "v1", 14.0)
+    feed(160.0, replay.HISTORY_OUTDOOR, None, 31.0)
+    feed(170.0, replay.HISTORY_DOOR, "v1", True)
+    feed(180.0, replay.HISTORY_TEMP, "v9", 30.0)  # not an assigned vent
+    assert feed(200.0, replay.HISTORY_ACTION, None, ("cooling", 23.5)) is None
+    feed(230.0, replay.HISTORY_TEMP, "v1", 26.5)  # before started_running
+    feed(380.0, replay.HISTORY_TEMP, "v1", 26.0)
+    feed(500.0, replay.HISTORY_APERTURE, "v1", 55.0)
+    feed(600.0, replay.HISTORY_TEMP, "v2", 25.0)  # no aperture yet
+    feed(740.0, replay.HISTORY_TEMP, "v1", 25.0)
+    feed(900.0, replay.HISTORY_TEMP, "v1", 24.5)  # past the window
+    feed(950.0, replay.HISTORY_SUN, None, "below_horizon")
+    record = feed(1000.0, replay.HISTORY_ACTION, None, ("heating", 20.0))
+
+    assert record == replay.CycleRecord(
+        260.0,
+        "cooling",
+        23.5,
+        3,
+        [
+            replay.VentCycleSamples(
+                "v1", "Room1", True, [120.0, 240.0, 480.0], [26.0, 26.0, 25.0], [50.0, 55.0, 55.0], [14.0] * 3
+            )
+        ],
+    )
+    assert regimes == [(1000.0, 31.0, "below_horizon")]
+    # The heating cycle is still running when the history ends.
+    feed(1200.0, replay.HISTORY_TEMP, "v1", 25.5)
+    assert builder.feed(1300.0, replay.HISTORY_ACTION, None, ("heating", 20.5)) is None
@@ -23,12 +23,19 @@ Covers (R15.1/15.2/15.4/15.5/15.7, R25.12):
 * the learned **non-linear saturating curve** ``flow_i`` is monotonic with
   ``flow(0)=leak``, ``flow(100%)=1`` and a knee below 100 % (R25.12);
 * an optional outdoor/weather drift profile feeds the context regime (R15.7);
-* inactive rooms are excluded from termination and the spread metric.
+* inactive rooms are excluded from termination and the spread metric;
+* the adaptive (event-driven) clock stays step-aligned with the fixed clock
+  while re-allocating only at events;
+* the streaming interface yields per-step records whose online summary matches
+  the batch run, with optional down-sampled histories;
+* the procedural scenario generator is seeded/deterministic and draws within
+  its spec, and the named stress scenarios build and time.
 """
 
 from __future__ import annotations
 
 import importlib.util
+import itertools
 import pathlib
 import sys
 
@@ -318,6 +325,21 @@ def test_total_moves_counted_and_per_room_reported():
     assert sum(result.moves_per_room.values()) == result.total_moves
 
 
+def test_plan_selection_cuts_moves_per_allocation_and_keeps_the_floor():
+    scenario = simulator.default_scenario()
+    baseline = simulator.run(scenario, strategy="balance", move_aware=False)
+    selected = simulator.run(scenario, strategy="balance")
+
+    assert baseline.moves_per_allocation == baseline.total_moves / baseline.allocations
+    assert selected.moves_per_allocation < baseline.moves_per_allocation
+    assert selected.min_combined_open_pct >= 40.0 - 1e-6
+    # dab has no plan-selection stage; the flag is a no-op for it.
+    assert (
+        simulator.run(scenario, "dab").total_moves
+        == simulator.run(scenario, "dab", move_aware=False).total_moves
+    )
+
+
 # ---------------------------------------------------------------------------
 # Side-by-side comparison table (Task 25.2, R15.3)
 # ---------------------------------------------------------------------------
@@ -381,6 +403,169 @@ def test_compare_rejects_unknown_strategy():
         simulator.compare(_cooling_scenario(), ["does_not_exist"], to_stdout=False)
 
 
+# ---------------------------------------------------------------------------
+# Adaptive (event-driven) clock
+# ---------------------------------------------------------------------------
+def test_adaptive_matches_fixed_when_apertures_are_constant():
+    # One active room far from setpoint: balance holds it at its knee every
+    # step, so the trajectory is a single linear segment in both clocks.
+    rooms = [simulator.RoomScenario("solo", 28.0, 0.05, 0.1, idle_drift=0.0)]
+    scenario = simulator.Scenario(rooms=rooms, setpoint_c=26.0, mode="cooling", horizon_min=600.0)
+    fixed = simulator.run(scenario, strategy="balance")
+    adaptive = simulator.run(scenario, strategy="balance", adaptive=True)
+    assert adaptive.ended_reason == fixed.ended_reason == "setpoint"
+    assert adaptive.steps == fixed.steps
+    assert adaptive.final_temps["solo"] == pytest.approx(fixed.final_temps["solo"], abs=1e-6)
+    assert adaptive.allocations < fixed.allocations == fixed.steps
+
+
+def test_adaptive_run_is_step_aligned_and_honors_floor():
+    scenario = _cooling_scenario()
+    fixed = simulator.run(scenario, strategy="balance")
+    result = simulator.run(scenario, strategy="balance", adaptive=True)
+    assert result.ended_reason == fixed.ended_reason
+    assert abs(result.steps - fixed.steps) <= 2
+    # Every reconstructed step is recorded, even though few were allocated.
+    assert len(result.spread_history) == result.steps
+    assert len(result.combined_open_history) == result.steps
+    assert result.allocations < result.steps
+    assert result.min_combined_open_pct >= 40.0 - 1e-6
+
+
+def test_adaptive_segments_respect_max_step():
+    rooms = [simulator.RoomScenario("r", 30.0, 0.001, 0.0, idle_drift=-0.05)]
+    scenario = simulator.Scenario(rooms=rooms, setpoint_c=24.0, mode="cooling", horizon_min=120.0)
+    result = simulator.run(scenario, strategy="balance", adaptive=True, max_step_min=10.0)
+    assert result.ended_reason == "horizon"
+    assert result.minutes == pytest.approx(120.0)
+    assert result.allocations == 12
+
+
+def test_next_event_is_the_earliest_threshold_crossing():
+    scenario = _cooling_scenario(settings=balance.AllocSettings(hysteresis_c=0.3))
+    temps = {"bedroom_2": 27.0, "bedroom_3": 27.0, "bathroom": 26.5}
+    # bathroom cools at 0.1 °C/min: setpoint (26.1) in 4 min, the others later.
+    rates = {"bedroom_2": -0.01, "bedroom_3": -0.01, "bathroom": -0.1}
+    assert simulator._minutes_to_next_event(scenario, temps, rates, 0.0, 60.0) == pytest.approx(4.0)
+    # The context-hour boundary caps the segment.
+    assert simulator._minutes_to_next_event(scenario, temps, rates, 58.0, 60.0) == pytest.approx(2.0)
+
+
+def test_adaptive_is_deterministic():
+    a = simulator.run(_cooling_scenario(sensor_noise_c=0.05, seed=11), strategy="balance", adaptive=True)
+    b = simulator.run(_cooling_scenario(sensor_noise_c=0.05, seed=11), strategy="balance", adaptive=True)
+    assert a.steps == b.steps
+    assert a.allocations == b.allocations
+    assert a.final_temps == b.final_temps
+
+
+# ---------------------------------------------------------------------------
+# Streaming output / online metrics
+# ---------------------------------------------------------------------------
+def test_stream_yields_one_record_per_step_and_matches_run():
+    stream = simulator.stream_run(_cooling_scenario(), "balance")
+    records = list(stream)
+    direct = simulator.run(_cooling_scenario(), strategy="balance")
+    assert len(records) == stream.result.steps == direct.steps
+    assert [r.step for r in records] == list(range(direct.steps))
+    assert [r.spread for r in records] == direct.spread_history
+    assert sum(r.moves for r in records) == direct.total_moves
+    # Online summary equals the batch run's.
+    assert stream.result.avg_spread == pytest.approx(direct.avg_spread)
+    assert stream.result.avg_active_error == pytest.approx(direct.avg_active_error)
+    assert stream.result.time_above_guardrail_min == pytest.approx(direct.time_above_guardrail_min)
+    # Histories are off by default on the streaming entry point.
+    assert stream.result.spread_history == []
+
+
+def test_run_sink_and_downsampled_history():
+    seen = []
+    result = simulator.run(_cooling_scenario(), strategy="balance", sink=seen.append, history_every=5)
+    assert len(seen) == result.steps
+    assert result.spread_history == [r.spread for r in seen if r.step % 5 == 0]
+    assert len(result.combined_open_history) == len(result.spread_history)
+    # Summary metrics do not depend on the retained history.
+    full = simulator.run(_cooling_scenario(), strategy="balance")
+    assert result.avg_spread == pytest.approx(full.avg_spread)
+    assert result.min_combined_open_pct == pytest.approx(full.min_combined_open_pct)
+
+
+def test_stream_result_requires_exhaustion_and_single_use():
+    stream = simulator.stream_run(_cooling_scenario(), "balance")
+    with pytest.raises(RuntimeError):
+        _ = stream.result
+    list(stream)
+    with pytest.raises(RuntimeError):
+        iter(stream)
+
+
+def test_compare_can_drop_histories():
+    cmp = simulator.compare(_cooling_scenario(), ["dab", "balance"], to_stdout=False, history_every=0)
+    for result in cmp.results.values():
+        assert result.spread_history == []
+        assert result.combined_open_history == []
+
+
+# ---------------------------------------------------------------------------
+# Procedural scenario generator / stress scenarios
+# ---------------------------------------------------------------------------
+def test_generate_scenario_is_deterministic_per_seed():
+    spec = simulator.ScenarioSpec(rooms=25, seed=5)
+    a = simulator.generate_scenario(spec)
+    b = simulator.generate_scenario(spec)
+    assert [(r.room_id, r.temp_c, r.efficiency, r.vent_ids, r.active) for r in a.rooms] == [
+        (r.room_id, r.temp_c, r.efficiency, r.vent_ids, r.active) for r in b.rooms
+    ]
+    c = simulator.generate_scenario(simulator.ScenarioSpec(rooms=25, seed=6))
+    assert [r.temp_c for r in a.rooms] != [r.temp_c for r in c.rooms]
+
+
+def test_generate_scenario_draws_within_spec():
+    spec = simulator.ScenarioSpec(rooms=60, seed=1, inactive_fraction=0.3, door_fraction=0.5)
+    scenario = simulator.generate_scenario(spec)
+    assert len(scenario.rooms) == 60
+    assert any(not r.active for r in scenario.rooms)
+    assert {len(r.vent_ids) for r in scenario.rooms} <= {1, 2, 3}
+    for room in scenario.rooms:
+        assert spec.efficiency_range[0] <= room.efficiency <= spec.efficiency_range[1]
+        assert spec.leak_range[0] <= room.leak <= spec.leak_range[1]
+        if room.door_open_factor is not None:
+            assert room.door_open_samples == spec.door_samples
+    # Inactive vents are counted for the floor's last-resort reopen.
+    inactive_vents = sum(len(r.vent_ids) for r in scenario.rooms if not r.active)
+    assert scenario.settings.inactive_count == inactive_vents
+
+
+def test_generate_scenario_keeps_one_room_active():
+    scenario = simulator.generate_scenario(simulator.ScenarioSpec(rooms=3, seed=2, inactive_fraction=1.0))
+    assert sum(r.active for r in scenario.rooms) == 1
+
+
+def test_blended_curve_is_monotonic_with_pinned_endpoints():
+    for saturation in (0.0, 0.4, 1.0):
+        curve = simulator.blended_curve(0.1, saturation)
+        flows = curve["flow"]
+        assert flows[0] == pytest.approx(0.1)
+        assert flows[-1] == 1.0
+        assert all(b >= a for a, b in itertools.pairwise(flows))
+    # More saturation pulls the knee below full open.
+    assert learning.curve_knee_pct(simulator.blended_curve(0.1, 1.0)) < 100
+
+
+def test_stress_scenarios_build_and_time():
+    for name, spec in simulator.STRESS_SCENARIOS.items():
+        assert 40 <= spec.rooms <= 200
+        assert len(simulator.stress_scenario(name).rooms) == spec.rooms
+    with pytest.raises(ValueError):
+        simulator.stress_scenario("nope")
+    timing = simulator.time_run(simulator.stress_scenario("house_40"), "balance", adaptive=True)
+    assert timing.rooms == 40
+    assert timing.result.allocations > 0
+    assert timing.ms_per_allocation > 0.0
+    assert timing.ms_per_sim_hour > 0.0
+    assert "house_40" in simulator.render_timing_table({"house_40/balance": timing})
+
+
 # ---------------------------------------------------------------------------
 # Per-room door-leakage learning (Task 13.1, R26.1/R26.3/R27.4)
 # ---------------------------------------------------------------------------
@@ -24,6 +24,7 @@ PLATFORM_MODULES = [
     "hvac_vent_optimizer.cover",
     "hvac_vent_optimizer.services",
     "hvac_vent_optimizer.config_flow",
+    "hvac_vent_optimizer.diagnostics",
     "hvac_vent_optimizer.utils",
 ]
 
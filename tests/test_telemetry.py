@@ -0,0 +1,383 @@
+"""Tests for per-phase poll timing (``telemetry.py``) and its HA surfaces.
+
+Covers:
+
+* nearest-rank percentiles and the bounded rolling window;
+* per-poll accumulation (a phase run twice in one poll is one sample), direct
+  samples outside a poll, and the monotonic ``spent`` totals;
+* a real coordinator poll against the fake Flair server records every poll
+  phase, the ``_dab_lock`` wait/hold and per-endpoint request counts;
+* the poll-timing diagnostic sensor and the diagnostics download (credentials
+  redacted);
+* Flair API telemetry: latency histogram percentiles, 429/error/retry
+  counting, the rolling hourly request rate, and the coordinator's budget
+  projection surfaced by the API sensors and diagnostics;
+* with the Flair client's circuit breaker open, a poll serves the last good
+  snapshot marked stale without issuing requests, and recovers after a probe;
+* the on-demand ``PollProfiler``: nested spans enable cProfile once, only polls
+  count towards N, a timeout returns the partial capture, and the coordinator
+  capture yields a ranked top-functions summary.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import pathlib
+import sys
+
+import pytest
+
+from tests import bench_coordinator as bench
+
+_ROOT = pathlib.Path(__file__).resolve().parent.parent / "custom_components" / "hvac_vent_optimizer"
+
+
+def _load(name: str):
+    path = _ROOT / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(f"hvo_{name}", path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+telemetry = _load("telemetry")
+
+
+# ---------------------------------------------------------------------------
+# Pure module
+# ---------------------------------------------------------------------------
+def test_percentile_is_nearest_rank():
+    ordered = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]
+    assert telemetry.percentile(ordered, 50) == 5.0
+    assert telemetry.percentile(ordered, 90) == 9.0
+    assert telemetry.percentile(ordered, 99) == 10.0
+    assert telemetry.percentile(ordered, 0) == 1.0
+    assert telemetry.percentile([], 50) == 0.0
+
+
+def test_rolling_window_keeps_last_samples_only():
+    win = telemetry.RollingWindow(size=3)
+    for value in (100.0, 1.0, 2.0, 3.0):
+        win.add(value)
+    summary = win.summary()
+    assert len(win) == 3
+    assert summary["n"] == 4  # samples ever seen
+    assert summary["max_ms"] == 3.0  # the 100 ms sample rolled out
+    assert summary["last_ms"] == 3.0
+    assert summary["mean_ms"] == 2.0
+    assert summary["p50_ms"] <= summary["p90_ms"] <= summary["p99_ms"] <= summary["max_ms"]
+
+
+def test_phase_timer_accumulates_within_a_poll():
+    timer = telemetry.PhaseTimer(window=10)
+    timer.begin_poll()
+    timer.add("dispatch", 0.010)
+    timer.add("dispatch", 0.015)
+    timer.add("fetch", 0.002)
+    assert timer.in_poll
+    timer.end_poll()
+    summary = timer.summary()
+    assert summary["dispatch"]["n"] == 1
+    assert summary["dispatch"]["last_ms"] == pytest.approx(25.0)
+    assert list(summary)[:2] == ["fetch", "dispatch"]  # poll order, then total
+    assert "total" in summary
+    assert timer.last_total_ms() is not None
+
+    # Outside a poll every measurement is its own sample.
+    timer.add("save", 0.004)
+    timer.add("save", -1.0)  # clamps to 0
+    assert timer.summary()["save"]["n"] == 2
+    assert timer.spent(["dispatch", "save"]) == pytest.approx(0.029)
+    with timer.measure("lock_wait"):
+        pass
+    assert timer.summary()["lock_wait"]["n"] == 1
+    timer.end_poll()  # no-op when no poll is open
+
+
+# ---------------------------------------------------------------------------
+# Coordinator wiring
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_coordinator_poll_records_phases_and_endpoint_counts():
+    coord, _hass, _server = bench.build_harness(bench.BenchConfig(vents=4, pucks=2))
+    await coord.async_initialize()
+    for _ in range(2):
+        coord.data = await coord._async_update_data()
+
+    timings = coord.get_poll_timings()
+    for phase in (
+        "structure_mode",
+        "fetch",
+        "enrich_vents",
+        "enrich_pucks",
+        "decide",
+        "observability",
+        "lock_wait",
+        "lock_hold",
+        "total",
+    ):
+        assert timings[phase]["n"] >= 1, phase
+    assert timings["total"]["n"] == 2
+    assert coord.get_last_poll_ms() == timings["total"]["last_ms"]
+    # The lock is held across decide + dispatch + observability.
+    assert timings["lock_hold"]["last_ms"] >= timings["decide"]["last_ms"]
+
+    counts = coord.get_api_request_counts()
+    assert counts["GET /api/structures/{id}/vents"] == 2
+    assert counts["GET /api/vents/{id}/current-reading"] == 8
+    assert counts["POST /oauth2/token"] == 1
+    coord.async_shutdown()
+
+
+def test_endpoint_key_templates_resource_ids():
+    from hvac_vent_optimizer.api import endpoint_key
+
+    assert endpoint_key("get", "/api/vents/abc-123/room") == "GET /api/vents/{id}/room"
+    assert endpoint_key("PATCH", "/api/structures/s1") == "PATCH /api/structures/{id}"
+    assert endpoint_key("GET", "/api/structures") == "GET /api/structures"
+    assert (
+        endpoint_key("GET", "/api/remote-sensors/r9/current-reading?x=1")
+        == "GET /api/remote-sensors/{id}/current-reading"
+    )
+
+
+@pytest.mark.asyncio
+async def test_poll_timing_sensor_and_diagnostics():
+    from hvac_vent_optimizer import const, diagnostics, sensor as sensor_mod
+
+    coord, hass, _server = bench.build_harness(bench.BenchConfig(vents=2, pucks=1))
+    await coord.async_initialize()
+
+    ent = sensor_mod.PollTimingSensor(coord, "e1")
+    assert ent.native_value is None  # no poll yet
+    assert ent.entity_description.entity_category == "diagnostic"
+
+    coord.data = await coord._async_update_data()
+    assert ent.native_value == coord.get_last_poll_ms() > 0.0
+    attrs = ent.extra_state_attributes
+    assert "fetch" in attrs["phases"]
+    assert attrs["requests_by_endpoint"]["GET /api/structures/{id}/pucks"] == 1
+
+    hass.data[const.DOMAIN] = {coord.entry.entry_id: coord}
+    diag = await diagnostics.async_get_config_entry_diagnostics(hass, coord.entry)
+    assert diag["entry"]["data"][const.CONF_CLIENT_SECRET] == "**REDACTED**"
+    assert diag["entry"]["data"][const.CONF_CLIENT_ID] == "**REDACTED**"
+    assert "bench-secret" not in repr(diag)
+    assert diag["devices"] == {"vents": 2, "pucks": 1}
+    assert diag["poll_timings_ms"]["total"]["n"] == 1
+    assert diag["api"]["endpoints"]["GET /api/structures/{id}/vents"]["requests"] == 1
+    assert diag["api_budget"]["requests_last_poll"] > 0
+    coord.async_shutdown()
+
+
+# ---------------------------------------------------------------------------
+# On-demand profiling
+# ---------------------------------------------------------------------------
+def _busy(n=2000):
+    return sorted(range(n), key=lambda v: -v)
+
+
+@pytest.mark.asyncio
+async def test_profiler_counts_polls_and_nests_spans():
+    profiler = telemetry.PollProfiler()
+    with profiler.span(poll=True):  # unarmed: no-op
+        _busy()
+    profiler.arm(2)
+    assert profiler.armed
+    with pytest.raises(telemetry.ProfilerBusyError):
+        profiler.arm(1)
+    with profiler.span(poll=True):
+        with profiler.span():  # DAB apply inside the poll
+            _busy()
+    with profiler.span():  # an apply outside a poll is captured but not counted
+        _busy()
+    assert profiler.armed
+    with profiler.span(poll=True):
+        _busy()
+    capture = await profiler.wait(1.0)
+    assert not profiler.armed
+    assert capture.polls == 2 and not capture.timed_out and capture.error is None
+
+    rows = telemetry.top_functions(capture.profile, limit=5, sort="tottime")
+    assert 0 < len(rows) <= 5
+    assert [r["tottime_ms"] for r in rows] == sorted((r["tottime_ms"] for r in rows), reverse=True)
+    assert any("_busy" in r["function"] or "sorted" in r["function"] for r in rows)
+    with pytest.raises(ValueError):
+        telemetry.top_functions(capture.profile, sort="nope")
+
+
+@pytest.mark.asyncio
+async def test_profiler_timeout_returns_partial_capture():
+    profiler = telemetry.PollProfiler()
+    profiler.arm(3)
+    with profiler.span(poll=True):
+        _busy()
+    capture = await profiler.wait(0.01)
+    assert capture.timed_out and capture.polls == 1
+    assert not profiler.armed
+    profiler.arm(1)  # a new capture can start after the timeout
+
+
+@pytest.mark.asyncio
+async def test_coordinator_profiles_next_polls(tmp_path):
+    from hvac_vent_optimizer import services
+
+    coord, _hass, _server = bench.build_harness(bench.BenchConfig(vents=3, pucks=1))
+    await coord.async_initialize()
+    task = asyncio.ensure_future(coord.async_capture_profile(2))
+    await asyncio.sleep(0)
+    for _ in range(2):
+        coord.data = await coord._async_update_data()
+    capture = await asyncio.wait_for(task, 5.0)
+    assert capture.polls == 2 and not capture.timed_out
+
+    path = tmp_path / "poll.prof"
+    rows = services._dump_profile(str(path), capture, 10, "cumulative")
+    assert path.stat().st_size > 0
+    assert len(rows) == 10
+    assert any("_async_poll" in r["function"] for r in rows)
+    coord.async_shutdown()
+
+
+# ---------------------------------------------------------------------------
+# Flair API telemetry
+# ---------------------------------------------------------------------------
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_api_telemetry_histogram_and_outcomes():
+    api = telemetry.ApiTelemetry()
+    for latency_s in (0.02, 0.04, 0.08, 0.3, 12.0):
+        api.record("GET /api/structures", 200, latency_s, nbytes=100)
+    api.record("GET /api/structures", 429, 0.01, retry=False)
+    api.record("GET /api/structures", None, 10.0, retry=True)
+    api.record("GET /api/structures", 500, 0.05)
+    api.record_error("GET /api/structures")
+
+    stats = api.summary()["endpoints"]["GET /api/structures"]
+    assert stats["requests"] == 8
+    assert stats["rate_limited"] == 1
+    assert stats["errors"] == 3  # transport failure, 500, non-JSON
+    assert stats["retries"] == 1
+    assert stats["bytes"] == 500
+    assert stats["latency_histogram"]["le_50"] == 4
+    assert stats["latency_histogram"]["inf"] == 1
+    assert stats["latency_p50_ms"] == 50.0
+    assert stats["latency_p99_ms"] == 12000.0  # overflow bucket reports the max
+    assert api.totals()["requests"] == 8
+
+
+def test_api_telemetry_hourly_rate_rolls_off():
+    clock = _Clock()
+    api = telemetry.ApiTelemetry(clock=clock)
+    for minute in range(90):
+        clock.now = minute * 60.0 + 1.0
+        api.record("GET /api/structures", 200, 0.05)
+        api.record("GET /api/structures", 200, 0.05)
+    assert api.requests_last_hour() == 120
+    budget = api.budget(hourly_budget=240)
+    assert budget["budget_used_pct"] == 50.0
+    clock.now += 3 * 3600.0
+    assert api.requests_last_hour() == 0
+
+
+@pytest.mark.asyncio
+async def test_coordinator_api_budget_projection_and_sensors():
+    from hvac_vent_optimizer import sensor as sensor_mod
+
+    coord, _hass, _server = bench.build_harness(bench.BenchConfig(vents=4, pucks=2))
+    await coord.async_initialize()
+    coord.data = await coord._async_update_data()
+
+    budget = coord.get_api_budget()
+    per_poll = budget["requests_last_poll"]
+    assert per_poll > 4  # the list fetches plus per-device enrichment
+    active_s = coord._poll_interval_active.total_seconds()
+    assert budget["projected_per_hour_active"] == pytest.approx(per_poll * 3600.0 / active_s, abs=0.1)
+    assert budget["projected_per_hour_idle"] <= budget["projected_per_hour_active"]
+
+    rate = sensor_mod.ApiTelemetrySensor(coord, "e1", sensor_mod.API_REQUESTS_HOUR_DESCRIPTION)
+    used = sensor_mod.ApiTelemetrySensor(coord, "e1", sensor_mod.API_BUDGET_USED_DESCRIPTION)
+    assert rate.native_value == coord.api.telemetry.requests_last_hour() >= per_poll
+    assert used.native_value == budget["budget_used_pct"]
+    attrs = rate.extra_state_attributes
+    assert attrs["hourly_budget"] == telemetry.API_HOURLY_BUDGET
+    assert attrs["rate_limited"] == 0
+    assert "GET /api/vents/{id}/current-reading" in attrs["endpoints"]
+    coord.async_shutdown()
+
+
+_DEVICE_PATHS = ("/api/vents/", "/api/pucks/")
+
+
+@pytest.mark.asyncio
+async def test_outage_during_enrichment_trips_the_breaker_before_the_fan_out():
+    from hvac_vent_optimizer.api import BREAKER_FAILURE_THRESHOLD
+
+    coord, _hass, server = bench.build_harness(bench.BenchConfig(vents=20, pucks=5))
+    await coord.async_initialize()
+    assert (await coord._async_update_data())["stale"] is False
+
+    async def _no_sleep(_delay):
+        return None
+
+    coord.api._sleep = _no_sleep
+    handle = server.handle
+    server.handle = lambda method, path, body=None: (
+        (503, {"errors": []}) if path.startswith(_DEVICE_PATHS) else handle(method, path, body)
+    )
+    server.reset_counters()
+    stale = await coord._async_update_data()
+
+    # Devices are probed one by one: the breaker opens after the threshold's
+    # worth of failed requests and the remaining devices are refused locally.
+    attempts = coord.api.retry_policies["read"].retries + 1
+    device_requests = sum(
+        n for template, n in server.requests.items() if template.split(" ")[1].startswith(_DEVICE_PATHS)
+    )
+    assert device_requests == BREAKER_FAILURE_THRESHOLD * attempts
+    assert stale["stale"] is True and coord.api.breaker.is_open
+    coord.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_serves_last_good_snapshot_marked_stale():
+    from hvac_vent_optimizer import const, diagnostics
+    from hvac_vent_optimizer.utils import CircuitBreaker
+
+    coord, hass, _server = bench.build_harness(bench.BenchConfig(vents=2, pucks=1))
+    clock = _Clock()
+    coord.api.breaker = CircuitBreaker(failure_threshold=1, cooldown_s=60.0, clock=clock)
+    await coord.async_initialize()
+    fresh = await coord._async_update_data()
+    assert fresh["stale"] is False
+
+    coord.api.breaker.record_failure()  # the outage trips the breaker
+    issued = coord.api.telemetry.total
+    stale = await coord._async_update_data()
+    assert stale["stale"] is True and stale["stale_since"]
+    assert stale["vents"] == fresh["vents"]
+    assert coord.api.telemetry.total == issued  # short-circuited, no fan-out
+    assert coord.get_api_circuit()["state"] == "open"
+    hass.data[const.DOMAIN] = {coord.entry.entry_id: coord}
+    diag = await diagnostics.async_get_config_entry_diagnostics(hass, coord.entry)
+    assert diag["api_circuit"]["stale_since"] == stale["stale_since"]
+
+    clock.now = 61.0  # cooldown over: the vents list request is the probe
+    recovered = await coord._async_update_data()
+    assert recovered["stale"] is False
+    assert coord.get_api_circuit() == {
+        "state": "closed",
+        "consecutive_failures": 0,
+        "trips": 1,
+        "rejected": coord.api.breaker.rejected,
+        "stale_since": None,
+    }
+    coord.async_shutdown()